@@ -0,0 +1,92 @@
+"""Cold import time of agno.agent, agno.team, agno.workflow and agno.os.
+
+Every module is imported in a fresh interpreter with `python -X importtime`, so nothing is cached in `sys.modules`.
+The script reports the median import time of each module, the submodules that cost the most, and exits with an error
+when a module is over its budget or loads an optional subsystem it should only load on first use.
+
+Run `pip install agno` to install dependencies, and `pip install "agno[os]"` to include agno.os.
+"""
+
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Import time budget of each module in milliseconds, measured as the median of the runs
+IMPORT_TIME_BUDGET_MS: Dict[str, float] = {
+    "agno.agent": 1000,
+    "agno.team": 1000,
+    "agno.workflow": 1100,
+    "agno.os": 1800,
+}
+
+# Optional subsystems that are loaded on first use, and should not be loaded by importing these modules
+LAZY_MODULES: Dict[str, List[str]] = {
+    "agno.agent": ["agno.knowledge.knowledge", "agno.memory.manager", "rich.markdown", "httpx", "fastapi"],
+    "agno.team": ["agno.knowledge.knowledge", "agno.memory.manager", "rich.markdown", "httpx", "fastapi"],
+    "agno.workflow": ["agno.knowledge.knowledge", "agno.memory.manager", "rich.markdown", "httpx", "fastapi"],
+    "agno.os": [],
+}
+
+NUM_RUNS = 5
+NUM_TOP_MODULES = 10
+
+
+def measure_import(module: str) -> Tuple[float, List[Tuple[float, str]]]:
+    """Import the module in a fresh interpreter.
+
+    Returns:
+        The cumulative import time of the module in ms, and the self import time of every module imported with it in ms.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_ms = 0.0
+    self_times: List[Tuple[float, str]] = []
+    for line in result.stderr.splitlines():
+        # Lines look like "import time:       123 |       4567 |     agno.tools"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            # Header line
+            continue
+        self_times.append((int(self_us) / 1000, name.strip()))
+        if name.strip() == module:
+            total_ms = int(cumulative_us) / 1000
+    return total_ms, self_times
+
+
+def run_benchmark() -> bool:
+    within_budget = True
+    for module, budget_ms in IMPORT_TIME_BUDGET_MS.items():
+        try:
+            runs = [measure_import(module) for _ in range(NUM_RUNS)]
+        except subprocess.CalledProcessError as e:
+            print(f"\n{module}: could not be imported\n{e.stderr.strip().splitlines()[-1]}")
+            continue
+
+        median_ms = statistics.median(total_ms for total_ms, _ in runs)
+        status = "OK" if median_ms <= budget_ms else "OVER BUDGET"
+        print(
+            f"\n{module}: {median_ms:.0f} ms (min {min(r[0] for r in runs):.0f} ms, budget {budget_ms:.0f} ms) {status}"
+        )
+
+        self_times = runs[0][1]
+        imported = {name for _, name in self_times}
+        print(f"  {len(imported)} modules imported, slowest by self time:")
+        for self_ms, name in sorted(self_times, reverse=True)[:NUM_TOP_MODULES]:
+            print(f"    {self_ms:8.1f} ms  {name}")
+
+        eager = [name for name in LAZY_MODULES[module] if name in imported]
+        if eager:
+            print(f"  Optional modules loaded at import: {', '.join(eager)}")
+        within_budget = within_budget and median_ms <= budget_ms and not eager
+    return within_budget
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_benchmark() else 1)
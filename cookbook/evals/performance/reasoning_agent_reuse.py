@@ -0,0 +1,70 @@
+"""Per-run overhead of setting up reasoning, building the reasoning agent on every run vs reusing it.
+
+Run `pip install agno openai memory_profiler` to install dependencies. No API calls are made.
+"""
+
+from copy import deepcopy
+from typing import Literal
+
+from agno.agent import Agent
+from agno.eval.performance import PerformanceEval
+from agno.models.openai import OpenAIChat
+from agno.reasoning.default import get_default_reasoning_agent
+
+
+def get_weather(city: Literal["nyc", "sf"]):
+    """Use this to get weather information."""
+    if city == "nyc":
+        return "It might be cloudy in nyc"
+    elif city == "sf":
+        return "It's always sunny in sf"
+
+
+agent = Agent(model=OpenAIChat(id="gpt-4o"), tools=[get_weather], reasoning=True)
+
+
+def build_reasoning_agent_per_run():
+    """What every run with reasoning enabled used to do"""
+    reasoning_model = deepcopy(agent.model)
+    return get_default_reasoning_agent(
+        reasoning_model=reasoning_model,  # type: ignore
+        min_steps=agent.reasoning_min_steps,
+        max_steps=agent.reasoning_max_steps,
+        tools=agent.tools,
+        tool_call_limit=agent.tool_call_limit,
+        use_json_mode=agent.use_json_mode,
+        telemetry=agent.telemetry,
+        debug_mode=agent.debug_mode,
+        debug_level=agent.debug_level,
+        session_state=agent.session_state,
+        dependencies=agent.dependencies,
+        metadata=agent.metadata,
+    )
+
+
+def reuse_reasoning_agent():
+    """What every run does now: the reasoning agent is built once and reused"""
+    reasoning_model = agent._reasoning_cache.get_model_copy(agent.model)  # type: ignore
+    return agent._reasoning_cache.get_agent(
+        "default",
+        key=(id(reasoning_model), id(agent.tools)),
+        build=lambda: get_default_reasoning_agent(
+            reasoning_model=reasoning_model,
+            min_steps=agent.reasoning_min_steps,
+            max_steps=agent.reasoning_max_steps,
+            tools=agent.tools,
+        ),
+        session_state=agent.session_state,
+        dependencies=agent.dependencies,
+        metadata=agent.metadata,
+    )
+
+
+per_run_perf = PerformanceEval(
+    name="Reasoning Agent Built Per Run", func=build_reasoning_agent_per_run, num_iterations=1000
+)
+reuse_perf = PerformanceEval(name="Reasoning Agent Reused", func=reuse_reasoning_agent, num_iterations=1000)
+
+if __name__ == "__main__":
+    per_run_perf.run(print_results=True, print_summary=True)
+    reuse_perf.run(print_results=True, print_summary=True)
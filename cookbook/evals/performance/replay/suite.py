@@ -0,0 +1,222 @@
+"""Benchmark suite measuring the overhead of agno itself, using the replay model instead of a live provider.
+
+The replay model returns scripted responses without any network call, so the measured time is the time spent in
+agno: building messages, executing tools, streaming events, updating memories and reading and writing sessions.
+
+Run `pip install agno memory_profiler` to install dependencies. No API keys are needed.
+
+Usage:
+    python cookbook/evals/performance/replay/suite.py
+    # Save the results as the baseline to compare future runs against
+    python cookbook/evals/performance/replay/suite.py --save-baseline tmp/replay_baseline.json
+    # Fail if a benchmark is more than 25% slower than the baseline
+    python cookbook/evals/performance/replay/suite.py --baseline tmp/replay_baseline.json --tolerance 0.25
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+from uuid import uuid4
+
+from agno.agent import Agent
+from agno.db.in_memory import InMemoryDb
+from agno.db.sqlite import SqliteDb
+from agno.eval.performance import PerformanceEval
+from agno.memory import MemoryManager
+from agno.models.replay import ReplayModel
+from agno.team import Team
+from agno.workflow import Step, Workflow
+
+ANSWER = "The weather in San Francisco is sunny, with a light breeze coming from the ocean."
+
+
+def get_weather(city: str) -> str:
+    """Get the weather of a city."""
+    return f"It is sunny in {city}"
+
+
+def weather_tool_call(city: str = "San Francisco") -> dict:
+    return {"tool_calls": [{"name": "get_weather", "arguments": {"city": city}}]}
+
+
+def simple_agent():
+    agent = Agent(model=ReplayModel(responses=[ANSWER]), telemetry=False)
+    return agent.run("What is the weather in San Francisco?")
+
+
+def agent_with_tool_calls():
+    agent = Agent(
+        model=ReplayModel(responses=[weather_tool_call(), weather_tool_call("Paris"), ANSWER]),
+        tools=[get_weather],
+        telemetry=False,
+    )
+    return agent.run("What is the weather in San Francisco and Paris?")
+
+
+def streaming_agent():
+    agent = Agent(model=ReplayModel(responses=[weather_tool_call(), ANSWER]), tools=[get_weather], telemetry=False)
+    for _ in agent.run("What is the weather in San Francisco?", stream=True, stream_intermediate_steps=True):
+        pass
+
+
+async def async_streaming_agents():
+    agents = [
+        Agent(model=ReplayModel(responses=[weather_tool_call(), ANSWER]), tools=[get_weather], telemetry=False)
+        for _ in range(10)
+    ]
+
+    async def consume(agent: Agent):
+        async for _ in agent.arun("What is the weather in San Francisco?", stream=True):
+            pass
+
+    await asyncio.gather(*(consume(agent) for agent in agents))
+
+
+def team_delegation():
+    member = Agent(
+        id="weather-agent",
+        model=ReplayModel(responses=[weather_tool_call(), ANSWER]),
+        tools=[get_weather],
+        telemetry=False,
+    )
+    team = Team(
+        members=[member],
+        model=ReplayModel(
+            responses=[
+                {
+                    "tool_calls": [
+                        {
+                            "name": "delegate_task_to_member",
+                            "arguments": {"member_id": "weather-agent", "task_description": "Get the weather"},
+                        }
+                    ]
+                },
+                ANSWER,
+            ]
+        ),
+        telemetry=False,
+    )
+    return team.run("What is the weather in San Francisco?")
+
+
+def workflow_steps():
+    researcher = Agent(name="Researcher", model=ReplayModel(responses=[ANSWER]), telemetry=False)
+    writer = Agent(name="Writer", model=ReplayModel(responses=[ANSWER]), telemetry=False)
+    workflow = Workflow(
+        name="Weather Report",
+        steps=[Step(name="research", agent=researcher), Step(name="write", agent=writer)],
+        telemetry=False,
+    )
+    return workflow.run("Write a weather report for San Francisco")
+
+
+memory_db = InMemoryDb()
+
+
+def agent_with_memory_updates():
+    memory_manager = MemoryManager(
+        model=ReplayModel(
+            responses=[
+                {"tool_calls": [{"name": "add_memory", "arguments": {"memory": "The user lives in San Francisco"}}]},
+                "Memory added",
+            ]
+        ),
+        db=memory_db,
+    )
+    agent = Agent(
+        model=ReplayModel(responses=[ANSWER]),
+        db=memory_db,
+        memory_manager=memory_manager,
+        enable_user_memories=True,
+        telemetry=False,
+    )
+    return agent.run("I live in San Francisco, what is the weather there?", user_id="benchmark-user")
+
+
+storage_db = SqliteDb(db_file="tmp/replay_benchmark.db")
+
+
+def agent_with_storage():
+    agent = Agent(
+        model=ReplayModel(responses=[ANSWER]),
+        db=storage_db,
+        add_history_to_context=True,
+        telemetry=False,
+    )
+    # A new session every time, so the history doesn't grow across iterations
+    session_id = str(uuid4())
+    agent.run("What is the weather in San Francisco?", session_id=session_id)
+    return agent.run("And tomorrow?", session_id=session_id)
+
+
+BENCHMARKS: List[PerformanceEval] = [
+    PerformanceEval(name="Agent", func=simple_agent, num_iterations=100, telemetry=False),
+    PerformanceEval(name="Agent With Tool Calls", func=agent_with_tool_calls, num_iterations=100, telemetry=False),
+    PerformanceEval(name="Agent Streaming", func=streaming_agent, num_iterations=100, telemetry=False),
+    PerformanceEval(
+        name="Concurrent Async Streaming Agents", func=async_streaming_agents, num_iterations=20, telemetry=False
+    ),
+    PerformanceEval(name="Team Delegation", func=team_delegation, num_iterations=50, telemetry=False),
+    PerformanceEval(name="Workflow", func=workflow_steps, num_iterations=50, telemetry=False),
+    PerformanceEval(name="Memory Updates", func=agent_with_memory_updates, num_iterations=50, telemetry=False),
+    PerformanceEval(name="Storage", func=agent_with_storage, num_iterations=50, telemetry=False),
+]
+
+
+def run_suite() -> Dict[str, Dict[str, float]]:
+    results = {}
+    for benchmark in BENCHMARKS:
+        if asyncio.iscoroutinefunction(benchmark.func):
+            result = asyncio.run(benchmark.arun(print_summary=True))
+        else:
+            result = benchmark.run(print_summary=True)
+        results[benchmark.name] = {
+            "median_run_time": result.median_run_time,
+            "avg_run_time": result.avg_run_time,
+            "avg_memory_usage": result.avg_memory_usage,
+        }
+    return results
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float
+) -> List[str]:
+    """Benchmarks whose median run time grew more than `tolerance` over the baseline"""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        previous = baseline[name]["median_run_time"]
+        current = result["median_run_time"]
+        if previous > 0 and current > previous * (1 + tolerance):
+            regressions.append(
+                f"{name}: {previous * 1000:.2f}ms -> {current * 1000:.2f}ms (+{current / previous - 1:.0%})"
+            )
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", help="JSON file with the results to compare against")
+    parser.add_argument("--save-baseline", help="JSON file to save the results to")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown over the baseline")
+    args = parser.parse_args()
+
+    results = run_suite()
+
+    if args.save_baseline:
+        Path(args.save_baseline).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.save_baseline).write_text(json.dumps(results, indent=2))
+        print(f"Saved the results to {args.save_baseline}")
+
+    if args.baseline:
+        regressions = find_regressions(results, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        if regressions:
+            print("Regressions found:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("No regressions found")
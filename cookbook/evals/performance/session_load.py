@@ -0,0 +1,99 @@
+"""Memory and time to load an agent session with 10,000 messages, and to sum the metrics of its messages.
+
+A stored session is deserialized with `AgentSession.from_dict` every time it is read from the database, which
+rebuilds every Message, ToolExecution and Metrics of its runs.
+
+Run `pip install agno` to install dependencies. No API calls are made.
+"""
+
+import json
+
+from agno.eval.performance import PerformanceEval
+from agno.models.metrics import Metrics
+from agno.session import AgentSession
+
+NUM_RUNS = 1000
+# Every run stores 10 messages
+NUM_MESSAGES = NUM_RUNS * 10
+
+
+def build_run(index: int) -> dict:
+    call_id = f"call_{index}"
+    messages = [
+        {"role": "system", "content": "You are a weather assistant."},
+        {"role": "user", "content": f"Question {index}: what is the weather in nyc?"},
+        {
+            "role": "assistant",
+            "tool_calls": [
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": "get_weather", "arguments": '{"city": "nyc"}'},
+                }
+            ],
+            "metrics": {"input_tokens": 120, "output_tokens": 20, "total_tokens": 140, "duration": 0.5},
+        },
+        {
+            "role": "tool",
+            "content": "It might be cloudy in nyc",
+            "tool_call_id": call_id,
+            "tool_name": "get_weather",
+            "tool_args": {"city": "nyc"},
+            "metrics": {"duration": 0.01},
+        },
+        {
+            "role": "assistant",
+            "content": "It might be cloudy in nyc today.",
+            "metrics": {"input_tokens": 160, "output_tokens": 12, "total_tokens": 172, "duration": 0.4},
+        },
+    ] * 2
+    return {
+        "run_id": f"run_{index}",
+        "agent_id": "weather-agent",
+        "session_id": "session",
+        "content": "It might be cloudy in nyc today.",
+        "status": "COMPLETED",
+        "messages": [{**message, "created_at": 1700000000} for message in messages],
+        "tools": [
+            {
+                "tool_call_id": call_id,
+                "tool_name": "get_weather",
+                "tool_args": {"city": "nyc"},
+                "result": "It might be cloudy in nyc",
+                "metrics": {"duration": 0.01},
+            }
+        ],
+        "metrics": {"input_tokens": 560, "output_tokens": 64, "total_tokens": 624, "duration": 1.8},
+    }
+
+
+# The session as it is stored in the database
+stored_session = json.dumps(
+    {"session_id": "session", "agent_id": "weather-agent", "runs": [build_run(i) for i in range(NUM_RUNS)]}
+)
+session = AgentSession.from_dict(json.loads(stored_session))
+messages = [message for run in session.runs or [] for message in run.messages or []]
+assert len(messages) == NUM_MESSAGES
+
+
+def load_session():
+    return AgentSession.from_dict(json.loads(stored_session))
+
+
+def sum_message_metrics():
+    metrics = Metrics()
+    for message in messages:
+        metrics += message.metrics
+    return metrics
+
+
+session_load_perf = PerformanceEval(
+    name="Load a session with 10k messages", func=load_session, num_iterations=10, warmup_runs=1
+)
+metrics_sum_perf = PerformanceEval(
+    name="Sum the metrics of 10k messages", func=sum_message_metrics, num_iterations=50, warmup_runs=5
+)
+
+if __name__ == "__main__":
+    session_load_perf.run(print_results=True, print_summary=True)
+    metrics_sum_perf.run(print_results=True, print_summary=True)
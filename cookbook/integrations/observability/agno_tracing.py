@@ -0,0 +1,38 @@
+"""
+This example shows how to trace the stages of a run with agno's built-in tracing, to see where the time of a run went.
+
+Every run is traced as a tree of spans: session read, system message build, knowledge retrieval, every model call
+(with the time to first token when streaming), every tool execution, memory and summary updates and session write.
+Tracing is disabled, and costs nothing, until an exporter is added.
+
+1. Install dependencies: pip install openai agno
+2. Set your OpenAI API key: export OPENAI_API_KEY=<your-key>
+"""
+
+from agno.agent import Agent
+from agno.db.sqlite import SqliteDb
+from agno.models.openai import OpenAIChat
+from agno.tools.duckduckgo import DuckDuckGoTools
+from agno.tracing import ConsoleSpanExporter, add_span_exporter
+
+# Print the span tree of every run once it completes
+add_span_exporter(ConsoleSpanExporter())
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o-mini"),
+    tools=[DuckDuckGoTools()],
+    db=SqliteDb(db_file="tmp/agno_tracing.db"),
+    enable_user_memories=True,
+)
+
+agent.print_response("What is the latest news about AI agents?", stream=True)
+# agent.run 5412.10ms
+#   agent.read_session 0.41ms
+#   agent.build_system_message 0.38ms
+#   model.response 812.55ms
+#   tool.execute 1630.02ms
+#   model.response 2410.87ms
+#   agent.update_memories 551.30ms
+#     memory.create_user_memories 550.12ms
+#       model.response 548.96ms
+#   agent.save_session 2.15ms
@@ -0,0 +1,36 @@
+"""
+This example shows how to send agno's built-in tracing spans to any OpenTelemetry backend.
+
+The spans of a run are exported with your OpenTelemetry tracer provider, so they show up wherever it exports to:
+Jaeger, Grafana Tempo, Langfuse, Arize Phoenix, or any other OTLP collector.
+
+1. Install dependencies: pip install openai agno opentelemetry-sdk opentelemetry-exporter-otlp
+2. Run a local collector, e.g. Jaeger: docker run -p 16686:16686 -p 4318:4318 jaegertracing/all-in-one
+3. Set your OpenAI API key: export OPENAI_API_KEY=<your-key>
+4. Open http://localhost:16686 to see the traces
+"""
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.tracing import add_span_exporter
+from agno.tracing.otel import OpenTelemetrySpanExporter
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+tracer_provider = TracerProvider(resource=Resource.create({"service.name": "agno-agent"}))
+tracer_provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint="http://localhost:4318/v1/traces")))
+
+add_span_exporter(OpenTelemetrySpanExporter(tracer_provider=tracer_provider))
+
+
+def get_weather(city: str) -> str:
+    """Get the weather of a city."""
+    return f"It is sunny in {city}"
+
+
+agent = Agent(model=OpenAIChat(id="gpt-4o-mini"), tools=[get_weather])
+agent.print_response("What is the weather in Paris?", stream=True)
+
+tracer_provider.shutdown()
@@ -0,0 +1,27 @@
+"""This cookbook shows how to cache knowledge search results.
+
+Repeated questions are answered from the cache, without embedding the query or querying the vector db. Adding,
+updating or removing content invalidates the cached results.
+
+1. Run: `python cookbook/knowledge/basic_operations/17_search_cache.py` to run the cookbook
+"""
+
+from agno.agent import Agent
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.search_cache import SearchCache
+from agno.vectordb.lancedb import LanceDb
+
+knowledge = Knowledge(
+    name="Cached Knowledge Base",
+    vector_db=LanceDb(uri="tmp/lancedb", table_name="recipes"),
+    # Entries expire after 10 minutes, in case other processes write to the same table
+    search_cache=SearchCache(ttl=600, max_entries=500),
+)
+
+knowledge.add_content(url="https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf")
+
+agent = Agent(knowledge=knowledge, search_knowledge=True)
+agent.print_response("How do I make pad thai?", markdown=True)
+agent.print_response("How do I make pad thai?", markdown=True)
+
+print(knowledge.search_cache.get_metrics())
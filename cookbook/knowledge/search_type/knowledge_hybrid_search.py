@@ -0,0 +1,30 @@
+"""Hybrid search with any vector db.
+
+Knowledge keeps a local BM25 index of the ingested documents, and fuses its results with the vector db results by
+reciprocal rank fusion. This works with vector dbs without their own hybrid search, like ChromaDb.
+"""
+
+from agno.agent import Agent
+from agno.knowledge.hybrid import HybridSearch
+from agno.knowledge.knowledge import Knowledge
+from agno.vectordb.chroma import ChromaDb
+
+knowledge = Knowledge(
+    name="Hybrid Search Knowledge Base",
+    vector_db=ChromaDb(collection="recipes", path="tmp/chromadb", persistent_client=True),
+    # Weigh keyword matches twice as much as vector matches, and keep the keyword index across restarts
+    hybrid_search=HybridSearch(keyword_weight=2.0, path="tmp/keyword_index/recipes.json"),
+)
+
+knowledge.add_content(
+    url="https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf",
+)
+
+results = knowledge.search("chicken coconut soup", max_results=5)
+print("Hybrid Search Results:", results)
+
+agent = Agent(knowledge=knowledge, search_knowledge=True)
+agent.print_response("How do I make chicken and galangal in coconut milk soup?", markdown=True)
+
+# Latencies of the vector search, keyword search and fusion stages
+print(knowledge.hybrid_search.get_metrics())
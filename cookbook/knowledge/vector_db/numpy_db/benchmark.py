@@ -0,0 +1,86 @@
+"""Benchmark the recall and queries per second of the NumpyDb indexes against brute force search.
+
+Documents are random vectors drawn around cluster centers, so no embedder or API key is needed. Recall is the share
+of the exact top results (found by brute force) that an index returns.
+
+Run `pip install agno numpy` to install dependencies, and `pip install hnswlib` to benchmark the HNSW index as well.
+
+Usage:
+    python cookbook/knowledge/vector_db/numpy_db/benchmark.py
+    python cookbook/knowledge/vector_db/numpy_db/benchmark.py --rows 200000 --dimensions 384 --nprobe 16
+"""
+
+import argparse
+import time
+from typing import List, Optional, Set
+
+import numpy as np
+
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.vectordb.numpydb import HNSW, IVF, NumpyDb, VectorIndex
+
+
+def make_vectors(rows: int, dimensions: int, clusters: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dimensions))
+    vectors = centers[rng.integers(0, clusters, size=rows)] + rng.normal(scale=0.5, size=(rows, dimensions))
+    return vectors.astype(np.float32)
+
+
+def load(index: Optional[VectorIndex], vectors: np.ndarray) -> NumpyDb:
+    # Documents are added with their embeddings, so the embedder is never called
+    vector_db = NumpyDb(embedder=Embedder(dimensions=vectors.shape[1]), index=index)
+    documents = [Document(content=f"document {i}", embedding=vector.tolist()) for i, vector in enumerate(vectors)]
+    start = time.perf_counter()
+    vector_db._add_documents("benchmark", documents)
+    if index is not None:
+        vector_db.optimize()
+    print(f"  loaded {len(vectors)} rows in {time.perf_counter() - start:.2f}s")
+    return vector_db
+
+
+def run(vector_db: NumpyDb, queries: np.ndarray, limit: int) -> List[Set[str]]:
+    results = []
+    start = time.perf_counter()
+    for query in queries.tolist():
+        results.append({document.id for document in vector_db.search_by_embedding(query, limit=limit) if document.id})
+    elapsed = time.perf_counter() - start
+    print(f"  {len(queries) / elapsed:.0f} queries per second, {1000 * elapsed / len(queries):.2f}ms per query")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--dimensions", type=int, default=256)
+    parser.add_argument("--clusters", type=int, default=100)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, default=8)
+    parser.add_argument("--ef-search", type=int, default=64)
+    args = parser.parse_args()
+
+    vectors = make_vectors(args.rows, args.dimensions, args.clusters)
+    queries = make_vectors(args.queries, args.dimensions, args.clusters, seed=1)
+
+    print("Brute force")
+    exact = run(load(None, vectors), queries, args.limit)
+
+    indexes: List[VectorIndex] = [IVF(nprobe=args.nprobe, min_rows=0)]
+    try:
+        import hnswlib  # noqa: F401
+
+        indexes.append(HNSW(ef_search=args.ef_search, min_rows=0))
+    except ImportError:
+        print("hnswlib is not installed, skipping the HNSW index")
+
+    for index in indexes:
+        print(index)
+        found = run(load(index, vectors), queries, args.limit)
+        hits = sum(len(expected & result) for expected, result in zip(exact, found))
+        print(f"  recall@{args.limit}: {hits / sum(len(expected) for expected in exact):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+from agno.agent import Agent
+from agno.knowledge.knowledge import Knowledge
+from agno.vectordb.numpydb import IVF, NumpyDb
+
+# The collection is stored in tmp/numpydb/recipes. Leave out `path` to keep it in memory.
+# The IVF index is built once the collection has `min_rows` documents, smaller collections are searched exactly.
+knowledge = Knowledge(
+    name="Basic SDK Knowledge Base",
+    description="Agno 2.0 Knowledge Implementation with NumpyDb",
+    vector_db=NumpyDb(collection="recipes", path="tmp/numpydb", index=IVF(nprobe=8)),
+)
+
+knowledge.add_content(
+    name="Recipes",
+    url="https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf",
+    metadata={"doc_type": "recipe_book"},
+)
+
+agent = Agent(knowledge=knowledge)
+agent.print_response("List down the ingredients to make Massaman Gai", markdown=True)
+
+# Delete operations examples
+vector_db = knowledge.vector_db
+vector_db.delete_by_name("Recipes")
+# or
+vector_db.delete_by_metadata({"doc_type": "recipe_book"})
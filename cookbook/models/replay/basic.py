@@ -0,0 +1,25 @@
+"""The replay model returns scripted responses, without calling any provider. No API key is needed."""
+
+from agno.agent import Agent
+from agno.models.replay import ReplayModel
+
+
+def get_weather(city: str) -> str:
+    """Get the weather of a city."""
+    return f"It is sunny in {city}"
+
+
+agent = Agent(
+    model=ReplayModel(
+        responses=[
+            {"tool_calls": [{"name": "get_weather", "arguments": {"city": "Paris"}}]},
+            "It is sunny in Paris today.",
+        ],
+        # Simulate the latency of a provider
+        latency=0.5,
+        token_delay=0.05,
+    ),
+    tools=[get_weather],
+)
+
+agent.print_response("What is the weather in Paris?", stream=True)
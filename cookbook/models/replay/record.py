@@ -0,0 +1,18 @@
+"""Record the responses of a live model, then replay them offline.
+
+Run `pip install openai agno` to install dependencies. Recording needs an OpenAI API key, replaying doesn't.
+"""
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.models.replay import ReplayModel
+
+responses_file = "tmp/replay/horror_story.json"
+
+# Calls are forwarded to the live model, and its responses saved to the file
+recording_agent = Agent(model=ReplayModel(record_model=OpenAIChat(id="gpt-4o-mini"), responses_file=responses_file))
+recording_agent.print_response("Share a 2 sentence horror story")
+
+# The same responses are replayed from the file
+replay_agent = Agent(model=ReplayModel(responses_file=responses_file))
+replay_agent.print_response("Share a 2 sentence horror story")
@@ -0,0 +1,27 @@
+"""Keep large tool results out of the conversation.
+
+Results longer than `max_result_chars` are replaced with a preview and a handle. The agent gets a
+`get_tool_result_page` tool to read the rest of a result, page by page, only if it needs it.
+"""
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.tools.duckdb import DuckDbTools
+from agno.tools.file import FileTools
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o-mini"),
+    tools=[
+        # Query results over 20k characters are paged
+        DuckDbTools(max_result_chars=20_000),
+        FileTools(),
+    ],
+    # Default for the tools without their own limit
+    max_tool_result_chars=50_000,
+)
+
+agent.print_response(
+    "Load https://agno-public.s3.amazonaws.com/demo_data/IMDB-Movie-Data.csv into a table and list every movie "
+    "released in 2016 with a rating above 7",
+    markdown=True,
+)
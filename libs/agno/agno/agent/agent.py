@@ -3,9 +3,11 @@ from __future__ import annotations
 import asyncio
 from collections import ChainMap, deque
 from dataclasses import dataclass
+from functools import partial
 from os import getenv
 from textwrap import dedent
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -36,14 +38,13 @@ from agno.exceptions import (
     StopAgentRun,
 )
 from agno.guardrails import BaseGuardrail
-from agno.knowledge.knowledge import Knowledge
 from agno.knowledge.types import KnowledgeFilter
 from agno.media import Audio, File, Image, Video
-from agno.memory import MemoryManager
 from agno.models.base import Model
 from agno.models.message import Message, MessageReferences
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
+from agno.reasoning.helpers import ReasoningAgentCache
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.agent import (
     RunEvent,
@@ -65,6 +66,8 @@ from agno.run.team import TeamRunOutputEvent
 from agno.session import AgentSession, SessionSummaryManager
 from agno.tools import Toolkit
 from agno.tools.function import Function
+from agno.tools.spillover import add_result_page_tool
+from agno.tracing import get_current_span, traced
 from agno.utils.common import is_typed_dict, validate_typed_dict
 from agno.utils.events import (
     create_memory_update_completed_event,
@@ -99,12 +102,6 @@ from agno.utils.log import (
 )
 from agno.utils.merge_dict import merge_dictionaries
 from agno.utils.message import get_text_from_message
-from agno.utils.print_response.agent import (
-    aprint_response,
-    aprint_response_stream,
-    print_response,
-    print_response_stream,
-)
 from agno.utils.prompts import get_json_output_prompt, get_response_model_format_prompt
 from agno.utils.reasoning import (
     add_reasoning_metrics_to_metadata,
@@ -118,9 +115,52 @@ from agno.utils.response import (
     get_paused_content,
 )
 from agno.utils.safe_formatter import SafeFormatter
-from agno.utils.string import generate_id_from_name, parse_response_model_str
+from agno.utils.stream import ResponseStreamBuffers
+from agno.utils.string import generate_id_from_name, parse_response_model_str, substitute_variables
 from agno.utils.timer import Timer
 
+if TYPE_CHECKING:
+    # Optional subsystems are imported when first used, to keep `import agno.agent` fast
+    from agno.knowledge.knowledge import Knowledge
+    from agno.memory import MemoryManager
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import of the optional subsystems in the annotations of Agent.
+
+    The first access adds them to the module namespace. `typing.get_type_hints(Agent)` reads the namespace without
+    calling this function, so it raises a NameError until they were accessed, e.g. with
+    `from agno.agent.agent import Knowledge, MemoryManager`.
+    """
+    if name == "Knowledge":
+        from agno.knowledge.knowledge import Knowledge
+
+        globals()[name] = Knowledge
+        return Knowledge
+    elif name == "MemoryManager":
+        from agno.memory import MemoryManager
+
+        globals()[name] = MemoryManager
+        return MemoryManager
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def _span_attributes(agent: "Agent", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"agent.id": agent.id, "agent.name": agent.name}
+
+
+def _session_span_attributes(agent: "Agent", session_id: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"agent.id": agent.id, "agent.name": agent.name, "session.id": session_id}
+
+
+def _run_span_attributes(agent: "Agent", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {
+        "agent.id": agent.id,
+        "agent.name": agent.name,
+        "user.id": kwargs.get("user_id"),
+        "model.id": agent.model.id if agent.model is not None else None,
+    }
+
 
 @dataclass(init=False)
 class Agent:
@@ -218,6 +258,9 @@ class Agent:
 
     # A function that acts as middleware and is called around tool calls.
     tool_hooks: Optional[List[Callable]] = None
+    # Tool results longer than this many characters are replaced with a preview and a handle, and the model can read
+    # the rest with the `get_tool_result_page` tool. Applies to tools without their own `max_result_chars`.
+    max_tool_result_chars: Optional[int] = None
 
     # --- Agent Hooks ---
     # Functions called right after agent-session is loaded, before processing starts
@@ -239,6 +282,8 @@ class Agent:
     # Add a tool that allows the Model to search the knowledge base (aka Agentic RAG)
     # Added only if knowledge is provided.
     search_knowledge: bool = True
+    # If True, the knowledge search tool takes a list of queries, which are searched at once and their results merged
+    search_knowledge_multi_query: bool = False
     # Add a tool that allows the Agent to update Knowledge.
     update_knowledge: bool = False
     # Add a tool that allows the Model to get the tool call history.
@@ -395,6 +440,7 @@ class Agent:
         tool_call_limit: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
+        max_tool_result_chars: Optional[int] = None,
         pre_hooks: Optional[Union[List[Callable[..., Any]], List[BaseGuardrail]]] = None,
         post_hooks: Optional[Union[List[Callable[..., Any]], List[BaseGuardrail]]] = None,
         reasoning: bool = False,
@@ -404,6 +450,7 @@ class Agent:
         reasoning_max_steps: int = 10,
         read_chat_history: bool = False,
         search_knowledge: bool = True,
+        search_knowledge_multi_query: bool = False,
         update_knowledge: bool = False,
         read_tool_call_history: bool = False,
         send_media_to_model: bool = True,
@@ -498,6 +545,7 @@ class Agent:
         self.tool_call_limit = tool_call_limit
         self.tool_choice = tool_choice
         self.tool_hooks = tool_hooks
+        self.max_tool_result_chars = max_tool_result_chars
 
         # Initialize hooks with backward compatibility
         self.pre_hooks = pre_hooks
@@ -511,6 +559,7 @@ class Agent:
 
         self.read_chat_history = read_chat_history
         self.search_knowledge = search_knowledge
+        self.search_knowledge_multi_query = search_knowledge_multi_query
         self.update_knowledge = update_knowledge
         self.read_tool_call_history = read_tool_call_history
         self.send_media_to_model = send_media_to_model
@@ -572,11 +621,19 @@ class Agent:
         self._tools_for_model: Optional[List[Dict[str, Any]]] = None
         self._functions_for_model: Optional[Dict[str, Function]] = None
         self._rebuild_tools: bool = True
+        # If any function for the model takes media as a parameter
+        self._functions_need_media: bool = False
+
+        # Static sections of the system message, with the configuration they were built from
+        self._system_message_sections: Dict[str, Tuple[Any, Any]] = {}
 
         self._formatter: Optional[SafeFormatter] = None
 
         self._hooks_normalised = False
 
+        # Reasoning agents built from this agent's configuration, reused across runs
+        self._reasoning_cache = ReasoningAgentCache()
+
     def set_id(self) -> None:
         if self.id is None:
             self.id = generate_id_from_name(self.name)
@@ -666,6 +723,8 @@ class Agent:
             log_warning("Database not provided. Memories will not be stored.")
 
         if self.memory_manager is None:
+            from agno.memory import MemoryManager
+
             self.memory_manager = MemoryManager(model=self.model, db=self.db)
         else:
             if self.memory_manager.model is None:
@@ -1219,6 +1278,7 @@ class Agent:
         **kwargs: Any,
     ) -> Iterator[Union[RunOutputEvent, RunOutput]]: ...
 
+    @traced("agent.run", attributes=_run_span_attributes)
     def run(
         self,
         input: Union[str, List, Dict, Message, BaseModel, List[Message]],
@@ -1279,6 +1339,8 @@ class Agent:
             files=file_artifacts,
         )
 
+        get_current_span().set_attributes({"run.id": run_id, "session.id": session_id})
+
         # Read existing session from database
         agent_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
         self._update_metadata(session=agent_session)
@@ -1919,6 +1981,7 @@ class Agent:
         **kwargs: Any,
     ) -> AsyncIterator[Union[RunOutputEvent, RunOutput]]: ...
 
+    @traced("agent.run", attributes=_run_span_attributes)
     def arun(  # type: ignore
         self,
         input: Union[str, List, Dict, Message, BaseModel, List[Message]],
@@ -1979,6 +2042,8 @@ class Agent:
             files=file_artifacts,
         )
 
+        get_current_span().set_attributes({"run.id": run_id, "session.id": session_id})
+
         # Read existing session from storage
         agent_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
         self._update_metadata(session=agent_session)
@@ -2186,6 +2251,7 @@ class Agent:
         debug_mode: Optional[bool] = None,
     ) -> Iterator[RunOutputEvent]: ...
 
+    @traced("agent.run", attributes=_run_span_attributes)
     def continue_run(
         self,
         run_response: Optional[RunOutput] = None,
@@ -2233,6 +2299,8 @@ class Agent:
         # Initialize the Agent
         self.initialize_agent(debug_mode=debug_mode)
 
+        get_current_span().set_attribute("session.id", session_id)
+
         # Read existing session from storage
         agent_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
         self._update_metadata(session=agent_session)
@@ -2587,6 +2655,7 @@ class Agent:
         debug_mode: Optional[bool] = None,
     ) -> AsyncIterator[Union[RunOutputEvent, RunOutput]]: ...
 
+    @traced("agent.run", attributes=_run_span_attributes)
     def acontinue_run(  # type: ignore
         self,
         run_response: Optional[RunOutput] = None,
@@ -2633,6 +2702,8 @@ class Agent:
         # Initialize the Agent
         self.initialize_agent(debug_mode=debug_mode)
 
+        get_current_span().set_attribute("session.id", session_id)
+
         # Read existing session from storage
         agent_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
         self._update_metadata(session=agent_session)
@@ -3617,6 +3688,7 @@ class Agent:
             "reasoning_time_taken": 0.0,
         }
         model_response = ModelResponse(content="")
+        stream_buffers = ResponseStreamBuffers()
 
         stream_model_response = True
         if self.should_parse_structured_output:
@@ -3639,12 +3711,15 @@ class Agent:
                 run_response=run_response,
                 model_response=model_response,
                 model_response_event=model_response_event,
+                stream_buffers=stream_buffers,
                 reasoning_state=reasoning_state,
                 parse_structured_output=self.should_parse_structured_output,
                 stream_intermediate_steps=stream_intermediate_steps,
                 workflow_context=workflow_context,
             )
 
+        self._flush_stream_buffers(stream_buffers, model_response, run_response)
+
         # Determine reasoning completed
         if stream_intermediate_steps and reasoning_state["reasoning_started"]:
             all_reasoning_steps: List[ReasoningStep] = []
@@ -3694,6 +3769,7 @@ class Agent:
             "reasoning_time_taken": 0.0,
         }
         model_response = ModelResponse(content="")
+        stream_buffers = ResponseStreamBuffers()
 
         stream_model_response = True
         if self.should_parse_structured_output:
@@ -3718,6 +3794,7 @@ class Agent:
                 run_response=run_response,
                 model_response=model_response,
                 model_response_event=model_response_event,
+                stream_buffers=stream_buffers,
                 reasoning_state=reasoning_state,
                 parse_structured_output=self.should_parse_structured_output,
                 stream_intermediate_steps=stream_intermediate_steps,
@@ -3725,6 +3802,8 @@ class Agent:
             ):
                 yield event
 
+        self._flush_stream_buffers(stream_buffers, model_response, run_response)
+
         if stream_intermediate_steps and reasoning_state["reasoning_started"]:
             all_reasoning_steps: List[ReasoningStep] = []
             if run_response and run_response.reasoning_steps:
@@ -3757,17 +3836,34 @@ class Agent:
         if model_response.audio is not None:
             run_response.response_audio = model_response.audio
 
+    def _flush_stream_buffers(
+        self, stream_buffers: ResponseStreamBuffers, model_response: ModelResponse, run_response: RunOutput
+    ) -> None:
+        """Write the content streamed into the buffers to the model and run responses"""
+        stream_buffers.flush(model_response)
+        if stream_buffers.content:
+            run_response.content = model_response.content
+            run_response.content_type = "str"
+        if stream_buffers.reasoning_content:
+            run_response.reasoning_content = model_response.reasoning_content
+
     def _handle_model_response_chunk(
         self,
         session: AgentSession,
         run_response: RunOutput,
         model_response: ModelResponse,
         model_response_event: Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent],
+        stream_buffers: ResponseStreamBuffers,
         reasoning_state: Optional[Dict[str, Any]] = None,
         parse_structured_output: bool = False,
         stream_intermediate_steps: bool = False,
         workflow_context: Optional[Dict] = None,
     ) -> Iterator[RunOutputEvent]:
+        """Handle a chunk of a streamed model response.
+
+        Streamed content, reasoning and audio are accumulated in `stream_buffers`, which the caller flushes to the
+        model and run responses once the stream ends, see `_flush_stream_buffers`.
+        """
         if isinstance(model_response_event, tuple(get_args(RunOutputEvent))) or isinstance(
             model_response_event, tuple(get_args(TeamRunOutputEvent))
         ):
@@ -3795,23 +3891,14 @@ class Agent:
                         run_response.content = model_response.content
                         run_response.content_type = content_type
                     else:
-                        model_response.content = (model_response.content or "") + model_response_event.content
-                        run_response.content = model_response.content
-                        run_response.content_type = "str"
+                        stream_buffers.content.append(model_response_event.content)
 
                 # Process reasoning content
                 if model_response_event.reasoning_content is not None:
-                    model_response.reasoning_content = (
-                        model_response.reasoning_content or ""
-                    ) + model_response_event.reasoning_content
-                    run_response.reasoning_content = model_response.reasoning_content
+                    stream_buffers.reasoning_content.append(model_response_event.reasoning_content)
 
                 if model_response_event.redacted_reasoning_content is not None:
-                    if not model_response.reasoning_content:
-                        model_response.reasoning_content = model_response_event.redacted_reasoning_content
-                    else:
-                        model_response.reasoning_content += model_response_event.redacted_reasoning_content
-                    run_response.reasoning_content = model_response.reasoning_content
+                    stream_buffers.reasoning_content.append(model_response_event.redacted_reasoning_content)
 
                 # Handle provider data (one chunk)
                 if model_response_event.provider_data is not None:
@@ -3867,23 +3954,16 @@ class Agent:
                             try:
                                 import base64
 
-                                decoded_content = base64.b64decode(model_response_event.audio.content)
-                                if model_response.audio.content is None:
-                                    model_response.audio.content = b""
-                                model_response.audio.content += decoded_content
+                                stream_buffers.audio_content += base64.b64decode(model_response_event.audio.content)
                             except Exception:
                                 # If decode fails, encode string as bytes
-                                if model_response.audio.content is None:
-                                    model_response.audio.content = b""
-                                model_response.audio.content += model_response_event.audio.content.encode("utf-8")
+                                stream_buffers.audio_content += model_response_event.audio.content.encode("utf-8")
                         elif isinstance(model_response_event.audio.content, bytes):
                             # Content is already bytes
-                            if model_response.audio.content is None:
-                                model_response.audio.content = b""
-                            model_response.audio.content += model_response_event.audio.content
+                            stream_buffers.audio_content += model_response_event.audio.content
 
                     if model_response_event.audio.transcript is not None:
-                        model_response.audio.transcript += model_response_event.audio.transcript  # type: ignore
+                        stream_buffers.audio_transcript.append(model_response_event.audio.transcript)
 
                     if model_response_event.audio.expires_at is not None:
                         model_response.audio.expires_at = model_response_event.audio.expires_at  # type: ignore
@@ -4043,6 +4123,7 @@ class Agent:
                             run_response,
                         )
 
+    @traced("agent.update_memories", attributes=_span_attributes)
     def _make_memories_and_summaries(
         self,
         run_response: RunOutput,
@@ -4051,7 +4132,9 @@ class Agent:
         user_id: Optional[str] = None,
     ) -> Iterator[RunOutputEvent]:
         from concurrent.futures import ThreadPoolExecutor, as_completed
+        from contextvars import copy_context
 
+        # The updates run in a copy of the current context, so their tracing spans are nested under the run
         with ThreadPoolExecutor(max_workers=3) as executor:
             futures = []
 
@@ -4063,6 +4146,7 @@ class Agent:
                 log_debug("Creating user memories.")
                 futures.append(
                     executor.submit(
+                        copy_context().run,
                         self.memory_manager.create_user_memories,
                         message=user_message_str,
                         user_id=user_id,
@@ -4092,6 +4176,7 @@ class Agent:
                 if len(parsed_messages) > 0 and self.memory_manager is not None:
                     futures.append(
                         executor.submit(
+                            copy_context().run,
                             self.memory_manager.create_user_memories,
                             messages=parsed_messages,
                             user_id=user_id,
@@ -4106,6 +4191,7 @@ class Agent:
                 log_debug("Creating session summary.")
                 futures.append(
                     executor.submit(
+                        copy_context().run,
                         self.session_summary_manager.create_session_summary,  # type: ignore
                         session=session,
                     )
@@ -4129,6 +4215,7 @@ class Agent:
                         create_memory_update_completed_event(from_run_response=run_response), run_response
                     )
 
+    @traced("agent.update_memories", attributes=_span_attributes)
     async def _amake_memories_and_summaries(
         self,
         run_response: RunOutput,
@@ -4304,6 +4391,12 @@ class Agent:
                             run_response=run_response, async_mode=async_mode, knowledge_filters=knowledge_filters
                         )
                     )
+                elif self.search_knowledge_multi_query:
+                    agent_tools.append(
+                        self._get_multi_query_search_knowledge_base_function(
+                            run_response=run_response, async_mode=async_mode, knowledge_filters=knowledge_filters
+                        )
+                    )
                 else:
                     agent_tools.append(
                         self._get_search_knowledge_base_function(
@@ -4545,18 +4638,21 @@ class Agent:
                         except Exception as e:
                             log_warning(f"Could not add tool {tool}: {e}")
 
-        # Update the session state for the functions
-        if self._functions_for_model:
+            add_result_page_tool(self._functions_for_model, self._tools_for_model, self.max_tool_result_chars)
+
+            # Check once per build if any functions need media
             from inspect import signature
 
-            # Check if any functions need media before collecting
-            needs_media = any(
+            self._functions_need_media = any(
                 any(param in signature(func.entrypoint).parameters for param in ["images", "videos", "audios", "files"])
                 for func in self._functions_for_model.values()
                 if func.entrypoint is not None
             )
 
+        # Update the session state for the functions
+        if self._functions_for_model:
             # Only collect media if functions actually need them
+            needs_media = self._functions_need_media
             joint_images = self._collect_joint_images(run_response.input, session) if needs_media else None
             joint_files = self._collect_joint_files(run_response.input) if needs_media else None
             joint_audios = self._collect_joint_audios(run_response.input, session) if needs_media else None
@@ -4739,6 +4835,7 @@ class Agent:
         else:
             return Metrics()
 
+    @traced("agent.read_session", attributes=_session_span_attributes)
     def _read_or_create_session(
         self,
         session_id: str,
@@ -4874,6 +4971,7 @@ class Agent:
         log_debug(f"AgentSession {session_id_to_load} not found in db")
         return None
 
+    @traced("agent.save_session", attributes=_span_attributes)
     def save_session(self, session: AgentSession) -> None:
         """Save the AgentSession to storage
 
@@ -5093,10 +5191,6 @@ class Agent:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """Format a message with the session state variables."""
-        import re
-        import string
-        from copy import deepcopy
-
         if not isinstance(message, str):
             return message
 
@@ -5107,22 +5201,70 @@ class Agent:
             metadata or {},
             {"user_id": user_id} if user_id is not None else {},
         )
-        converted_msg = deepcopy(message)
-        for var_name in format_variables.keys():
-            # Only convert standalone {var_name} patterns, not nested ones
-            pattern = r"\{" + re.escape(var_name) + r"\}"
-            replacement = "${" + var_name + "}"
-            converted_msg = re.sub(pattern, replacement, converted_msg)
-
-        # Use Template to safely substitute variables
-        template = string.Template(converted_msg)
         try:
-            result = template.safe_substitute(format_variables)
-            return result
+            return substitute_variables(message, format_variables)
         except Exception as e:
             log_warning(f"Template substitution failed: {e}")
             return message
 
+    def _get_system_message_section(self, name: str, key: Any, build: Callable[[], Any]) -> Any:
+        """Return a static section of the system message, built again only when the values it is built from change."""
+        cached = self._system_message_sections.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        section = build()
+        self._system_message_sections[name] = (key, section)
+        return section
+
+    def _build_system_message_prefix(self, instructions: List[str]) -> str:
+        system_message_content = ""
+        # First add the Agent description if provided
+        if self.description is not None:
+            system_message_content += f"{self.description}\n"
+        # Then add the Agent role if provided
+        if self.role is not None:
+            system_message_content += f"\n<your_role>\n{self.role}\n</your_role>\n\n"
+        # Then add instructions for the Agent
+        if len(instructions) > 0:
+            system_message_content += "<instructions>"
+            if len(instructions) > 1:
+                for _upi in instructions:
+                    system_message_content += f"\n- {_upi}"
+            else:
+                system_message_content += "\n" + instructions[0]
+            system_message_content += "\n</instructions>\n\n"
+        # Then add instructions for the tools
+        if self._tool_instructions is not None:
+            for _ti in self._tool_instructions:
+                system_message_content += f"{_ti}\n"
+        return system_message_content
+
+    def _build_system_message_output_format(self) -> str:
+        model = cast(Model, self.model)
+        system_message_content = ""
+        # Add the system message from the Model
+        system_message_from_model = model.get_system_message_for_model(self._tools_for_model)
+        if system_message_from_model is not None:
+            system_message_content += system_message_from_model
+
+        # Add the JSON output prompt if output_schema is provided and the model does not support native structured outputs or JSON schema outputs
+        # or if use_json_mode is True
+        if (
+            self.output_schema is not None
+            and self.parser_model is None
+            and not (
+                (model.supports_native_structured_outputs or model.supports_json_schema_outputs)
+                and (not self.use_json_mode or self.structured_outputs is True)
+            )
+        ):
+            system_message_content += f"{get_json_output_prompt(self.output_schema)}"  # type: ignore
+
+        # Add the response model format prompt if output_schema is provided
+        if self.output_schema is not None and self.parser_model is not None:
+            system_message_content += f"{get_response_model_format_prompt(self.output_schema)}"
+        return system_message_content
+
+    @traced("agent.build_system_message", attributes=_span_attributes)
     def get_system_message(
         self,
         session: AgentSession,
@@ -5199,16 +5341,64 @@ class Agent:
                 instructions.extend(_instructions)
 
         # 3.1.1 Add instructions from the Model
-        _model_instructions = self.model.get_instructions_for_model(self._tools_for_model)
+        _model_instructions = self._get_system_message_section(
+            "model_instructions",
+            (self.model, self._tools_for_model),
+            lambda: self.model.get_instructions_for_model(self._tools_for_model),  # type: ignore
+        )
         if _model_instructions is not None:
             instructions.extend(_model_instructions)
 
-        # 3.2 Build a list of additional information for the system message
+        # 3.2 Build the static sections of the system message, which are rebuilt only when the configuration changes.
+        # They come first, so the system message shares a stable prefix across runs for provider prompt caching.
+        # 3.2.1 Add the Agent description, role, instructions and instructions for the tools
+        system_message_content: str = self._get_system_message_section(
+            "prefix",
+            (self.description, self.role, instructions, self._tool_instructions),
+            lambda: self._build_system_message_prefix(instructions),
+        )
+
+        # Format the system message with the session state variables
+        if self.resolve_in_context:
+            system_message_content = self._format_message_with_state_variables(
+                system_message_content,
+                user_id=user_id,
+                session_state=session_state,
+                dependencies=dependencies,
+                metadata=metadata,
+            )
+
+        # 3.2.2 Then add the expected output
+        if self.expected_output is not None:
+            system_message_content += f"<expected_output>\n{self.expected_output.strip()}\n</expected_output>\n\n"
+        # 3.2.3 Then add additional context
+        if self.additional_context is not None:
+            system_message_content += f"{self.additional_context}\n"
+        # 3.2.4 Then add the system message from the Model and the output format prompts
+        system_message_content += self._get_system_message_section(
+            "output_format",
+            (
+                self.model,
+                self.model.supports_native_structured_outputs,
+                self.model.supports_json_schema_outputs,
+                self._tools_for_model,
+                self.output_schema,
+                self.parser_model is None,
+                self.use_json_mode,
+                self.structured_outputs,
+            ),
+            self._build_system_message_output_format,
+        )
+
+        # 3.3 Build a list of additional information for the system message, which can change on every run
         additional_information: List[str] = []
-        # 3.2.1 Add instructions for using markdown
+        # 3.3.1 Add instructions for using markdown
         if self.markdown and self.output_schema is None:
             additional_information.append("Use markdown to format your answers.")
-        # 3.2.2 Add the current datetime
+        # 3.3.2 Add agent name if provided
+        if self.name is not None and self.add_name_to_context:
+            additional_information.append(f"Your name is: {self.name}.")
+        # 3.3.3 Add the current datetime
         if self.add_datetime_to_context:
             from datetime import datetime
 
@@ -5226,7 +5416,7 @@ class Agent:
 
             additional_information.append(f"The current time is {time}.")
 
-        # 3.2.3 Add the current location
+        # 3.3.4 Add the current location
         if self.add_location_to_context:
             from agno.utils.location import get_location
 
@@ -5238,11 +5428,7 @@ class Agent:
                 if location_str:
                     additional_information.append(f"Your approximate location is: {location_str}.")
 
-        # 3.2.4 Add agent name if provided
-        if self.name is not None and self.add_name_to_context:
-            additional_information.append(f"Your name is: {self.name}.")
-
-        # 3.2.5 Add information about agentic filters if enabled
+        # 3.3.5 Add information about agentic filters if enabled
         if self.knowledge is not None and self.enable_agentic_knowledge_filters:
             valid_filters = self.knowledge.get_valid_filters()
             if valid_filters:
@@ -5267,51 +5453,14 @@ class Agent:
                 """)
                 )
 
-        # 3.3 Build the default system message for the Agent.
-        system_message_content: str = ""
-        # 3.3.1 First add the Agent description if provided
-        if self.description is not None:
-            system_message_content += f"{self.description}\n"
-        # 3.3.2 Then add the Agent role if provided
-        if self.role is not None:
-            system_message_content += f"\n<your_role>\n{self.role}\n</your_role>\n\n"
-        # 3.3.4 Then add instructions for the Agent
-        if len(instructions) > 0:
-            system_message_content += "<instructions>"
-            if len(instructions) > 1:
-                for _upi in instructions:
-                    system_message_content += f"\n- {_upi}"
-            else:
-                system_message_content += "\n" + instructions[0]
-            system_message_content += "\n</instructions>\n\n"
         # 3.3.6 Add additional information
         if len(additional_information) > 0:
             system_message_content += "<additional_information>"
             for _ai in additional_information:
                 system_message_content += f"\n- {_ai}"
             system_message_content += "\n</additional_information>\n\n"
-        # 3.3.7 Then add instructions for the tools
-        if self._tool_instructions is not None:
-            for _ti in self._tool_instructions:
-                system_message_content += f"{_ti}\n"
 
-        # Format the system message with the session state variables
-        if self.resolve_in_context:
-            system_message_content = self._format_message_with_state_variables(
-                system_message_content,
-                user_id=user_id,
-                session_state=session_state,
-                dependencies=dependencies,
-                metadata=metadata,
-            )
-
-        # 3.3.7 Then add the expected output
-        if self.expected_output is not None:
-            system_message_content += f"<expected_output>\n{self.expected_output.strip()}\n</expected_output>\n\n"
-        # 3.3.8 Then add additional context
-        if self.additional_context is not None:
-            system_message_content += f"{self.additional_context}\n"
-        # 3.3.9 Then add memories to the system prompt
+        # 3.4 Then add memories to the system prompt
         if self.add_memories_to_context:
             _memory_manager_not_set = False
             if not user_id:
@@ -5352,7 +5501,7 @@ class Agent:
                     "</updating_user_memories>\n\n"
                 )
 
-        # 3.3.11 Then add a summary of the interaction to the system prompt
+        # 3.5 Then add a summary of the interaction to the system prompt
         if self.add_session_summary_to_context and session.summary is not None:
             system_message_content += "Here is a brief summary of your previous interactions:\n\n"
             system_message_content += "<summary_of_previous_interactions>\n"
@@ -5363,28 +5512,7 @@ class Agent:
                 "You should ALWAYS prefer information from this conversation over the past summary.\n\n"
             )
 
-        # 3.3.12 Add the system message from the Model
-        system_message_from_model = self.model.get_system_message_for_model(self._tools_for_model)
-        if system_message_from_model is not None:
-            system_message_content += system_message_from_model
-
-        # 3.3.13 Add the JSON output prompt if output_schema is provided and the model does not support native structured outputs or JSON schema outputs
-        # or if use_json_mode is True
-        if (
-            self.output_schema is not None
-            and self.parser_model is None
-            and not (
-                (self.model.supports_native_structured_outputs or self.model.supports_json_schema_outputs)
-                and (not self.use_json_mode or self.structured_outputs is True)
-            )
-        ):
-            system_message_content += f"{get_json_output_prompt(self.output_schema)}"  # type: ignore
-
-        # 3.3.14 Add the response model format prompt if output_schema is provided
-        if self.output_schema is not None and self.parser_model is not None:
-            system_message_content += f"{get_response_model_format_prompt(self.output_schema)}"
-
-        # 3.3.15 Add the session state to the system message
+        # 3.6 Add the session state to the system message
         if add_session_state_to_context and session_state is not None:
             system_message_content += self._get_formatted_session_state_for_system_message(session_state)
 
@@ -5855,6 +5983,7 @@ class Agent:
 
         return messages
 
+    @traced("agent.knowledge_retrieval", attributes=_span_attributes)
     def get_relevant_docs_from_knowledge(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None, **kwargs
     ) -> Optional[List[Union[Dict[str, Any], str]]]:
@@ -5913,6 +6042,8 @@ class Agent:
                 return None
 
             if num_documents is None:
+                from agno.knowledge.knowledge import Knowledge
+
                 if isinstance(self.knowledge, Knowledge):
                     num_documents = self.knowledge.max_results
 
@@ -5930,6 +6061,7 @@ class Agent:
             log_warning(f"Error searching knowledge base: {e}")
             raise e
 
+    @traced("agent.knowledge_retrieval", attributes=_span_attributes)
     async def aget_relevant_docs_from_knowledge(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None, **kwargs
     ) -> Optional[List[Union[Dict[str, Any], str]]]:
@@ -6162,7 +6294,10 @@ class Agent:
 
     def _calculate_run_metrics(self, messages: List[Message], current_run_metrics: Optional[Metrics] = None) -> Metrics:
         """Sum the metrics of the given messages into a Metrics object"""
-        metrics = current_run_metrics or Metrics()
+        # Sum into a new object, as the current run metrics keep their own time related metrics
+        metrics = Metrics()
+        if current_run_metrics is not None:
+            metrics += current_run_metrics
 
         assistant_message_role = self.model.assistant_message_role if self.model is not None else "assistant"
         for m in messages:
@@ -6274,9 +6409,7 @@ class Agent:
         reasoning_model: Optional[Model] = self.reasoning_model
         reasoning_model_provided = reasoning_model is not None
         if reasoning_model is None and self.model is not None:
-            from copy import deepcopy
-
-            reasoning_model = deepcopy(self.model)
+            reasoning_model = self._reasoning_cache.get_model_copy(self.model)
         if reasoning_model is None:
             log_warning("Reasoning error. Reasoning model is None, continuing regular session...")
             return
@@ -6290,11 +6423,17 @@ class Agent:
             from agno.reasoning.ollama import is_ollama_reasoning_model
             from agno.reasoning.openai import is_openai_reasoning_model
 
-            reasoning_agent = self.reasoning_agent or get_reasoning_agent(
-                reasoning_model=reasoning_model,
-                telemetry=self.telemetry,
-                debug_mode=self.debug_mode,
-                debug_level=self.debug_level,
+            reasoning_agent = self.reasoning_agent or self._reasoning_cache.get_agent(
+                "reasoning_model",
+                key=(self.telemetry, self.debug_mode, self.debug_level),
+                objects=(reasoning_model,),
+                build=partial(
+                    get_reasoning_agent,
+                    reasoning_model=reasoning_model,
+                    telemetry=self.telemetry,
+                    debug_mode=self.debug_mode,
+                    debug_level=self.debug_level,
+                ),
                 session_state=self.session_state,
                 dependencies=self.dependencies,
                 metadata=self.metadata,
@@ -6378,16 +6517,30 @@ class Agent:
             # Get default reasoning agent
             reasoning_agent: Optional[Agent] = self.reasoning_agent  # type: ignore
             if reasoning_agent is None:
-                reasoning_agent = get_default_reasoning_agent(
-                    reasoning_model=reasoning_model,
-                    min_steps=self.reasoning_min_steps,
-                    max_steps=self.reasoning_max_steps,
-                    tools=self.tools,
-                    tool_call_limit=self.tool_call_limit,
-                    use_json_mode=self.use_json_mode,
-                    telemetry=self.telemetry,
-                    debug_mode=self.debug_mode,
-                    debug_level=self.debug_level,
+                reasoning_agent = self._reasoning_cache.get_agent(
+                    "default",
+                    key=(
+                        self.reasoning_min_steps,
+                        self.reasoning_max_steps,
+                        self.tool_call_limit,
+                        self.use_json_mode,
+                        self.telemetry,
+                        self.debug_mode,
+                        self.debug_level,
+                    ),
+                    objects=(reasoning_model, self.tools, *(self.tools or [])),
+                    build=partial(
+                        get_default_reasoning_agent,
+                        reasoning_model=reasoning_model,
+                        min_steps=self.reasoning_min_steps,
+                        max_steps=self.reasoning_max_steps,
+                        tools=self.tools,
+                        tool_call_limit=self.tool_call_limit,
+                        use_json_mode=self.use_json_mode,
+                        telemetry=self.telemetry,
+                        debug_mode=self.debug_mode,
+                        debug_level=self.debug_level,
+                    ),
                     session_state=self.session_state,
                     dependencies=self.dependencies,
                     metadata=self.metadata,
@@ -6500,9 +6653,7 @@ class Agent:
         reasoning_model: Optional[Model] = self.reasoning_model
         reasoning_model_provided = reasoning_model is not None
         if reasoning_model is None and self.model is not None:
-            from copy import deepcopy
-
-            reasoning_model = deepcopy(self.model)
+            reasoning_model = self._reasoning_cache.get_model_copy(self.model)
         if reasoning_model is None:
             log_warning("Reasoning error. Reasoning model is None, continuing regular session...")
             return
@@ -6516,11 +6667,17 @@ class Agent:
             from agno.reasoning.ollama import is_ollama_reasoning_model
             from agno.reasoning.openai import is_openai_reasoning_model
 
-            reasoning_agent = self.reasoning_agent or get_reasoning_agent(
-                reasoning_model=reasoning_model,
-                telemetry=self.telemetry,
-                debug_mode=self.debug_mode,
-                debug_level=self.debug_level,
+            reasoning_agent = self.reasoning_agent or self._reasoning_cache.get_agent(
+                "reasoning_model",
+                key=(self.telemetry, self.debug_mode, self.debug_level),
+                objects=(reasoning_model,),
+                build=partial(
+                    get_reasoning_agent,
+                    reasoning_model=reasoning_model,
+                    telemetry=self.telemetry,
+                    debug_mode=self.debug_mode,
+                    debug_level=self.debug_level,
+                ),
                 session_state=self.session_state,
                 dependencies=self.dependencies,
                 metadata=self.metadata,
@@ -6604,16 +6761,30 @@ class Agent:
             # Get default reasoning agent
             reasoning_agent: Optional[Agent] = self.reasoning_agent  # type: ignore
             if reasoning_agent is None:
-                reasoning_agent = get_default_reasoning_agent(
-                    reasoning_model=reasoning_model,
-                    min_steps=self.reasoning_min_steps,
-                    max_steps=self.reasoning_max_steps,
-                    tools=self.tools,
-                    tool_call_limit=self.tool_call_limit,
-                    use_json_mode=self.use_json_mode,
-                    telemetry=self.telemetry,
-                    debug_mode=self.debug_mode,
-                    debug_level=self.debug_level,
+                reasoning_agent = self._reasoning_cache.get_agent(
+                    "default",
+                    key=(
+                        self.reasoning_min_steps,
+                        self.reasoning_max_steps,
+                        self.tool_call_limit,
+                        self.use_json_mode,
+                        self.telemetry,
+                        self.debug_mode,
+                        self.debug_level,
+                    ),
+                    objects=(reasoning_model, self.tools, *(self.tools or [])),
+                    build=partial(
+                        get_default_reasoning_agent,
+                        reasoning_model=reasoning_model,
+                        min_steps=self.reasoning_min_steps,
+                        max_steps=self.reasoning_max_steps,
+                        tools=self.tools,
+                        tool_call_limit=self.tool_call_limit,
+                        use_json_mode=self.use_json_mode,
+                        telemetry=self.telemetry,
+                        debug_mode=self.debug_mode,
+                        debug_level=self.debug_level,
+                    ),
                     session_state=self.session_state,
                     dependencies=self.dependencies,
                     metadata=self.metadata,
@@ -6784,6 +6955,7 @@ class Agent:
                     yield self._handle_event(create_parser_model_response_started_event(run_response), run_response)
 
                 parser_model_response = ModelResponse(content="")
+                stream_buffers = ResponseStreamBuffers()
                 parser_response_format = self._get_response_format(self.parser_model)
                 messages_for_parser_model = self._get_messages_for_parser_model_stream(
                     run_response, parser_response_format
@@ -6798,10 +6970,13 @@ class Agent:
                         run_response=run_response,
                         model_response=parser_model_response,
                         model_response_event=model_response_event,
+                        stream_buffers=stream_buffers,
                         parse_structured_output=True,
                         stream_intermediate_steps=stream_intermediate_steps,
                     )
 
+                self._flush_stream_buffers(stream_buffers, parser_model_response, run_response)
+
                 parser_model_response_message: Optional[Message] = None
                 for message in reversed(messages_for_parser_model):
                     if message.role == "assistant":
@@ -6829,6 +7004,7 @@ class Agent:
                     yield self._handle_event(create_parser_model_response_started_event(run_response), run_response)
 
                 parser_model_response = ModelResponse(content="")
+                stream_buffers = ResponseStreamBuffers()
                 parser_response_format = self._get_response_format(self.parser_model)
                 messages_for_parser_model = self._get_messages_for_parser_model_stream(
                     run_response, parser_response_format
@@ -6844,11 +7020,14 @@ class Agent:
                         run_response=run_response,
                         model_response=parser_model_response,
                         model_response_event=model_response_event,
+                        stream_buffers=stream_buffers,
                         parse_structured_output=True,
                         stream_intermediate_steps=stream_intermediate_steps,
                     ):
                         yield event
 
+                self._flush_stream_buffers(stream_buffers, parser_model_response, run_response)
+
                 parser_model_response_message: Optional[Message] = None
                 for message in reversed(messages_for_parser_model):
                     if message.role == "assistant":
@@ -6897,6 +7076,7 @@ class Agent:
         messages_for_output_model = self._get_messages_for_output_model(run_messages.messages)
 
         model_response = ModelResponse(content="")
+        stream_buffers = ResponseStreamBuffers()
 
         for model_response_event in self.output_model.response_stream(messages=messages_for_output_model):
             yield from self._handle_model_response_chunk(
@@ -6904,10 +7084,13 @@ class Agent:
                 run_response=run_response,
                 model_response=model_response,
                 model_response_event=model_response_event,
+                stream_buffers=stream_buffers,
                 workflow_context=workflow_context,
                 stream_intermediate_steps=stream_intermediate_steps,
             )
 
+        self._flush_stream_buffers(stream_buffers, model_response, run_response)
+
         if stream_intermediate_steps:
             yield self._handle_event(create_output_model_response_completed_event(run_response), run_response)
 
@@ -6950,6 +7133,7 @@ class Agent:
         messages_for_output_model = self._get_messages_for_output_model(run_messages.messages)
 
         model_response = ModelResponse(content="")
+        stream_buffers = ResponseStreamBuffers()
 
         model_response_stream = self.output_model.aresponse_stream(messages=messages_for_output_model)
 
@@ -6959,11 +7143,14 @@ class Agent:
                 run_response=run_response,
                 model_response=model_response,
                 model_response_event=model_response_event,
+                stream_buffers=stream_buffers,
                 workflow_context=workflow_context,
                 stream_intermediate_steps=stream_intermediate_steps,
             ):
                 yield event
 
+        self._flush_stream_buffers(stream_buffers, model_response, run_response)
+
         if stream_intermediate_steps:
             yield self._handle_event(create_output_model_response_completed_event(run_response), run_response)
 
@@ -7006,7 +7193,7 @@ class Agent:
             Returns:
                 str: A string indicating the status of the task.
             """
-            self.memory_manager = cast(MemoryManager, self.memory_manager)
+            self.memory_manager = cast("MemoryManager", self.memory_manager)
             response = self.memory_manager.update_memory_task(task=task, user_id=user_id)
 
             return response
@@ -7022,7 +7209,7 @@ class Agent:
             Returns:
                 str: A string indicating the status of the task.
             """
-            self.memory_manager = cast(MemoryManager, self.memory_manager)
+            self.memory_manager = cast("MemoryManager", self.memory_manager)
             response = await self.memory_manager.aupdate_memory_task(task=task, user_id=user_id)
             return response
 
@@ -7176,6 +7363,107 @@ class Agent:
 
         return Function.from_callable(search_knowledge_base_function, name="search_knowledge_base")
 
+    def _get_relevant_docs_for_queries(
+        self, queries: List[str], filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[List[Union[Dict[str, Any], str]]]:
+        """Get relevant docs for several queries, searching them together when the knowledge base supports it."""
+        if self.knowledge_retriever is not None or not hasattr(self.knowledge, "search_many"):
+            docs: List[Union[Dict[str, Any], str]] = []
+            for query in queries:
+                docs.extend(self.get_relevant_docs_from_knowledge(query=query, filters=filters) or [])
+            return docs or None
+
+        valid_filters, invalid_keys = self.knowledge.validate_filters(filters)  # type: ignore
+        if invalid_keys:
+            log_warning(f"Invalid filter keys provided: {invalid_keys}. These filters will be ignored.")
+            filters = valid_filters
+        relevant_docs = self.knowledge.search_many(queries=queries, filters=filters)  # type: ignore
+        return [doc.to_dict() for doc in relevant_docs] or None
+
+    async def _aget_relevant_docs_for_queries(
+        self, queries: List[str], filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[List[Union[Dict[str, Any], str]]]:
+        """Get relevant docs for several queries asynchronously, searching them together when possible."""
+        if self.knowledge_retriever is not None or not hasattr(self.knowledge, "async_search_many"):
+            results = await asyncio.gather(
+                *[self.aget_relevant_docs_from_knowledge(query=query, filters=filters) for query in queries]
+            )
+            docs: List[Union[Dict[str, Any], str]] = [doc for result in results for doc in result or []]
+            return docs or None
+
+        valid_filters, invalid_keys = self.knowledge.validate_filters(filters)  # type: ignore
+        if invalid_keys:
+            log_warning(f"Invalid filter keys provided: {invalid_keys}. These filters will be ignored.")
+            filters = valid_filters
+        relevant_docs = await self.knowledge.async_search_many(queries=queries, filters=filters)  # type: ignore
+        return [doc.to_dict() for doc in relevant_docs] or None
+
+    def _get_multi_query_search_knowledge_base_function(
+        self, run_response: RunOutput, knowledge_filters: Optional[Dict[str, Any]] = None, async_mode: bool = False
+    ) -> Function:
+        """Factory function to create a search_knowledge_base function taking several queries."""
+
+        def search_knowledge_base(queries: List[str]) -> str:
+            """Use this function to search the knowledge base for information. Pass all the queries you need at once,
+            e.g. different phrasings of a question or its sub-questions.
+
+            Args:
+                queries: The queries to search for.
+
+            Returns:
+                str: A string containing the response from the knowledge base.
+            """
+            retrieval_timer = Timer()
+            retrieval_timer.start()
+            docs_from_knowledge = self._get_relevant_docs_for_queries(queries=queries, filters=knowledge_filters)
+            if docs_from_knowledge is not None:
+                references = MessageReferences(
+                    query="; ".join(queries), references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
+                )
+                if run_response.references is None:
+                    run_response.references = []
+                run_response.references.append(references)
+            retrieval_timer.stop()
+            log_debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
+
+            if docs_from_knowledge is None:
+                return "No documents found"
+            return self._convert_documents_to_string(docs_from_knowledge)
+
+        async def asearch_knowledge_base(queries: List[str]) -> str:
+            """Use this function to search the knowledge base for information. Pass all the queries you need at once,
+            e.g. different phrasings of a question or its sub-questions.
+
+            Args:
+                queries: The queries to search for.
+
+            Returns:
+                str: A string containing the response from the knowledge base.
+            """
+            retrieval_timer = Timer()
+            retrieval_timer.start()
+            docs_from_knowledge = await self._aget_relevant_docs_for_queries(queries=queries, filters=knowledge_filters)
+            if docs_from_knowledge is not None:
+                references = MessageReferences(
+                    query="; ".join(queries), references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
+                )
+                if run_response.references is None:
+                    run_response.references = []
+                run_response.references.append(references)
+            retrieval_timer.stop()
+            log_debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
+
+            if docs_from_knowledge is None:
+                return "No documents found"
+            return self._convert_documents_to_string(docs_from_knowledge)
+
+        if async_mode:
+            search_knowledge_base_function = asearch_knowledge_base
+        else:
+            search_knowledge_base_function = search_knowledge_base  # type: ignore
+
+        return Function.from_callable(search_knowledge_base_function, name="search_knowledge_base")
+
     def _search_knowledge_base_with_agentic_filters_function(
         self, run_response: RunOutput, knowledge_filters: Optional[Dict[str, Any]] = None, async_mode: bool = False
     ) -> Function:
@@ -7387,6 +7675,9 @@ class Agent:
         if stream_intermediate_steps is None:
             stream_intermediate_steps = self.stream_intermediate_steps or False
 
+        # Printing needs rich, which is only imported when printing
+        from agno.utils.print_response.agent import print_response, print_response_stream
+
         if stream:
             print_response_stream(
                 agent=self,
@@ -7487,6 +7778,8 @@ class Agent:
         if stream_intermediate_steps is None:
             stream_intermediate_steps = self.stream_intermediate_steps or False
 
+        from agno.utils.print_response.agent import aprint_response, aprint_response_stream
+
         if stream:
             await aprint_response_stream(
                 agent=self,
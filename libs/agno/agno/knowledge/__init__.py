@@ -1,5 +1,17 @@
-from agno.knowledge.knowledge import Knowledge
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agno.knowledge.knowledge import Knowledge
 
 __all__ = [
     "Knowledge",
 ]
+
+
+def __getattr__(name: str):
+    """Lazy import of Knowledge, so submodules like agno.knowledge.types can be imported without its dependencies."""
+    if name == "Knowledge":
+        from agno.knowledge.knowledge import Knowledge
+
+        return Knowledge
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -1,30 +1,77 @@
-from typing import List
+from typing import Iterator, List, Optional
 
-from agno.knowledge.chunking.strategy import ChunkingStrategy
+from agno.knowledge.chunking.strategy import ChunkingStrategy, TextSource, iter_clean_text, iter_text
+from agno.knowledge.chunking.tokenizer import TOKEN_LOOKAHEAD_CHARS, Tokenizer
 from agno.knowledge.document.base import Document
+from agno.knowledge.embedder.base import Embedder
 
 
 class FixedSizeChunking(ChunkingStrategy):
-    """Chunking strategy that splits text into fixed-size chunks with optional overlap"""
+    """Chunking strategy that splits text into fixed-size chunks with optional overlap
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    `chunk_size` and `overlap` are measured in characters, or in tokens when a `tokenizer` is given. Passing an
+    `embedder` uses the tokenizer of its model, so chunks fit the embedding model's input limit.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 5000,
+        overlap: int = 0,
+        tokenizer: Optional[Tokenizer] = None,
+        embedder: Optional[Embedder] = None,
+    ):
         # overlap must be less than chunk size
         if overlap >= chunk_size:
             raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
 
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.tokenizer = tokenizer or (embedder.get_tokenizer() if embedder else None)
 
     def chunk(self, document: Document) -> List[Document]:
         """Split document into fixed-size chunks with optional overlap"""
-        content = self.clean_text(document.content)
-        content_length = len(content)
-        chunked_documents: List[Document] = []
+        return list(self._iter_chunks(iter([self.clean_text(document.content)]), document))
+
+    def chunk_stream(self, source: TextSource, document: Optional[Document] = None) -> Iterator[Document]:
+        """Split text read incrementally from `source` into fixed-size chunks with optional overlap"""
+        return self._iter_chunks(iter_clean_text(iter_text(source)), document or Document(content=""))
+
+    def _iter_chunks(self, blocks: Iterator[str], document: Document) -> Iterator[Document]:
+        # Only the text from the start of the current chunk onwards is kept in the buffer
+        content = ""
+        exhausted = False
         chunk_number = 1
         chunk_meta_data = document.meta_data
         start = 0
-        while start + self.overlap < content_length:
-            end = min(start + self.chunk_size, content_length)
+        # Number of characters past the start of a chunk needed to find its end
+        lookahead = self.chunk_size if self.tokenizer is None else self.chunk_size * TOKEN_LOOKAHEAD_CHARS
+        offsets: List[int] = []
+        while True:
+            # Read until we can look one character past the lookahead, or until the end of the text
+            while not exhausted and len(content) - start <= lookahead:
+                block = next(blocks, None)
+                if block is None:
+                    exhausted = True
+                else:
+                    content = content[start:] + block
+                    start = 0
+
+            content_length = len(content)
+            if self.tokenizer is None:
+                if start + self.overlap >= content_length:
+                    break
+                end = min(start + self.chunk_size, content_length)
+            else:
+                if start >= content_length:
+                    break
+                window = content[start : start + lookahead]
+                split, offsets = self.tokenizer.split_at(window, self.chunk_size)
+                if split == len(window) and start + len(window) < content_length:
+                    # The window holds less than a full chunk of tokens but there is more text: look further
+                    lookahead *= 2
+                    continue
+                end = start + max(split, 1)
+            hard_end = end
 
             # Ensure we're not splitting a word in half
             if end < content_length:
@@ -33,7 +80,7 @@ class FixedSizeChunking(ChunkingStrategy):
 
             # If the entire chunk is a word, then just split it at chunk_size
             if end == start:
-                end = start + self.chunk_size
+                end = hard_end
 
             chunk = content[start:end]
             meta_data = chunk_meta_data.copy()
@@ -44,14 +91,25 @@ class FixedSizeChunking(ChunkingStrategy):
             elif document.name:
                 chunk_id = f"{document.name}_{chunk_number}"
             meta_data["chunk_size"] = len(chunk)
-            chunked_documents.append(
-                Document(
-                    id=chunk_id,
-                    name=document.name,
-                    meta_data=meta_data,
-                    content=chunk,
-                )
+            yield Document(
+                id=chunk_id,
+                name=document.name,
+                meta_data=meta_data,
+                content=chunk,
             )
             chunk_number += 1
-            start = end - self.overlap
-        return chunked_documents
+            if exhausted and end >= content_length:
+                break
+
+            if self.tokenizer is None:
+                next_start = end - self.overlap
+            elif not self.overlap:
+                next_start = end
+            else:
+                # Step back `overlap` tokens from the end of the chunk
+                tokens_in_chunk = self.tokenizer.tokens_before(offsets, end - start)
+                next_start = (
+                    start + offsets[tokens_in_chunk - self.overlap] if tokens_in_chunk > self.overlap else start
+                )
+            # Always move forward, even if the overlap is larger than the chunk we just cut
+            start = next_start if next_start > start else end
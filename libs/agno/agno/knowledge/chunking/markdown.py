@@ -1,6 +1,6 @@
 import os
 import tempfile
-from typing import List
+from typing import List, Optional
 
 try:
     from unstructured.chunking.title import chunk_by_title  # type: ignore
@@ -9,15 +9,52 @@ except ImportError:
     raise ImportError("`unstructured` not installed. Please install it using `pip install unstructured markdown`")
 
 from agno.knowledge.chunking.strategy import ChunkingStrategy
+from agno.knowledge.chunking.tokenizer import Tokenizer
 from agno.knowledge.document.base import Document
+from agno.knowledge.embedder.base import Embedder
 
 
 class MarkdownChunking(ChunkingStrategy):
-    """A chunking strategy that splits markdown based on structure like headers, paragraphs and sections"""
-
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    """A chunking strategy that splits markdown based on structure like headers, paragraphs and sections
+
+    `chunk_size` and `overlap` are measured in characters, or in tokens when a `tokenizer` is given. Passing an
+    `embedder` uses the tokenizer of its model, so chunks fit the embedding model's input limit.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 5000,
+        overlap: int = 0,
+        tokenizer: Optional[Tokenizer] = None,
+        embedder: Optional[Embedder] = None,
+    ):
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.tokenizer = tokenizer or (embedder.get_tokenizer() if embedder else None)
+
+    def _size(self, text: str) -> int:
+        """Size of the text in the unit of chunk_size: tokens when a tokenizer is set, characters otherwise"""
+        if self.tokenizer is None:
+            return len(text)
+        return self.tokenizer.count_tokens(text)
+
+    def _split_section(self, section: str) -> List[str]:
+        """Split a section holding more than chunk_size tokens at word boundaries"""
+        if self.tokenizer is None:
+            return [section]
+        parts = []
+        while section:
+            split, _ = self.tokenizer.split_at(section, self.chunk_size)
+            if split < len(section):
+                # Don't split a word in half, unless the section starts with a word longer than a chunk
+                word_end = max(section.rfind(" ", 0, split + 1), section.rfind("\n", 0, split + 1))
+                if word_end > 0:
+                    split = word_end
+            part = section[: max(split, 1)]
+            if part.strip():
+                parts.append(part.strip())
+            section = section[max(split, 1) :]
+        return parts
 
     def _partition_markdown_content(self, content: str) -> List[str]:
         """
@@ -37,12 +74,16 @@ class MarkdownChunking(ChunkingStrategy):
                 if not elements:
                     return self.clean_text(content).split("\n\n")
 
+                # unstructured sizes chunks in characters, so assume ~4 characters per token in token mode.
+                # Sections that still hold too many tokens are split afterwards.
+                max_characters = self.chunk_size if self.tokenizer is None else self.chunk_size * 4
+
                 # Chunk by title with some default values
                 chunked_elements = chunk_by_title(
                     elements=elements,
-                    max_characters=self.chunk_size,
-                    new_after_n_chars=int(self.chunk_size * 0.8),
-                    combine_text_under_n_chars=self.chunk_size,
+                    max_characters=max_characters,
+                    new_after_n_chars=int(max_characters * 0.8),
+                    combine_text_under_n_chars=max_characters,
                     overlap=0,
                 )
 
@@ -69,11 +110,13 @@ class MarkdownChunking(ChunkingStrategy):
 
     def chunk(self, document: Document) -> List[Document]:
         """Split markdown document into chunks based on markdown structure"""
-        if not document.content or len(document.content) <= self.chunk_size:
+        if not document.content or self._size(document.content) <= self.chunk_size:
             return [document]
 
         # Split using markdown chunking logic, or fallback to paragraphs
         sections = self._partition_markdown_content(document.content)
+        if self.tokenizer is not None:
+            sections = [part for section in sections for part in self._split_section(section.strip())]
 
         chunks: List[Document] = []
         current_chunk = []
@@ -83,7 +126,7 @@ class MarkdownChunking(ChunkingStrategy):
 
         for section in sections:
             section = section.strip()
-            section_size = len(section)
+            section_size = self._size(section)
 
             if current_size + section_size <= self.chunk_size:
                 current_chunk.append(section)
@@ -128,7 +171,12 @@ class MarkdownChunking(ChunkingStrategy):
             for i in range(len(chunks)):
                 if i > 0:
                     # Add overlap from previous chunk
-                    prev_text = chunks[i - 1].content[-self.overlap :]
+                    if self.tokenizer is None:
+                        prev_text = chunks[i - 1].content[-self.overlap :]
+                    else:
+                        offsets = self.tokenizer.token_offsets(chunks[i - 1].content)
+                        prev_start = offsets[-self.overlap] if len(offsets) > self.overlap else 0
+                        prev_text = chunks[i - 1].content[prev_start:]
                     meta_data = chunk_meta_data.copy()
                     meta_data["chunk"] = chunks[i].meta_data["chunk"]
                     chunk_id = chunks[i].id
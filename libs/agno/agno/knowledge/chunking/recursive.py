@@ -1,14 +1,26 @@
 import warnings
-from typing import List
+from typing import Iterator, List, Optional
 
-from agno.knowledge.chunking.strategy import ChunkingStrategy
+from agno.knowledge.chunking.strategy import ChunkingStrategy, TextSource, iter_clean_text, iter_text
+from agno.knowledge.chunking.tokenizer import TOKEN_LOOKAHEAD_CHARS, Tokenizer
 from agno.knowledge.document.base import Document
+from agno.knowledge.embedder.base import Embedder
 
 
 class RecursiveChunking(ChunkingStrategy):
-    """Chunking strategy that recursively splits text into chunks by finding natural break points"""
+    """Chunking strategy that recursively splits text into chunks by finding natural break points
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    `chunk_size` and `overlap` are measured in characters, or in tokens when a `tokenizer` is given. Passing an
+    `embedder` uses the tokenizer of its model, so chunks fit the embedding model's input limit.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 5000,
+        overlap: int = 0,
+        tokenizer: Optional[Tokenizer] = None,
+        embedder: Optional[Embedder] = None,
+    ):
         # overlap must be less than chunk size
         if overlap >= chunk_size:
             raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
@@ -21,26 +33,62 @@ class RecursiveChunking(ChunkingStrategy):
 
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.tokenizer = tokenizer or (embedder.get_tokenizer() if embedder else None)
 
     def chunk(self, document: Document) -> List[Document]:
         """Recursively chunk text by finding natural break points"""
-        if len(document.content) <= self.chunk_size:
+        if self.tokenizer is None:
+            if len(document.content) <= self.chunk_size:
+                return [document]
+        elif self.tokenizer.count_tokens(document.content) <= self.chunk_size:
             return [document]
 
-        chunks: List[Document] = []
+        return list(self._iter_chunks(iter([self.clean_text(document.content)]), document))
+
+    def chunk_stream(self, source: TextSource, document: Optional[Document] = None) -> Iterator[Document]:
+        """Recursively chunk text read incrementally from `source` by finding natural break points"""
+        return self._iter_chunks(iter_clean_text(iter_text(source)), document or Document(content=""))
+
+    def _iter_chunks(self, blocks: Iterator[str], document: Document) -> Iterator[Document]:
+        # Only the text from the start of the current chunk onwards is kept in the buffer
+        content = ""
+        exhausted = False
         start = 0
         chunk_meta_data = document.meta_data
         chunk_number = 1
-        content = self.clean_text(document.content)
+        # Number of characters past the start of a chunk needed to find its end
+        lookahead = self.chunk_size if self.tokenizer is None else self.chunk_size * TOKEN_LOOKAHEAD_CHARS
+        offsets: List[int] = []
 
-        while start < len(content):
-            end = min(start + self.chunk_size, len(content))
+        while True:
+            # Read until the buffer holds more than the lookahead, or until the end of the text
+            while not exhausted and len(content) - start <= lookahead:
+                block = next(blocks, None)
+                if block is None:
+                    exhausted = True
+                else:
+                    content = content[start:] + block
+                    start = 0
+
+            if start >= len(content):
+                break
+
+            if self.tokenizer is None:
+                end = min(start + self.chunk_size, len(content))
+            else:
+                window = content[start : start + lookahead]
+                split, offsets = self.tokenizer.split_at(window, self.chunk_size)
+                if split == len(window) and start + len(window) < len(content):
+                    # The window holds less than a full chunk of tokens but there is more text: look further
+                    lookahead *= 2
+                    continue
+                end = start + max(split, 1)
 
             if end < len(content):
                 for sep in ["\n", "."]:
-                    last_sep = content[start:end].rfind(sep)
+                    last_sep = content.rfind(sep, start, end)
                     if last_sep != -1:
-                        end = start + last_sep + 1
+                        end = last_sep + 1
                         break
 
             chunk = content[start:end]
@@ -51,13 +99,21 @@ class RecursiveChunking(ChunkingStrategy):
                 chunk_id = f"{document.id}_{chunk_number}"
             chunk_number += 1
             meta_data["chunk_size"] = len(chunk)
-            chunks.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk))
+            yield Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk)
 
-            new_start = end - self.overlap
-            if new_start <= start:  # Prevent infinite loop
-                new_start = min(
-                    len(content), start + max(1, self.chunk_size // 10)
-                )  # Move forward by at least 10% of chunk size
+            if self.tokenizer is None:
+                new_start = end - self.overlap
+                if new_start <= start:  # Prevent infinite loop
+                    new_start = min(
+                        len(content), start + max(1, self.chunk_size // 10)
+                    )  # Move forward by at least 10% of chunk size
+            else:
+                if exhausted and end >= len(content):
+                    break
+                new_start = end
+                if self.overlap:
+                    # Step back `overlap` tokens from the end of the chunk
+                    tokens_in_chunk = self.tokenizer.tokens_before(offsets, end - start)
+                    if tokens_in_chunk > self.overlap:
+                        new_start = max(start + offsets[tokens_in_chunk - self.overlap], start + 1)
             start = new_start
-
-        return chunks
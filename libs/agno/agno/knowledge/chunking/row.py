@@ -1,8 +1,11 @@
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 
-from agno.knowledge.chunking.strategy import ChunkingStrategy
+from agno.knowledge.chunking.strategy import ChunkingStrategy, TextSource, iter_text
 from agno.knowledge.document.base import Document
 
+# Characters str.splitlines treats as line boundaries
+LINE_BOUNDARIES = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
 
 class RowChunking(ChunkingStrategy):
     def __init__(self, skip_header: bool = False, clean_rows: bool = True):
@@ -16,24 +19,46 @@ class RowChunking(ChunkingStrategy):
         if not isinstance(document.content, str):
             raise ValueError("Document content must be a string")
 
-        rows = document.content.splitlines()
+        return list(self._iter_chunks(document.content.splitlines(), document))
+
+    def chunk_stream(self, source: TextSource, document: Optional[Document] = None) -> Iterator[Document]:
+        """Yield one chunk per row of the text read incrementally from `source`"""
+        return self._iter_chunks(self._iter_lines(iter_text(source)), document or Document(content=""))
 
-        if self.skip_header and rows:
-            rows = rows[1:]
-            start_index = 2
-        else:
-            start_index = 1
+    def _iter_lines(self, blocks: Iterable[str]) -> Iterator[str]:
+        """Split blocks of text into the same lines as str.splitlines would for the whole text"""
+        partial = ""
+        after_carriage_return = False
+        for block in blocks:
+            # A "\r\n" may be split across two blocks
+            if after_carriage_return and block.startswith("\n"):
+                block = block[1:]
+            after_carriage_return = False
+            if not block:
+                continue
 
-        chunks = []
+            text = partial + block
+            lines = text.splitlines()
+            # The last line may continue in the next block
+            partial = "" if text[-1] in LINE_BOUNDARIES else lines.pop()
+            after_carriage_return = text.endswith("\r")
+            yield from lines
+        if partial:
+            yield partial
+
+    def _iter_chunks(self, rows: Iterable[str], document: Document) -> Iterator[Document]:
         for i, row in enumerate(rows):
+            if self.skip_header and i == 0:
+                continue
+
             if self.clean_rows:
                 chunk_content = " ".join(row.split())  # Normalize internal whitespace
             else:
                 chunk_content = row.strip()
 
             if chunk_content:  # Skip empty rows
+                row_number = i + 1
                 meta_data = document.meta_data.copy()
-                meta_data["row_number"] = start_index + i  # Preserve logical row numbering
-                chunk_id = f"{document.id}_row_{start_index + i}" if document.id else None
-                chunks.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk_content))
-        return chunks
+                meta_data["row_number"] = row_number  # Preserve logical row numbering
+                chunk_id = f"{document.id}_row_{row_number}" if document.id else None
+                yield Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk_content)
@@ -1,35 +1,123 @@
+import codecs
+import re
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, List, Optional, Union
 
 from agno.knowledge.document.base import Document
 
+# Any run of whitespace collapses to a single space
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Number of characters read at a time from file handles
+STREAM_BLOCK_SIZE = 64 * 1024
+
+# A text source for streaming chunking: a string, a Document, a path, a (text or binary) file handle,
+# or an iterable of strings, bytes or Documents (e.g. the pages produced by a reader)
+TextSource = Union[str, Document, Path, IO[Any], Iterable[Union[str, bytes, Document]]]
+
+
+def iter_text(source: TextSource, encoding: str = "utf-8", block_size: int = STREAM_BLOCK_SIZE) -> Iterator[str]:
+    """Yield the text of a source in blocks, without reading it all into memory."""
+    if isinstance(source, str):
+        yield source
+    elif isinstance(source, Document):
+        yield source.content
+    elif isinstance(source, Path):
+        with source.open("r", encoding=encoding) as file:
+            yield from iter_text(file, encoding=encoding, block_size=block_size)
+    elif hasattr(source, "read"):
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        while True:
+            block = source.read(block_size)  # type: ignore[union-attr]
+            if not block:
+                break
+            yield decoder.decode(block) if isinstance(block, bytes) else block
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+    else:
+        for item in source:  # type: ignore[union-attr]
+            if isinstance(item, Document):
+                yield item.content
+            elif isinstance(item, bytes):
+                yield item.decode(encoding, errors="replace")
+            else:
+                yield item
+
+
+def iter_clean_text(blocks: Iterable[str]) -> Iterator[str]:
+    """Streaming equivalent of ChunkingStrategy.clean_text, also collapsing whitespace runs split across blocks."""
+    previous_ends_with_space = False
+    for block in blocks:
+        cleaned = WHITESPACE_PATTERN.sub(" ", block)
+        if previous_ends_with_space and cleaned.startswith(" "):
+            cleaned = cleaned[1:]
+        if cleaned:
+            previous_ends_with_space = cleaned.endswith(" ")
+            yield cleaned
+
+
+def iter_windows(blocks: Iterable[str], window_size: int) -> Iterator[str]:
+    """Regroup blocks of text into windows of about `window_size` characters, split at paragraph or line ends."""
+    buffer = ""
+    for block in blocks:
+        buffer += block
+        while len(buffer) >= window_size:
+            cut = -1
+            for sep in ["\n\n", "\n", " "]:
+                cut = buffer.rfind(sep, 0, window_size)
+                if cut > 0:
+                    cut += len(sep)
+                    break
+            if cut <= 0:
+                cut = window_size
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+    if buffer:
+        yield buffer
+
 
 class ChunkingStrategy(ABC):
     """Base class for chunking strategies"""
 
+    # Number of characters handed to `chunk` at a time by the default `chunk_stream` implementation
+    stream_window_size: int = 1_000_000
+
     @abstractmethod
     def chunk(self, document: Document) -> List[Document]:
         raise NotImplementedError
 
+    def chunk_stream(self, source: TextSource, document: Optional[Document] = None) -> Iterator[Document]:
+        """Chunk text read incrementally from `source`, yielding chunks as soon as they are ready.
+
+        Memory use is bounded by `stream_window_size` regardless of the size of the input. Strategies that can
+        chunk a stream natively override this; the default applies `chunk` to consecutive windows of the text.
+
+        Args:
+            source: The text to chunk, see `TextSource`.
+            document: Provides the id, name and meta_data of the chunks. Its content is ignored.
+        """
+        document = document or Document(content="")
+        chunk_number = 1
+        for window in iter_windows(iter_text(source), self.stream_window_size):
+            window_document = Document(
+                id=document.id, name=document.name, meta_data=document.meta_data.copy(), content=window
+            )
+            for chunk in self.chunk(window_document):
+                # Number chunks across windows so ids stay unique
+                chunk.meta_data["chunk"] = chunk_number
+                if document.id:
+                    chunk.id = f"{document.id}_{chunk_number}"
+                elif document.name:
+                    chunk.id = f"{document.name}_{chunk_number}"
+                chunk_number += 1
+                yield chunk
+
     def clean_text(self, text: str) -> str:
-        """Clean the text by replacing multiple newlines with a single newline"""
-        import re
-
-        # Replace multiple newlines with a single newline
-        cleaned_text = re.sub(r"\n+", "\n", text)
-        # Replace multiple spaces with a single space
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
-        # Replace multiple tabs with a single tab
-        cleaned_text = re.sub(r"\t+", "\t", cleaned_text)
-        # Replace multiple carriage returns with a single carriage return
-        cleaned_text = re.sub(r"\r+", "\r", cleaned_text)
-        # Replace multiple form feeds with a single form feed
-        cleaned_text = re.sub(r"\f+", "\f", cleaned_text)
-        # Replace multiple vertical tabs with a single vertical tab
-        cleaned_text = re.sub(r"\v+", "\v", cleaned_text)
-
-        return cleaned_text
+        """Clean the text by collapsing every run of whitespace (newlines, tabs, spaces...) into a single space"""
+        return WHITESPACE_PATTERN.sub(" ", text)
 
 
 class ChunkingStrategyType(str, Enum):
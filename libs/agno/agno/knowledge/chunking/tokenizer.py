@@ -0,0 +1,139 @@
+"""Tokenizers used to measure chunk sizes and overlaps in tokens instead of characters.
+
+Tokenizers are loaded once per process and shared, as loading a vocabulary is far more expensive than tokenizing
+a chunk. Use `Embedder.get_tokenizer()` to get the tokenizer matching the model that will embed the chunks.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+from agno.utils.log import log_debug, log_warning
+
+# Scripts written without spaces, where most tokenizers emit about one token per character
+_CJK_RANGES = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af"
+_APPROXIMATE_TOKEN_PATTERN = re.compile(rf"[{_CJK_RANGES}]|[^\W{_CJK_RANGES}]{{1,5}}|[^\w\s]")
+
+# Characters of text tokenized per token of chunk size when looking for the end of a chunk.
+# Chunkers double the window whenever it turns out to hold fewer tokens than a full chunk.
+TOKEN_LOOKAHEAD_CHARS = 6
+
+
+class Tokenizer(ABC):
+    """Base class for tokenizers used to size chunks"""
+
+    @abstractmethod
+    def token_offsets(self, text: str) -> List[int]:
+        """Return the character offset at which each token of `text` starts."""
+        raise NotImplementedError
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.token_offsets(text))
+
+    def split_at(self, text: str, max_tokens: int) -> Tuple[int, List[int]]:
+        """Return the character offset right after the first `max_tokens` tokens of `text`, and the token offsets.
+
+        The offset is `len(text)` when `text` holds no more than `max_tokens` tokens.
+        """
+        offsets = self.token_offsets(text)
+        if len(offsets) <= max_tokens:
+            return len(text), offsets
+        return offsets[max_tokens], offsets
+
+    def tokens_before(self, offsets: List[int], position: int) -> int:
+        """Return the number of tokens starting before the character `position`, given the token offsets."""
+        return bisect_left(offsets, position)
+
+
+class ApproximateTokenizer(Tokenizer):
+    """Dependency-free tokenizer approximating subword tokenizers.
+
+    Words count as one token per five characters, punctuation as one token per character and CJK text as one
+    token per character, which slightly overestimates the token count of most BPE and WordPiece vocabularies.
+    """
+
+    def token_offsets(self, text: str) -> List[int]:
+        return [match.start() for match in _APPROXIMATE_TOKEN_PATTERN.finditer(text)]
+
+    def count_tokens(self, text: str) -> int:
+        return sum(1 for _ in _APPROXIMATE_TOKEN_PATTERN.finditer(text))
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Tokenizer backed by a `tiktoken` encoding, as used by OpenAI models"""
+
+    def __init__(self, encoding: Any):
+        self.encoding = encoding
+
+    def token_offsets(self, text: str) -> List[int]:
+        tokens = self.encoding.encode_ordinary(text)
+        _, offsets = self.encoding.decode_with_offsets(tokens)
+        return offsets
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.encoding.encode_ordinary(text))
+
+
+class HuggingFaceTokenizer(Tokenizer):
+    """Tokenizer backed by a fast Hugging Face tokenizer (`tokenizers.Tokenizer` or `PreTrainedTokenizerFast`)"""
+
+    def __init__(self, tokenizer: Any):
+        self.tokenizer = tokenizer
+
+    def token_offsets(self, text: str) -> List[int]:
+        if hasattr(self.tokenizer, "encode_batch"):
+            # tokenizers.Tokenizer
+            offsets = self.tokenizer.encode(text, add_special_tokens=False).offsets
+        else:
+            # transformers.PreTrainedTokenizerFast
+            offsets = self.tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)["offset_mapping"]
+        return [start for start, _ in offsets]
+
+
+@lru_cache(maxsize=None)
+def get_approximate_tokenizer() -> Tokenizer:
+    return ApproximateTokenizer()
+
+
+@lru_cache(maxsize=None)
+def get_tiktoken_tokenizer(model: Optional[str] = None, encoding_name: str = "cl100k_base") -> Tokenizer:
+    """Return the shared tiktoken tokenizer for a model, falling back to `encoding_name` for unknown models."""
+    try:
+        import tiktoken
+    except ImportError:
+        log_warning(
+            "`tiktoken` not installed, chunk token counts will be approximated. Install with `pip install tiktoken`"
+        )
+        return get_approximate_tokenizer()
+
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding(encoding_name)
+        except KeyError:
+            log_debug(f"No tiktoken encoding registered for {model}, using {encoding_name}")
+            encoding = tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        # The vocabulary is downloaded on first use, which fails when offline
+        log_warning(f"Could not load the tiktoken encoding, chunk token counts will be approximated: {e}")
+        return get_approximate_tokenizer()
+    return TiktokenTokenizer(encoding)
+
+
+@lru_cache(maxsize=None)
+def get_huggingface_tokenizer(model: str) -> Tokenizer:
+    """Return the shared tokenizer of a model on the Hugging Face Hub, loaded with `tokenizers`."""
+    try:
+        from tokenizers import Tokenizer as HFTokenizer
+    except ImportError:
+        log_warning(
+            "`tokenizers` not installed, chunk token counts will be approximated. Install with `pip install tokenizers`"
+        )
+        return get_approximate_tokenizer()
+
+    try:
+        return HuggingFaceTokenizer(HFTokenizer.from_pretrained(model))
+    except Exception as e:
+        log_warning(f"Could not load the tokenizer of {model}, chunk token counts will be approximated: {e}")
+        return get_approximate_tokenizer()
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from agno.knowledge.chunking.tokenizer import Tokenizer
 
 
 @dataclass
@@ -9,6 +12,9 @@ class Embedder:
     dimensions: Optional[int] = 1536
     enable_batch: bool = False
     batch_size: int = 100  # Number of texts to process in each API call
+    batch_concurrency: int = 4  # Maximum number of batch API calls in flight
+    batch_max_tokens: Optional[int] = None  # Approximate token budget of each batch API call
+    batch_max_retries: int = 3  # Number of retries for each failed batch API call
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
@@ -21,3 +27,47 @@ class Embedder:
 
     async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_tokenizer(self) -> "Tokenizer":
+        """Return the tokenizer used to size chunks in tokens of this embedder's model."""
+        from agno.knowledge.chunking.tokenizer import get_approximate_tokenizer
+
+        return get_approximate_tokenizer()
+
+    def _embed_in_batches(
+        self,
+        texts: List[str],
+        embed_batch: Callable[[List[str]], Tuple[List[List[float]], Optional[Dict]]],
+        retry_rate_limits: bool = True,
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Run `embed_batch` over concurrent, rate-limit aware batches of texts."""
+        from agno.knowledge.embedder.batch import embed_in_batches
+
+        return embed_in_batches(
+            texts,
+            embed_batch,
+            batch_size=self.batch_size,
+            max_concurrency=self.batch_concurrency,
+            max_batch_tokens=self.batch_max_tokens,
+            max_retries=self.batch_max_retries,
+            retry_rate_limits=retry_rate_limits,
+        )
+
+    async def _async_embed_in_batches(
+        self,
+        texts: List[str],
+        embed_batch: Callable[[List[str]], Awaitable[Tuple[List[List[float]], Optional[Dict]]]],
+        retry_rate_limits: bool = True,
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Await `embed_batch` over concurrent, rate-limit aware batches of texts."""
+        from agno.knowledge.embedder.batch import async_embed_in_batches
+
+        return await async_embed_in_batches(
+            texts,
+            embed_batch,
+            batch_size=self.batch_size,
+            max_concurrency=self.batch_concurrency,
+            max_batch_tokens=self.batch_max_tokens,
+            max_retries=self.batch_max_retries,
+            retry_rate_limits=retry_rate_limits,
+        )
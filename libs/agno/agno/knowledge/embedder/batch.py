@@ -0,0 +1,318 @@
+"""Shared batch-embedding engine used by the remote embedders.
+
+Texts are split into batches bounded by both a maximum number of texts and an approximate token budget.
+Batches are sent concurrently, with the number of in-flight requests adapted to the provider's rate limits:
+a 429 halves the concurrency and pauses new requests for the `Retry-After` interval, while successful
+batches slowly raise it back up. Failed batches are retried individually; batches failing with non-retryable
+errors are bisected so a single bad text does not drop the whole batch, while batches still failing with transient
+errors after their retries are left without embeddings.
+"""
+
+import asyncio
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from agno.utils.log import log_debug, log_warning
+
+BatchResult = Tuple[List[List[float]], Optional[Dict[str, Any]]]
+
+RATE_LIMIT_PHRASES = ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap, slightly pessimistic token estimate (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def get_status_code(error: Exception) -> Optional[int]:
+    """Return the HTTP status code carried by a provider SDK or HTTP client error, if any."""
+    for obj in (error, getattr(error, "response", None)):
+        if obj is None:
+            continue
+        for attr in ("status_code", "status", "code"):
+            value = getattr(obj, attr, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check if the error is a rate limiting error."""
+    if get_status_code(error) == 429:
+        return True
+    error_str = str(error).lower()
+    return any(phrase in error_str for phrase in RATE_LIMIT_PHRASES)
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Return the number of seconds the provider asked us to wait, from `Retry-After` style headers."""
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return float(retry_after_ms) / 1000
+
+        retry_after = headers.get("retry-after")
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(0.0, retry_at.timestamp() - time.time())
+    except Exception:
+        return None
+
+
+def backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 60.0) -> float:
+    """Exponential backoff with jitter."""
+    delay = min(max_delay, base_delay * (2**attempt))
+    return delay * (0.5 + random.random() / 2)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Client errors (except timeouts and conflicts) will fail again with the same input."""
+    status_code = get_status_code(error)
+    if status_code is None:
+        return True
+    return not (400 <= status_code < 500) or status_code in (408, 409)
+
+
+@dataclass
+class _Batch:
+    start: int
+    end: int
+    attempt: int = 0
+    ready_at: float = 0.0
+
+
+class BatchScheduler:
+    """Tracks pending batches, the adaptive concurrency limit and the collected results.
+
+    The scheduler does no I/O itself, so the same logic drives both the thread-based and the asyncio-based loops.
+    """
+
+    def __init__(
+        self,
+        texts: List[str],
+        batch_size: int = 100,
+        max_concurrency: int = 4,
+        max_batch_tokens: Optional[int] = None,
+        max_retries: int = 3,
+        retry_rate_limits: bool = True,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+    ):
+        self.texts = texts
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.retry_rate_limits = retry_rate_limits
+
+        self.embeddings: List[List[float]] = [[] for _ in texts]
+        self.usage: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+
+        self.limit = self.max_concurrency
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+        self._successes = 0
+        self._pending: List[_Batch] = self._plan(max(1, batch_size), max_batch_tokens, count_tokens)
+
+    def _plan(
+        self, batch_size: int, max_batch_tokens: Optional[int], count_tokens: Callable[[str], int]
+    ) -> List[_Batch]:
+        batches: List[_Batch] = []
+        start = 0
+        tokens = 0
+        for i, text in enumerate(self.texts):
+            text_tokens = count_tokens(text) if max_batch_tokens else 0
+            if i > start and (
+                i - start >= batch_size or (max_batch_tokens and tokens + text_tokens > max_batch_tokens)
+            ):
+                batches.append(_Batch(start, i))
+                start = i
+                tokens = 0
+            tokens += text_tokens
+        if start < len(self.texts):
+            batches.append(_Batch(start, len(self.texts)))
+        return batches
+
+    @property
+    def done(self) -> bool:
+        return not self._pending and self.in_flight == 0
+
+    def batch_texts(self, batch: _Batch) -> List[str]:
+        return self.texts[batch.start : batch.end]
+
+    def next_batch(self) -> Optional[_Batch]:
+        """Return the next batch that may be sent now, or None if we are at the limit or cooling down."""
+        if self.in_flight >= self.limit:
+            return None
+        now = time.monotonic()
+        if now < self.cooldown_until:
+            return None
+        for i, batch in enumerate(self._pending):
+            if batch.ready_at <= now:
+                self.in_flight += 1
+                return self._pending.pop(i)
+        return None
+
+    def time_until_ready(self) -> Optional[float]:
+        """Seconds until a pending batch may be sent, or None if only a running batch can unblock us."""
+        if not self._pending or self.in_flight >= self.limit:
+            return None
+        now = time.monotonic()
+        ready_at = max(self.cooldown_until, min(batch.ready_at for batch in self._pending))
+        return max(0.0, ready_at - now)
+
+    def complete(self, batch: _Batch, embeddings: List[List[float]], usage: Optional[Dict[str, Any]]) -> None:
+        self.in_flight -= 1
+        for offset, embedding in enumerate(embeddings[: batch.end - batch.start]):
+            self.embeddings[batch.start + offset] = embedding
+            self.usage[batch.start + offset] = usage
+
+        # Additive increase: one more concurrent request after a full window of successes
+        self._successes += 1
+        if self.limit < self.max_concurrency and self._successes >= self.limit:
+            self.limit += 1
+            self._successes = 0
+            log_debug(f"Embedding batch concurrency raised to {self.limit}")
+
+    def fail(self, batch: _Batch, error: Exception) -> None:
+        """Reschedule a failed batch. Raises the error when a rate limit persists after all retries."""
+        self.in_flight -= 1
+        now = time.monotonic()
+
+        if is_rate_limit_error(error):
+            if not self.retry_rate_limits or batch.attempt >= self.max_retries:
+                log_warning(f"Rate limit persisted after {batch.attempt} retries: {error}")
+                raise error
+            # Multiplicative decrease, and pause every new request until the provider is ready again
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
+            delay = get_retry_after(error)
+            if delay is None:
+                delay = backoff_delay(batch.attempt)
+            self.cooldown_until = max(self.cooldown_until, now + delay)
+            log_debug(f"Rate limited, concurrency lowered to {self.limit}, pausing for {delay:.2f}s")
+            self._pending.insert(0, _Batch(batch.start, batch.end, batch.attempt + 1))
+            return
+
+        if _is_retryable(error):
+            if batch.attempt < self.max_retries:
+                log_debug(f"Embedding batch failed on attempt {batch.attempt + 1}, retrying: {error}")
+                delay = backoff_delay(batch.attempt)
+                self._pending.append(_Batch(batch.start, batch.end, batch.attempt + 1, now + delay))
+                return
+            # Timeouts, connection and server errors don't depend on the texts, so splitting the batch won't help
+            log_warning(
+                f"Error getting embeddings for texts {batch.start} to {batch.end - 1} "
+                f"after {batch.attempt} retries: {error}"
+            )
+            return
+
+        if batch.end - batch.start > 1:
+            # Bisect so that only the offending text(s) end up without an embedding
+            middle = (batch.start + batch.end) // 2
+            log_debug(f"Embedding batch failed, splitting it in two: {error}")
+            self._pending.append(_Batch(batch.start, middle, self.max_retries))
+            self._pending.append(_Batch(middle, batch.end, self.max_retries))
+            return
+
+        log_warning(f"Error getting embedding for text at index {batch.start}: {error}")
+
+    def results(self) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
+        return self.embeddings, self.usage
+
+
+def embed_in_batches(
+    texts: List[str], embed_batch: Callable[[List[str]], BatchResult], **options: Any
+) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
+    """Embed texts by running `embed_batch` on concurrent batches in a thread pool.
+
+    Args:
+        texts: List of text strings to embed
+        embed_batch: Function embedding one batch, returning the embeddings and the usage of the request
+        **options: Options for the BatchScheduler
+
+    Returns:
+        Tuple of (List of embedding vectors, List of usage dictionaries)
+    """
+    scheduler = BatchScheduler(texts, **options)
+    executor = ThreadPoolExecutor(max_workers=scheduler.max_concurrency)
+    futures: Dict[Future, _Batch] = {}
+    try:
+        while not scheduler.done:
+            batch = scheduler.next_batch()
+            while batch is not None:
+                futures[executor.submit(embed_batch, scheduler.batch_texts(batch))] = batch
+                batch = scheduler.next_batch()
+
+            if not futures:
+                time.sleep(scheduler.time_until_ready() or 0)
+                continue
+
+            done, _ = wait(futures, timeout=scheduler.time_until_ready(), return_when=FIRST_COMPLETED)
+            for future in done:
+                batch = futures.pop(future)
+                try:
+                    embeddings, usage = future.result()
+                except Exception as e:
+                    scheduler.fail(batch, e)
+                else:
+                    scheduler.complete(batch, embeddings, usage)
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+    return scheduler.results()
+
+
+async def async_embed_in_batches(
+    texts: List[str], embed_batch: Callable[[List[str]], Awaitable[BatchResult]], **options: Any
+) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
+    """Embed texts by awaiting `embed_batch` on concurrent batches.
+
+    Args:
+        texts: List of text strings to embed
+        embed_batch: Coroutine function embedding one batch, returning the embeddings and the usage of the request
+        **options: Options for the BatchScheduler
+
+    Returns:
+        Tuple of (List of embedding vectors, List of usage dictionaries)
+    """
+    scheduler = BatchScheduler(texts, **options)
+    tasks: Dict[asyncio.Task, _Batch] = {}
+    try:
+        while not scheduler.done:
+            batch = scheduler.next_batch()
+            while batch is not None:
+                tasks[asyncio.ensure_future(embed_batch(scheduler.batch_texts(batch)))] = batch
+                batch = scheduler.next_batch()
+
+            if not tasks:
+                await asyncio.sleep(scheduler.time_until_ready() or 0)
+                continue
+
+            done, _ = await asyncio.wait(
+                tasks, timeout=scheduler.time_until_ready(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                batch = tasks.pop(task)
+                try:
+                    embeddings, usage = task.result()
+                except Exception as e:
+                    scheduler.fail(batch, e)
+                else:
+                    scheduler.complete(batch, embeddings, usage)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return scheduler.results()
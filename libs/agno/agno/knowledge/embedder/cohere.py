@@ -1,9 +1,8 @@
-import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agno.knowledge.embedder.base import Embedder
-from agno.utils.log import log_debug, log_error, log_info, log_warning
+from agno.utils.log import log_info, log_warning
 
 try:
     from cohere import AsyncClient as AsyncCohereClient
@@ -24,6 +23,7 @@ class CohereEmbedder(Embedder):
     cohere_client: Optional[CohereClient] = None
     async_client: Optional[AsyncCohereClient] = None
     exponential_backoff: bool = False  # Enable exponential backoff on rate limits
+    batch_size: int = 96  # Cohere accepts at most 96 texts per embed call
 
     @property
     def client(self) -> CohereClient:
@@ -78,95 +78,29 @@ class CohereEmbedder(Embedder):
 
         return request_params
 
-    def _is_rate_limit_error(self, error: Exception) -> bool:
-        """Check if the error is a rate limiting error."""
-        if hasattr(error, "status_code") and error.status_code == 429:
-            return True
-        error_str = str(error).lower()
-        return any(
-            phrase in error_str
-            for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-        )
-
-    def _exponential_backoff_sleep(self, attempt: int, base_delay: float = 1.0) -> None:
-        """Sleep with exponential backoff."""
-        delay = base_delay * (2**attempt) + (time.time() % 1)  # Add jitter
-        log_debug(f"Rate limited, waiting {delay:.2f} seconds before retry (attempt {attempt + 1})")
-        time.sleep(delay)
-
-    async def _async_rate_limit_backoff_sleep(self, attempt: int) -> None:
-        """Async version of rate-limit-aware backoff for APIs with per-minute limits."""
-        import asyncio
-
-        # For 40 req/min APIs like Cohere Trial, we need longer waits
-        if attempt == 0:
-            delay = 15.0  # Wait 15 seconds (1/4 of minute window)
-        elif attempt == 1:
-            delay = 30.0  # Wait 30 seconds (1/2 of minute window)
+    def _parse_batch_response(
+        self, response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]
+    ) -> Tuple[List[List[float]], Optional[Dict]]:
+        # Extract embeddings from response
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            batch_embeddings = response.embeddings
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+            batch_embeddings = response.embeddings.float_ if response.embeddings.float_ else []
         else:
-            delay = 60.0  # Wait full minute for window reset
+            log_warning("No embeddings found in response")
+            batch_embeddings = []
 
-        # Add small jitter
-        delay += time.time() % 3
+        # Extract usage information
+        usage = response.meta.billed_units if response.meta else None
+        return batch_embeddings, usage.model_dump() if usage else None
 
-        log_debug(
-            f"Async rate limit backoff, waiting {delay:.1f} seconds for rate limit window reset (attempt {attempt + 1})"
-        )
-        await asyncio.sleep(delay)
+    def _embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response = self.client.embed(texts=texts, **self._get_batch_request_params())
+        return self._parse_batch_response(response)
 
-    async def _async_batch_with_retry(
-        self, texts: List[str], max_retries: int = 3
-    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
-        """Execute async batch embedding with rate-limit-aware backoff for rate limiting."""
-
-        log_debug(f"Starting async batch retry for {len(texts)} texts with max_retries={max_retries}")
-
-        for attempt in range(max_retries + 1):
-            try:
-                request_params = self._get_batch_request_params()
-                response: Union[
-                    EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse
-                ] = await self.aclient.embed(texts=texts, **request_params)
-
-                # Extract embeddings from response
-                if isinstance(response, EmbeddingsFloatsEmbedResponse):
-                    batch_embeddings = response.embeddings
-                elif isinstance(response, EmbeddingsByTypeEmbedResponse):
-                    batch_embeddings = response.embeddings.float_ if response.embeddings.float_ else []
-                else:
-                    log_warning("No embeddings found in response")
-                    batch_embeddings = []
-
-                # Extract usage information
-                usage = response.meta.billed_units if response.meta else None
-                usage_dict = usage.model_dump() if usage else None
-                all_usage = [usage_dict] * len(batch_embeddings)
-
-                log_debug(f"Async batch embedding succeeded on attempt {attempt + 1}")
-                return batch_embeddings, all_usage
-
-            except Exception as e:
-                if self._is_rate_limit_error(e):
-                    if not self.exponential_backoff:
-                        log_warning(
-                            "Rate limit detected. To enable automatic backoff retry, set enable_backoff=True when creating the embedder."
-                        )
-                        raise e
-
-                    log_info(f"Async rate limit detected on attempt {attempt + 1}")
-                    if attempt < max_retries:
-                        await self._async_rate_limit_backoff_sleep(attempt)
-                        continue
-                    else:
-                        log_warning(f"Async max retries ({max_retries}) reached for rate limiting")
-                        raise e
-                else:
-                    log_debug(f"Async non-rate-limit error on attempt {attempt + 1}: {e}")
-                    raise e
-
-        # This should never be reached, but just in case
-        log_error("Could not create embeddings. End of retry loop reached.")
-        return [], []
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response = await self.aclient.embed(texts=texts, **self._get_batch_request_params())
+        return self._parse_batch_response(response)
 
     def get_embedding(self, text: str) -> List[float]:
         response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=text)
@@ -250,74 +184,36 @@ class CohereEmbedder(Embedder):
             return embedding, usage.model_dump()
         return embedding, None
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts in concurrent batches.
+
+        Rate limited batches are only retried when `exponential_backoff` is enabled.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        log_info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
+        return self._embed_in_batches(texts, self._embed_batch, retry_rate_limits=self.exponential_backoff)
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
         """
-                Get embeddings and usage for multiple texts in batches (async version).
+        Get embeddings and usage for multiple texts in concurrent batches (async version).
+
+        Rate limited batches are only retried when `exponential_backoff` is enabled.
 
-                Args:
-                    texts: List of text strings to embed
+        Args:
+            texts: List of text strings to embed
 
-                Returns:
-        s, List of usage dictionaries)
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
         """
-        all_embeddings = []
-        all_usage = []
         log_info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size} (async)")
-
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i : i + self.batch_size]
-
-            try:
-                # Use retry logic for batch processing
-                batch_embeddings, batch_usage = await self._async_batch_with_retry(batch_texts)
-                all_embeddings.extend(batch_embeddings)
-                all_usage.extend(batch_usage)
-
-            except Exception as e:
-                log_warning(f"Async batch embedding failed after retries: {e}")
-
-                # Check if this is a rate limit error and backoff is disabled
-                if self._is_rate_limit_error(e) and not self.exponential_backoff:
-                    log_warning("Rate limit hit and backoff is disabled. Failing immediately.")
-                    raise e
-
-                # Only fall back to individual calls for non-rate-limit errors
-                # For rate limit errors, we should reduce batch size instead
-                if self._is_rate_limit_error(e):
-                    log_warning("Rate limit hit even after retries. Consider reducing batch_size or upgrading API key.")
-                    # Try with smaller batch size
-                    if len(batch_texts) > 1:
-                        smaller_batch_size = max(1, len(batch_texts) // 2)
-                        log_info(f"Retrying with smaller batch size: {smaller_batch_size}")
-                        for j in range(0, len(batch_texts), smaller_batch_size):
-                            small_batch = batch_texts[j : j + smaller_batch_size]
-                            try:
-                                small_embeddings, small_usage = await self._async_batch_with_retry(small_batch)
-                                all_embeddings.extend(small_embeddings)
-                                all_usage.extend(small_usage)
-                            except Exception as e3:
-                                log_error(f"Failed even with reduced batch size: {e3}")
-                                # Fall back to empty results for this batch
-                                all_embeddings.extend([[] for _ in small_batch])
-                                all_usage.extend([None for _ in small_batch])
-                    else:
-                        # Single item already failed, add empty result
-                        log_debug("Single item failed, adding empty result")
-                        all_embeddings.append([])
-                        all_usage.append(None)
-                else:
-                    # For non-rate-limit errors, fall back to individual calls
-                    log_debug("Non-rate-limit error, falling back to individual calls")
-                    for text in batch_texts:
-                        try:
-                            embedding, usage = await self.async_get_embedding_and_usage(text)
-                            all_embeddings.append(embedding)
-                            all_usage.append(usage)
-                        except Exception as e2:
-                            log_warning(f"Error in individual async embedding fallback: {e2}")
-                            all_embeddings.append([])
-                            all_usage.append(None)
-
-        return all_embeddings, all_usage
+        return await self._async_embed_in_batches(
+            texts, self._async_embed_batch, retry_rate_limits=self.exponential_backoff
+        )
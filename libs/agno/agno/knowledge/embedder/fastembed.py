@@ -1,8 +1,10 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from agno.knowledge.chunking.tokenizer import Tokenizer, get_huggingface_tokenizer
 from agno.knowledge.embedder.base import Embedder
-from agno.utils.log import logger
+from agno.knowledge.local_models import get_local_model_registry
+from agno.utils.log import log_debug, logger
 
 try:
     import numpy as np
@@ -24,10 +26,32 @@ class FastEmbedEmbedder(Embedder):
 
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: int = 384
+    # Local models always support batch encoding, so vector dbs should use it by default
+    enable_batch: bool = True
+    # Number of texts encoded per ONNX run
+    batch_size: int = 256
+    # Number of worker processes used for data-parallel encoding. 0 uses all cores, None disables it
+    parallel: Optional[int] = None
+    fastembed_client: Optional[Any] = None
+
+    @property
+    def client(self) -> TextEmbedding:
+        if self.fastembed_client is not None:
+            return self.fastembed_client
+        # The model is loaded once per process and shared by all embedders using it
+        return get_local_model_registry().get(
+            "fastembed", self.id, load=lambda: TextEmbedding(model_name=self.id), holder=self
+        )
+
+    def warm_up(self) -> None:
+        """Load the model ahead of the first embedding"""
+        _ = self.client
+
+    def get_tokenizer(self) -> Tokenizer:
+        return get_huggingface_tokenizer(self.id)
 
     def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
-        embeddings = model.embed(text)
+        embeddings = self.client.embed(text)
         embedding_list = list(embeddings)[0]
         if isinstance(embedding_list, np.ndarray):
             return embedding_list.tolist()
@@ -45,6 +69,34 @@ class FastEmbedEmbedder(Embedder):
 
         return embedding, usage
 
+    def get_embeddings_array(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts into a float32 matrix of shape (len(texts), dimensions).
+
+        Use this when the caller can work with numpy arrays directly, as it avoids converting
+        every embedding into a list of Python floats.
+        """
+        if len(texts) == 0:
+            return np.empty((0, self.dimensions), dtype=np.float32)
+
+        embeddings = self.client.embed(texts, batch_size=self.batch_size, parallel=self.parallel)
+        return np.asarray(list(embeddings), dtype=np.float32)
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings for multiple texts, encoding them in batches of `batch_size`.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        log_debug(f"Getting embeddings for {len(texts)} texts in batches of {self.batch_size}")
+        embeddings = self.get_embeddings_array(texts).tolist()
+        # Currently, FastEmbed does not provide usage information
+        return embeddings, [None] * len(texts)
+
     async def async_get_embedding(self, text: str) -> List[float]:
         """Async version using thread executor for CPU-bound operations."""
         import asyncio
@@ -60,3 +112,12 @@ class FastEmbedEmbedder(Embedder):
         loop = asyncio.get_event_loop()
         # Run the CPU-bound operation in a thread executor
         return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Async version using a single thread executor hop for the whole batch."""
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_embeddings_batch_and_usage, texts)
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from os import getenv
 from typing import Any, Dict, List, Optional, Tuple
 
+from agno.knowledge.chunking.tokenizer import Tokenizer, get_huggingface_tokenizer
 from agno.knowledge.embedder.base import Embedder
 from agno.utils.log import log_error, log_warning
 
@@ -54,6 +55,9 @@ class HuggingfaceCustomEmbedder(Embedder):
     def _response(self, text: str):
         return self.client.feature_extraction(text=text, model=self.id)
 
+    def get_tokenizer(self) -> Tokenizer:
+        return get_huggingface_tokenizer(self.id)
+
     def get_embedding(self, text: str) -> List[float]:
         response = self._response(text=text)
         try:
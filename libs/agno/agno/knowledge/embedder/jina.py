@@ -139,11 +139,49 @@ class JinaEmbedder(Embedder):
                 response.raise_for_status()
                 return await response.json()
 
+    def _batch_response(self, texts: List[str]) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "model": self.id,
+            "late_chunking": self.late_chunking,
+            "dimensions": self.dimensions,
+            "embedding_type": self.embedding_type,
+            "input": texts,  # Jina API expects a list of texts for batch processing
+        }
+        if self.user is not None:
+            data["user"] = self.user
+        if self.request_params:
+            data.update(self.request_params)
+
+        response = requests.post(self.base_url, headers=self._get_headers(), json=data, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        result = self._batch_response(texts)
+        return [data["embedding"] for data in result["data"]], result.get("usage")
+
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        result = await self._async_batch_response(texts)
+        return [data["embedding"] for data in result["data"]], result.get("usage")
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts in concurrent batches.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        logger.info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
+        return self._embed_in_batches(texts, self._embed_batch)
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
         """
-        Get embeddings and usage for multiple texts in batches.
+        Get embeddings and usage for multiple texts in concurrent batches.
 
         Args:
             texts: List of text strings to embed
@@ -151,32 +189,5 @@ class JinaEmbedder(Embedder):
         Returns:
             Tuple of (List of embedding vectors, List of usage dictionaries)
         """
-        all_embeddings = []
-        all_usage = []
         logger.info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
-
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i : i + self.batch_size]
-
-            try:
-                result = await self._async_batch_response(batch_texts)
-                batch_embeddings = [data["embedding"] for data in result["data"]]
-                all_embeddings.extend(batch_embeddings)
-
-                # For each embedding in the batch, add the same usage information
-                usage_dict = result.get("usage")
-                all_usage.extend([usage_dict] * len(batch_embeddings))
-            except Exception as e:
-                logger.warning(f"Error in async batch embedding: {e}")
-                # Fallback to individual calls for this batch
-                for text in batch_texts:
-                    try:
-                        embedding, usage = await self.async_get_embedding_and_usage(text)
-                        all_embeddings.append(embedding)
-                        all_usage.append(usage)
-                    except Exception as e2:
-                        logger.warning(f"Error in individual async embedding fallback: {e2}")
-                        all_embeddings.append([])
-                        all_usage.append(None)
-
-        return all_embeddings, all_usage
+        return await self._async_embed_in_batches(texts, self._async_embed_batch)
@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from typing_extensions import Literal
 
+from agno.knowledge.chunking.tokenizer import Tokenizer, get_tiktoken_tokenizer
 from agno.knowledge.embedder.base import Embedder
 from agno.utils.log import logger
 
@@ -27,6 +28,8 @@ class OpenAIEmbedder(Embedder):
     client_params: Optional[Dict[str, Any]] = None
     openai_client: Optional[OpenAIClient] = None
     async_client: Optional[AsyncOpenAI] = None
+    # OpenAI accepts at most 300k tokens across all inputs of a single request
+    batch_max_tokens: Optional[int] = 300_000
 
     def __post_init__(self):
         if self.dimensions is None:
@@ -77,6 +80,9 @@ class OpenAIEmbedder(Embedder):
             _request_params.update(self.request_params)
         return self.client.embeddings.create(**_request_params)
 
+    def get_tokenizer(self) -> Tokenizer:
+        return get_tiktoken_tokenizer(self.id)
+
     def get_embedding(self, text: str) -> List[float]:
         try:
             response: CreateEmbeddingResponse = self.response(text=text)
@@ -140,11 +146,46 @@ class OpenAIEmbedder(Embedder):
             logger.warning(e)
             return [], None
 
+    def _batch_request_params(self, texts: List[str]) -> Dict[str, Any]:
+        req: Dict[str, Any] = {
+            "input": texts,
+            "model": self.id,
+            "encoding_format": self.encoding_format,
+        }
+        if self.user is not None:
+            req["user"] = self.user
+        if self.id.startswith("text-embedding-3"):
+            req["dimensions"] = self.dimensions
+        if self.request_params:
+            req.update(self.request_params)
+        return req
+
+    def _embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response: CreateEmbeddingResponse = self.client.embeddings.create(**self._batch_request_params(texts))
+        return [data.embedding for data in response.data], response.usage.model_dump() if response.usage else None
+
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response: CreateEmbeddingResponse = await self.aclient.embeddings.create(**self._batch_request_params(texts))
+        return [data.embedding for data in response.data], response.usage.model_dump() if response.usage else None
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts in concurrent batches.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        logger.info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
+        return self._embed_in_batches(texts, self._embed_batch)
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
         """
-        Get embeddings and usage for multiple texts in batches (async version).
+        Get embeddings and usage for multiple texts in concurrent batches (async version).
 
         Args:
             texts: List of text strings to embed
@@ -152,44 +193,5 @@ class OpenAIEmbedder(Embedder):
         Returns:
             Tuple of (List of embedding vectors, List of usage dictionaries)
         """
-        all_embeddings = []
-        all_usage = []
         logger.info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size} (async)")
-
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i : i + self.batch_size]
-
-            req: Dict[str, Any] = {
-                "input": batch_texts,
-                "model": self.id,
-                "encoding_format": self.encoding_format,
-            }
-            if self.user is not None:
-                req["user"] = self.user
-            if self.id.startswith("text-embedding-3"):
-                req["dimensions"] = self.dimensions
-            if self.request_params:
-                req.update(self.request_params)
-
-            try:
-                response: CreateEmbeddingResponse = await self.aclient.embeddings.create(**req)
-                batch_embeddings = [data.embedding for data in response.data]
-                all_embeddings.extend(batch_embeddings)
-
-                # For each embedding in the batch, add the same usage information
-                usage_dict = response.usage.model_dump() if response.usage else None
-                all_usage.extend([usage_dict] * len(batch_embeddings))
-            except Exception as e:
-                logger.warning(f"Error in async batch embedding: {e}")
-                # Fallback to individual calls for this batch
-                for text in batch_texts:
-                    try:
-                        embedding, usage = await self.async_get_embedding_and_usage(text)
-                        all_embeddings.append(embedding)
-                        all_usage.append(usage)
-                    except Exception as e2:
-                        logger.warning(f"Error in individual async embedding fallback: {e2}")
-                        all_embeddings.append([])
-                        all_usage.append(None)
-
-        return all_embeddings, all_usage
+        return await self._async_embed_in_batches(texts, self._async_embed_batch)
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from agno.knowledge.chunking.tokenizer import HuggingFaceTokenizer, Tokenizer
 from agno.knowledge.embedder.base import Embedder
-from agno.utils.log import logger
+from agno.knowledge.local_models import get_local_model_registry
+from agno.utils.log import log_debug, logger
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -24,12 +26,39 @@ class SentenceTransformerEmbedder(Embedder):
     sentence_transformer_client: Optional[SentenceTransformer] = None
     prompt: Optional[str] = None
     normalize_embeddings: bool = False
+    # Local models always support batch encoding, so vector dbs should use it by default
+    enable_batch: bool = True
+    # Number of texts encoded per forward pass
+    batch_size: int = 32
+    # Encode batches using a pool of worker processes (one per target device)
+    multi_process: bool = False
+    # Devices used by the multi-process pool, e.g. ["cpu", "cpu"] or ["cuda:0", "cuda:1"]
+    target_devices: Optional[List[str]] = None
 
-    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        if not self.sentence_transformer_client:
-            self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.id)
+    _pool: Optional[Dict[str, Any]] = None
+
+    @property
+    def client(self) -> SentenceTransformer:
+        if self.sentence_transformer_client:
+            return self.sentence_transformer_client
+        # The model is loaded once per process and shared by all embedders using it
+        return get_local_model_registry().get(
+            "sentence-transformer",
+            self.id,
+            load=lambda: SentenceTransformer(model_name_or_path=self.id),
+            holder=self,
+        )
+
+    def warm_up(self) -> None:
+        """Load the model ahead of the first embedding"""
+        _ = self.client
+
+    def get_tokenizer(self) -> Tokenizer:
+        # The model ships with its tokenizer, so sizing chunks with it is exact
+        return HuggingFaceTokenizer(self.client.tokenizer)
 
-        model = self.sentence_transformer_client
+    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+        model = self.client
         embedding = model.encode(text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings)
         try:
             if isinstance(embedding, np.ndarray):
@@ -43,6 +72,52 @@ class SentenceTransformerEmbedder(Embedder):
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
 
+    def get_embeddings_array(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts into a float32 matrix of shape (len(texts), dimensions).
+
+        Use this when the caller can work with numpy arrays directly, as it avoids converting
+        every embedding into a list of Python floats.
+        """
+        if len(texts) == 0:
+            return np.empty((0, self.dimensions), dtype=np.float32)
+
+        model = self.client
+        if self.multi_process:
+            if self._pool is None:
+                log_debug(f"Starting SentenceTransformer multi-process pool on {self.target_devices or 'all devices'}")
+                self._pool = model.start_multi_process_pool(target_devices=self.target_devices)
+            embeddings = model.encode_multi_process(
+                texts,
+                self._pool,
+                prompt=self.prompt,
+                batch_size=self.batch_size,
+                normalize_embeddings=self.normalize_embeddings,
+            )
+        else:
+            embeddings = model.encode(
+                texts,
+                prompt=self.prompt,
+                batch_size=self.batch_size,
+                normalize_embeddings=self.normalize_embeddings,
+                convert_to_numpy=True,
+            )
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings for multiple texts, encoding them in batches of `batch_size`.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        log_debug(f"Getting embeddings for {len(texts)} texts in batches of {self.batch_size}")
+        embeddings = self.get_embeddings_array(texts).tolist()
+        return embeddings, [None] * len(texts)
+
     async def async_get_embedding(self, text: Union[str, List[str]]) -> List[float]:
         """Async version using thread executor for CPU-bound operations."""
         import asyncio
@@ -57,3 +132,18 @@ class SentenceTransformerEmbedder(Embedder):
 
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Async version using a single thread executor hop for the whole batch."""
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_embeddings_batch_and_usage, texts)
+
+    def close(self) -> None:
+        """Stop the multi-process pool, if one was started."""
+        if self._pool is not None:
+            SentenceTransformer.stop_multi_process_pool(self._pool)
+            self._pool = None
@@ -0,0 +1,445 @@
+"""Hybrid search for knowledge bases, working with any vector db.
+
+A local BM25 index is kept over the documents ingested through a `Knowledge`, and its keyword results are fused with
+the results of the vector db by reciprocal rank fusion. Each document gets `weight / (rrf_k + rank)` from each list
+it appears in, so a document ranked well by both searches comes first, without comparing their scores.
+"""
+
+import asyncio
+import heapq
+import json
+import math
+import os
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from hashlib import md5
+from pathlib import Path
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from agno.knowledge.document import Document
+from agno.utils.log import log_debug, log_error
+from agno.vectordb.executor import SearchMetrics, run_in_vectordb_executor
+
+if TYPE_CHECKING:
+    from agno.vectordb.base import VectorDb
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split a text into lowercase words"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def get_document_key(document: Document) -> str:
+    """Key identifying a document across search results, from its content, as vector dbs give documents different ids"""
+    return md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest()
+
+
+def _matches(meta_data: Dict[str, Any], filters: Optional[Dict[str, Any]]) -> bool:
+    if not filters:
+        return True
+    for key, value in filters.items():
+        # Filters can be prefixed, e.g. "meta_data.key"
+        actual = meta_data.get(key.split(".")[-1])
+        if isinstance(value, (list, tuple, set)):
+            if actual not in value:
+                return False
+        elif actual != value:
+            return False
+    return True
+
+
+@dataclass
+class _IndexedDocument:
+    content: str
+    # Id of the document in the vector db, if it was set when the document was ingested
+    id: Optional[str] = None
+    name: Optional[str] = None
+    meta_data: Dict[str, Any] = field(default_factory=dict)
+    content_id: Optional[str] = None
+    content_hash: Optional[str] = None
+    length: int = 0
+
+
+class BM25Index:
+    """Incremental BM25 inverted index over documents.
+
+    Documents can be added and removed at any time, without rebuilding the index. If `path` is set, the documents are
+    saved to that JSON file, and every change is appended to a log next to it. The log is compacted into the JSON file
+    once it holds more documents than the index, and the index is rebuilt from both on first use.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.5,
+        b: float = 0.75,
+        tokenizer: Callable[[str], List[str]] = tokenize,
+        path: Optional[str] = None,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.tokenizer = tokenizer
+        self.path: Optional[Path] = Path(path) if path is not None else None
+
+        self._documents: Dict[str, _IndexedDocument] = {}
+        # Frequency of each term in each document, by term and document key
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+        self._lock = RLock()
+        self._loaded = False
+        # Generation of the JSON file, and number of documents added or removed in the log since it was written
+        self._generation = 0
+        self._log_size = 0
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._documents)
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if self.path is not None and self.path.exists():
+                with open(self.path) as f:
+                    data = json.load(f)
+                self._generation = data.get("generation", 0)
+                for key, document in data["documents"].items():
+                    self._add(key, _IndexedDocument(**document))
+                self._replay_log()
+                log_debug(f"Loaded {len(self._documents)} documents in the keyword index from {self.path}")
+            self._loaded = True
+
+    @property
+    def _log_path(self) -> Path:
+        # The generation of the JSON file is part of the name, so a log is never replayed on the file that replaced it
+        assert self.path is not None
+        return self.path.with_name(f"{self.path.name}.{self._generation}.log")
+
+    def _replay_log(self) -> None:
+        if not self._log_path.exists():
+            return
+        with open(self._log_path, "rb+") as f:
+            offset = 0
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A write interrupted by a crash, the changes before it are complete. It is cut off, so the next
+                    # changes are appended after them.
+                    f.truncate(offset)
+                    break
+                offset += len(line)
+                for key, document in entry.get("add", {}).items():
+                    self._add(key, _IndexedDocument(**document))
+                for key in entry.get("remove", []):
+                    self._remove(key)
+                self._log_size += len(entry.get("add", {})) + len(entry.get("remove", []))
+
+    def _save(self) -> None:
+        """Write all the documents to the JSON file and start a new log"""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        previous_log = self._log_path
+        documents = {key: self._serialize(document) for key, document in self._documents.items()}
+        temp_file = self.path.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump({"generation": self._generation + 1, "documents": documents}, f, default=str)
+        os.replace(temp_file, self.path)
+        self._generation += 1
+        self._log_size = 0
+        previous_log.unlink(missing_ok=True)
+
+    def _log_changes(self, added: Dict[str, _IndexedDocument], removed: Sequence[str]) -> None:
+        """Append the added and removed documents to the log, compacting it once it outgrows the index"""
+        if self.path is None or not (added or removed):
+            return
+        self._log_size += len(added) + len(removed)
+        if not self.path.exists() or self._log_size > max(len(self._documents), 1000):
+            self._save()
+            return
+        entry: Dict[str, Any] = {}
+        if added:
+            entry["add"] = {key: self._serialize(document) for key, document in added.items()}
+        if removed:
+            entry["remove"] = list(removed)
+        with open(self._log_path, "a") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+
+    @staticmethod
+    def _serialize(document: _IndexedDocument) -> Dict[str, Any]:
+        return {
+            "content": document.content,
+            "id": document.id,
+            "name": document.name,
+            "meta_data": document.meta_data,
+            "content_id": document.content_id,
+            "content_hash": document.content_hash,
+        }
+
+    def _add(self, key: str, document: _IndexedDocument) -> None:
+        if key in self._documents:
+            self._remove(key)
+        terms = Counter(self.tokenizer(document.content))
+        document.length = sum(terms.values())
+        self._documents[key] = document
+        self._total_length += document.length
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[key] = frequency
+
+    def _remove(self, key: str) -> bool:
+        document = self._documents.pop(key, None)
+        if document is None:
+            return False
+        self._total_length -= document.length
+        for term in set(self.tokenizer(document.content)):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+        return True
+
+    def add(
+        self,
+        documents: Sequence[Document],
+        content_hash: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Add documents to the index, replacing the documents with the same content.
+
+        Args:
+            documents: Documents to add
+            content_hash: Hash of the content the documents were read from
+            metadata: Metadata of the content, merged into the metadata of each document
+        """
+        self._load()
+        with self._lock:
+            added: Dict[str, _IndexedDocument] = {}
+            for document in documents:
+                key = get_document_key(document)
+                added[key] = _IndexedDocument(
+                    content=document.content,
+                    id=document.id,
+                    name=document.name,
+                    meta_data={**(document.meta_data or {}), **(metadata or {})},
+                    content_id=document.content_id,
+                    content_hash=content_hash,
+                )
+                self._add(key, added[key])
+            self._log_changes(added, [])
+
+    def remove(self, predicate: Callable[[str, _IndexedDocument], bool]) -> int:
+        """Remove the documents matching the predicate, called with the key and the document"""
+        self._load()
+        with self._lock:
+            keys = [key for key, document in self._documents.items() if predicate(key, document)]
+            for key in keys:
+                self._remove(key)
+            self._log_changes({}, keys)
+        return len(keys)
+
+    def remove_by_id(self, id: str) -> int:
+        """Remove the document with the given vector db id, or with the given content key for documents without one"""
+        return self.remove(lambda key, document: document.id == id or key == id)
+
+    def remove_by_name(self, name: str) -> int:
+        return self.remove(lambda _, document: document.name == name)
+
+    def remove_by_content_id(self, content_id: str) -> int:
+        return self.remove(lambda _, document: document.content_id == content_id)
+
+    def remove_by_content_hash(self, content_hash: str) -> int:
+        return self.remove(lambda _, document: document.content_hash == content_hash)
+
+    def remove_by_metadata(self, metadata: Dict[str, Any]) -> int:
+        return self.remove(lambda _, document: _matches(document.meta_data, metadata))
+
+    def clear(self) -> None:
+        self.remove(lambda _, __: True)
+
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Document, float]]:
+        """Return the documents best matching the words of the query, with their BM25 score"""
+        self._load()
+        with self._lock:
+            if not self._documents:
+                return []
+            count = len(self._documents)
+            average_length = self._total_length / count
+            scores: Dict[str, float] = {}
+            for term in set(self.tokenizer(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, frequency in postings.items():
+                    length = self._documents[key].length
+                    norm = self.k1 * (1 - self.b + self.b * length / average_length)
+                    scores[key] = scores.get(key, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+            if filters:
+                scores = {
+                    key: score for key, score in scores.items() if _matches(self._documents[key].meta_data, filters)
+                }
+            top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            return [
+                (
+                    Document(
+                        id=key,
+                        content=self._documents[key].content,
+                        name=self._documents[key].name,
+                        meta_data=dict(self._documents[key].meta_data),
+                        content_id=self._documents[key].content_id,
+                    ),
+                    score,
+                )
+                for key, score in top
+            ]
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Document]],
+    weights: Optional[Sequence[float]] = None,
+    k: int = 60,
+    limit: Optional[int] = None,
+) -> List[Document]:
+    """Merge ranked lists of documents, scoring each document `weight / (k + rank)` for each list it is in.
+
+    Documents are identified by their content, and the first list a document appears in gives the returned copy.
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores: Dict[str, float] = {}
+    documents: Dict[str, Document] = {}
+    for ranking, weight in zip(rankings, weights):
+        seen: Set[str] = set()
+        for rank, document in enumerate(ranking, start=1):
+            key = get_document_key(document)
+            # Duplicates within a list only count once
+            if key in seen:
+                continue
+            seen.add(key)
+            scores[key] = scores.get(key, 0.0) + weight / (k + rank)
+            documents.setdefault(key, document)
+    ranked = sorted(scores, key=lambda key: scores[key], reverse=True)
+    return [documents[key] for key in ranked[:limit]]
+
+
+@dataclass
+class HybridSearch:
+    """Hybrid search settings and keyword index of a `Knowledge`.
+
+    The keyword index covers the documents ingested through the knowledge base. If `path` is not set, it lives in
+    memory and is empty after a restart, until the content is ingested again.
+    """
+
+    # Weights of the vector and keyword results in the fusion
+    vector_weight: float = 1.0
+    keyword_weight: float = 1.0
+    # Rank constant of reciprocal rank fusion. Higher values flatten the difference between the top ranks.
+    rrf_k: int = 60
+    # Each search fetches `max_results * candidates_multiplier` results to fuse
+    candidates_multiplier: int = 3
+    # BM25 parameters
+    k1: float = 1.5
+    b: float = 0.75
+    # JSON file the keyword index is persisted to
+    path: Optional[str] = None
+
+    index: BM25Index = field(init=False, repr=False)
+    # Latencies of the vector search, keyword search and fusion stages
+    metrics: Dict[str, SearchMetrics] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.index = BM25Index(k1=self.k1, b=self.b, path=self.path)
+        self.metrics = {"vector": SearchMetrics(), "keyword": SearchMetrics(), "fusion": SearchMetrics()}
+
+    def _timed(self, stage: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        error = False
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.metrics[stage].record(time.perf_counter() - start, error=error)
+
+    def _keyword_search(self, query: str, limit: int, filters: Optional[Dict[str, Any]]) -> List[Document]:
+        return [document for document, _ in self.index.search(query, limit=limit, filters=filters)]
+
+    def _fuse(self, vector_results: List[Document], keyword_results: List[Document], limit: int) -> List[Document]:
+        return reciprocal_rank_fusion(
+            [vector_results, keyword_results],
+            weights=[self.vector_weight, self.keyword_weight],
+            k=self.rrf_k,
+            limit=limit,
+        )
+
+    def search(
+        self, vector_db: "VectorDb", query: str, limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        candidates = limit * self.candidates_multiplier
+        vector_results = self._timed("vector", vector_db.search, query=query, limit=candidates, filters=filters)
+        keyword_results = self._timed("keyword", self._keyword_search, query, candidates, filters)
+        return self._timed("fusion", self._fuse, vector_results, keyword_results, limit)
+
+    async def async_search(
+        self, vector_db: "VectorDb", query: str, limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        candidates = limit * self.candidates_multiplier
+
+        async def vector_search() -> List[Document]:
+            start = time.perf_counter()
+            error = False
+            try:
+                return await vector_db.run_async_search(query=query, limit=candidates, filters=filters)
+            except Exception:
+                error = True
+                raise
+            finally:
+                self.metrics["vector"].record(time.perf_counter() - start, error=error)
+
+        # Both searches run at once, the keyword search in a thread so it doesn't block the event loop
+        vector_results, keyword_results = await asyncio.gather(
+            vector_search(),
+            run_in_vectordb_executor(self._timed, "keyword", self._keyword_search, query, candidates, filters),
+        )
+        return self._timed("fusion", self._fuse, vector_results, keyword_results, limit)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Counters and latencies of each stage"""
+        return {stage: metrics.to_dict() for stage, metrics in self.metrics.items()}
+
+    def index_documents(
+        self,
+        documents: Sequence[Document],
+        content_hash: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        replace: bool = False,
+    ) -> None:
+        """Add ingested documents to the keyword index. With `replace`, the documents of the content are replaced."""
+        try:
+            if replace and content_hash is not None:
+                self.index.remove_by_content_hash(content_hash)
+            self.index.add(documents, content_hash=content_hash, metadata=metadata)
+        except Exception as e:
+            log_error(f"Error adding documents to the keyword index: {e}")
+
+    async def async_index_documents(
+        self,
+        documents: Sequence[Document],
+        content_hash: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        replace: bool = False,
+    ) -> None:
+        """Add ingested documents to the keyword index in a thread, so tokenizing and saving them doesn't block the
+        event loop"""
+        await run_in_vectordb_executor(self.index_documents, documents, content_hash, metadata, replace)
@@ -0,0 +1,496 @@
+"""Durable job queue for ingesting content into knowledge bases.
+
+Jobs and the bodies of uploaded files are spooled to disk, so accepted content survives restarts and uploads are
+not held in memory while they wait. A bounded pool of workers processes the jobs, retrying failures with
+exponential backoff. The status of each content is kept up to date in the contents DB of its knowledge base.
+
+The workers can run in the process that accepts the uploads, or in separate processes sharing the spool directory:
+
+    queue = IngestionQueue(knowledge_instances=[knowledge], spool_dir="/var/lib/agno/ingestion", num_workers=4)
+    asyncio.run(queue.run())
+
+Spool directory layout:
+    pending/<ready_at>_<job_id>.json
+                            jobs waiting to be processed. <ready_at> is the time in ms from which the job can run,
+                            zero-padded so workers claim jobs in order from the sorted file names alone.
+    running/<job_id>.json   jobs claimed by a worker. Workers refresh the file while they run, and jobs whose
+                            worker stopped refreshing them (e.g. after a crash) are moved back to pending.
+    failed/<job_id>.json    jobs that failed on every attempt
+    bodies/<job_id>         uploaded file contents
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, List, Optional
+from uuid import uuid4
+
+from agno.knowledge.content import Content, ContentStatus, FileData
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader import ReaderFactory
+from agno.utils.common import get_private_temp_dir
+from agno.utils.log import log_debug, log_error, log_info, log_warning
+
+# Size of the blocks copied when spooling an upload to disk
+SPOOL_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass
+class IngestionJob:
+    """Everything needed to (re)process a content, as persisted in the spool directory"""
+
+    content_id: str
+    content_hash: Optional[str] = None
+    name: Optional[str] = None
+    description: Optional[str] = None
+    url: Optional[Any] = None
+    metadata: Optional[Dict[str, Any]] = None
+    # Set for uploaded files and text, whose body is spooled to disk
+    file_type: Optional[str] = None
+    filename: Optional[str] = None
+    size: Optional[int] = None
+    has_body: bool = False
+    reader_id: Optional[str] = None
+    chunker: Optional[str] = None
+    # ID of the contents DB of the knowledge base the content belongs to
+    db_id: Optional[str] = None
+
+    id: str = field(default_factory=lambda: str(uuid4()))
+    attempts: int = 0
+    created_at: int = field(default_factory=lambda: int(time.time()))
+    next_attempt_at: float = 0.0
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IngestionJob":
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+@dataclass
+class IngestionMetrics:
+    """Counters of the jobs processed by the workers of this process"""
+
+    enqueued: int = 0
+    completed: int = 0
+    failed: int = 0
+    retried: int = 0
+    # Jobs moved back to pending after their worker stopped refreshing them
+    recovered: int = 0
+    total_processing_time: float = 0.0
+    # Completion times of recent jobs, used to compute the throughput
+    recent_completions: Deque[float] = field(default_factory=lambda: deque(maxlen=10_000))
+
+    def record_completion(self, processing_time: float) -> None:
+        self.completed += 1
+        self.total_processing_time += processing_time
+        self.recent_completions.append(time.time())
+
+    def throughput(self, window: float = 60.0) -> float:
+        """Jobs completed per minute over the last `window` seconds"""
+        since = time.time() - window
+        return sum(1 for completed_at in self.recent_completions if completed_at >= since) * 60.0 / window
+
+    @property
+    def avg_processing_time(self) -> float:
+        return self.total_processing_time / self.completed if self.completed else 0.0
+
+
+def resolve_content_reader(
+    knowledge: Knowledge, content: Content, reader_id: Optional[str] = None, chunker: Optional[str] = None
+) -> None:
+    """Set the reader requested by its id (a custom reader of the knowledge base or a reader key), and its chunker"""
+    if reader_id:
+        reader = None
+        if knowledge.readers and reader_id in knowledge.readers:
+            reader = knowledge.readers[reader_id]
+        else:
+            key = reader_id.lower().strip().replace("-", "_").replace(" ", "_")
+            candidates = [key] + ([key[:-6]] if key.endswith("reader") else [])
+            for cand in candidates:
+                try:
+                    reader = ReaderFactory.create_reader(cand)
+                    log_debug(f"Resolved reader: {reader.__class__.__name__}")
+                    break
+                except Exception:
+                    continue
+        if reader:
+            content.reader = reader
+    if chunker and content.reader:
+        # Set the chunker name on the reader - let the reader handle it internally
+        content.reader.set_chunking_strategy_from_string(chunker)
+        log_debug(f"Set chunking strategy: {chunker}")
+
+
+class IngestionQueue:
+    """Durable, bounded queue of content ingestion jobs.
+
+    Args:
+        knowledge_instances: Knowledge bases the jobs belong to, matched on the ID of their contents DB.
+        spool_dir: Directory where jobs and uploads are spooled. Defaults to a private directory of the current user in
+            the system temp dir, named after the contents DBs of the knowledge bases, so only queues of the same
+            knowledge bases share it.
+        num_workers: Number of jobs processed concurrently by `start`/`run`.
+        max_attempts: Number of times a job is attempted before it is marked as failed.
+        retry_delay: Delay before the first retry, doubled on every following attempt.
+        lease_timeout: Seconds after which a running job that is no longer refreshed by its worker is recovered.
+        poll_interval: Seconds between checks for jobs enqueued by other processes.
+    """
+
+    def __init__(
+        self,
+        knowledge_instances: List[Knowledge],
+        spool_dir: Optional[str] = None,
+        num_workers: int = 2,
+        max_attempts: int = 3,
+        retry_delay: float = 5.0,
+        lease_timeout: float = 60.0,
+        poll_interval: float = 1.0,
+    ):
+        self.knowledge_instances = knowledge_instances
+        self.spool_dir = Path(spool_dir) if spool_dir else self._default_spool_dir(knowledge_instances)
+        self.num_workers = num_workers
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self.metrics = IngestionMetrics()
+
+        for directory in (self.pending_dir, self.running_dir, self.failed_dir, self.bodies_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        self._workers: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def _default_spool_dir(knowledge_instances: List[Knowledge]) -> Path:
+        db_ids = sorted(
+            str(knowledge.contents_db.id) if knowledge.contents_db else f"knowledge:{knowledge.name}"
+            for knowledge in knowledge_instances
+        )
+        namespace = hashlib.sha256("\n".join(db_ids).encode("utf-8")).hexdigest()[:16]
+        return get_private_temp_dir("ingestion", namespace)
+
+    @property
+    def pending_dir(self) -> Path:
+        return self.spool_dir / "pending"
+
+    @property
+    def running_dir(self) -> Path:
+        return self.spool_dir / "running"
+
+    @property
+    def failed_dir(self) -> Path:
+        return self.spool_dir / "failed"
+
+    @property
+    def bodies_dir(self) -> Path:
+        return self.spool_dir / "bodies"
+
+    def body_path(self, job: IngestionJob) -> Path:
+        return self.bodies_dir / job.id
+
+    # --- Enqueueing ---
+
+    def spool_body(self, job: IngestionJob, source: IO[bytes]) -> None:
+        """Copy the body of an upload to the spool directory, block by block."""
+        try:
+            with open(self.body_path(job), "wb") as body:
+                shutil.copyfileobj(source, body, SPOOL_BLOCK_SIZE)
+        except BaseException:
+            self.body_path(job).unlink(missing_ok=True)
+            raise
+        job.has_body = True
+        job.size = self.body_path(job).stat().st_size
+
+    def enqueue(self, job: IngestionJob) -> None:
+        """Persist a job and mark its content as processing in the contents DB.
+
+        The spooled body of the job is deleted if the job can't be enqueued.
+        """
+        try:
+            knowledge = self._get_knowledge(job)
+            content = self.build_content(job, load_body=False)
+            content.status = ContentStatus.PROCESSING
+            content.status_message = "Queued for processing"
+            knowledge._add_to_contents_db(content)
+
+            self._write_job(self.pending_dir, job)
+        except BaseException:
+            self._delete_body(job)
+            raise
+        self.metrics.enqueued += 1
+        log_debug(f"Enqueued ingestion job {job.id} for content {job.content_id}")
+        self._notify()
+
+    # --- Workers ---
+
+    @property
+    def started(self) -> bool:
+        return any(not worker.done() for worker in self._workers)
+
+    def start(self) -> None:
+        """Start the workers on the running event loop. Does nothing if they are already running."""
+        if self.started or self.num_workers <= 0:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"agno-ingestion-worker-{i}") for i in range(self.num_workers)
+        ]
+        log_info(f"Started {self.num_workers} knowledge ingestion workers")
+
+    async def stop(self) -> None:
+        """Stop the workers. Jobs they were running are retried by the next worker to start."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def run(self) -> None:
+        """Run the workers until cancelled, e.g. in a dedicated worker process."""
+        self.start()
+        try:
+            await asyncio.gather(*self._workers)
+        finally:
+            await self.stop()
+
+    def _notify(self) -> None:
+        if self._wakeup is None or self._loop is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _worker(self) -> None:
+        while True:
+            self._recover_expired_jobs()
+            job = self._claim_next_job()
+            if job is None:
+                assert self._wakeup is not None
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heartbeat = asyncio.create_task(self._heartbeat(job))
+            try:
+                await self.process(job)
+            finally:
+                heartbeat.cancel()
+
+    async def _heartbeat(self, job: IngestionJob) -> None:
+        path = self.running_dir / f"{job.id}.json"
+        while True:
+            await asyncio.sleep(self.lease_timeout / 3)
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                return
+
+    async def process(self, job: IngestionJob) -> None:
+        """Process a claimed job, then complete, reschedule or fail it."""
+        start = time.perf_counter()
+        try:
+            knowledge = self._get_knowledge(job)
+            content = await asyncio.get_running_loop().run_in_executor(None, self.build_content, job)
+            resolve_content_reader(knowledge, content, job.reader_id, job.chunker)
+            log_debug(f"Using reader: {content.reader.__class__.__name__}")
+            await knowledge._load_content(content, upsert=False, skip_if_exists=True)
+        except Exception as e:
+            self._retry_or_fail(job, e)
+            return
+
+        if content.status == ContentStatus.FAILED:
+            # The knowledge base rejected the content itself (e.g. it could not be read), so retrying won't help
+            log_warning(f"Content {job.content_id} failed to process: {content.status_message}")
+            self.metrics.failed += 1
+            job.last_error = content.status_message
+            self._move_job(job, self.running_dir, self.failed_dir)
+            self._delete_body(job)
+            return
+
+        self.metrics.record_completion(time.perf_counter() - start)
+        log_info(f"Content {job.content_id} processed successfully")
+        (self.running_dir / f"{job.id}.json").unlink(missing_ok=True)
+        self._delete_body(job)
+
+    def _retry_or_fail(self, job: IngestionJob, error: Exception) -> None:
+        job.last_error = str(error)
+        if job.attempts < self.max_attempts:
+            delay = self.retry_delay * 2 ** (job.attempts - 1)
+            log_warning(
+                f"Error processing content {job.content_id} (attempt {job.attempts}/{self.max_attempts}), "
+                f"retrying in {delay:.0f}s: {error}"
+            )
+            job.next_attempt_at = time.time() + delay
+            self.metrics.retried += 1
+            self._set_content_status(job, ContentStatus.PROCESSING, f"Retrying after error: {error}")
+            self._move_job(job, self.running_dir, self.pending_dir)
+            self._notify()
+            return
+
+        log_error(f"Error processing content {job.content_id}, giving up after {job.attempts} attempts: {error}")
+        self.metrics.failed += 1
+        self._set_content_status(job, ContentStatus.FAILED, str(error))
+        self._move_job(job, self.running_dir, self.failed_dir)
+        self._delete_body(job)
+
+    # --- Job files ---
+
+    def _job_path(self, directory: Path, job: IngestionJob) -> Path:
+        if directory == self.pending_dir:
+            ready_at = max(job.next_attempt_at, job.created_at)
+            return directory / f"{int(ready_at * 1000):015d}_{job.id}.json"
+        return directory / f"{job.id}.json"
+
+    def _write_job(self, directory: Path, job: IngestionJob) -> None:
+        # Write then rename, so readers never see a partially written job
+        path = self._job_path(directory, job)
+        tmp_path = directory / f".{job.id}.json.tmp"
+        tmp_path.write_text(json.dumps(job.to_dict()))
+        os.replace(tmp_path, path)
+
+    def _read_job(self, path: Path) -> Optional[IngestionJob]:
+        try:
+            return IngestionJob.from_dict(json.loads(path.read_text()))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log_error(f"Invalid ingestion job file {path}: {e}")
+            return None
+
+    def _move_job(self, job: IngestionJob, source: Path, destination: Path) -> None:
+        self._write_job(destination, job)
+        self._job_path(source, job).unlink(missing_ok=True)
+
+    def _claim_next_job(self) -> Optional[IngestionJob]:
+        now_ms = int(time.time() * 1000)
+        # Pending file names start with the time the job is ready, so only the claimed job is read
+        for name in sorted(os.listdir(self.pending_dir)):
+            ready_at, _, job_file = name.partition("_")
+            if not ready_at.isdigit() or not job_file.endswith(".json"):
+                continue
+            if int(ready_at) > now_ms:
+                break
+            running_path = self.running_dir / job_file
+            try:
+                # The rename is atomic, so only one worker (in any process) can claim a job
+                os.replace(self.pending_dir / name, running_path)
+            except FileNotFoundError:
+                continue
+            job = self._read_job(running_path)
+            if job is None:
+                # Don't keep recovering a job that can't be read
+                os.replace(running_path, self.failed_dir / job_file)
+                continue
+            # Count the attempt before processing starts, so a job that kills its worker still runs out of attempts.
+            # Writing the job also starts the lease from now.
+            job.attempts += 1
+            self._write_job(self.running_dir, job)
+            return job
+        return None
+
+    def _recover_expired_jobs(self) -> None:
+        expired_before = time.time() - self.lease_timeout
+        for path in self.running_dir.glob("*.json"):
+            try:
+                if path.stat().st_mtime >= expired_before:
+                    continue
+            except FileNotFoundError:
+                continue
+            job = self._read_job(path)
+            if job is not None and job.attempts >= self.max_attempts:
+                # The job stopped its worker on every attempt
+                self._retry_or_fail(job, RuntimeError("The worker processing the content stopped"))
+                continue
+            try:
+                os.replace(path, self.pending_dir / f"{int(time.time() * 1000):015d}_{path.name}")
+            except FileNotFoundError:
+                continue
+            log_warning(f"Recovered ingestion job {path.stem} from a stopped worker")
+            self.metrics.recovered += 1
+
+    def _delete_body(self, job: IngestionJob) -> None:
+        if job.has_body:
+            self.body_path(job).unlink(missing_ok=True)
+
+    # --- Content ---
+
+    def _get_knowledge(self, job: IngestionJob) -> Knowledge:
+        if job.db_id is None and len(self.knowledge_instances) == 1:
+            return self.knowledge_instances[0]
+        for knowledge in self.knowledge_instances:
+            if knowledge.contents_db and knowledge.contents_db.id == job.db_id:
+                return knowledge
+        raise ValueError(f"Knowledge instance with id '{job.db_id}' not found")
+
+    def build_content(self, job: IngestionJob, load_body: bool = True) -> Content:
+        file_data = None
+        if job.has_body:
+            file_data = FileData(
+                content=self.body_path(job).read_bytes() if load_body else None,
+                type=job.file_type,
+                filename=job.filename,
+                size=job.size,
+            )
+        return Content(
+            id=job.content_id,
+            name=job.name,
+            description=job.description,
+            url=job.url,
+            metadata=job.metadata,
+            file_data=file_data,
+            size=job.size,
+            content_hash=job.content_hash,
+            created_at=job.created_at,
+        )
+
+    def _set_content_status(self, job: IngestionJob, status: ContentStatus, status_message: str) -> None:
+        try:
+            content = self.build_content(job, load_body=False)
+            content.status = status
+            content.status_message = status_message
+            self._get_knowledge(job).patch_content(content)
+        except Exception as e:
+            # Never let a contents DB error take down a worker
+            log_warning(f"Could not update the status of content {job.content_id}: {e}")
+
+    # --- Metrics ---
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth (shared by all processes using the spool directory) and this process' counters"""
+        now = time.time()
+        pending = [job for job in map(self._read_job, self.pending_dir.glob("*_*.json")) if job is not None]
+        oldest = min((job.created_at for job in pending), default=None)
+        return {
+            "pending": len(pending),
+            "scheduled_retries": sum(1 for job in pending if job.next_attempt_at > now),
+            "running": sum(1 for _ in self.running_dir.glob("*.json")),
+            "failed": sum(1 for _ in self.failed_dir.glob("*.json")),
+            "oldest_pending_age": now - oldest if oldest is not None else None,
+            "workers": sum(1 for worker in self._workers if not worker.done()),
+            "enqueued": self.metrics.enqueued,
+            "completed": self.metrics.completed,
+            "failed_total": self.metrics.failed,
+            "retried": self.metrics.retried,
+            "recovered": self.metrics.recovered,
+            "throughput_per_minute": self.metrics.throughput(),
+            "avg_processing_time": self.metrics.avg_processing_time,
+        }
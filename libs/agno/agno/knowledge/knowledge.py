@@ -2,6 +2,8 @@ import asyncio
 import hashlib
 import io
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass
 from enum import Enum
 from functools import cached_property
@@ -16,8 +18,11 @@ from agno.db.base import BaseDb
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.knowledge.content import Content, ContentAuth, ContentStatus, FileData
 from agno.knowledge.document import Document
+from agno.knowledge.hybrid import HybridSearch
+from agno.knowledge.multi_query import async_embed_queries, embed_queries, merge_results, unique_queries
 from agno.knowledge.reader import Reader, ReaderFactory
 from agno.knowledge.remote_content.remote_content import GCSContent, RemoteContent, S3Content
+from agno.knowledge.search_cache import SearchCache, build_search_key
 from agno.utils.http import async_fetch_with_retry
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -42,6 +47,10 @@ class Knowledge:
     contents_db: Optional[BaseDb] = None
     max_results: int = 10
     readers: Optional[Dict[str, Reader]] = None
+    # Fuse the vector db results with a local keyword index of the ingested documents
+    hybrid_search: Optional[HybridSearch] = None
+    # Cache search results until the content of the knowledge base changes
+    search_cache: Optional[SearchCache] = None
 
     def __post_init__(self):
         from agno.vectordb import VectorDb
@@ -52,6 +61,13 @@ class Knowledge:
 
         self.construct_readers()
         self.valid_metadata_filters = set()
+        # Bumped whenever content is ingested, updated or removed, to invalidate cached search results
+        self.content_version = 0
+
+    def _bump_content_version(self) -> None:
+        self.content_version += 1
+        if self.search_cache is not None:
+            self.search_cache.clear()
 
     # --- SDK Specific Methods ---
 
@@ -963,6 +979,11 @@ class Knowledge:
                 self._update_content(content)
                 return
 
+        if self.hybrid_search is not None:
+            await self.hybrid_search.async_index_documents(
+                read_documents, content_hash=content.content_hash, metadata=content.metadata, replace=upsert
+            )
+
         content.status = ContentStatus.COMPLETED
         self._update_content(content)
 
@@ -1003,7 +1024,8 @@ class Knowledge:
         elif content.url:
             hash = hashlib.sha256(content.url.encode()).hexdigest()
             return hash
-        elif content.file_data and content.file_data.content:
+        elif content.file_data and (content.file_data.content or content.file_data.size):
+            # Uploads spooled to disk are hashed before their body is loaded
             name = content.name or "content"
             return hashlib.sha256(name.encode()).hexdigest()
         elif content.topics and len(content.topics) > 0:
@@ -1108,6 +1130,9 @@ class Knowledge:
         from agno.vectordb import VectorDb
 
         self.vector_db = cast(VectorDb, self.vector_db)
+        # Ingestion finished, possibly after writing part of the documents
+        if content.status in (ContentStatus.COMPLETED, ContentStatus.FAILED):
+            self._bump_content_version()
         if self.contents_db:
             if not content.id:
                 log_warning("Content id is required to update Knowledge content")
@@ -1143,6 +1168,7 @@ class Knowledge:
 
             if self.vector_db and content.metadata:
                 self.vector_db.update_metadata(content_id=content.id, metadata=content.metadata)
+                self._bump_content_version()
 
             if content.metadata:
                 self.add_filters(content.metadata)
@@ -1327,8 +1353,18 @@ class Knowledge:
                 return []
 
             _max_results = max_results or self.max_results
+            key, version = build_search_key(query, _max_results, filters), self.content_version
+            if self.search_cache is not None:
+                cached = self.search_cache.get(key, version)
+                if cached is not None:
+                    log_debug(f"Using cached search results for query: {query}")
+                    return cached
+
             log_debug(f"Getting {_max_results} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_max_results, filters=filters)
+            documents = self._search(query, _max_results, filters)
+            if self.search_cache is not None:
+                self.search_cache.set(key, version, documents)
+            return documents
         except Exception as e:
             log_error(f"Error searching for documents: {e}")
             return []
@@ -1347,16 +1383,155 @@ class Knowledge:
                 return []
 
             _max_results = max_results or self.max_results
+            key, version = build_search_key(query, _max_results, filters), self.content_version
+            if self.search_cache is not None:
+                cached = self.search_cache.get(key, version)
+                if cached is not None:
+                    log_debug(f"Using cached search results for query: {query}")
+                    return cached
+
             log_debug(f"Getting {_max_results} relevant documents for query: {query}")
-            try:
-                return await self.vector_db.async_search(query=query, limit=_max_results, filters=filters)
-            except NotImplementedError:
-                log_info("Vector db does not support async search")
-                return self.search(query=query, max_results=_max_results, filters=filters)
+            documents = await self._async_search(query, _max_results, filters)
+            if self.search_cache is not None:
+                self.search_cache.set(key, version, documents)
+            return documents
         except Exception as e:
             log_error(f"Error searching for documents: {e}")
             return []
 
+    def search_many(
+        self, queries: List[str], max_results: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Returns relevant documents matching any of the queries.
+
+        The queries are embedded with a single embedder call when the vector db can search with a given embedding,
+        and searched concurrently. The results are merged without duplicates, keeping at most `max_results` documents.
+        """
+
+        from agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+        if self.vector_db is None:
+            log_warning("No vector db provided")
+            return []
+
+        _max_results = max_results or self.max_results
+        queries = unique_queries(queries)
+        results, pending = self._get_cached_searches(queries, _max_results, filters)
+        if pending:
+            log_debug(f"Getting {_max_results} relevant documents for {len(pending)} queries: {pending}")
+            version = self.content_version
+            embeddings: List[Optional[List[float]]] = [None] * len(pending)
+            if self.hybrid_search is None and self.vector_db.embedding_search_available():
+                embeddings = embed_queries(getattr(self.vector_db, "embedder"), pending)
+
+            max_workers = min(len(pending), self.vector_db.search_concurrency or 8)
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-search") as executor:
+                futures = [
+                    executor.submit(copy_context().run, self._search, query, _max_results, filters, embedding)
+                    for query, embedding in zip(pending, embeddings)
+                ]
+                for query, future in zip(pending, futures):
+                    try:
+                        results[query] = future.result()
+                    except Exception as e:
+                        log_error(f"Error searching for documents matching '{query}': {e}")
+                        continue
+                    if self.search_cache is not None:
+                        self.search_cache.set(build_search_key(query, _max_results, filters), version, results[query])
+
+        return merge_results([results[query] for query in queries if query in results], limit=_max_results)
+
+    async def async_search_many(
+        self, queries: List[str], max_results: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Returns relevant documents matching any of the queries, searching them concurrently"""
+
+        from agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+        if self.vector_db is None:
+            log_warning("No vector db provided")
+            return []
+
+        _max_results = max_results or self.max_results
+        queries = unique_queries(queries)
+        results, pending = self._get_cached_searches(queries, _max_results, filters)
+        if pending:
+            log_debug(f"Getting {_max_results} relevant documents for {len(pending)} queries: {pending}")
+            version = self.content_version
+            embeddings: List[Optional[List[float]]] = [None] * len(pending)
+            if self.hybrid_search is None and self.vector_db.embedding_search_available():
+                embeddings = await async_embed_queries(getattr(self.vector_db, "embedder"), pending)
+
+            searches = await asyncio.gather(
+                *[
+                    self._async_search(query, _max_results, filters, embedding)
+                    for query, embedding in zip(pending, embeddings)
+                ],
+                return_exceptions=True,
+            )
+            for query, documents in zip(pending, searches):
+                if isinstance(documents, BaseException):
+                    log_error(f"Error searching for documents matching '{query}': {documents}")
+                    continue
+                results[query] = documents
+                if self.search_cache is not None:
+                    self.search_cache.set(build_search_key(query, _max_results, filters), version, documents)
+
+        return merge_results([results[query] for query in queries if query in results], limit=_max_results)
+
+    def _get_cached_searches(
+        self, queries: List[str], max_results: int, filters: Optional[Dict[str, Any]]
+    ) -> Tuple[Dict[str, List[Document]], List[str]]:
+        """Split queries into the cached results and the queries to search"""
+        results: Dict[str, List[Document]] = {}
+        pending: List[str] = []
+        for query in queries:
+            cached = None
+            if self.search_cache is not None:
+                cached = self.search_cache.get(build_search_key(query, max_results, filters), self.content_version)
+            if cached is not None:
+                results[query] = cached
+            else:
+                pending.append(query)
+        return results, pending
+
+    def _search(
+        self,
+        query: str,
+        max_results: int,
+        filters: Optional[Dict[str, Any]],
+        embedding: Optional[List[float]] = None,
+    ) -> List[Document]:
+        from agno.vectordb import VectorDb
+
+        vector_db = cast(VectorDb, self.vector_db)
+        if embedding is not None:
+            return vector_db.search_with_embedding(query, embedding, limit=max_results, filters=filters)
+        if self.hybrid_search is not None:
+            return self.hybrid_search.search(vector_db, query=query, limit=max_results, filters=filters)
+        return vector_db.search(query=query, limit=max_results, filters=filters)
+
+    async def _async_search(
+        self,
+        query: str,
+        max_results: int,
+        filters: Optional[Dict[str, Any]],
+        embedding: Optional[List[float]] = None,
+    ) -> List[Document]:
+        from agno.vectordb import VectorDb
+
+        vector_db = cast(VectorDb, self.vector_db)
+        if embedding is not None:
+            return await vector_db.run_in_executor(
+                vector_db.search_with_embedding, query, embedding, limit=max_results, filters=filters
+            )
+        if self.hybrid_search is not None:
+            return await self.hybrid_search.async_search(vector_db, query=query, limit=max_results, filters=filters)
+        # Falls back to the sync search in a thread pool when the vector db has no async search
+        return await vector_db.run_async_search(query=query, limit=max_results, filters=filters)
+
     def get_valid_filters(self) -> Set[str]:
         if self.valid_metadata_filters is None:
             self.valid_metadata_filters = set()
@@ -1417,7 +1592,11 @@ class Knowledge:
         if self.vector_db is None:
             log_warning("No vector DB provided")
             return False
-        return self.vector_db.delete_by_id(id)
+        if self.hybrid_search is not None:
+            self.hybrid_search.index.remove_by_id(id)
+        removed = self.vector_db.delete_by_id(id)
+        self._bump_content_version()
+        return removed
 
     def remove_vectors_by_name(self, name: str) -> bool:
         from agno.vectordb import VectorDb
@@ -1426,7 +1605,11 @@ class Knowledge:
         if self.vector_db is None:
             log_warning("No vector DB provided")
             return False
-        return self.vector_db.delete_by_name(name)
+        if self.hybrid_search is not None:
+            self.hybrid_search.index.remove_by_name(name)
+        removed = self.vector_db.delete_by_name(name)
+        self._bump_content_version()
+        return removed
 
     def remove_vectors_by_metadata(self, metadata: Dict[str, Any]) -> bool:
         from agno.vectordb import VectorDb
@@ -1435,7 +1618,11 @@ class Knowledge:
         if self.vector_db is None:
             log_warning("No vector DB provided")
             return False
-        return self.vector_db.delete_by_metadata(metadata)
+        if self.hybrid_search is not None:
+            self.hybrid_search.index.remove_by_metadata(metadata)
+        removed = self.vector_db.delete_by_metadata(metadata)
+        self._bump_content_version()
+        return removed
 
     # --- API Only Methods ---
 
@@ -1531,6 +1718,9 @@ class Knowledge:
                     log_warning(f"No external_id found for content {content_id}, cannot delete from LightRAG")
             else:
                 self.vector_db.delete_by_content_id(content_id)
+        if self.hybrid_search is not None:
+            self.hybrid_search.index.remove_by_content_id(content_id)
+        self._bump_content_version()
 
         if self.contents_db is not None:
             self.contents_db.delete_knowledge_content(content_id)
@@ -0,0 +1,179 @@
+import json
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agno.utils.log import log_debug, log_warning
+
+ModelKey = Tuple[str, str, str]
+
+
+def estimate_model_size(model: Any) -> int:
+    """Estimate the memory used by a loaded model, in bytes, from the size of its parameters. 0 if unknown."""
+    for module in (model, getattr(model, "model", None)):
+        parameters = getattr(module, "parameters", None)
+        if callable(parameters):
+            try:
+                return sum(parameter.numel() * parameter.element_size() for parameter in parameters())
+            except Exception:
+                continue
+    return 0
+
+
+@dataclass
+class _LoadedModel:
+    model: Any = None
+    size: int = 0
+    last_used: float = 0.0
+    # Weak references to the objects using the model, by their id
+    holders: Dict[int, weakref.ref] = field(default_factory=dict)
+    # Held while the model is loaded, so concurrent requests for it load it once
+    load_lock: Lock = field(default_factory=Lock)
+
+
+class LocalModelRegistry:
+    """Process-wide registry of the local models loaded by embedders and rerankers.
+
+    A model is loaded once per model id and loading arguments, and shared by every embedder or reranker using it, so
+    copies of an Agent or Knowledge don't load their own copy of the weights. Each model counts the objects using it,
+    and is released once all of them were garbage collected.
+
+    Released models stay loaded, so a model used again later doesn't have to be reloaded. If `max_memory_bytes` is set,
+    the least recently used released models are evicted once the loaded models use more memory than that.
+    """
+
+    def __init__(self, max_memory_bytes: Optional[int] = None):
+        self.max_memory_bytes = max_memory_bytes
+        self._models: Dict[ModelKey, _LoadedModel] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def get_key(kind: str, model_id: str, kwargs: Optional[Dict[str, Any]] = None) -> ModelKey:
+        return (kind, model_id, json.dumps(kwargs or {}, sort_keys=True, default=str))
+
+    def get(
+        self,
+        kind: str,
+        model_id: str,
+        load: Callable[[], Any],
+        kwargs: Optional[Dict[str, Any]] = None,
+        holder: Optional[Any] = None,
+    ) -> Any:
+        """Return the model, loading it with `load` if it isn't loaded yet.
+
+        Args:
+            kind: Kind of model, e.g. "sentence-transformer" or "cross-encoder"
+            model_id: Id of the model
+            load: Function loading the model
+            kwargs: Arguments the model is loaded with, as loading it with different arguments gives a different model
+            holder: Object using the model. The model is referenced until it is garbage collected.
+        """
+        key = self.get_key(kind, model_id, kwargs)
+        with self._lock:
+            loaded_model = self._models.setdefault(key, _LoadedModel())
+
+        if loaded_model.model is None:
+            with loaded_model.load_lock:
+                if loaded_model.model is None:
+                    log_debug(f"Loading local model {model_id}")
+                    model = load()
+                    loaded_model.size = estimate_model_size(model)
+                    loaded_model.model = model
+
+        loaded_model.last_used = monotonic()
+        if holder is not None and id(holder) not in loaded_model.holders:
+            self._add_holder(key, loaded_model, holder)
+        self._evict_over_budget()
+        return loaded_model.model
+
+    def _add_holder(self, key: ModelKey, loaded_model: _LoadedModel, holder: Any) -> None:
+        holder_id = id(holder)
+
+        def release(_: Any) -> None:
+            self._release(key, holder_id)
+
+        try:
+            reference = weakref.ref(holder, release)
+        except TypeError:
+            log_warning(f"{type(holder).__name__} can't be tracked by the local model registry")
+            return
+        with self._lock:
+            loaded_model.holders[holder_id] = reference
+
+    def _release(self, key: ModelKey, holder_id: int) -> None:
+        with self._lock:
+            loaded_model = self._models.get(key)
+            if loaded_model is not None:
+                loaded_model.holders.pop(holder_id, None)
+
+    def release(self, holder: Any) -> None:
+        """Stop referencing the models used by the holder"""
+        with self._lock:
+            for loaded_model in self._models.values():
+                loaded_model.holders.pop(id(holder), None)
+
+    def get_reference_count(self, kind: str, model_id: str, kwargs: Optional[Dict[str, Any]] = None) -> int:
+        loaded_model = self._models.get(self.get_key(kind, model_id, kwargs))
+        return len(loaded_model.holders) if loaded_model is not None else 0
+
+    def is_loaded(self, kind: str, model_id: str, kwargs: Optional[Dict[str, Any]] = None) -> bool:
+        loaded_model = self._models.get(self.get_key(kind, model_id, kwargs))
+        return loaded_model is not None and loaded_model.model is not None
+
+    @property
+    def memory_usage(self) -> int:
+        """Estimated memory used by the loaded models, in bytes"""
+        return sum(loaded_model.size for loaded_model in list(self._models.values()))
+
+    def _evict_over_budget(self) -> None:
+        if self.max_memory_bytes is None or self.memory_usage <= self.max_memory_bytes:
+            return
+        with self._lock:
+            released = sorted(
+                (item for item in self._models.items() if not item[1].holders and item[1].model is not None),
+                key=lambda item: item[1].last_used,
+            )
+            memory_usage = sum(loaded_model.size for loaded_model in self._models.values())
+            for key, loaded_model in released:
+                if memory_usage <= self.max_memory_bytes:
+                    break
+                log_debug(f"Evicting local model {key[1]} to stay within the memory budget")
+                memory_usage -= loaded_model.size
+                del self._models[key]
+
+    def evict(self, kind: str, model_id: str, kwargs: Optional[Dict[str, Any]] = None) -> None:
+        """Unload a model. Objects still using it load it again on their next use."""
+        with self._lock:
+            self._models.pop(self.get_key(kind, model_id, kwargs), None)
+
+    def clear(self) -> None:
+        """Unload all models"""
+        with self._lock:
+            self._models.clear()
+
+
+_registry = LocalModelRegistry()
+
+
+def get_local_model_registry() -> LocalModelRegistry:
+    """Return the process-wide registry of local models"""
+    return _registry
+
+
+def warm_up_local_models(*components: Any, max_workers: Optional[int] = None) -> None:
+    """Load the models of local embedders and rerankers ahead of their first use, e.g. when an app starts.
+
+    Components without a `warm_up` method, e.g. embedders calling an API, are skipped.
+    """
+    warm_ups: List[Callable[[], None]] = [
+        component.warm_up for component in components if callable(getattr(component, "warm_up", None))
+    ]
+    if not warm_ups:
+        return
+    # Models load mostly in native code, so loading them in threads overlaps the disk reads
+    with ThreadPoolExecutor(max_workers=max_workers or len(warm_ups)) as executor:
+        for future in [executor.submit(warm_up) for warm_up in warm_ups]:
+            future.result()
@@ -0,0 +1,87 @@
+"""Helpers to search a knowledge base for several queries at once.
+
+The queries are embedded with a single batch request to the embedder, searched concurrently, and their results are
+merged into one list without duplicates.
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Sequence
+
+from agno.knowledge.document import Document
+from agno.knowledge.embedder import Embedder
+from agno.knowledge.hybrid import get_document_key, reciprocal_rank_fusion
+from agno.knowledge.search_cache import normalize_query
+from agno.utils.log import log_warning
+
+
+def unique_queries(queries: Sequence[str]) -> List[str]:
+    """Drop empty queries and queries that only differ from a previous one by case or whitespace"""
+    seen = set()
+    result = []
+    for query in queries:
+        normalized = normalize_query(query)
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            result.append(query)
+    return result
+
+
+def embed_queries(embedder: Embedder, queries: List[str]) -> List[Optional[List[float]]]:
+    """Embed the queries in one batch request when the embedder supports it, and one by one otherwise.
+
+    Queries that could not be embedded get None.
+    """
+    if hasattr(embedder, "get_embeddings_batch_and_usage"):
+        try:
+            embeddings, _ = embedder.get_embeddings_batch_and_usage(queries)
+            if len(embeddings) == len(queries):
+                return list(embeddings)
+        except Exception as e:
+            log_warning(f"Batch embedding of the queries failed, embedding them one by one: {e}")
+
+    results: List[Optional[List[float]]] = []
+    for query in queries:
+        try:
+            results.append(embedder.get_embedding(query) or None)
+        except Exception as e:
+            log_warning(f"Error embedding query '{query}': {e}")
+            results.append(None)
+    return results
+
+
+async def async_embed_queries(embedder: Embedder, queries: List[str]) -> List[Optional[List[float]]]:
+    """Async version of `embed_queries`, embedding the queries concurrently when there is no batch support"""
+    if hasattr(embedder, "async_get_embeddings_batch_and_usage"):
+        try:
+            embeddings, _ = await embedder.async_get_embeddings_batch_and_usage(queries)
+            if len(embeddings) == len(queries):
+                return list(embeddings)
+        except Exception as e:
+            log_warning(f"Batch embedding of the queries failed, embedding them one by one: {e}")
+
+    async def embed(query: str) -> Optional[List[float]]:
+        try:
+            return await embedder.async_get_embedding(query) or None
+        except Exception as e:
+            log_warning(f"Error embedding query '{query}': {e}")
+            return None
+
+    return list(await asyncio.gather(*[embed(query) for query in queries]))
+
+
+def merge_results(rankings: Sequence[Sequence[Document]], limit: Optional[int] = None) -> List[Document]:
+    """Merge the results of several queries, keeping one copy of each document.
+
+    Documents are ordered by their best reranking score when every document has one, as scores are then comparable
+    across queries. Otherwise the rankings are merged with reciprocal rank fusion.
+    """
+    documents = [document for ranking in rankings for document in ranking]
+    if documents and all(document.reranking_score is not None for document in documents):
+        best: Dict[str, Document] = {}
+        for document in documents:
+            key = get_document_key(document)
+            if key not in best or document.reranking_score > best[key].reranking_score:  # type: ignore
+                best[key] = document
+        merged = sorted(best.values(), key=lambda document: document.reranking_score, reverse=True)  # type: ignore
+        return merged[:limit]
+    return reciprocal_rank_fusion(rankings, limit=limit)
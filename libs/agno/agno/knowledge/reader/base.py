@@ -1,9 +1,14 @@
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional
 
 from agno.knowledge.chunking.fixed import FixedSizeChunking
-from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyFactory, ChunkingStrategyType
+from agno.knowledge.chunking.strategy import (
+    ChunkingStrategy,
+    ChunkingStrategyFactory,
+    ChunkingStrategyType,
+    TextSource,
+)
 from agno.knowledge.document.base import Document
 from agno.knowledge.types import ContentType
 
@@ -71,6 +76,12 @@ class Reader:
             self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
         return self.chunking_strategy.chunk(document)  # type: ignore
 
+    def chunk_document_stream(self, source: TextSource, document: Document) -> Iterator[Document]:
+        """Chunk text read incrementally from `source`, using `document` for the id, name and meta_data of the chunks."""
+        if self.chunking_strategy is None:
+            self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
+        return self.chunking_strategy.chunk_stream(source, document)
+
     async def chunk_documents_async(self, documents: List[Document]) -> List[Document]:
         """
         Asynchronously chunk a list of documents using the instance's chunk_document method.
@@ -2,7 +2,7 @@ import asyncio
 import csv
 import io
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, Iterator, List, Optional, Union
 from uuid import uuid4
 
 try:
@@ -11,7 +11,7 @@ except ImportError:
     raise ImportError("`aiofiles` not installed. Please install it with `pip install aiofiles`")
 
 from agno.knowledge.chunking.row import RowChunking
-from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyType
+from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyType, iter_text
 from agno.knowledge.document.base import Document
 from agno.knowledge.reader.base import Reader
 from agno.knowledge.types import ContentType
@@ -81,6 +81,47 @@ class CSVReader(Reader):
             logger.error(f"Error reading: {getattr(file, 'name', str(file)) if isinstance(file, IO) else file}: {e}")
             return []
 
+    def read_stream(
+        self, file: Union[Path, IO[Any]], delimiter: str = ",", quotechar: str = '"', name: Optional[str] = None
+    ) -> Iterator[Document]:
+        """Read a CSV file row by row, yielding chunks without loading the whole file into memory."""
+        if isinstance(file, Path):
+            if not file.exists():
+                raise FileNotFoundError(f"Could not find file: {file}")
+            logger.info(f"Reading as a stream: {file}")
+            csv_name = name or file.stem
+            file_content: Any = file.open(newline="", mode="r", encoding=self.encoding or "utf-8")
+        else:
+            logger.info(f"Reading retrieved file as a stream: {name or file.name}")
+            csv_name = name or (
+                getattr(file, "name", "csv_file").split(".")[0] if hasattr(file, "name") else "csv_file"
+            )
+            file.seek(0)
+            # csv.reader only needs an iterable of lines, so decode the upload lazily
+            file_content = self._iter_decoded_lines(file)
+
+        document = Document(name=csv_name, id=str(uuid4()), content="")
+        rows = (", ".join(row) + "\n" for row in csv.reader(file_content, delimiter=delimiter, quotechar=quotechar))
+        try:
+            if self.chunk:
+                yield from self.chunk_document_stream(rows, document)
+            else:
+                document.content = "".join(rows)
+                yield document
+        finally:
+            if hasattr(file_content, "close"):
+                file_content.close()
+
+    def _iter_decoded_lines(self, file: IO[Any]) -> Iterator[str]:
+        partial = ""
+        for block in iter_text(file, encoding=self.encoding or "utf-8"):
+            lines = (partial + block).split("\n")
+            partial = lines.pop()
+            for line in lines:
+                yield line + "\n"
+        if partial:
+            yield partial
+
     async def async_read(
         self,
         file: Union[Path, IO[Any]],
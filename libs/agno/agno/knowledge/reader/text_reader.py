@@ -1,10 +1,10 @@
 import asyncio
 import uuid
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, Iterator, List, Optional, Union
 
 from agno.knowledge.chunking.fixed import FixedSizeChunking
-from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyType
+from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyType, iter_text
 from agno.knowledge.document.base import Document
 from agno.knowledge.reader.base import Reader
 from agno.knowledge.types import ContentType
@@ -63,6 +63,31 @@ class TextReader(Reader):
             logger.error(f"Error reading: {file}: {e}")
             return []
 
+    def read_stream(self, file: Union[Path, IO[Any]], name: Optional[str] = None) -> Iterator[Document]:
+        """Read a text file incrementally, yielding chunks without loading the whole file into memory."""
+        if isinstance(file, Path):
+            if not file.exists():
+                raise FileNotFoundError(f"Could not find file: {file}")
+            log_info(f"Reading as a stream: {file}")
+            document = Document(name=name or file.stem, id=str(uuid.uuid4()), content="")
+            with file.open("r", encoding=self.encoding or "utf-8") as f:
+                if self.chunk:
+                    yield from self.chunk_document_stream(f, document)
+                else:
+                    document.content = f.read()
+                    yield document
+        else:
+            file_name = name or file.name.split(".")[0]
+            log_info(f"Reading uploaded file as a stream: {file_name}")
+            file.seek(0)
+            document = Document(name=file_name, id=str(uuid.uuid4()), content="")
+            blocks = iter_text(file, encoding=self.encoding or "utf-8")
+            if self.chunk:
+                yield from self.chunk_document_stream(blocks, document)
+            else:
+                document.content = "".join(blocks)
+                yield document
+
     async def async_read(self, file: Union[Path, IO[Any]], name: Optional[str] = None) -> List[Document]:
         try:
             if isinstance(file, Path):
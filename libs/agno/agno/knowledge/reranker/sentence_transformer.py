@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Optional
 
 from agno.knowledge.document import Document
+from agno.knowledge.local_models import get_local_model_registry
 from agno.knowledge.reranker.base import Reranker
 from agno.utils.log import logger
 
@@ -15,11 +16,26 @@ class SentenceTransformerReranker(Reranker):
     model_kwargs: Optional[Dict[str, Any]] = None
     top_n: Optional[int] = None
 
+    @property
+    def client(self) -> CrossEncoder:
+        # The model is loaded once per process and shared by all rerankers using it
+        return get_local_model_registry().get(
+            "cross-encoder",
+            self.model,
+            load=lambda: CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs),
+            kwargs=self.model_kwargs,
+            holder=self,
+        )
+
+    def warm_up(self) -> None:
+        """Load the model ahead of the first reranking"""
+        _ = self.client
+
     def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
         if not documents:
             return []
 
-        sentence_transformer_client = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
+        sentence_transformer_client = self.client
 
         top_n = self.top_n
         if top_n and not (0 < top_n):
@@ -0,0 +1,113 @@
+"""Cache of knowledge search results.
+
+Entries are keyed by the normalized query, the filters and the number of results, and are tagged with the content
+version of the knowledge base when they were stored. The knowledge base bumps its content version whenever content is
+ingested, updated or removed, so results computed before the change are never served.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.knowledge.document import Document
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase the query and collapse its whitespace, so trivially different queries share an entry"""
+    return _WHITESPACE.sub(" ", query).strip().lower()
+
+
+def build_search_key(query: str, max_results: int, filters: Optional[Dict[str, Any]] = None) -> str:
+    return json.dumps([normalize_query(query), max_results, filters or {}], sort_keys=True, default=str)
+
+
+@dataclass
+class SearchCacheMetrics:
+    hits: int = 0
+    misses: int = 0
+    # Entries dropped because they expired or were stored before the last content change
+    expired: int = 0
+    invalidated: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "invalidated": self.invalidated,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+@dataclass
+class SearchCache:
+    """In-memory cache of the documents returned by `Knowledge.search` and `Knowledge.async_search`.
+
+    Args:
+        ttl: Seconds after which an entry expires. None keeps entries until the content changes or they are evicted.
+            Set it when other processes write to the same vector db, as their changes don't invalidate the cache.
+        max_entries: Maximum number of search results kept, the least recently used are evicted first.
+    """
+
+    ttl: Optional[float] = 300.0
+    max_entries: int = 1000
+
+    metrics: SearchCacheMetrics = field(default_factory=SearchCacheMetrics)
+    # Search key -> (content version, expiry time, documents)
+    _entries: "OrderedDict[str, Tuple[int, Optional[float], List[Document]]]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def get(self, key: str, version: int) -> Optional[List[Document]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.metrics.misses += 1
+                return None
+            entry_version, expires_at, documents = entry
+            if entry_version != version or (expires_at is not None and expires_at <= time.monotonic()):
+                del self._entries[key]
+                if entry_version != version:
+                    self.metrics.invalidated += 1
+                else:
+                    self.metrics.expired += 1
+                self.metrics.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.metrics.hits += 1
+        # Callers get copies, so changing a returned document doesn't change the cached one
+        return [replace(document) for document in documents]
+
+    def set(self, key: str, version: int, documents: List[Document]) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (version, expires_at, [replace(document) for document in documents])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.metrics.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.metrics.invalidated += len(self._entries)
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {**self.metrics.to_dict(), "entries": len(self._entries)}
@@ -12,6 +12,7 @@ from agno.db.schemas import UserMemory
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.tools.function import Function
+from agno.tracing import traced
 from agno.utils.log import log_debug, log_error, log_warning, set_log_level_to_debug, set_log_level_to_info
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
@@ -25,6 +26,13 @@ class MemorySearchResponse(BaseModel):
     )
 
 
+def _span_attributes(memory_manager: "MemoryManager", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {
+        "user.id": kwargs.get("user_id"),
+        "model.id": memory_manager.model.id if memory_manager.model is not None else None,
+    }
+
+
 @dataclass
 class MemoryManager:
     """Memory Manager"""
@@ -243,6 +251,7 @@ class MemoryManager:
             return None
 
     # -*- Agent Functions
+    @traced("memory.create_user_memories", attributes=_span_attributes)
     def create_user_memories(
         self,
         message: Optional[str] = None,
@@ -291,6 +300,7 @@ class MemoryManager:
         self.read_from_db(user_id=user_id)
         return response
 
+    @traced("memory.create_user_memories", attributes=_span_attributes)
     async def acreate_user_memories(
         self,
         message: Optional[str] = None,
@@ -341,6 +351,7 @@ class MemoryManager:
 
         return response
 
+    @traced("memory.update_memories", attributes=_span_attributes)
     def update_memory_task(self, task: str, user_id: Optional[str] = None) -> str:
         """Updates the memory with a task"""
 
@@ -374,6 +385,7 @@ class MemoryManager:
 
         return response
 
+    @traced("memory.update_memories", attributes=_span_attributes)
     async def aupdate_memory_task(self, task: str, user_id: Optional[str] = None) -> str:
         """Updates the memory with a task"""
         self.set_log_level()
@@ -646,7 +646,7 @@ class AwsBedrock(Model):
             should_yield = False
 
             if response_delta.content:
-                stream_data.response_content += response_delta.content
+                stream_data.content_buffer.append(response_delta.content)
                 should_yield = True
 
             if response_delta.tool_calls:
@@ -687,7 +687,7 @@ class AwsBedrock(Model):
             should_yield = False
 
             if response_delta.content:
-                stream_data.response_content += response_delta.content
+                stream_data.content_buffer.append(response_delta.content)
                 should_yield = True
 
             if response_delta.tool_calls:
@@ -1,7 +1,9 @@
 import asyncio
 import collections.abc
 from abc import ABC, abstractmethod
+from copy import deepcopy
 from dataclasses import dataclass, field
+from time import perf_counter, sleep
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
     Any,
@@ -20,16 +22,21 @@ from uuid import uuid4
 
 from pydantic import BaseModel
 
-from agno.exceptions import AgentRunException
+from agno.exceptions import AgentRunException, ModelProviderError
 from agno.media import Audio, File, Image, Video
+from agno.models.cache.base import ResponseCache, ResponseCacheKey, build_cache_key
+from agno.models.latency import LatencyHistogram, get_latency_histogram
 from agno.models.message import Citations, Message
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
+from agno.models.retry import ModelRetryPolicy, arun_hedged, run_hedged
 from agno.run.agent import CustomEvent, RunContentEvent, RunOutput, RunOutputEvent
 from agno.run.team import RunContentEvent as TeamRunContentEvent
 from agno.run.team import TeamRunOutputEvent
 from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
+from agno.tracing import get_current_span, trace_async_iterator, trace_iterator, traced
 from agno.utils.log import log_debug, log_error, log_warning
+from agno.utils.stream import StreamBuffer
 from agno.utils.timer import Timer
 from agno.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
 
@@ -37,9 +44,6 @@ from agno.utils.tools import get_function_call_for_tool_call, get_function_call_
 @dataclass
 class MessageData:
     response_role: Optional[Literal["system", "user", "assistant", "tool"]] = None
-    response_content: Any = ""
-    response_reasoning_content: Any = ""
-    response_redacted_reasoning_content: Any = ""
     response_citations: Optional[Citations] = None
     response_tool_calls: List[Dict[str, Any]] = field(default_factory=list)
 
@@ -53,6 +57,51 @@ class MessageData:
 
     extra: Optional[Dict[str, Any]] = None
 
+    # Streamed text and audio are appended to buffers, and only joined when read
+    content_buffer: StreamBuffer = field(default_factory=StreamBuffer)
+    reasoning_content_buffer: StreamBuffer = field(default_factory=StreamBuffer)
+    redacted_reasoning_content_buffer: StreamBuffer = field(default_factory=StreamBuffer)
+    audio_content_buffer: StreamBuffer = field(default_factory=StreamBuffer)
+    audio_transcript_buffer: StreamBuffer = field(default_factory=StreamBuffer)
+
+    @property
+    def response_content(self) -> Any:
+        return self.content_buffer.value
+
+    @response_content.setter
+    def response_content(self, value: Any) -> None:
+        self.content_buffer = StreamBuffer(value or "")
+
+    @property
+    def response_reasoning_content(self) -> Any:
+        return self.reasoning_content_buffer.value
+
+    @response_reasoning_content.setter
+    def response_reasoning_content(self, value: Any) -> None:
+        self.reasoning_content_buffer = StreamBuffer(value or "")
+
+    @property
+    def response_redacted_reasoning_content(self) -> Any:
+        return self.redacted_reasoning_content_buffer.value
+
+    @response_redacted_reasoning_content.setter
+    def response_redacted_reasoning_content(self, value: Any) -> None:
+        self.redacted_reasoning_content_buffer = StreamBuffer(value or "")
+
+    def get_response_audio(self) -> Optional[Audio]:
+        """The streamed audio, with the content and transcript accumulated so far"""
+        if self.response_audio is not None:
+            if self.audio_content_buffer:
+                self.response_audio.content = self.audio_content_buffer.value
+            if self.audio_transcript_buffer:
+                self.response_audio.transcript = self.audio_transcript_buffer.value
+        return self.response_audio
+
+
+async def _iterate_async(responses: List[ModelResponse]) -> AsyncIterator[ModelResponse]:
+    for response in responses:
+        yield response
+
 
 def _log_messages(messages: List[Message]) -> None:
     """
@@ -63,6 +112,22 @@ def _log_messages(messages: List[Message]) -> None:
         m.log(metrics=False)
 
 
+def _span_attributes(model: "Model", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"model.id": model.id, "model.provider": model.provider}
+
+
+def _set_usage_span_attributes(assistant_message: Message) -> None:
+    """Record the token usage of a model call on the active span"""
+    span = get_current_span()
+    if span.is_recording and assistant_message.metrics is not None:
+        span.set_attributes(
+            {
+                "input_tokens": assistant_message.metrics.input_tokens,
+                "output_tokens": assistant_message.metrics.output_tokens,
+            }
+        )
+
+
 def _handle_agent_exception(a_exc: AgentRunException, additional_input: Optional[List[Message]] = None) -> None:
     """Handle AgentRunException and collect additional messages."""
     if additional_input is None:
@@ -107,6 +172,16 @@ class Model(ABC):
     # Provider for this Model. This is not sent to the Model API.
     provider: Optional[str] = None
 
+    # Cache of the provider responses. Identical requests (messages, tools and parameters) are answered from it.
+    response_cache: Optional[ResponseCache] = None
+    # Seconds a cached response is valid for. Overrides the TTL of the cache.
+    cache_ttl: Optional[float] = None
+
+    # How failed requests to the provider are retried and hedged. Requests are not retried by default.
+    retry_policy: Optional[ModelRetryPolicy] = None
+    # Model that requests fall back to when they failed on this model
+    fallback_model: Optional["Model"] = None
+
     # -*- Do not set the following attributes directly -*-
     # -*- Set them on the Agent instead -*-
 
@@ -481,6 +556,250 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response End", center=True, symbol="-")
         return model_response
 
+    def _get_response_cache_key(
+        self,
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        stream: bool = False,
+    ) -> Optional[ResponseCacheKey]:
+        if self.response_cache is None:
+            return None
+        try:
+            return build_cache_key(self, messages, response_format, tools, tool_choice, stream=stream)
+        except Exception as e:
+            log_warning(f"Could not build the response cache key, skipping the cache: {e}")
+            return None
+
+    def _prepare_cached_responses(
+        self,
+        responses: Optional[List[ModelResponse]],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+    ) -> Optional[List[ModelResponse]]:
+        if responses is None:
+            return None
+        log_debug(f"Using cached response from {self.get_provider()}")
+        for response in responses:
+            # No tokens were used to answer from the cache
+            response.response_usage = None
+            # Structured outputs are cached as dicts
+            if isinstance(response.parsed, dict) and isinstance(response_format, type):
+                response.parsed = response_format.model_validate(response.parsed)
+        return responses
+
+    def _get_cached_responses(
+        self,
+        cache_key: Optional[ResponseCacheKey],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+    ) -> Optional[List[ModelResponse]]:
+        if cache_key is None or self.response_cache is None:
+            return None
+        try:
+            return self._prepare_cached_responses(self.response_cache.get(cache_key), response_format)
+        except Exception as e:
+            log_warning(f"Error reading the response cache: {e}")
+            return None
+
+    async def _aget_cached_responses(
+        self,
+        cache_key: Optional[ResponseCacheKey],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+    ) -> Optional[List[ModelResponse]]:
+        if cache_key is None or self.response_cache is None:
+            return None
+        try:
+            return self._prepare_cached_responses(await self.response_cache.aget(cache_key), response_format)
+        except Exception as e:
+            log_warning(f"Error reading the response cache: {e}")
+            return None
+
+    def _cache_responses(self, cache_key: Optional[ResponseCacheKey], responses: List[ModelResponse]) -> None:
+        if cache_key is None or self.response_cache is None:
+            return
+        try:
+            self.response_cache.set(cache_key, responses, ttl=self.cache_ttl)
+        except Exception as e:
+            log_warning(f"Error writing to the response cache: {e}")
+
+    async def _acache_responses(self, cache_key: Optional[ResponseCacheKey], responses: List[ModelResponse]) -> None:
+        if cache_key is None or self.response_cache is None:
+            return
+        try:
+            await self.response_cache.aset(cache_key, responses, ttl=self.cache_ttl)
+        except Exception as e:
+            log_warning(f"Error writing to the response cache: {e}")
+
+    def _get_latency_histogram(self, kind: str = "response") -> LatencyHistogram:
+        return get_latency_histogram(self.get_provider(), self.id, kind=kind)
+
+    def _should_retry(self, error: Exception, attempt: int) -> bool:
+        policy = self.retry_policy
+        return (
+            policy is not None
+            and attempt < policy.max_retries
+            and policy.is_retryable(error)
+            and policy.budget.try_withdraw()
+        )
+
+    def _get_retry_delay(self, error: Exception, attempt: int) -> float:
+        delay = self.retry_policy.get_delay(attempt, error)  # type: ignore
+        log_warning(f"Request to {self.get_provider()} failed: {error}. Retrying in {delay:.2f}s")
+        get_current_span().add_event("model.retry", {"attempt": attempt + 1, "delay": delay, "error": str(error)})
+        return delay
+
+    def _get_hedge_delay(self) -> Optional[float]:
+        policy = self.retry_policy
+        if policy is None or policy.hedge_percentile is None:
+            return None
+        histogram = self._get_latency_histogram()
+        if histogram.count < policy.hedge_min_samples:
+            return None
+        return histogram.percentile(policy.hedge_percentile)
+
+    def _log_fallback(self, error: Exception) -> None:
+        fallback_provider = self.fallback_model.get_provider()  # type: ignore
+        log_warning(f"Request to {self.get_provider()} failed: {error}. Falling back to {fallback_provider}")
+        get_current_span().add_event("model.fallback", {"model.id": self.fallback_model.id, "error": str(error)})  # type: ignore
+
+    def _timed_invoke(self, **kwargs: Any) -> ModelResponse:
+        start = perf_counter()
+        provider_response = self.invoke(**kwargs)
+        self._get_latency_histogram().record(perf_counter() - start)
+        return provider_response
+
+    async def _atimed_invoke(self, **kwargs: Any) -> ModelResponse:
+        start = perf_counter()
+        provider_response = await self.ainvoke(**kwargs)
+        self._get_latency_histogram().record(perf_counter() - start)
+        return provider_response
+
+    def _invoke_with_retries(self, assistant_message: Message, **kwargs: Any) -> ModelResponse:
+        """Invoke the model, retrying, hedging and falling back according to the retry policy and fallback model."""
+        if self.retry_policy is not None:
+            self.retry_policy.budget.deposit()
+
+        attempt = 0
+        while True:
+            try:
+                hedge_delay = self._get_hedge_delay()
+                if hedge_delay is None:
+                    return self._timed_invoke(assistant_message=assistant_message, **kwargs)
+
+                # Every request is timed on its own message, and the metrics of the first to respond are kept
+                def hedged_invoke() -> Tuple[ModelResponse, Message]:
+                    message = Message(role=assistant_message.role)
+                    return self._timed_invoke(assistant_message=message, **kwargs), message
+
+                calls = [hedged_invoke] * (1 + self.retry_policy.max_hedged_requests)  # type: ignore
+                provider_response, message = run_hedged(calls, delay=hedge_delay)
+                assistant_message.metrics = message.metrics
+                return provider_response
+            except Exception as e:
+                if self._should_retry(e, attempt):
+                    sleep(self._get_retry_delay(e, attempt))
+                    attempt += 1
+                    continue
+                if self.fallback_model is not None and isinstance(e, ModelProviderError):
+                    self._log_fallback(e)
+                    return self.fallback_model._invoke_with_retries(assistant_message=assistant_message, **kwargs)
+                raise
+
+    async def _ainvoke_with_retries(self, assistant_message: Message, **kwargs: Any) -> ModelResponse:
+        """Invoke the model, retrying, hedging and falling back according to the retry policy and fallback model."""
+        if self.retry_policy is not None:
+            self.retry_policy.budget.deposit()
+
+        attempt = 0
+        while True:
+            try:
+                hedge_delay = self._get_hedge_delay()
+                if hedge_delay is None:
+                    return await self._atimed_invoke(assistant_message=assistant_message, **kwargs)
+
+                # Every request is timed on its own message, and the metrics of the first to respond are kept
+                async def hedged_invoke() -> Tuple[ModelResponse, Message]:
+                    message = Message(role=assistant_message.role)
+                    return await self._atimed_invoke(assistant_message=message, **kwargs), message
+
+                calls = [hedged_invoke] * (1 + self.retry_policy.max_hedged_requests)  # type: ignore
+                provider_response, message = await arun_hedged(calls, delay=hedge_delay)
+                assistant_message.metrics = message.metrics
+                return provider_response
+            except Exception as e:
+                if self._should_retry(e, attempt):
+                    await asyncio.sleep(self._get_retry_delay(e, attempt))
+                    attempt += 1
+                    continue
+                if self.fallback_model is not None and isinstance(e, ModelProviderError):
+                    self._log_fallback(e)
+                    return await self.fallback_model._ainvoke_with_retries(
+                        assistant_message=assistant_message, **kwargs
+                    )
+                raise
+
+    def _invoke_stream_with_retries(self, **kwargs: Any) -> Iterator[ModelResponse]:
+        """Stream from the model, retrying and falling back if the stream failed before its first delta."""
+        if self.retry_policy is not None:
+            self.retry_policy.budget.deposit()
+
+        attempt = 0
+        while True:
+            started = False
+            start = perf_counter()
+            try:
+                for response_delta in self.invoke_stream(**kwargs):
+                    if not started:
+                        started = True
+                        self._get_latency_histogram(kind="first_token").record(perf_counter() - start)
+                    yield response_delta
+                return
+            except Exception as e:
+                # Deltas already sent can't be taken back
+                if started:
+                    raise
+                if self._should_retry(e, attempt):
+                    sleep(self._get_retry_delay(e, attempt))
+                    attempt += 1
+                    continue
+                if self.fallback_model is not None and isinstance(e, ModelProviderError):
+                    self._log_fallback(e)
+                    yield from self.fallback_model._invoke_stream_with_retries(**kwargs)
+                    return
+                raise
+
+    async def _ainvoke_stream_with_retries(self, **kwargs: Any) -> AsyncIterator[ModelResponse]:
+        """Stream from the model, retrying and falling back if the stream failed before its first delta."""
+        if self.retry_policy is not None:
+            self.retry_policy.budget.deposit()
+
+        attempt = 0
+        while True:
+            started = False
+            start = perf_counter()
+            try:
+                async for response_delta in self.ainvoke_stream(**kwargs):
+                    if not started:
+                        started = True
+                        self._get_latency_histogram(kind="first_token").record(perf_counter() - start)
+                    yield response_delta
+                return
+            except Exception as e:
+                # Deltas already sent can't be taken back
+                if started:
+                    raise
+                if self._should_retry(e, attempt):
+                    await asyncio.sleep(self._get_retry_delay(e, attempt))
+                    attempt += 1
+                    continue
+                if self.fallback_model is not None and isinstance(e, ModelProviderError):
+                    self._log_fallback(e)
+                    async for response_delta in self.fallback_model._ainvoke_stream_with_retries(**kwargs):
+                        yield response_delta
+                    return
+                raise
+
+    @traced("model.response", attributes=_span_attributes)
     def _process_model_response(
         self,
         messages: List[Message],
@@ -497,18 +816,25 @@ class Model(ABC):
         Returns:
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
-        # Generate response
-        provider_response = self.invoke(
-            assistant_message=assistant_message,
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            run_response=run_response,
-        )
+        # Generate response, unless an identical request was cached
+        cache_key = self._get_response_cache_key(messages, response_format, tools, tool_choice or self._tool_choice)
+        cached_responses = self._get_cached_responses(cache_key, response_format)
+        if cached_responses:
+            provider_response = cached_responses[0]
+        else:
+            provider_response = self._invoke_with_retries(
+                assistant_message=assistant_message,
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                run_response=run_response,
+            )
+            self._cache_responses(cache_key, [provider_response])
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+        _set_usage_span_attributes(assistant_message)
 
         # Update model response with assistant message content and audio
         if assistant_message.content is not None:
@@ -534,6 +860,7 @@ class Model(ABC):
                 model_response.extra = {}
             model_response.extra.update(provider_response.extra)
 
+    @traced("model.response", attributes=_span_attributes)
     async def _aprocess_model_response(
         self,
         messages: List[Message],
@@ -550,18 +877,25 @@ class Model(ABC):
         Returns:
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
-        # Generate response
-        provider_response = await self.ainvoke(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            assistant_message=assistant_message,
-            run_response=run_response,
-        )
+        # Generate response, unless an identical request was cached
+        cache_key = self._get_response_cache_key(messages, response_format, tools, tool_choice or self._tool_choice)
+        cached_responses = await self._aget_cached_responses(cache_key, response_format)
+        if cached_responses:
+            provider_response = cached_responses[0]
+        else:
+            provider_response = await self._ainvoke_with_retries(
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                assistant_message=assistant_message,
+                run_response=run_response,
+            )
+            await self._acache_responses(cache_key, [provider_response])
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+        _set_usage_span_attributes(assistant_message)
 
         # Update model response with assistant message content and audio
         if assistant_message.content is not None:
@@ -672,22 +1006,40 @@ class Model(ABC):
         Process a streaming response from the model.
         """
 
-        for response_delta in self.invoke_stream(
-            messages=messages,
-            assistant_message=assistant_message,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            run_response=run_response,
-        ):
+        # Replay the deltas of an identical request if it was cached, otherwise record them
+        cache_key = self._get_response_cache_key(
+            messages, response_format, tools, tool_choice or self._tool_choice, stream=True
+        )
+        cached_responses = self._get_cached_responses(cache_key, response_format)
+        recorded_responses: Optional[List[ModelResponse]] = [] if cache_key and cached_responses is None else None
+
+        response_deltas: Iterator[ModelResponse] = (
+            iter(cached_responses)
+            if cached_responses is not None
+            else self._invoke_stream_with_retries(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                run_response=run_response,
+            )
+        )
+        for response_delta in response_deltas:
+            if recorded_responses is not None:
+                recorded_responses.append(deepcopy(response_delta))
             yield from self._populate_stream_data_and_assistant_message(
                 stream_data=stream_data,
                 assistant_message=assistant_message,
                 model_response_delta=response_delta,
             )
 
+        if recorded_responses:
+            self._cache_responses(cache_key, recorded_responses)
+
         # Add final metrics to assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=response_delta)
+        _set_usage_span_attributes(assistant_message)
 
     def response_stream(
         self,
@@ -718,14 +1070,19 @@ class Model(ABC):
             model_response = ModelResponse()
             if stream_model_response:
                 # Generate response
-                yield from self.process_response_stream(
-                    messages=messages,
-                    assistant_message=assistant_message,
-                    stream_data=stream_data,
-                    response_format=response_format,
-                    tools=tools,
-                    tool_choice=tool_choice or self._tool_choice,
-                    run_response=run_response,
+                yield from trace_iterator(
+                    "model.response",
+                    self.process_response_stream(
+                        messages=messages,
+                        assistant_message=assistant_message,
+                        stream_data=stream_data,
+                        response_format=response_format,
+                        tools=tools,
+                        tool_choice=tool_choice or self._tool_choice,
+                        run_response=run_response,
+                    ),
+                    attributes=_span_attributes(self),
+                    first_chunk_attribute="time_to_first_token",
                 )
 
                 # Populate assistant message from stream data
@@ -740,7 +1097,7 @@ class Model(ABC):
                 if stream_data.response_citations:
                     assistant_message.citations = stream_data.response_citations
                 if stream_data.response_audio:
-                    assistant_message.audio_output = stream_data.response_audio
+                    assistant_message.audio_output = stream_data.get_response_audio()
                 if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
                     assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
 
@@ -839,14 +1196,28 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-        async for response_delta in self.ainvoke_stream(
-            messages=messages,
-            assistant_message=assistant_message,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            run_response=run_response,
-        ):  # type: ignore
+        # Replay the deltas of an identical request if it was cached, otherwise record them
+        cache_key = self._get_response_cache_key(
+            messages, response_format, tools, tool_choice or self._tool_choice, stream=True
+        )
+        cached_responses = await self._aget_cached_responses(cache_key, response_format)
+        recorded_responses: Optional[List[ModelResponse]] = [] if cache_key and cached_responses is None else None
+
+        response_deltas: AsyncIterator[ModelResponse] = (
+            _iterate_async(cached_responses)
+            if cached_responses is not None
+            else self._ainvoke_stream_with_retries(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                run_response=run_response,
+            )
+        )
+        async for response_delta in response_deltas:
+            if recorded_responses is not None:
+                recorded_responses.append(deepcopy(response_delta))
             for model_response in self._populate_stream_data_and_assistant_message(
                 stream_data=stream_data,
                 assistant_message=assistant_message,
@@ -854,8 +1225,12 @@ class Model(ABC):
             ):
                 yield model_response
 
+        if recorded_responses:
+            await self._acache_responses(cache_key, recorded_responses)
+
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=model_response)
+        _set_usage_span_attributes(assistant_message)
 
     async def aresponse_stream(
         self,
@@ -886,14 +1261,19 @@ class Model(ABC):
             model_response = ModelResponse()
             if stream_model_response:
                 # Generate response
-                async for model_response in self.aprocess_response_stream(
-                    messages=messages,
-                    assistant_message=assistant_message,
-                    stream_data=stream_data,
-                    response_format=response_format,
-                    tools=tools,
-                    tool_choice=tool_choice or self._tool_choice,
-                    run_response=run_response,
+                async for model_response in trace_async_iterator(
+                    "model.response",
+                    self.aprocess_response_stream(
+                        messages=messages,
+                        assistant_message=assistant_message,
+                        stream_data=stream_data,
+                        response_format=response_format,
+                        tools=tools,
+                        tool_choice=tool_choice or self._tool_choice,
+                        run_response=run_response,
+                    ),
+                    attributes=_span_attributes(self),
+                    first_chunk_attribute="time_to_first_token",
                 ):
                     yield model_response
 
@@ -907,7 +1287,7 @@ class Model(ABC):
                 if stream_data.response_provider_data:
                     assistant_message.provider_data = stream_data.response_provider_data
                 if stream_data.response_audio:
-                    assistant_message.audio_output = stream_data.response_audio
+                    assistant_message.audio_output = stream_data.get_response_audio()
                 if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
                     assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
 
@@ -1005,15 +1385,15 @@ class Model(ABC):
         should_yield = False
         # Update stream_data content
         if model_response_delta.content is not None:
-            stream_data.response_content += model_response_delta.content
+            stream_data.content_buffer.append(model_response_delta.content)
             should_yield = True
 
         if model_response_delta.reasoning_content is not None:
-            stream_data.response_reasoning_content += model_response_delta.reasoning_content
+            stream_data.reasoning_content_buffer.append(model_response_delta.reasoning_content)
             should_yield = True
 
         if model_response_delta.redacted_reasoning_content is not None:
-            stream_data.response_redacted_reasoning_content += model_response_delta.redacted_reasoning_content
+            stream_data.redacted_reasoning_content_buffer.append(model_response_delta.redacted_reasoning_content)
             should_yield = True
 
         if model_response_delta.citations is not None:
@@ -1042,11 +1422,11 @@ class Model(ABC):
 
             # Update the stream data with audio information
             if audio_response.id is not None:
-                stream_data.response_audio.id = audio_response.id  # type: ignore
+                stream_data.response_audio.id = audio_response.id
             if audio_response.content is not None:
-                stream_data.response_audio.content += audio_response.content  # type: ignore
+                stream_data.audio_content_buffer.append(audio_response.content)
             if audio_response.transcript is not None:
-                stream_data.response_audio.transcript += audio_response.transcript  # type: ignore
+                stream_data.audio_transcript_buffer.append(audio_response.transcript)
             if audio_response.expires_at is not None:
                 stream_data.response_audio.expires_at = audio_response.expires_at
             if audio_response.mime_type is not None:
@@ -1154,6 +1534,9 @@ class Model(ABC):
             videos = function_execution_result.videos
             audios = function_execution_result.audios
 
+        if success and isinstance(output, str):
+            output = function_call.spill_result(output)
+
         return Message(
             role=self.tool_message_role,
             content=output if success else function_call.error,
@@ -1900,6 +2283,10 @@ class Model(ABC):
         for k, v in self.__dict__.items():
             if k in {"response_format", "_tools", "_functions"}:
                 continue
+            if k in {"response_cache", "retry_policy"}:
+                # Copies of the model share its cache and retry budget
+                setattr(new_model, k, v)
+                continue
             try:
                 setattr(new_model, k, deepcopy(v, memo))
             except Exception:
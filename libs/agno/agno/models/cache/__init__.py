@@ -0,0 +1,13 @@
+from agno.models.cache.base import ResponseCache, ResponseCacheKey, build_cache_key
+from agno.models.cache.memory import InMemoryResponseCache
+from agno.models.cache.semantic import SemanticResponseCache
+from agno.models.cache.sqlite import SqliteResponseCache
+
+__all__ = [
+    "ResponseCache",
+    "ResponseCacheKey",
+    "build_cache_key",
+    "InMemoryResponseCache",
+    "SemanticResponseCache",
+    "SqliteResponseCache",
+]
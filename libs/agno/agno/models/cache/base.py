@@ -0,0 +1,164 @@
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
+from hashlib import sha256
+from typing import Any, Dict, List, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.utils.log import log_warning
+
+# Model attributes never part of a cache key, because they hold secrets or don't change the response
+_EXCLUDED_MODEL_FIELDS = {"response_cache", "cache_ttl", "_tool_choice"}
+_SECRET_FIELD_SUFFIXES = ("key", "_token", "secret", "password")
+
+
+@dataclass
+class ResponseCacheKey:
+    """Identifies a model request in a response cache"""
+
+    # Hash of the whole request: model parameters, messages, tools, response format and tool choice
+    exact: str
+    # Hash of the request without the content of the last user message, for similarity lookups
+    context: str
+    # Content of the last user message, if the request ends with one
+    prompt: Optional[str] = None
+
+
+def _is_plain(value: Any) -> bool:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_plain(v) for k, v in value.items())
+    return False
+
+
+def _get_model_params(model: Any) -> Dict[str, Any]:
+    """Attributes of the model that change its responses, e.g. temperature or max_tokens"""
+    params: Dict[str, Any] = {"class": model.__class__.__name__}
+    for f in fields(model):
+        if f.name in _EXCLUDED_MODEL_FIELDS or f.name.lower().endswith(_SECRET_FIELD_SUFFIXES):
+            continue
+        value = getattr(model, f.name, None)
+        # Clients and other objects are skipped, their repr is not stable across processes
+        if value is not None and _is_plain(value):
+            params[f.name] = value
+    return params
+
+
+def _strip_ids(tool_calls: Optional[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
+    # Tool call ids are generated by the provider on every call, so they must not break a cache hit
+    if not tool_calls:
+        return None
+    return [{k: v for k, v in tool_call.items() if k != "id"} for tool_call in tool_calls]
+
+
+def _normalize_message(message: Message) -> Dict[str, Any]:
+    normalized: Dict[str, Any] = {
+        "role": message.role,
+        "content": message.content,
+        "name": message.name,
+        "tool_name": message.tool_name,
+        "tool_args": message.tool_args,
+        "tool_calls": _strip_ids(message.tool_calls),
+    }
+    for media_type in ("images", "audio", "videos", "files"):
+        media = getattr(message, media_type, None)
+        if media:
+            normalized[media_type] = [{k: v for k, v in item.to_dict().items() if k != "id"} for item in media]
+    return {k: v for k, v in normalized.items() if v is not None}
+
+
+def _hash(data: Any) -> str:
+    return sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def build_cache_key(
+    model: Any,
+    messages: List[Message],
+    response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+    stream: bool = False,
+) -> ResponseCacheKey:
+    """Build the cache key of a model request from its normalized messages, tools and model parameters"""
+    if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+        response_format_data: Any = response_format.model_json_schema()
+    else:
+        response_format_data = response_format
+
+    request = {
+        "model": _get_model_params(model),
+        "response_format": response_format_data,
+        "tools": tools,
+        "tool_choice": tool_choice,
+        "stream": stream,
+    }
+    normalized_messages = [_normalize_message(m) for m in messages]
+
+    prompt = None
+    context_messages = normalized_messages
+    if messages and messages[-1].role == "user":
+        prompt = messages[-1].get_content_string()
+        context_messages = normalized_messages[:-1] + [
+            {k: v for k, v in normalized_messages[-1].items() if k != "content"}
+        ]
+
+    return ResponseCacheKey(
+        exact=_hash({**request, "messages": normalized_messages}),
+        context=_hash({**request, "messages": context_messages}),
+        prompt=prompt,
+    )
+
+
+def serialize_responses(responses: List[ModelResponse]) -> Optional[bytes]:
+    try:
+        return json.dumps([response.to_dict() for response in responses]).encode("utf-8")
+    except Exception as e:
+        log_warning(f"Could not cache the model response: {e}")
+        return None
+
+
+def deserialize_responses(data: bytes) -> Optional[List[ModelResponse]]:
+    try:
+        return [ModelResponse.from_dict(response) for response in json.loads(data)]
+    except Exception as e:
+        log_warning(f"Could not read the cached model response: {e}")
+        return None
+
+
+class ResponseCache(ABC):
+    """Stores the responses of model providers, to answer identical requests without calling the provider.
+
+    A cache entry holds the responses of one provider call: a single response, or the deltas of a streamed
+    response, which are replayed in order on a cache hit.
+
+    Entries are stored as JSON. Structured outputs are stored as dicts, and parsed again with the response format of
+    the request that hits the cache.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        # Seconds after which an entry expires. None keeps entries until they are evicted.
+        self.ttl = ttl
+
+    @abstractmethod
+    def get(self, key: ResponseCacheKey) -> Optional[List[ModelResponse]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: ResponseCacheKey, responses: List[ModelResponse], ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    async def aget(self, key: ResponseCacheKey) -> Optional[List[ModelResponse]]:
+        return self.get(key)
+
+    async def aset(self, key: ResponseCacheKey, responses: List[ModelResponse], ttl: Optional[float] = None) -> None:
+        self.set(key, responses, ttl=ttl)
@@ -0,0 +1,51 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Optional, Tuple
+
+from agno.models.cache.base import ResponseCache, ResponseCacheKey, deserialize_responses, serialize_responses
+from agno.models.response import ModelResponse
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Response cache in the memory of the current process, evicting the least recently used entries.
+
+    Args:
+        ttl: Seconds after which an entry expires. None keeps entries until they are evicted.
+        max_entries: Maximum number of responses kept.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: int = 1000):
+        super().__init__(ttl=ttl)
+        self.max_entries = max_entries
+        # Exact key -> (expiry time, serialized responses)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], bytes]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: ResponseCacheKey) -> Optional[List[ModelResponse]]:
+        with self._lock:
+            entry = self._entries.get(key.exact)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key.exact]
+                return None
+            self._entries.move_to_end(key.exact)
+        # Entries are stored serialized, so callers can't modify the cached responses
+        return deserialize_responses(data)
+
+    def set(self, key: ResponseCacheKey, responses: List[ModelResponse], ttl: Optional[float] = None) -> None:
+        data = serialize_responses(responses)
+        if data is None:
+            return
+        ttl = ttl if ttl is not None else self.ttl
+        with self._lock:
+            self._entries[key.exact] = (time.time() + ttl if ttl is not None else None, data)
+            self._entries.move_to_end(key.exact)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,52 @@
+from typing import List, Optional
+
+from agno.models.cache.base import ResponseCache, ResponseCacheKey, deserialize_responses, serialize_responses
+from agno.models.response import ModelResponse
+
+try:
+    from redis import Redis
+except ImportError:
+    raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+
+class RedisResponseCache(ResponseCache):
+    """Response cache in Redis, shared by every process connected to it.
+
+    Args:
+        redis_client: Redis client to use. If not provided, a client is created from `db_url`.
+        db_url: Redis URL, e.g. redis://localhost:6379/0.
+        prefix: Prefix of the keys of the cache entries.
+        ttl: Seconds after which an entry expires. None keeps entries until they are evicted by Redis.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Redis] = None,
+        db_url: Optional[str] = None,
+        prefix: str = "agno:model_responses:",
+        ttl: Optional[float] = None,
+    ):
+        super().__init__(ttl=ttl)
+        if redis_client is None:
+            if db_url is None:
+                raise ValueError("One of redis_client or db_url must be provided")
+            redis_client = Redis.from_url(db_url)
+        self.redis_client = redis_client
+        self.prefix = prefix
+
+    def get(self, key: ResponseCacheKey) -> Optional[List[ModelResponse]]:
+        data = self.redis_client.get(self.prefix + key.exact)
+        if data is None:
+            return None
+        return deserialize_responses(data)  # type: ignore
+
+    def set(self, key: ResponseCacheKey, responses: List[ModelResponse], ttl: Optional[float] = None) -> None:
+        data = serialize_responses(responses)
+        if data is None:
+            return
+        ttl = ttl if ttl is not None else self.ttl
+        self.redis_client.set(self.prefix + key.exact, data, px=int(ttl * 1000) if ttl is not None else None)
+
+    def clear(self) -> None:
+        for cache_key in self.redis_client.scan_iter(match=f"{self.prefix}*"):
+            self.redis_client.delete(cache_key)
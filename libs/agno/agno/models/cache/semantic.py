@@ -0,0 +1,130 @@
+import math
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from agno.models.cache.base import ResponseCache, ResponseCacheKey
+from agno.models.cache.memory import InMemoryResponseCache
+from agno.models.response import ModelResponse
+from agno.utils.log import log_debug
+
+if TYPE_CHECKING:
+    from agno.knowledge.embedder.base import Embedder
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class SemanticResponseCache(ResponseCache):
+    """Response cache that also answers requests whose last user message is similar to a cached one.
+
+    Requests only match if everything but the last user message (model parameters, system message, history, tools)
+    is identical. Responses are stored in `backend`, an in-memory cache by default, and the embeddings of the
+    cached prompts in memory.
+
+    Args:
+        embedder: Embedder used to compare prompts.
+        similarity_threshold: Minimum cosine similarity for a cached prompt to match.
+        backend: Cache storing the responses.
+        ttl: Seconds after which an entry expires.
+        max_entries: Maximum number of prompt embeddings kept.
+    """
+
+    def __init__(
+        self,
+        embedder: "Embedder",
+        similarity_threshold: float = 0.95,
+        backend: Optional[ResponseCache] = None,
+        ttl: Optional[float] = None,
+        max_entries: int = 1000,
+    ):
+        super().__init__(ttl=ttl)
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.backend = backend or InMemoryResponseCache(ttl=ttl, max_entries=max_entries)
+        self.max_entries = max_entries
+        # Exact key -> (context key, prompt embedding, expiry time)
+        self._index: "OrderedDict[str, Tuple[str, List[float], Optional[float]]]" = OrderedDict()
+        # Embeddings of recent prompts, so a miss followed by a set embeds the prompt once
+        self._embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = Lock()
+
+    def _remember_embedding(self, prompt: str, embedding: List[float]) -> None:
+        with self._lock:
+            self._embeddings[prompt] = embedding
+            while len(self._embeddings) > self.max_entries:
+                self._embeddings.popitem(last=False)
+
+    def _get_embedding(self, prompt: str) -> List[float]:
+        embedding = self._embeddings.get(prompt)
+        if embedding is None:
+            embedding = self.embedder.get_embedding(prompt)
+            self._remember_embedding(prompt, embedding)
+        return embedding
+
+    async def _aget_embedding(self, prompt: str) -> List[float]:
+        embedding = self._embeddings.get(prompt)
+        if embedding is None:
+            embedding = await self.embedder.async_get_embedding(prompt)
+            self._remember_embedding(prompt, embedding)
+        return embedding
+
+    def _find_similar(self, key: ResponseCacheKey, embedding: List[float]) -> Optional[ResponseCacheKey]:
+        now = time.time()
+        best_key, best_similarity = None, self.similarity_threshold
+        with self._lock:
+            for exact, (context, cached_embedding, expires_at) in list(self._index.items()):
+                if expires_at is not None and expires_at <= now:
+                    del self._index[exact]
+                    continue
+                if context != key.context:
+                    continue
+                similarity = _cosine_similarity(embedding, cached_embedding)
+                if similarity >= best_similarity:
+                    best_key, best_similarity = exact, similarity
+        if best_key is None:
+            return None
+        log_debug(f"Semantic cache match with similarity {best_similarity:.3f}")
+        return ResponseCacheKey(exact=best_key, context=key.context)
+
+    def _add_to_index(self, key: ResponseCacheKey, embedding: List[float], ttl: Optional[float]) -> None:
+        ttl = ttl if ttl is not None else self.ttl
+        with self._lock:
+            self._index[key.exact] = (key.context, embedding, time.time() + ttl if ttl is not None else None)
+            self._index.move_to_end(key.exact)
+            while len(self._index) > self.max_entries:
+                self._index.popitem(last=False)
+
+    def get(self, key: ResponseCacheKey) -> Optional[List[ModelResponse]]:
+        responses = self.backend.get(key)
+        if responses is not None or key.prompt is None:
+            return responses
+        similar_key = self._find_similar(key, self._get_embedding(key.prompt))
+        return self.backend.get(similar_key) if similar_key is not None else None
+
+    def set(self, key: ResponseCacheKey, responses: List[ModelResponse], ttl: Optional[float] = None) -> None:
+        self.backend.set(key, responses, ttl=ttl)
+        if key.prompt is not None:
+            self._add_to_index(key, self._get_embedding(key.prompt), ttl)
+
+    async def aget(self, key: ResponseCacheKey) -> Optional[List[ModelResponse]]:
+        responses = await self.backend.aget(key)
+        if responses is not None or key.prompt is None:
+            return responses
+        similar_key = self._find_similar(key, await self._aget_embedding(key.prompt))
+        return await self.backend.aget(similar_key) if similar_key is not None else None
+
+    async def aset(self, key: ResponseCacheKey, responses: List[ModelResponse], ttl: Optional[float] = None) -> None:
+        await self.backend.aset(key, responses, ttl=ttl)
+        if key.prompt is not None:
+            self._add_to_index(key, await self._aget_embedding(key.prompt), ttl)
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            self._index.clear()
+            self._embeddings.clear()
@@ -0,0 +1,63 @@
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import List, Optional
+
+from agno.models.cache.base import ResponseCache, ResponseCacheKey, deserialize_responses, serialize_responses
+from agno.models.response import ModelResponse
+from agno.utils.common import get_private_temp_dir
+
+
+class SqliteResponseCache(ResponseCache):
+    """Response cache in a SQLite file, shared by the processes of a machine and kept across restarts.
+
+    Args:
+        db_file: Path of the SQLite file. Defaults to a file in a directory of the system temp dir that only the current
+            user can access.
+        ttl: Seconds after which an entry expires. None keeps entries until the cache is cleared.
+    """
+
+    def __init__(self, db_file: Optional[str] = None, ttl: Optional[float] = None):
+        super().__init__(ttl=ttl)
+        if db_file is None:
+            db_file = str(get_private_temp_dir("model_cache") / "model_responses.db")
+        else:
+            Path(db_file).parent.mkdir(parents=True, exist_ok=True)
+        self.db_file = db_file
+
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.db_file, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS model_responses (key TEXT PRIMARY KEY, expires_at REAL, responses BLOB)"
+            )
+
+    def get(self, key: ResponseCacheKey) -> Optional[List[ModelResponse]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at, responses FROM model_responses WHERE key = ?", (key.exact,)
+            ).fetchone()
+            if row is None:
+                return None
+            expires_at, data = row
+            if expires_at is not None and expires_at <= time.time():
+                with self._connection:
+                    self._connection.execute("DELETE FROM model_responses WHERE key = ?", (key.exact,))
+                return None
+        return deserialize_responses(data)
+
+    def set(self, key: ResponseCacheKey, responses: List[ModelResponse], ttl: Optional[float] = None) -> None:
+        data = serialize_responses(responses)
+        if data is None:
+            return
+        ttl = ttl if ttl is not None else self.ttl
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO model_responses (key, expires_at, responses) VALUES (?, ?, ?)",
+                (key.exact, time.time() + ttl if ttl is not None else None, data),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM model_responses")
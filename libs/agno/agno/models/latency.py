@@ -0,0 +1,76 @@
+import math
+from bisect import bisect_left
+from threading import Lock
+from typing import Dict, List, Optional
+
+# Bucket bounds grow by 10% from 1ms to about 10 minutes, so percentiles are within 10% of the measured latency
+_BUCKET_GROWTH = 1.1
+_BUCKET_BOUNDS: List[float] = [0.001 * _BUCKET_GROWTH**i for i in range(int(math.log(600_000, _BUCKET_GROWTH)) + 1)]
+
+
+class LatencyHistogram:
+    """Histogram of the latencies of a model, in seconds.
+
+    Latencies are counted in buckets growing by 10%, so recording a latency and reading a percentile cost the same
+    regardless of the number of recorded latencies. Once `max_samples` latencies were recorded, all counts are halved,
+    so the histogram follows changes of the provider latency over time.
+    """
+
+    def __init__(self, max_samples: int = 1000):
+        self.max_samples = max_samples
+        self._counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self._count = 0
+        self._lock = Lock()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record(self, latency: float) -> None:
+        with self._lock:
+            self._counts[bisect_left(_BUCKET_BOUNDS, latency)] += 1
+            self._count += 1
+            if self._count >= self.max_samples:
+                self._counts = [count // 2 for count in self._counts]
+                self._count = sum(self._counts)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Return the latency below which `percentile` (between 0 and 1) of the recorded latencies are"""
+        with self._lock:
+            if self._count == 0:
+                return None
+            rank = percentile * self._count
+            seen = 0
+            for bucket, count in enumerate(self._counts):
+                seen += count
+                if count and seen >= rank:
+                    return _BUCKET_BOUNDS[min(bucket, len(_BUCKET_BOUNDS) - 1)]
+            return _BUCKET_BOUNDS[-1]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+            self._count = 0
+
+
+_histograms: Dict[str, LatencyHistogram] = {}
+_histograms_lock = Lock()
+
+
+def get_latency_histogram(provider: str, model_id: str, kind: str = "response") -> LatencyHistogram:
+    """Return the process-wide latency histogram of a model of a provider.
+
+    The kind is "response" for the latency of complete responses, and "first_token" for the latency of the first
+    delta of streamed responses.
+    """
+    key = f"{provider}:{model_id}:{kind}"
+    histogram = _histograms.get(key)
+    if histogram is None:
+        with _histograms_lock:
+            histogram = _histograms.setdefault(key, LatencyHistogram())
+    return histogram
+
+
+def get_latency_histograms() -> Dict[str, LatencyHistogram]:
+    """Return the latency histograms of all models called in this process, by "provider:model_id:kind" """
+    return dict(_histograms)
@@ -254,6 +254,10 @@ class Message(BaseModel):
                 else:
                     data["video_output"] = Video(**vid_data)
 
+        # Stored metrics are built directly, which is faster than validating them as a nested dataclass
+        if isinstance(data.get("metrics"), dict):
+            data["metrics"] = Metrics(**data["metrics"])
+
         return cls(**data)
 
     def to_dict(self) -> Dict[str, Any]:
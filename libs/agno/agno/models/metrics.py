@@ -1,9 +1,12 @@
-from dataclasses import asdict, dataclass
+from copy import deepcopy
+from dataclasses import dataclass, fields
 from typing import Any, Dict, Optional
 
+from agno.utils.common import add_slots
 from agno.utils.timer import Timer
 
 
+@add_slots
 @dataclass
 class Metrics:
     """All relevant metrics for a session, run or message."""
@@ -40,64 +43,56 @@ class Metrics:
     additional_metrics: Optional[dict] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        metrics_dict = asdict(self)
-        # Remove the timer util if present
-        metrics_dict.pop("timer", None)
-        metrics_dict = {
-            k: v
-            for k, v in metrics_dict.items()
-            if v is not None and (not isinstance(v, (int, float)) or v != 0) and (not isinstance(v, dict) or len(v) > 0)
-        }
+        metrics_dict: Dict[str, Any] = {}
+        # The timer util is not included
+        for name in _METRICS_FIELDS:
+            value = getattr(self, name)
+            if value is None or (isinstance(value, (int, float)) and value == 0):
+                continue
+            if isinstance(value, dict):
+                if len(value) == 0:
+                    continue
+                value = deepcopy(value)
+            metrics_dict[name] = value
         return metrics_dict
 
     def __add__(self, other: "Metrics") -> "Metrics":
         # Create new instance of the same type as self
-        result_class = type(self)
-        result = result_class(
-            input_tokens=self.input_tokens + other.input_tokens,
-            output_tokens=self.output_tokens + other.output_tokens,
-            total_tokens=self.total_tokens + other.total_tokens,
-            audio_total_tokens=self.audio_total_tokens + other.audio_total_tokens,
-            audio_input_tokens=self.audio_input_tokens + other.audio_input_tokens,
-            audio_output_tokens=self.audio_output_tokens + other.audio_output_tokens,
-            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
-            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
-            reasoning_tokens=self.reasoning_tokens + other.reasoning_tokens,
-        )
-
-        # Handle provider_metrics
-        if self.provider_metrics or other.provider_metrics:
-            result.provider_metrics = {}
-            if self.provider_metrics:
-                result.provider_metrics.update(self.provider_metrics)
-            if other.provider_metrics:
-                result.provider_metrics.update(other.provider_metrics)
-
-        # Handle additional metrics
-        if self.additional_metrics or other.additional_metrics:
-            result.additional_metrics = {}
-            if self.additional_metrics:
-                result.additional_metrics.update(self.additional_metrics)
-            if other.additional_metrics:
-                result.additional_metrics.update(other.additional_metrics)
+        result = type(self)()
+        result += self
+        result += other
+        return result
+
+    def __iadd__(self, other: "Metrics") -> "Metrics":
+        """Add the other metrics in place, so summing many metrics does not create an instance per addition"""
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.total_tokens += other.total_tokens
+        self.audio_input_tokens += other.audio_input_tokens
+        self.audio_output_tokens += other.audio_output_tokens
+        self.audio_total_tokens += other.audio_total_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_write_tokens += other.cache_write_tokens
+        self.reasoning_tokens += other.reasoning_tokens
+
+        # Merge the dicts into new ones, as they may be shared with the other metrics or their source data
+        if other.provider_metrics:
+            self.provider_metrics = {**(self.provider_metrics or {}), **other.provider_metrics}
+        if other.additional_metrics:
+            self.additional_metrics = {**(self.additional_metrics or {}), **other.additional_metrics}
 
         # Sum durations if both exist
-        if self.duration is not None and other.duration is not None:
-            result.duration = self.duration + other.duration
-        elif self.duration is not None:
-            result.duration = self.duration
-        elif other.duration is not None:
-            result.duration = other.duration
+        if other.duration is not None:
+            self.duration = other.duration if self.duration is None else self.duration + other.duration
 
         # Sum time to first token if both exist
-        if self.time_to_first_token is not None and other.time_to_first_token is not None:
-            result.time_to_first_token = self.time_to_first_token + other.time_to_first_token
-        elif self.time_to_first_token is not None:
-            result.time_to_first_token = self.time_to_first_token
-        elif other.time_to_first_token is not None:
-            result.time_to_first_token = other.time_to_first_token
+        if other.time_to_first_token is not None:
+            if self.time_to_first_token is None:
+                self.time_to_first_token = other.time_to_first_token
+            else:
+                self.time_to_first_token += other.time_to_first_token
 
-        return result
+        return self
 
     def __radd__(self, other: "Metrics") -> "Metrics":
         if other == 0:  # Handle sum() starting value
@@ -118,3 +113,6 @@ class Metrics:
     def set_time_to_first_token(self):
         if self.timer is not None:
             self.time_to_first_token = self.timer.elapsed
+
+
+_METRICS_FIELDS = tuple(f.name for f in fields(Metrics) if f.name != "timer")
@@ -0,0 +1,6 @@
+from agno.models.replay.model import ReplayModel, ReplayResponse
+
+__all__ = [
+    "ReplayModel",
+    "ReplayResponse",
+]
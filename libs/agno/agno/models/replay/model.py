@@ -0,0 +1,410 @@
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from agno.exceptions import ModelProviderError
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
+from agno.run.agent import RunOutput
+from agno.utils.log import log_debug
+
+
+@dataclass
+class ReplayResponse:
+    """A scripted or recorded response of the replay model"""
+
+    content: Optional[Any] = None
+    reasoning_content: Optional[str] = None
+    # Tool calls, either as {"name": ..., "arguments": {...}} or in the OpenAI format
+    tool_calls: Optional[List[Dict[str, Any]]] = None
+    # Token usage reported for the response. Estimated from the messages if not provided.
+    usage: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        _dict = {
+            "content": self.content,
+            "reasoning_content": self.reasoning_content,
+            "tool_calls": self.tool_calls,
+            "usage": self.usage,
+        }
+        return {k: v for k, v in _dict.items() if v is not None}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReplayResponse":
+        return cls(
+            content=data.get("content"),
+            reasoning_content=data.get("reasoning_content"),
+            tool_calls=data.get("tool_calls"),
+            usage=data.get("usage"),
+        )
+
+
+def _count_tokens(text: Optional[str]) -> int:
+    # A rough estimate, good enough to exercise the metrics paths
+    return len(text.split()) if text else 0
+
+
+def _split_into_deltas(text: str, chunk_size: int) -> List[str]:
+    words = re.findall(r"\S+\s*|\s+", text)
+    return ["".join(words[i : i + chunk_size]) for i in range(0, len(words), chunk_size)]
+
+
+@dataclass
+class ReplayModel(Model):
+    """
+    A model that replays scripted or recorded responses, without calling any provider.
+
+    Responses are returned in order, one per model call, and tool calls in them are executed like the ones of any
+    other model. It is deterministic and has no network overhead, which makes it suited to test agents offline and to
+    benchmark the overhead of the framework itself.
+
+    To record the responses of a live model, set `record_model` to that model: calls are forwarded to it and its
+    responses are saved to `responses_file`, to be replayed later with `ReplayModel(responses_file=...)`.
+    """
+
+    id: str = "replay"
+    name: str = "Replay"
+    provider: str = "Replay"
+
+    # Responses to replay, as strings, dicts or ReplayResponse objects
+    responses: List[Union[str, Dict[str, Any], ReplayResponse]] = field(default_factory=list)
+    # JSON file with recorded responses, loaded when `responses` is empty and written to when recording
+    responses_file: Optional[Union[str, Path]] = None
+    # Start from the first response again once all responses were replayed. Otherwise an error is raised.
+    loop: bool = True
+
+    # Seconds to wait before the response, or before the first delta when streaming
+    latency: float = 0.0
+    # Seconds to wait between streamed deltas
+    token_delay: float = 0.0
+    # Number of words in each streamed delta
+    chunk_size: int = 1
+
+    # Live model to record responses from
+    record_model: Optional[Model] = None
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._position = 0
+        self._lock = Lock()
+        if not self.responses and self.responses_file is not None and self.record_model is None:
+            self.responses = self.load_responses(self.responses_file)
+
+    @staticmethod
+    def load_responses(responses_file: Union[str, Path]) -> List[Union[str, Dict[str, Any], ReplayResponse]]:
+        data = json.loads(Path(responses_file).read_text())
+        return [ReplayResponse.from_dict(response) for response in data.get("responses", [])]
+
+    def save_responses(self, responses_file: Optional[Union[str, Path]] = None) -> None:
+        """Save the responses of the model to a JSON file"""
+        path = Path(responses_file or self.responses_file)  # type: ignore
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"responses": [self._get_replay_response(response).to_dict() for response in self.responses]}
+        path.write_text(json.dumps(data, indent=2, default=str))
+
+    def reset(self) -> None:
+        """Replay the responses from the start again"""
+        with self._lock:
+            self._position = 0
+
+    def _get_replay_response(self, response: Union[str, Dict[str, Any], ReplayResponse]) -> ReplayResponse:
+        if isinstance(response, ReplayResponse):
+            return response
+        if isinstance(response, dict):
+            return ReplayResponse.from_dict(response)
+        return ReplayResponse(content=response)
+
+    def _next_response(self, messages: List[Message]) -> ReplayResponse:
+        if not self.responses:
+            # Without a script, echo the last user message
+            user_messages = [m for m in messages if m.role == "user"]
+            return ReplayResponse(content=user_messages[-1].get_content_string() if user_messages else "")
+
+        with self._lock:
+            if self._position >= len(self.responses):
+                if not self.loop:
+                    raise ModelProviderError(
+                        message=f"All {len(self.responses)} replay responses were used",
+                        model_name=self.name,
+                        model_id=self.id,
+                    )
+                self._position = 0
+            position = self._position
+            self._position += 1
+
+        log_debug(f"Replaying response {position + 1}/{len(self.responses)}")
+        return self._get_replay_response(self.responses[position])
+
+    def _get_content(self, replay_response: ReplayResponse) -> Optional[str]:
+        if replay_response.content is None or isinstance(replay_response.content, str):
+            return replay_response.content
+        # Structured responses are replayed as JSON
+        if isinstance(replay_response.content, BaseModel):
+            return replay_response.content.model_dump_json()
+        return json.dumps(replay_response.content)
+
+    def _get_tool_calls(self, replay_response: ReplayResponse) -> List[Dict[str, Any]]:
+        tool_calls = []
+        for i, tool_call in enumerate(replay_response.tool_calls or []):
+            if "function" in tool_call:
+                tool_calls.append({"type": "function", "id": f"call_{i}", **tool_call})
+                continue
+            arguments = tool_call.get("arguments") or {}
+            tool_calls.append(
+                {
+                    "id": tool_call.get("id") or f"call_{i}",
+                    "type": "function",
+                    "function": {
+                        "name": tool_call["name"],
+                        "arguments": arguments if isinstance(arguments, str) else json.dumps(arguments),
+                    },
+                }
+            )
+        return tool_calls
+
+    def _get_metrics(self, messages: List[Message], replay_response: ReplayResponse) -> Metrics:
+        if replay_response.usage is not None:
+            return Metrics(**replay_response.usage)
+
+        input_tokens = sum(_count_tokens(m.get_content_string()) for m in messages)
+        output_tokens = _count_tokens(self._get_content(replay_response)) + _count_tokens(
+            replay_response.reasoning_content
+        )
+        for tool_call in self._get_tool_calls(replay_response):
+            output_tokens += _count_tokens(tool_call["function"]["arguments"])
+        return Metrics(
+            input_tokens=input_tokens, output_tokens=output_tokens, total_tokens=input_tokens + output_tokens
+        )
+
+    def _build_model_response(self, messages: List[Message], replay_response: ReplayResponse) -> ModelResponse:
+        model_response = ModelResponse(
+            role=self.assistant_message_role,
+            content=self._get_content(replay_response),
+            reasoning_content=replay_response.reasoning_content,
+            response_usage=self._get_metrics(messages, replay_response),
+        )
+        tool_calls = self._get_tool_calls(replay_response)
+        if tool_calls:
+            model_response.tool_calls = tool_calls
+        return model_response
+
+    def _build_model_response_deltas(
+        self, messages: List[Message], replay_response: ReplayResponse
+    ) -> Iterator[ModelResponse]:
+        chunk_size = max(1, self.chunk_size)
+        if replay_response.reasoning_content:
+            for delta in _split_into_deltas(replay_response.reasoning_content, chunk_size):
+                yield ModelResponse(reasoning_content=delta)
+        content = self._get_content(replay_response)
+        if content:
+            for delta in _split_into_deltas(content, chunk_size):
+                yield ModelResponse(content=delta)
+        tool_calls = self._get_tool_calls(replay_response)
+        if tool_calls:
+            yield ModelResponse(tool_calls=tool_calls)
+        yield ModelResponse(response_usage=self._get_metrics(messages, replay_response))
+
+    def _record(self, model_response: ModelResponse) -> None:
+        usage = model_response.response_usage.to_dict() if model_response.response_usage is not None else None
+        self.responses.append(
+            ReplayResponse(
+                content=model_response.content,
+                reasoning_content=model_response.reasoning_content,
+                tool_calls=model_response.tool_calls or None,
+                usage=usage,
+            )
+        )
+        if self.responses_file is not None:
+            self.save_responses()
+
+    def _merge_deltas(self, deltas: List[ModelResponse]) -> ModelResponse:
+        merged = ModelResponse()
+        content: List[str] = []
+        reasoning_content: List[str] = []
+        tool_calls_data: List[Any] = []
+        for delta in deltas:
+            if isinstance(delta.content, str):
+                content.append(delta.content)
+            if delta.reasoning_content:
+                reasoning_content.append(delta.reasoning_content)
+            if delta.tool_calls:
+                tool_calls_data.extend(delta.tool_calls)
+            if delta.response_usage is not None:
+                merged.response_usage = delta.response_usage
+        merged.content = "".join(content) or None
+        merged.reasoning_content = "".join(reasoning_content) or None
+        if tool_calls_data:
+            merged.tool_calls = self.parse_tool_calls(tool_calls_data)
+        return merged
+
+    def parse_tool_calls(self, tool_calls_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # When recording, the streamed tool calls are in the format of the recorded model
+        if self.record_model is not None:
+            return self.record_model.parse_tool_calls(tool_calls_data)
+        return tool_calls_data
+
+    def invoke(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> ModelResponse:
+        """
+        Return the next scripted response, or the response of the recorded model.
+        """
+        if self.record_model is not None:
+            model_response = self.record_model.invoke(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice,
+                run_response=run_response,
+            )
+            self._record(model_response)
+            return model_response
+
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+        replay_response = self._next_response(messages)
+        if self.latency > 0:
+            time.sleep(self.latency)
+        model_response = self._build_model_response(messages, replay_response)
+        assistant_message.metrics.stop_timer()
+        return model_response
+
+    async def ainvoke(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> ModelResponse:
+        """
+        Return the next scripted response, or the response of the recorded model.
+        """
+        if self.record_model is not None:
+            model_response = await self.record_model.ainvoke(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice,
+                run_response=run_response,
+            )
+            self._record(model_response)
+            return model_response
+
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+        replay_response = self._next_response(messages)
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        model_response = self._build_model_response(messages, replay_response)
+        assistant_message.metrics.stop_timer()
+        return model_response
+
+    def invoke_stream(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> Iterator[ModelResponse]:
+        """
+        Stream the next scripted response in deltas of `chunk_size` words, or the response of the recorded model.
+        """
+        if self.record_model is not None:
+            deltas = []
+            for delta in self.record_model.invoke_stream(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice,
+                run_response=run_response,
+            ):
+                deltas.append(delta)
+                yield delta
+            self._record(self._merge_deltas(deltas))
+            return
+
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+        replay_response = self._next_response(messages)
+        if self.latency > 0:
+            time.sleep(self.latency)
+        for i, delta in enumerate(self._build_model_response_deltas(messages, replay_response)):
+            if i > 0 and self.token_delay > 0:
+                time.sleep(self.token_delay)
+            yield delta
+        assistant_message.metrics.stop_timer()
+
+    async def ainvoke_stream(  # type: ignore[override]
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> AsyncIterator[ModelResponse]:
+        """
+        Stream the next scripted response in deltas of `chunk_size` words, or the response of the recorded model.
+        """
+        if self.record_model is not None:
+            deltas = []
+            async for delta in self.record_model.ainvoke_stream(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice,
+                run_response=run_response,
+            ):
+                deltas.append(delta)
+                yield delta
+            self._record(self._merge_deltas(deltas))
+            return
+
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+        replay_response = self._next_response(messages)
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        for i, delta in enumerate(self._build_model_response_deltas(messages, replay_response)):
+            if i > 0 and self.token_delay > 0:
+                await asyncio.sleep(self.token_delay)
+            yield delta
+        assistant_message.metrics.stop_timer()
+
+    def _parse_provider_response(self, response: ModelResponse, **kwargs) -> ModelResponse:
+        # Responses are built as ModelResponse objects directly
+        return response
+
+    def _parse_provider_response_delta(self, response: ModelResponse) -> ModelResponse:  # type: ignore[override]
+        return response
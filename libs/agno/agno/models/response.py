@@ -1,12 +1,16 @@
+from base64 import b64decode, b64encode
 from dataclasses import asdict, dataclass, field
 from enum import Enum
 from time import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel
 
 from agno.media import Audio, File, Image, Video
 from agno.models.message import Citations
 from agno.models.metrics import Metrics
 from agno.tools.function import UserInputField
+from agno.utils.common import add_slots
 
 
 class ModelResponseEvent(str, Enum):
@@ -18,6 +22,7 @@ class ModelResponseEvent(str, Enum):
     assistant_response = "AssistantResponse"
 
 
+@add_slots
 @dataclass
 class ToolExecution:
     """Execution of a tool"""
@@ -123,6 +128,91 @@ class ModelResponse:
 
     updated_session_state: Optional[Dict[str, Any]] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the response to a dict that can be serialized to JSON.
+
+        Pydantic models in `content` and `parsed` are converted to dicts, and are not converted back by `from_dict`.
+        """
+        response_dict: Dict[str, Any] = {
+            "role": self.role,
+            "content": _model_to_dict(self.content),
+            "parsed": _model_to_dict(self.parsed),
+            "tool_calls": self.tool_calls,
+            "event": self.event,
+            "provider_data": self.provider_data,
+            "redacted_reasoning_content": self.redacted_reasoning_content,
+            "reasoning_content": self.reasoning_content,
+            "created_at": self.created_at,
+            "extra": self.extra,
+            "updated_session_state": self.updated_session_state,
+        }
+        response_dict = {k: v for k, v in response_dict.items() if v is not None}
+
+        if self.audio is not None:
+            response_dict["audio"] = _media_to_dict(self.audio)
+        for name in ("images", "videos", "audios", "files"):
+            media = getattr(self, name)
+            if media is not None:
+                response_dict[name] = [_media_to_dict(item) for item in media]
+        if self.tool_executions is not None:
+            response_dict["tool_executions"] = [tool.to_dict() for tool in self.tool_executions]
+        if self.citations is not None:
+            response_dict["citations"] = self.citations.model_dump(mode="json")
+        if self.response_usage is not None:
+            response_dict["response_usage"] = self.response_usage.to_dict()
+        return response_dict
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelResponse":
+        return cls(
+            role=data.get("role"),
+            content=data.get("content"),
+            parsed=data.get("parsed"),
+            audio=_media_from_dict(Audio, data["audio"]) if data.get("audio") is not None else None,
+            images=[_media_from_dict(Image, item) for item in data["images"]] if "images" in data else None,
+            videos=[_media_from_dict(Video, item) for item in data["videos"]] if "videos" in data else None,
+            audios=[_media_from_dict(Audio, item) for item in data["audios"]] if "audios" in data else None,
+            files=[_media_from_dict(File, item) for item in data["files"]] if "files" in data else None,
+            tool_calls=data.get("tool_calls") or [],
+            tool_executions=[ToolExecution.from_dict(tool) for tool in data["tool_executions"]]
+            if "tool_executions" in data
+            else None,
+            event=data.get("event", ModelResponseEvent.assistant_response.value),
+            provider_data=data.get("provider_data"),
+            redacted_reasoning_content=data.get("redacted_reasoning_content"),
+            reasoning_content=data.get("reasoning_content"),
+            citations=Citations.model_validate(data["citations"]) if data.get("citations") is not None else None,
+            response_usage=Metrics(**data["response_usage"]) if data.get("response_usage") is not None else None,
+            created_at=data.get("created_at", int(time())),
+            extra=data.get("extra"),
+            updated_session_state=data.get("updated_session_state"),
+        )
+
+
+MediaT = TypeVar("MediaT", Image, Video, Audio, File)
+
+
+def _model_to_dict(value: Any) -> Any:
+    return value.model_dump(mode="json") if isinstance(value, BaseModel) else value
+
+
+def _media_to_dict(media: BaseModel) -> Dict[str, Any]:
+    media_dict = media.model_dump(mode="json", exclude={"content"}, exclude_none=True)
+    content = getattr(media, "content", None)
+    # Binary content is base64 encoded, and marked as such as file content can also be a string
+    if isinstance(content, bytes):
+        media_dict["content_base64"] = b64encode(content).decode("utf-8")
+    elif content is not None:
+        media_dict["content"] = content
+    return media_dict
+
+
+def _media_from_dict(media_class: Type[MediaT], data: Dict[str, Any]) -> MediaT:
+    data = dict(data)
+    if "content_base64" in data:
+        data["content"] = b64decode(data.pop("content_base64"))
+    return media_class(**data)
+
 
 class FileType(str, Enum):
     MP4 = "mp4"
@@ -0,0 +1,215 @@
+import asyncio
+import random
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import time
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from agno.exceptions import ModelProviderError
+
+T = TypeVar("T")
+
+
+class RetryBudget:
+    """Caps the retries of a model relative to its requests, so retries can't multiply the load on a failing provider.
+
+    Up to `min_retries` retries can be made in a burst. Every request then earns back `ratio` of a retry.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._balance = float(min_retries)
+        self._lock = Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self._balance + self.ratio, float(self.min_retries))
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+@dataclass
+class ModelRetryPolicy:
+    """How requests to a model provider are retried and hedged.
+
+    Failed requests are retried after a jittered exponential backoff, or after the delay the provider asked for in its
+    `Retry-After` header. Streamed requests are only retried if they failed before the first delta.
+
+    Hedging sends a duplicate request when a request takes longer than the `hedge_percentile` latency of the model,
+    and uses whichever response comes first. It trades a higher cost for a lower tail latency, and only applies to
+    requests that are not streamed.
+    """
+
+    # Number of times a failed request is retried
+    max_retries: int = 2
+    # Backoff before the first retry, in seconds. Multiplied by `backoff_multiplier` for every following retry.
+    initial_delay: float = 0.5
+    backoff_multiplier: float = 2.0
+    # Maximum backoff between retries, in seconds
+    max_delay: float = 30.0
+    # Wait a random delay between 0 and the backoff, so clients failing together don't retry together
+    jitter: bool = True
+    # Status codes of provider errors that are retried
+    retry_on_status_codes: Tuple[int, ...] = (408, 409, 429, 500, 502, 503, 504)
+    # Wait the delay asked for by the provider, when it is at most `max_retry_after` seconds
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+
+    # Fraction of the requests that can be retried, once a burst of `min_retries_budget` retries was used
+    retry_budget_ratio: float = 0.2
+    min_retries_budget: int = 10
+
+    # Latency percentile (between 0 and 1) of the model after which a hedged request is sent. None disables hedging.
+    hedge_percentile: Optional[float] = None
+    # Latencies to record for the model before requests are hedged
+    hedge_min_samples: int = 20
+    # Maximum number of hedged requests sent for a request
+    max_hedged_requests: int = 1
+
+    def __post_init__(self):
+        self.budget = RetryBudget(ratio=self.retry_budget_ratio, min_retries=self.min_retries_budget)
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Return True if the error, or the error it wraps, is a timeout, a connection error or a transient status.
+
+        A `ModelProviderError` wrapping another error gets the default 502 status unless the provider passed the status
+        of the wrapped error, so the wrapped error decides instead. A `ModelRateLimitError` is always a 429.
+        """
+        seen: Set[int] = set()
+        current: Optional[BaseException] = error
+        while current is not None and id(current) not in seen:
+            seen.add(id(current))
+            if _is_timeout_or_connection_error(current):
+                return True
+            cause = current.__cause__ or current.__context__
+            if type(current) is ModelProviderError and cause is not None:
+                current = cause
+                continue
+            status_code = _get_status_code(current)
+            if status_code is not None:
+                return status_code in self.retry_on_status_codes
+            current = cause
+        return False
+
+    def get_delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """Return the delay before retrying a request for the `attempt`-th time, starting from 0"""
+        if self.respect_retry_after and error is not None:
+            retry_after = get_retry_after(error)
+            if retry_after is not None and retry_after <= self.max_retry_after:
+                return retry_after
+
+        backoff = min(self.initial_delay * self.backoff_multiplier**attempt, self.max_delay)
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+
+def _is_timeout_or_connection_error(error: BaseException) -> bool:
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    # The timeout and connection errors of provider SDKs and HTTP clients don't subclass the builtin ones
+    return any("Timeout" in cls.__name__ or "Connect" in cls.__name__ for cls in type(error).__mro__)
+
+
+def _get_status_code(error: BaseException) -> Optional[int]:
+    for status_code in (
+        getattr(error, "status_code", None),
+        getattr(getattr(error, "response", None), "status_code", None),
+        getattr(error, "code", None),
+    ):
+        if isinstance(status_code, int) and not isinstance(status_code, bool):
+            return status_code
+    return None
+
+
+def _parse_retry_after(headers: Any) -> Optional[float]:
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return float(retry_after_ms) / 1000
+        retry_after = headers.get("retry-after")
+        if retry_after is None:
+            return None
+        try:
+            return float(retry_after)
+        except ValueError:
+            # Retry-After can also be an HTTP date
+            return max(parsedate_to_datetime(retry_after).timestamp() - time(), 0.0)
+    except Exception:
+        return None
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """Return the seconds to wait before retrying, from the `Retry-After` header of the error or the errors it wraps"""
+    seen: Set[int] = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        retry_after = getattr(current, "retry_after", None)
+        if isinstance(retry_after, (int, float)):
+            return float(retry_after)
+        headers = getattr(getattr(current, "response", None), "headers", None)
+        if headers is not None:
+            retry_after = _parse_retry_after(headers)
+            if retry_after is not None:
+                return retry_after
+        current = current.__cause__ or current.__context__
+    return None
+
+
+def run_hedged(calls: Sequence[Callable[[], T]], delay: float) -> T:
+    """Run the first call, and each following call once no result came for another `delay` seconds.
+
+    Return the first result. Raise the first error if all calls failed. Calls that lose the race run to completion in
+    the background, as threads can't be cancelled.
+    """
+    executor = ThreadPoolExecutor(max_workers=len(calls), thread_name_prefix="agno-hedge")
+    try:
+        pending: Set[Future] = set()
+        errors: List[BaseException] = []
+        remaining = list(calls)
+        while remaining or pending:
+            if remaining:
+                pending.add(executor.submit(copy_context().run, remaining.pop(0)))
+            done, pending = wait(pending, timeout=delay if remaining else None, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    return future.result()
+                errors.append(error)
+        raise errors[0]
+    finally:
+        executor.shutdown(wait=False)
+
+
+async def arun_hedged(calls: Sequence[Callable[[], Awaitable[T]]], delay: float) -> T:
+    """Run the first call, and each following call once no result came for another `delay` seconds.
+
+    Return the first result, cancelling the other calls. Raise the first error if all calls failed.
+    """
+    pending: Set[asyncio.Future] = set()
+    errors: List[BaseException] = []
+    remaining = list(calls)
+    try:
+        while remaining or pending:
+            if remaining:
+                pending.add(asyncio.ensure_future(remaining.pop(0)()))
+            done, pending = await asyncio.wait(
+                pending, timeout=delay if remaining else None, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    return task.result()
+                errors.append(error)
+        raise errors[0]
+    finally:
+        for task in pending:
+            task.cancel()
@@ -1,7 +1,8 @@
+import asyncio
 from contextlib import asynccontextmanager
 from functools import partial
 from os import getenv
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Sequence, Union
 from uuid import uuid4
 
 from fastapi import APIRouter, FastAPI, HTTPException
@@ -13,6 +14,8 @@ from starlette.requests import Request
 
 from agno.agent.agent import Agent
 from agno.db.base import BaseDb
+from agno.knowledge.ingestion import IngestionQueue
+from agno.knowledge.local_models import warm_up_local_models
 from agno.os.config import (
     AgentOSConfig,
     DatabaseConfig,
@@ -33,10 +36,12 @@ from agno.os.routers.evals import get_eval_router
 from agno.os.routers.health import get_health_router
 from agno.os.routers.home import get_home_router
 from agno.os.routers.knowledge import get_knowledge_router
+from agno.os.routers.knowledge.knowledge import create_ingestion_queue
 from agno.os.routers.memory import get_memory_router
 from agno.os.routers.metrics import get_metrics_router
 from agno.os.routers.session import get_session_router
 from agno.os.settings import AgnoAPISettings
+from agno.os.tracing import TracingMiddleware
 from agno.os.utils import (
     collect_mcp_tools_from_team,
     collect_mcp_tools_from_workflow,
@@ -45,7 +50,7 @@ from agno.os.utils import (
     update_cors_middleware,
 )
 from agno.team.team import Team
-from agno.utils.log import logger
+from agno.utils.log import log_warning, logger
 from agno.utils.string import generate_id, generate_id_from_name
 from agno.workflow.workflow import Workflow
 
@@ -64,6 +69,25 @@ async def mcp_lifespan(_, mcp_tools):
         await tool.close()
 
 
+@asynccontextmanager
+async def knowledge_lifespan(app, lifespan, ingestion_queue: IngestionQueue, local_models: Sequence[Any] = ()):
+    """Load the local models of the knowledge bases and run their ingestion workers while the FastAPI app is running"""
+    async with lifespan(app) as state:
+        # Startup logic: load the local embedder and reranker models, so the first requests don't wait for them
+        if local_models:
+            try:
+                await asyncio.to_thread(warm_up_local_models, *local_models)
+            except Exception as e:
+                log_warning(f"Could not load the local models of the knowledge bases: {e}")
+        # Start the workers, resuming the jobs left by a previous run
+        ingestion_queue.start()
+        try:
+            yield state
+        finally:
+            # Shutdown logic: stop the workers, their running jobs are retried on the next start
+            await ingestion_queue.stop()
+
+
 class AgentOS:
     def __init__(
         self,
@@ -156,6 +180,9 @@ class AgentOS:
         self.mcp_tools: List[Any] = []
         self._mcp_app: Optional[Any] = None
 
+        # Queue processing the content uploaded to the knowledge bases, created with the knowledge router
+        self._ingestion_queue: Optional[IngestionQueue] = None
+
         if self.agents:
             for agent in self.agents:
                 # Track all MCP tools to later handle their connection
@@ -275,12 +302,27 @@ class AgentOS:
             get_memory_router(dbs=self.dbs),
             get_eval_router(dbs=self.dbs, agents=self.agents, teams=self.teams),
             get_metrics_router(dbs=self.dbs),
-            get_knowledge_router(knowledge_instances=self.knowledge_instances),
+            get_knowledge_router(
+                knowledge_instances=self.knowledge_instances,
+                settings=self.settings,
+                ingestion_queue=self._get_ingestion_queue(),
+            ),
         ]
 
         for router in routers:
             self._add_router(fastapi_app, router)
 
+        # Load the local models and run the ingestion workers in the app lifespan, once per app even if the routes are
+        # added again
+        if self._ingestion_queue is not None and getattr(fastapi_app.state, "ingestion_queue", None) is None:
+            fastapi_app.state.ingestion_queue = self._ingestion_queue
+            fastapi_app.router.lifespan_context = partial(
+                knowledge_lifespan,
+                lifespan=fastapi_app.router.lifespan_context,
+                ingestion_queue=self._ingestion_queue,
+                local_models=self._get_knowledge_models(),
+            )
+
         # Mount MCP if needed
         if self.enable_mcp_server and self._mcp_app:
             fastapi_app.mount("/", self._mcp_app)
@@ -308,6 +350,10 @@ class AgentOS:
 
             fastapi_app.middleware("http")(general_exception_handler)
 
+        # Trace requests while tracing is enabled
+        if not any(middleware.cls is TracingMiddleware for middleware in fastapi_app.user_middleware):
+            fastapi_app.add_middleware(TracingMiddleware)  # type: ignore
+
         # Update CORS middleware
         update_cors_middleware(fastapi_app, self.settings.cors_origin_list)  # type: ignore
 
@@ -469,6 +515,23 @@ class AgentOS:
 
         return True
 
+    def _get_ingestion_queue(self) -> Optional[IngestionQueue]:
+        if self._ingestion_queue is None:
+            self._ingestion_queue = create_ingestion_queue(
+                knowledge_instances=self.knowledge_instances, settings=self.settings
+            )
+        return self._ingestion_queue
+
+    def _get_knowledge_models(self) -> List[Any]:
+        """Return the embedders and rerankers of the knowledge instances, each once"""
+        models: Dict[int, Any] = {}
+        for knowledge in self.knowledge_instances or []:
+            vector_db = getattr(knowledge, "vector_db", None)
+            for model in (getattr(vector_db, "embedder", None), getattr(vector_db, "reranker", None)):
+                if model is not None:
+                    models.setdefault(id(model), model)
+        return list(models.values())
+
     def _auto_discover_knowledge_instances(self) -> None:
         """Auto-discover the knowledge instances used by all contextual agents, teams and workflows."""
         knowledge_instances = []
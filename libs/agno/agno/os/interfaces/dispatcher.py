@@ -0,0 +1,147 @@
+"""Dispatches the events received by messaging interfaces (Slack, WhatsApp, ...) to agent runs.
+
+Messaging providers deliver webhooks at least once: a slow acknowledgement makes them retry the same event, which
+would trigger a duplicate run. Messages of one conversation can also arrive while the previous one is still being
+answered, and running them concurrently would race on the same session.
+
+The dispatcher drops duplicate events, processes the events of each conversation one batch at a time and in order,
+and bounds the number of runs in progress across all conversations. Events queued while their conversation is busy,
+or received within `coalesce_window` seconds of each other, are handed to the handler together so they can be
+answered in a single run.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Generic, List, Optional, Set, TypeVar
+
+from agno.utils.log import log_debug, log_error
+
+T = TypeVar("T")
+
+
+@dataclass
+class DispatcherMetrics:
+    received: int = 0
+    duplicates: int = 0
+    # Number of handler calls, and of events they processed
+    runs: int = 0
+    processed: int = 0
+    errors: int = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Events processed in the same run as a previous event of their conversation"""
+        return self.processed - self.runs
+
+
+@dataclass
+class _Conversation(Generic[T]):
+    events: Deque[T] = field(default_factory=deque)
+    task: Optional[asyncio.Task] = None
+
+
+class EventDispatcher(Generic[T]):
+    """Deduplicates events and runs them per conversation, in order, with bounded concurrency.
+
+    Args:
+        handler: Coroutine called with the key of a conversation and the batch of its events to process.
+        max_concurrent_runs: Maximum number of handler calls in progress, across all conversations.
+        dedup_ttl: Seconds during which an event id is remembered to drop redelivered events.
+        max_dedup_entries: Maximum number of event ids remembered.
+        coalesce_window: Seconds to wait for more events of a conversation before processing them.
+        max_batch_size: Maximum number of events processed in one handler call.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str, List[T]], Awaitable[Any]],
+        max_concurrent_runs: int = 8,
+        dedup_ttl: float = 600.0,
+        max_dedup_entries: int = 10_000,
+        coalesce_window: float = 0.0,
+        max_batch_size: int = 10,
+    ):
+        self.handler = handler
+        self.max_concurrent_runs = max_concurrent_runs
+        self.dedup_ttl = dedup_ttl
+        self.max_dedup_entries = max_dedup_entries
+        self.coalesce_window = coalesce_window
+        self.max_batch_size = max(1, max_batch_size)
+        self.metrics = DispatcherMetrics()
+
+        # Event ids seen recently, in order of arrival, with the time they expire
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+        self._conversations: Dict[str, _Conversation[T]] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def is_duplicate(self, event_id: str) -> bool:
+        """Whether the event was already received, remembering it otherwise"""
+        now = time.monotonic()
+        while self._seen:
+            oldest_id, expires_at = next(iter(self._seen.items()))
+            if expires_at > now:
+                break
+            self._seen.pop(oldest_id)
+
+        if event_id in self._seen:
+            return True
+        self._seen[event_id] = now + self.dedup_ttl
+        if len(self._seen) > self.max_dedup_entries:
+            self._seen.popitem(last=False)
+        return False
+
+    def submit(self, conversation_key: str, event: T, event_id: Optional[str] = None) -> bool:
+        """Queue an event for its conversation. Returns False if the event is a duplicate and was dropped.
+
+        Must be called from the event loop the events are processed on.
+        """
+        self.metrics.received += 1
+        if event_id is not None and self.is_duplicate(event_id):
+            log_debug(f"Dropping duplicate event {event_id}")
+            self.metrics.duplicates += 1
+            return False
+
+        conversation = self._conversations.setdefault(conversation_key, _Conversation())
+        conversation.events.append(event)
+        if conversation.task is None:
+            conversation.task = asyncio.create_task(self._drain(conversation_key, conversation))
+            self._tasks.add(conversation.task)
+            conversation.task.add_done_callback(self._tasks.discard)
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Number of events waiting to be processed"""
+        return sum(len(conversation.events) for conversation in self._conversations.values())
+
+    async def join(self) -> None:
+        """Wait until every queued event has been processed"""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def _drain(self, conversation_key: str, conversation: _Conversation[T]) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_runs)
+        try:
+            while conversation.events:
+                if self.coalesce_window > 0:
+                    # Give the user a moment to finish sending a burst of messages
+                    await asyncio.sleep(self.coalesce_window)
+
+                async with self._semaphore:
+                    batch_size = min(len(conversation.events), self.max_batch_size)
+                    batch = [conversation.events.popleft() for _ in range(batch_size)]
+                    self.metrics.runs += 1
+                    self.metrics.processed += len(batch)
+                    try:
+                        await self.handler(conversation_key, batch)
+                    except Exception as e:
+                        self.metrics.errors += 1
+                        log_error(f"Error processing events of conversation {conversation_key}: {e}")
+        finally:
+            conversation.task = None
+            if not conversation.events:
+                self._conversations.pop(conversation_key, None)
@@ -1,9 +1,11 @@
-from typing import Optional
+from itertools import groupby
+from typing import List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel, Field
 
 from agno.agent.agent import Agent
+from agno.os.interfaces.dispatcher import EventDispatcher
 from agno.os.interfaces.slack.security import verify_slack_signature
 from agno.team.team import Team
 from agno.tools.slack import SlackTools
@@ -24,12 +26,33 @@ class SlackChallengeResponse(BaseModel):
 
 
 def attach_routes(
-    router: APIRouter, agent: Optional[Agent] = None, team: Optional[Team] = None, workflow: Optional[Workflow] = None
+    router: APIRouter,
+    agent: Optional[Agent] = None,
+    team: Optional[Team] = None,
+    workflow: Optional[Workflow] = None,
+    max_concurrent_runs: int = 8,
+    dedup_ttl: float = 600.0,
+    coalesce_window: float = 0.0,
 ) -> APIRouter:
     # Determine entity type for documentation
     entity_type = "agent" if agent else "team" if team else "workflow" if workflow else "unknown"
     entity_name = getattr(agent or team or workflow, "name", f"Unnamed {entity_type}")
 
+    async def _process_slack_events(conversation_key: str, events: List[dict]):
+        # Consecutive messages of the same user in a thread are answered in a single run
+        for _, user_events in groupby(events, key=lambda event: event.get("user")):
+            batch = list(user_events)
+            message_text = "\n".join(event.get("text", "") for event in batch)
+            await _process_slack_event(batch[-1], message_text)
+
+    # Slack retries events it did not get a timely response for, and a thread must be answered in order
+    dispatcher: EventDispatcher[dict] = EventDispatcher(
+        handler=_process_slack_events,
+        max_concurrent_runs=max_concurrent_runs,
+        dedup_ttl=dedup_ttl,
+        coalesce_window=coalesce_window,
+    )
+
     @router.post(
         "/events",
         operation_id=f"slack_events_{entity_type}",
@@ -44,7 +67,7 @@ def attach_routes(
             403: {"description": "Invalid Slack signature"},
         },
     )
-    async def slack_events(request: Request, background_tasks: BackgroundTasks):
+    async def slack_events(request: Request):
         body = await request.body()
         timestamp = request.headers.get("X-Slack-Request-Timestamp")
         slack_signature = request.headers.get("X-Slack-Signature", "")
@@ -67,15 +90,20 @@ def attach_routes(
             if event.get("bot_id"):
                 log_info("bot event")
                 pass
-            else:
-                background_tasks.add_task(_process_slack_event, event)
+            elif event.get("type") == "message":
+                # Messages of a thread share a session, top-level messages start their own
+                thread_ts = event.get("thread_ts") or event.get("ts", "")
+                dispatcher.submit(
+                    f"{event.get('channel', '')}:{thread_ts}",
+                    event,
+                    event_id=data.get("event_id") or event.get("client_msg_id"),
+                )
 
         return SlackEventResponse(status="ok")
 
-    async def _process_slack_event(event: dict):
+    async def _process_slack_event(event: dict, message_text: str):
         if event.get("type") == "message":
             user = None
-            message_text = event.get("text", "")
             channel_id = event.get("channel", "")
             user = event.get("user")
             if event.get("thread_ts"):
@@ -17,10 +17,23 @@ class Slack(BaseInterface):
 
     router: APIRouter
 
-    def __init__(self, agent: Optional[Agent] = None, team: Optional[Team] = None, workflow: Optional[Workflow] = None):
+    def __init__(
+        self,
+        agent: Optional[Agent] = None,
+        team: Optional[Team] = None,
+        workflow: Optional[Workflow] = None,
+        max_concurrent_runs: int = 8,
+        dedup_ttl: float = 600.0,
+        coalesce_window: float = 0.0,
+    ):
         self.agent = agent
         self.team = team
         self.workflow = workflow
+        # Number of runs in progress across all threads, and how long retried events are recognized as duplicates
+        self.max_concurrent_runs = max_concurrent_runs
+        self.dedup_ttl = dedup_ttl
+        # Seconds to wait for more messages in a thread before answering them in a single run
+        self.coalesce_window = coalesce_window
 
         if not (self.agent or self.team or self.workflow):
             raise ValueError("Slack requires an agent, team or workflow")
@@ -29,6 +42,14 @@ class Slack(BaseInterface):
         # Cannot be overridden
         self.router = APIRouter(prefix="/slack", tags=["Slack"])
 
-        self.router = attach_routes(router=self.router, agent=self.agent, team=self.team, workflow=self.workflow)
+        self.router = attach_routes(
+            router=self.router,
+            agent=self.agent,
+            team=self.team,
+            workflow=self.workflow,
+            max_concurrent_runs=self.max_concurrent_runs,
+            dedup_ttl=self.dedup_ttl,
+            coalesce_window=self.coalesce_window,
+        )
 
         return self.router
@@ -1,12 +1,14 @@
 import base64
+from itertools import groupby
 from os import getenv
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import PlainTextResponse
 
 from agno.agent.agent import Agent
 from agno.media import Audio, File, Image, Video
+from agno.os.interfaces.dispatcher import EventDispatcher
 from agno.team.team import Team
 from agno.tools.whatsapp import WhatsAppTools
 from agno.utils.log import log_error, log_info, log_warning
@@ -15,13 +17,39 @@ from agno.utils.whatsapp import get_media_async, send_image_message_async, typin
 from .security import validate_webhook_signature
 
 
-def attach_routes(router: APIRouter, agent: Optional[Agent] = None, team: Optional[Team] = None) -> APIRouter:
+def attach_routes(
+    router: APIRouter,
+    agent: Optional[Agent] = None,
+    team: Optional[Team] = None,
+    max_concurrent_runs: int = 8,
+    dedup_ttl: float = 600.0,
+    coalesce_window: float = 0.0,
+) -> APIRouter:
     if agent is None and team is None:
         raise ValueError("Either agent or team must be provided.")
 
     # Create WhatsApp tools instance once for reuse
     whatsapp_tools = WhatsAppTools(async_mode=True)
 
+    async def process_messages(conversation_key: str, messages: List[dict]):
+        # Consecutive text messages are answered in a single run, media messages one by one
+        for is_text, group in groupby(messages, key=lambda message: message.get("type") == "text"):
+            batch = list(group)
+            if is_text and len(batch) > 1:
+                merged = dict(batch[-1])
+                merged["text"] = {"body": "\n".join(message["text"]["body"] for message in batch)}
+                batch = [merged]
+            for message in batch:
+                await process_message(message, agent, team)
+
+    # WhatsApp redelivers webhooks that are not acknowledged in time, and a user's messages must be answered in order
+    dispatcher: EventDispatcher[dict] = EventDispatcher(
+        handler=process_messages,
+        max_concurrent_runs=max_concurrent_runs,
+        dedup_ttl=dedup_ttl,
+        coalesce_window=coalesce_window,
+    )
+
     @router.get("/status")
     async def status():
         return {"status": "available"}
@@ -45,7 +73,7 @@ def attach_routes(router: APIRouter, agent: Optional[Agent] = None, team: Option
         raise HTTPException(status_code=403, detail="Invalid verify token or mode")
 
     @router.post("/webhook")
-    async def webhook(request: Request, background_tasks: BackgroundTasks):
+    async def webhook(request: Request):
         """Handle incoming WhatsApp messages"""
         try:
             # Get raw payload for signature validation
@@ -73,7 +101,8 @@ def attach_routes(router: APIRouter, agent: Optional[Agent] = None, team: Option
                         continue
 
                     message = messages[0]
-                    background_tasks.add_task(process_message, message, agent, team)
+                    # Messages of a phone number share a session, so they are processed in order
+                    dispatcher.submit(f"wa:{message.get('from')}", message, event_id=message.get("id"))
 
             return {"status": "processing"}
 
@@ -13,9 +13,21 @@ class Whatsapp(BaseInterface):
 
     router: APIRouter
 
-    def __init__(self, agent: Optional[Agent] = None, team: Optional[Team] = None):
+    def __init__(
+        self,
+        agent: Optional[Agent] = None,
+        team: Optional[Team] = None,
+        max_concurrent_runs: int = 8,
+        dedup_ttl: float = 600.0,
+        coalesce_window: float = 0.0,
+    ):
         self.agent = agent
         self.team = team
+        # Number of runs in progress across all users, and how long redelivered messages are recognized as duplicates
+        self.max_concurrent_runs = max_concurrent_runs
+        self.dedup_ttl = dedup_ttl
+        # Seconds to wait for more messages from a user before answering them in a single run
+        self.coalesce_window = coalesce_window
 
         if not (self.agent or self.team):
             raise ValueError("Whatsapp requires an agent or a team")
@@ -24,6 +36,13 @@ class Whatsapp(BaseInterface):
         # Cannot be overridden
         self.router = APIRouter(prefix="/whatsapp", tags=["Whatsapp"])
 
-        self.router = attach_routes(router=self.router, agent=self.agent, team=self.team)
+        self.router = attach_routes(
+            router=self.router,
+            agent=self.agent,
+            team=self.team,
+            max_concurrent_runs=self.max_concurrent_runs,
+            dedup_ttl=self.dedup_ttl,
+            coalesce_window=self.coalesce_window,
+        )
 
         return self.router
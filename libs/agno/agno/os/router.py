@@ -37,6 +37,7 @@ from agno.os.schema import (
     WorkflowSummaryResponse,
 )
 from agno.os.settings import AgnoAPISettings
+from agno.os.streaming import StreamCoalescingPolicy, stream_sse_events
 from agno.os.utils import (
     get_agent_by_id,
     get_team_by_id,
@@ -229,6 +230,7 @@ async def agent_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    coalescing: Optional[StreamCoalescingPolicy] = None,
     **kwargs: Any,
 ) -> AsyncGenerator:
     try:
@@ -244,8 +246,8 @@ async def agent_response_streamer(
             stream_intermediate_steps=True,
             **kwargs,
         )
-        async for run_response_chunk in run_response:
-            yield format_sse_event(run_response_chunk)  # type: ignore
+        async for frames in stream_sse_events(run_response, coalescing):  # type: ignore
+            yield frames
     except (InputCheckError, OutputCheckError) as e:
         error_response = RunErrorEvent(
             content=str(e),
@@ -270,6 +272,7 @@ async def agent_continue_response_streamer(
     updated_tools: Optional[List] = None,
     session_id: Optional[str] = None,
     user_id: Optional[str] = None,
+    coalescing: Optional[StreamCoalescingPolicy] = None,
 ) -> AsyncGenerator:
     try:
         continue_response = agent.acontinue_run(
@@ -280,8 +283,8 @@ async def agent_continue_response_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        async for run_response_chunk in continue_response:
-            yield format_sse_event(run_response_chunk)  # type: ignore
+        async for frames in stream_sse_events(continue_response, coalescing):  # type: ignore
+            yield frames
     except (InputCheckError, OutputCheckError) as e:
         error_response = RunErrorEvent(
             content=str(e),
@@ -313,6 +316,7 @@ async def team_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    coalescing: Optional[StreamCoalescingPolicy] = None,
     **kwargs: Any,
 ) -> AsyncGenerator:
     """Run the given team asynchronously and yield its response"""
@@ -329,8 +333,8 @@ async def team_response_streamer(
             stream_intermediate_steps=True,
             **kwargs,
         )
-        async for run_response_chunk in run_response:
-            yield format_sse_event(run_response_chunk)  # type: ignore
+        async for frames in stream_sse_events(run_response, coalescing):  # type: ignore
+            yield frames
     except (InputCheckError, OutputCheckError) as e:
         error_response = TeamRunErrorEvent(
             content=str(e),
@@ -423,6 +427,7 @@ async def workflow_response_streamer(
     input: Optional[Union[str, Dict[str, Any], List[Any], BaseModel]] = None,
     session_id: Optional[str] = None,
     user_id: Optional[str] = None,
+    coalescing: Optional[StreamCoalescingPolicy] = None,
     **kwargs: Any,
 ) -> AsyncGenerator:
     try:
@@ -435,8 +440,8 @@ async def workflow_response_streamer(
             **kwargs,
         )
 
-        async for run_response_chunk in run_response:
-            yield format_sse_event(run_response_chunk)  # type: ignore
+        async for frames in stream_sse_events(run_response, coalescing):  # type: ignore
+            yield frames
 
     except (InputCheckError, OutputCheckError) as e:
         error_response = WorkflowErrorEvent(
@@ -557,6 +562,9 @@ def get_base_router(
         },
     )
 
+    # How streamed content deltas are merged before they are sent
+    coalescing = StreamCoalescingPolicy.from_settings(settings)
+
     # -- Main Routes ---
     @router.get(
         "/config",
@@ -846,6 +854,7 @@ def get_base_router(
                     audio=base64_audios if base64_audios else None,
                     videos=base64_videos if base64_videos else None,
                     files=input_files if input_files else None,
+                    coalescing=coalescing,
                     **kwargs,
                 ),
                 media_type="text/event-stream",
@@ -974,6 +983,7 @@ def get_base_router(
                     updated_tools=updated_tools,
                     session_id=session_id,
                     user_id=user_id,
+                    coalescing=coalescing,
                 ),
                 media_type="text/event-stream",
             )
@@ -1227,6 +1237,7 @@ def get_base_router(
                     audio=base64_audios if base64_audios else None,
                     videos=base64_videos if base64_videos else None,
                     files=document_files if document_files else None,
+                    coalescing=coalescing,
                     **kwargs,
                 ),
                 media_type="text/event-stream",
@@ -1617,6 +1628,7 @@ def get_base_router(
                         input=message,
                         session_id=session_id,
                         user_id=user_id,
+                        coalescing=coalescing,
                         **kwargs,
                     ),
                     media_type="text/event-stream",
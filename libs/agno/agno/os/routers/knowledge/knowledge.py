@@ -1,13 +1,15 @@
 import json
 import logging
 import math
+from io import BytesIO
 from typing import Dict, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Path, Query, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Path, Query, UploadFile
+from starlette.concurrency import run_in_threadpool
 
-from agno.knowledge.content import Content, FileData
+from agno.knowledge.content import Content
+from agno.knowledge.ingestion import IngestionJob, IngestionQueue
 from agno.knowledge.knowledge import Knowledge
-from agno.knowledge.reader import ReaderFactory
 from agno.knowledge.reader.base import Reader
 from agno.knowledge.utils import get_all_chunkers_info, get_all_readers_info, get_content_types_to_readers_mapping
 from agno.os.auth import get_authentication_dependency
@@ -18,6 +20,7 @@ from agno.os.routers.knowledge.schemas import (
     ContentStatus,
     ContentStatusResponse,
     ContentUpdateSchema,
+    IngestionMetricsSchema,
     ReaderSchema,
 )
 from agno.os.schema import (
@@ -38,8 +41,27 @@ from agno.utils.string import generate_id
 logger = logging.getLogger(__name__)
 
 
-def get_knowledge_router(
+def create_ingestion_queue(
     knowledge_instances: List[Knowledge], settings: AgnoAPISettings = AgnoAPISettings()
+) -> Optional[IngestionQueue]:
+    """Create the queue processing the content uploaded to the knowledge bases, if there are any.
+
+    The workers of the queue are not started, the app serving the knowledge router starts and stops them in its lifespan.
+    """
+    if not knowledge_instances:
+        return None
+    return IngestionQueue(
+        knowledge_instances=knowledge_instances,
+        spool_dir=settings.knowledge_spool_dir,
+        num_workers=settings.knowledge_ingestion_workers,
+        max_attempts=settings.knowledge_ingestion_max_attempts,
+    )
+
+
+def get_knowledge_router(
+    knowledge_instances: List[Knowledge],
+    settings: AgnoAPISettings = AgnoAPISettings(),
+    ingestion_queue: Optional[IngestionQueue] = None,
 ) -> APIRouter:
     """Create knowledge router with comprehensive OpenAPI documentation for content management endpoints."""
     router = APIRouter(
@@ -53,10 +75,22 @@ def get_knowledge_router(
             500: {"description": "Internal Server Error", "model": InternalServerErrorResponse},
         },
     )
-    return attach_routes(router=router, knowledge_instances=knowledge_instances)
+    if ingestion_queue is None:
+        ingestion_queue = create_ingestion_queue(knowledge_instances=knowledge_instances, settings=settings)
+    return attach_routes(router=router, knowledge_instances=knowledge_instances, ingestion_queue=ingestion_queue)
 
 
-def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> APIRouter:
+def attach_routes(
+    router: APIRouter, knowledge_instances: List[Knowledge], ingestion_queue: Optional[IngestionQueue] = None
+) -> APIRouter:
+    if ingestion_queue is None and knowledge_instances:
+        ingestion_queue = IngestionQueue(knowledge_instances=knowledge_instances)
+
+    def get_ingestion_queue() -> IngestionQueue:
+        if ingestion_queue is None:
+            raise HTTPException(status_code=404, detail="No knowledge instances configured")
+        return ingestion_queue
+
     @router.post(
         "/knowledge/content",
         response_model=ContentResponseSchema,
@@ -65,7 +99,8 @@ def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> AP
         summary="Upload Content",
         description=(
             "Upload content to the knowledge base. Supports file uploads, text content, or URLs. "
-            "Content is processed asynchronously in the background. Supports custom readers and chunking strategies."
+            "Content is queued and processed asynchronously by the ingestion workers, with retries on failure. "
+            "Supports custom readers and chunking strategies."
         ),
         responses={
             202: {
@@ -90,7 +125,6 @@ def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> AP
         },
     )
     async def upload_content(
-        background_tasks: BackgroundTasks,
         name: Optional[str] = Form(None, description="Content name (auto-generated from file/URL if not provided)"),
         description: Optional[str] = Form(None, description="Content description for context"),
         url: Optional[str] = Form(None, description="URL to fetch content from (JSON array or single URL string)"),
@@ -102,22 +136,9 @@ def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> AP
         db_id: Optional[str] = Query(default=None, description="Database ID to use for content storage"),
     ):
         knowledge = get_knowledge_instance_by_db_id(knowledge_instances, db_id)
+        queue = get_ingestion_queue()
         log_info(f"Adding content: {name}, {description}, {url}, {metadata}")
 
-        parsed_metadata = None
-        if metadata:
-            try:
-                parsed_metadata = json.loads(metadata)
-            except json.JSONDecodeError:
-                # If it's not valid JSON, treat as a simple key-value pair
-                parsed_metadata = {"value": metadata} if metadata != "string" else None
-        if file:
-            content_bytes = await file.read()
-        elif text_content:
-            content_bytes = text_content.encode("utf-8")
-        else:
-            content_bytes = None
-
         parsed_urls = None
         if url and url.strip():
             try:
@@ -136,43 +157,39 @@ def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> AP
                 # If it's not valid JSON, treat as a simple key-value pair
                 parsed_metadata = {"value": metadata}
 
-        if text_content:
-            file_data = FileData(
-                content=content_bytes,
-                type="manual",
-            )
-        elif file:
-            file_data = FileData(
-                content=content_bytes,
-                type=file.content_type if file.content_type else None,
-                filename=file.filename,
-                size=file.size,
-            )
-        else:
-            file_data = None
-
         if not name:
             if file and file.filename:
                 name = file.filename
             elif url:
                 name = parsed_urls
 
-        content = Content(
+        job = IngestionJob(
+            content_id="",
             name=name,
             description=description,
             url=parsed_urls,
             metadata=parsed_metadata,
-            file_data=file_data,
-            size=file.size if file else None if text_content else None,
+            reader_id=reader_id,
+            chunker=chunker,
+            db_id=knowledge.contents_db.id if knowledge.contents_db else None,
         )
-        content_hash = knowledge._build_content_hash(content)
-        content.content_hash = content_hash
-        content.id = generate_id(content_hash)
+        # Spool the body to disk instead of holding it in memory until a worker picks the job
+        if file:
+            job.file_type = file.content_type if file.content_type else None
+            job.filename = file.filename
+            await run_in_threadpool(queue.spool_body, job, file.file)
+        elif text_content:
+            job.file_type = "manual"
+            await run_in_threadpool(queue.spool_body, job, BytesIO(text_content.encode("utf-8")))
 
-        background_tasks.add_task(process_content, knowledge, content, reader_id, chunker)
+        content_hash = knowledge._build_content_hash(queue.build_content(job, load_body=False))
+        job.content_hash = content_hash
+        job.content_id = generate_id(content_hash)
+
+        await run_in_threadpool(queue.enqueue, job)
 
         response = ContentResponseSchema(
-            id=content.id,
+            id=job.content_id,
             name=name,
             description=description,
             metadata=parsed_metadata,
@@ -513,6 +530,21 @@ def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> AP
 
         return ContentStatusResponse(status=status, status_message=status_message or "")
 
+    @router.get(
+        "/knowledge/ingestion/metrics",
+        response_model=IngestionMetricsSchema,
+        status_code=200,
+        operation_id="get_ingestion_metrics",
+        summary="Get Ingestion Metrics",
+        description=(
+            "Retrieve the depth of the content ingestion queue, shared by all the workers using the same spool "
+            "directory, and the throughput and failures of the workers of this server."
+        ),
+    )
+    async def get_ingestion_metrics() -> IngestionMetricsSchema:
+        queue = get_ingestion_queue()
+        return IngestionMetricsSchema(**await run_in_threadpool(queue.get_metrics))
+
     @router.get(
         "/knowledge/config",
         status_code=200,
@@ -801,50 +833,3 @@ def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> AP
         )
 
     return router
-
-
-async def process_content(
-    knowledge: Knowledge,
-    content: Content,
-    reader_id: Optional[str] = None,
-    chunker: Optional[str] = None,
-):
-    """Background task to process the content"""
-
-    try:
-        if reader_id:
-            reader = None
-            if knowledge.readers and reader_id in knowledge.readers:
-                reader = knowledge.readers[reader_id]
-            else:
-                key = reader_id.lower().strip().replace("-", "_").replace(" ", "_")
-                candidates = [key] + ([key[:-6]] if key.endswith("reader") else [])
-                for cand in candidates:
-                    try:
-                        reader = ReaderFactory.create_reader(cand)
-                        log_debug(f"Resolved reader: {reader.__class__.__name__}")
-                        break
-                    except Exception:
-                        continue
-            if reader:
-                content.reader = reader
-        if chunker and content.reader:
-            # Set the chunker name on the reader - let the reader handle it internally
-            content.reader.set_chunking_strategy_from_string(chunker)
-            log_debug(f"Set chunking strategy: {chunker}")
-
-        log_debug(f"Using reader: {content.reader.__class__.__name__}")
-        await knowledge._load_content(content, upsert=False, skip_if_exists=True)
-        log_info(f"Content {content.id} processed successfully")
-    except Exception as e:
-        log_info(f"Error processing content: {e}")
-        # Mark content as failed in the contents DB
-        try:
-            from agno.knowledge.content import ContentStatus as KnowledgeContentStatus
-
-            content.status = KnowledgeContentStatus.FAILED
-            content.status_message = str(e)
-            knowledge.patch_content(content)
-        except Exception:
-            # Swallow any secondary errors to avoid crashing the background task
-            pass
@@ -116,3 +116,21 @@ class ConfigResponseSchema(BaseModel):
     readersForType: Optional[Dict[str, List[str]]] = None
     chunkers: Optional[Dict[str, ChunkerSchema]] = None
     filters: Optional[List[str]] = None
+
+
+class IngestionMetricsSchema(BaseModel):
+    """Depth of the ingestion queue and counters of the jobs processed by this server"""
+
+    pending: int = Field(..., description="Jobs waiting to be processed, including scheduled retries")
+    scheduled_retries: int = Field(..., description="Pending jobs waiting for their retry delay")
+    running: int = Field(..., description="Jobs being processed by a worker")
+    failed: int = Field(..., description="Jobs that failed on every attempt")
+    oldest_pending_age: Optional[float] = Field(None, description="Age of the oldest pending job, in seconds")
+    workers: int = Field(..., description="Number of workers running in this server")
+    enqueued: int
+    completed: int
+    failed_total: int
+    retried: int
+    recovered: int = Field(..., description="Jobs recovered from a worker that stopped")
+    throughput_per_minute: float
+    avg_processing_time: float = Field(..., description="Average time to process a job, in seconds")
@@ -219,6 +219,7 @@ class AgentResponse(BaseModel):
             # Default tools defaults
             "read_chat_history": False,
             "search_knowledge": True,
+            "search_knowledge_multi_query": False,
             "update_knowledge": False,
             "read_tool_call_history": False,
             # System message defaults
@@ -324,6 +325,7 @@ class AgentResponse(BaseModel):
         default_tools_info = {
             "read_chat_history": agent.read_chat_history,
             "search_knowledge": agent.search_knowledge,
+            "search_knowledge_multi_query": agent.search_knowledge_multi_query,
             "update_knowledge": agent.update_knowledge,
             "read_tool_call_history": agent.read_tool_call_history,
         }
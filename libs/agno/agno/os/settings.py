@@ -20,6 +20,28 @@ class AgnoAPISettings(BaseSettings):
     # Authentication settings
     os_security_key: Optional[str] = Field(default=None, description="Bearer token for API authentication")
 
+    # Knowledge ingestion settings
+    knowledge_spool_dir: Optional[str] = Field(
+        default=None,
+        description="Directory where uploaded content is queued for ingestion. Defaults to a private temp dir",
+    )
+    knowledge_ingestion_workers: int = Field(
+        default=2, description="Number of ingestion workers in this server. Set to 0 to use a separate worker process"
+    )
+    knowledge_ingestion_max_attempts: int = Field(default=3, description="Attempts before an ingestion job fails")
+
+    # Streaming settings
+    stream_coalesce_interval: float = Field(
+        default=0.0,
+        description="Seconds over which consecutive content deltas are merged into one event. 0 disables it",
+    )
+    stream_coalesce_max_chars: int = Field(
+        default=0, description="Characters after which merged content deltas are sent. 0 disables the size limit"
+    )
+    stream_compact_events: bool = Field(
+        default=False, description="Omit the fields of streamed content events that are unchanged from the previous one"
+    )
+
     # Cors origin list to allow requests from.
     # This list is set using the set_cors_origin_list validator
     cors_origin_list: Optional[List[str]] = Field(default=None, validate_default=True)
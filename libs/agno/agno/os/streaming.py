@@ -0,0 +1,219 @@
+import json
+from dataclasses import dataclass, replace
+from time import monotonic
+from typing import Any, AsyncIterator, Dict, Optional, Union
+
+from agno.os.settings import AgnoAPISettings
+from agno.run.agent import RunContentEvent, RunOutputEvent
+from agno.run.team import RunContentEvent as TeamRunContentEvent
+from agno.run.team import TeamRunOutputEvent
+from agno.run.workflow import WorkflowRunOutputEvent
+from agno.utils.stream import StreamBuffer
+
+StreamEvent = Union[RunOutputEvent, TeamRunOutputEvent, WorkflowRunOutputEvent]
+
+CONTENT_EVENT_TYPES = (RunContentEvent, TeamRunContentEvent)
+
+# Content events carrying any of these can't be merged, nor encoded without `to_dict`
+_PAYLOAD_FIELDS = (
+    "model_provider_data",
+    "citations",
+    "response_audio",
+    "image",
+    "references",
+    "additional_input",
+    "reasoning_steps",
+    "reasoning_messages",
+    "tools",
+)
+
+# Content events are only merged with events of the same run and step
+_STREAM_FIELDS = (
+    "agent_id",
+    "team_id",
+    "run_id",
+    "parent_run_id",
+    "session_id",
+    "workflow_run_id",
+    "step_id",
+    "step_index",
+)
+
+# Fields repeated by every content event of a stream. The compact encoding omits them while they are unchanged.
+_REPEATED_FIELDS = frozenset(
+    (
+        "created_at",
+        "agent_id",
+        "agent_name",
+        "team_id",
+        "team_name",
+        "run_id",
+        "parent_run_id",
+        "session_id",
+        "workflow_id",
+        "workflow_run_id",
+        "step_id",
+        "step_name",
+        "step_index",
+        "content_type",
+    )
+)
+
+
+@dataclass
+class StreamCoalescingPolicy:
+    """How consecutive content deltas of a stream are merged before they are sent to the client.
+
+    Deltas are merged until `max_delay` seconds passed since the first one, or until the merged content reaches
+    `max_chars` characters. Any other event, e.g. a tool call, first sends the merged content. Deltas are only
+    checked when the next event arrives, so a merged delta also waits while the model pauses.
+
+    Args:
+        max_delay: Seconds over which content deltas are merged. 0 disables the time limit.
+        max_chars: Characters after which the merged content is sent. 0 disables the size limit.
+        compact: Omit the fields of content events that are unchanged from the previous content event.
+            Clients must then carry those fields over from the previous content event.
+    """
+
+    max_delay: float = 0.0
+    max_chars: int = 0
+    compact: bool = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_delay > 0 or self.max_chars > 0
+
+    @classmethod
+    def from_settings(cls, settings: AgnoAPISettings) -> "StreamCoalescingPolicy":
+        return cls(
+            max_delay=settings.stream_coalesce_interval,
+            max_chars=settings.stream_coalesce_max_chars,
+            compact=settings.stream_compact_events,
+        )
+
+
+def is_plain_content_event(event: Any) -> bool:
+    """Whether the event is a content event carrying only text content or reasoning"""
+    if not isinstance(event, CONTENT_EVENT_TYPES) or event.content_type != "str":
+        return False
+    if not (event.content is None or isinstance(event.content, str)):
+        return False
+    if not (event.reasoning_content is None or isinstance(event.reasoning_content, str)):
+        return False
+    return all(getattr(event, field, None) is None for field in _PAYLOAD_FIELDS)
+
+
+class _MergedContent:
+    """Consecutive plain content events of a stream, merged into one"""
+
+    __slots__ = ("first_event", "content", "reasoning_content", "chars", "started_at")
+
+    def __init__(self, event: Any):
+        self.first_event = event
+        self.content = StreamBuffer()
+        self.reasoning_content = StreamBuffer()
+        self.chars = 0
+        self.started_at = monotonic()
+        self.add(event)
+
+    def accepts(self, event: Any) -> bool:
+        return (
+            type(event) is type(self.first_event)
+            and is_plain_content_event(event)
+            and all(getattr(event, field, None) == getattr(self.first_event, field, None) for field in _STREAM_FIELDS)
+        )
+
+    def add(self, event: Any) -> None:
+        if event.content:
+            self.content.append(event.content)
+            self.chars += len(event.content)
+        if event.reasoning_content:
+            self.reasoning_content.append(event.reasoning_content)
+            self.chars += len(event.reasoning_content)
+
+    def is_due(self, policy: StreamCoalescingPolicy) -> bool:
+        if policy.max_chars > 0 and self.chars >= policy.max_chars:
+            return True
+        return policy.max_delay > 0 and monotonic() - self.started_at >= policy.max_delay
+
+    def to_event(self) -> Any:
+        return replace(
+            self.first_event,
+            content=self.content.value if self.content else self.first_event.content,
+            reasoning_content=self.reasoning_content.value if self.reasoning_content else None,
+        )
+
+
+class SSEEncoder:
+    """Encodes events as Server-Sent Events frames.
+
+    Plain content events, the bulk of a stream, are encoded from their fields directly instead of `to_dict`, which
+    deep-copies the whole event.
+    """
+
+    def __init__(self, compact: bool = False):
+        self.compact = compact
+        self._previous_fields: Dict[str, Any] = {}
+
+    def encode(self, event: StreamEvent) -> str:
+        event_type = event.event or "message"
+        if is_plain_content_event(event):
+            data = {key: value for key, value in event.__dict__.items() if value is not None}
+            if self.compact:
+                data = self._compact(data)
+            clean_json = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+        else:
+            clean_json = event.to_json(separators=(",", ":"), indent=None)
+        return f"event: {event_type}\ndata: {clean_json}\n\n"
+
+    def _compact(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        compacted = {}
+        for key, value in data.items():
+            if key in _REPEATED_FIELDS and self._previous_fields.get(key) == value:
+                continue
+            compacted[key] = value
+        self._previous_fields = {key: value for key, value in data.items() if key in _REPEATED_FIELDS}
+        return compacted
+
+
+async def stream_sse_events(
+    events: AsyncIterator[StreamEvent], policy: Optional[StreamCoalescingPolicy] = None
+) -> AsyncIterator[str]:
+    """Encode a stream of events as SSE frames, merging consecutive content deltas according to the policy.
+
+    The merged content and the event that ended it are sent in a single write.
+    """
+    policy = policy or StreamCoalescingPolicy()
+    encoder = SSEEncoder(compact=policy.compact)
+
+    if not policy.enabled:
+        async for event in events:
+            yield encoder.encode(event)
+        return
+
+    merged: Optional[_MergedContent] = None
+    try:
+        async for event in events:
+            if merged is not None and merged.accepts(event):
+                merged.add(event)
+            else:
+                frames = encoder.encode(merged.to_event()) if merged is not None else ""
+                merged = None
+                if is_plain_content_event(event):
+                    merged = _MergedContent(event)
+                else:
+                    frames += encoder.encode(event)
+                if frames:
+                    yield frames
+
+            if merged is not None and merged.is_due(policy):
+                yield encoder.encode(merged.to_event())
+                merged = None
+    except Exception:
+        # Send the content received before the error, the caller sends the error itself
+        if merged is not None:
+            yield encoder.encode(merged.to_event())
+        raise
+
+    if merged is not None:
+        yield encoder.encode(merged.to_event())
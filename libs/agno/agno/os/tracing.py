@@ -0,0 +1,32 @@
+from typing import Any, Dict
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from agno.tracing import is_tracing_enabled, trace_span
+
+
+class TracingMiddleware:
+    """
+    Traces every HTTP request to the AgentOS as a span, so the spans of the runs it starts are nested under it.
+
+    The span ends when the response is fully sent, so it covers the whole stream of streaming responses.
+    Requests are not traced while tracing is disabled.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not is_tracing_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        attributes: Dict[str, Any] = {"http.method": scope.get("method"), "http.target": scope.get("path")}
+        with trace_span("agentos.request", attributes) as span:
+
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            await self.app(scope, receive, send_with_status)
@@ -1,6 +1,8 @@
-from typing import Any, Dict, List, Literal, Optional
+from copy import copy, deepcopy
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
 
 from agno.models.base import Model
+from agno.models.cache.base import _get_model_params
 from agno.models.message import Message
 from agno.reasoning.step import NextAction, ReasoningStep
 from agno.run.messages import RunMessages
@@ -29,6 +31,74 @@ def get_reasoning_agent(
     )
 
 
+class ReasoningAgentCache:
+    """Reasoning agents of an Agent or Team, reused across runs.
+
+    Building a reasoning agent copies the model and processes the tools and instructions, so it is done once and
+    redone only when the configuration it was built from changes. Every run gets a shallow copy of the cached agent
+    with its own per-run state, so concurrent runs don't share a session.
+    """
+
+    def __init__(self):
+        self._model: Optional[Model] = None
+        self._model_params: Optional[Dict[str, Any]] = None
+        self._model_copy: Optional[Model] = None
+        # Kind of reasoning agent -> (configuration key, objects it was built from, reasoning agent)
+        self._agents: Dict[str, Tuple[Tuple[Any, ...], Tuple[Any, ...], Any]] = {}
+
+    def get_model_copy(self, model: Model) -> Model:
+        """Return a copy of the model to reason with, so reasoning settings don't leak into the model itself.
+
+        The model is copied again when it is replaced, or when its parameters were changed in place.
+        """
+        params = _get_model_params(model)
+        if self._model is not model or self._model_params != params or self._model_copy is None:
+            self._model_copy = deepcopy(model)
+            self._model = model
+            self._model_params = params
+        return self._model_copy
+
+    def get_agent(
+        self,
+        kind: str,
+        key: Tuple[Any, ...],
+        build: Callable[[], Optional["Agent"]],  # type: ignore  # noqa: F821
+        objects: Sequence[Any] = (),
+        session_state: Optional[Dict[str, Any]] = None,
+        dependencies: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional["Agent"]:  # type: ignore  # noqa: F821
+        """Return a copy of the reasoning agent of the given kind for one run, building it if the configuration `key`
+        changed, or if any of the `objects` it was built from, e.g. the model and tools, was replaced.
+
+        The objects are compared by identity, and kept alive by the cache so their ids can't be reused by new objects.
+        """
+        objects = tuple(objects)
+        cached = self._agents.get(kind)
+        if (
+            cached is not None
+            and cached[0] == key
+            and len(cached[1]) == len(objects)
+            and all(a is b for a, b in zip(cached[1], objects))
+        ):
+            agent = cached[2]
+        else:
+            agent = build()
+            if agent is None:
+                self._agents.pop(kind, None)
+                return None
+            self._agents[kind] = (key, objects, agent)
+
+        # The run sets its session on the agent, so it runs on a copy sharing the model and tools of the cached agent
+        agent = copy(agent)
+        agent.session_state = session_state
+        agent.dependencies = dependencies
+        agent.metadata = metadata
+        # Every run reasons in a new session, as with a newly built agent
+        agent.session_id = None
+        return agent
+
+
 def get_next_action(reasoning_step: ReasoningStep) -> NextAction:
     next_action = reasoning_step.next_action or NextAction.FINAL_ANSWER
     if isinstance(next_action, str):
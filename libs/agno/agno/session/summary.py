@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 
 from agno.models.base import Model
 from agno.run.agent import Message
+from agno.tracing import traced
 from agno.utils.log import log_debug, log_warning
 
 # TODO: Look into moving all managers into a separate dir
@@ -56,6 +57,10 @@ class SessionSummaryResponse(BaseModel):
         return self.model_dump_json(exclude_none=True, indent=2)
 
 
+def _span_attributes(summary_manager: "SessionSummaryManager", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"model.id": summary_manager.model.id if summary_manager.model is not None else None}
+
+
 @dataclass
 class SessionSummaryManager:
     """Session Summary Manager"""
@@ -181,6 +186,7 @@ class SessionSummaryManager:
 
         return None
 
+    @traced("session.create_summary", attributes=_span_attributes)
     def create_session_summary(
         self,
         session: Union["AgentSession", "TeamSession"],
@@ -202,6 +208,7 @@ class SessionSummaryManager:
 
         return session_summary
 
+    @traced("session.create_summary", attributes=_span_attributes)
     async def acreate_session_summary(
         self,
         session: Union["AgentSession", "TeamSession"],
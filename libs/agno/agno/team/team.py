@@ -4,9 +4,11 @@ import json
 from collections import ChainMap, deque
 from copy import copy
 from dataclasses import dataclass
+from functools import partial
 from os import getenv
 from textwrap import dedent
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -38,14 +40,13 @@ from agno.exceptions import (
     RunCancelledException,
 )
 from agno.guardrails import BaseGuardrail
-from agno.knowledge.knowledge import Knowledge
 from agno.knowledge.types import KnowledgeFilter
 from agno.media import Audio, File, Image, Video
-from agno.memory import MemoryManager
 from agno.models.base import Model
 from agno.models.message import Message, MessageReferences
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse, ModelResponseEvent
+from agno.reasoning.helpers import ReasoningAgentCache
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.agent import RunEvent, RunOutput, RunOutputEvent
 from agno.run.base import RunStatus
@@ -62,6 +63,8 @@ from agno.run.team import TeamRunEvent, TeamRunInput, TeamRunOutput, TeamRunOutp
 from agno.session import SessionSummaryManager, TeamSession
 from agno.tools import Toolkit
 from agno.tools.function import Function
+from agno.tools.spillover import add_result_page_tool
+from agno.tracing import get_current_span, traced
 from agno.utils.common import is_typed_dict, validate_typed_dict
 from agno.utils.events import (
     create_team_memory_update_completed_event,
@@ -96,12 +99,6 @@ from agno.utils.log import (
 )
 from agno.utils.merge_dict import merge_dictionaries
 from agno.utils.message import get_text_from_message
-from agno.utils.print_response.team import (
-    aprint_response,
-    aprint_response_stream,
-    print_response,
-    print_response_stream,
-)
 from agno.utils.reasoning import (
     add_reasoning_metrics_to_metadata,
     add_reasoning_step_to_metadata,
@@ -114,10 +111,53 @@ from agno.utils.response import (
     generator_wrapper,
 )
 from agno.utils.safe_formatter import SafeFormatter
-from agno.utils.string import generate_id_from_name, parse_response_model_str
+from agno.utils.stream import ResponseStreamBuffers
+from agno.utils.string import generate_id_from_name, parse_response_model_str, substitute_variables
 from agno.utils.team import format_member_agent_task, get_member_id
 from agno.utils.timer import Timer
 
+if TYPE_CHECKING:
+    # Optional subsystems are imported when first used, to keep `import agno.team` fast
+    from agno.knowledge.knowledge import Knowledge
+    from agno.memory import MemoryManager
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import of the optional subsystems in the annotations of Team.
+
+    The first access adds them to the module namespace. `typing.get_type_hints(Team)` reads the namespace without
+    calling this function, so it raises a NameError until they were accessed, e.g. with
+    `from agno.team.team import Knowledge, MemoryManager`.
+    """
+    if name == "Knowledge":
+        from agno.knowledge.knowledge import Knowledge
+
+        globals()[name] = Knowledge
+        return Knowledge
+    elif name == "MemoryManager":
+        from agno.memory import MemoryManager
+
+        globals()[name] = MemoryManager
+        return MemoryManager
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def _span_attributes(team: "Team", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"team.id": team.id, "team.name": team.name}
+
+
+def _session_span_attributes(team: "Team", session_id: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"team.id": team.id, "team.name": team.name, "session.id": session_id}
+
+
+def _run_span_attributes(team: "Team", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {
+        "team.id": team.id,
+        "team.name": team.name,
+        "user.id": kwargs.get("user_id"),
+        "model.id": team.model.id if team.model is not None else None,
+    }
+
 
 @dataclass(init=False)
 class Team:
@@ -217,7 +257,7 @@ class Team:
     db: Optional[BaseDb] = None
 
     # Memory manager to use for this agent
-    memory_manager: Optional[MemoryManager] = None
+    memory_manager: Optional["MemoryManager"] = None
 
     # --- User provided dependencies ---
     # User provided dependencies
@@ -226,7 +266,7 @@ class Team:
     add_dependencies_to_context: bool = False
 
     # --- Agent Knowledge ---
-    knowledge: Optional[Knowledge] = None
+    knowledge: Optional["Knowledge"] = None
     # Add knowledge_filters to the Agent class attributes
     knowledge_filters: Optional[Dict[str, Any]] = None
     # Let the agent choose the knowledge filters
@@ -276,6 +316,9 @@ class Team:
     tool_call_limit: Optional[int] = None
     # A list of hooks to be called before and after the tool call
     tool_hooks: Optional[List[Callable]] = None
+    # Tool results longer than this many characters are replaced with a preview and a handle, and the model can read
+    # the rest with the `get_tool_result_page` tool. Applies to tools without their own `max_result_chars`.
+    max_tool_result_chars: Optional[int] = None
 
     # --- Team Hooks ---
     # Functions called right after team session is loaded, before processing starts
@@ -406,7 +449,7 @@ class Team:
         additional_input: Optional[List[Union[str, Dict, BaseModel, Message]]] = None,
         dependencies: Optional[Dict[str, Any]] = None,
         add_dependencies_to_context: bool = False,
-        knowledge: Optional[Knowledge] = None,
+        knowledge: Optional["Knowledge"] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         add_knowledge_to_context: bool = False,
         enable_agentic_knowledge_filters: Optional[bool] = False,
@@ -423,6 +466,7 @@ class Team:
         tool_call_limit: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
+        max_tool_result_chars: Optional[int] = None,
         pre_hooks: Optional[Union[List[Callable[..., Any]], List[BaseGuardrail]]] = None,
         post_hooks: Optional[Union[List[Callable[..., Any]], List[BaseGuardrail]]] = None,
         input_schema: Optional[Type[BaseModel]] = None,
@@ -437,7 +481,7 @@ class Team:
         enable_agentic_memory: bool = False,
         enable_user_memories: bool = False,
         add_memories_to_context: Optional[bool] = None,
-        memory_manager: Optional[MemoryManager] = None,
+        memory_manager: Optional["MemoryManager"] = None,
         enable_session_summaries: bool = False,
         session_summary_manager: Optional[SessionSummaryManager] = None,
         add_session_summary_to_context: Optional[bool] = None,
@@ -524,6 +568,7 @@ class Team:
         self.tool_choice = tool_choice
         self.tool_call_limit = tool_call_limit
         self.tool_hooks = tool_hooks
+        self.max_tool_result_chars = max_tool_result_chars
 
         # Initialize hooks with backward compatibility
         self.pre_hooks = pre_hooks
@@ -612,6 +657,9 @@ class Team:
 
         self._hooks_normalised = False
 
+        # Reasoning agents built from this team's configuration, reused across runs
+        self._reasoning_cache = ReasoningAgentCache()
+
     @property
     def should_parse_structured_output(self) -> bool:
         return self.output_schema is not None and self.parse_response and self.parser_model is None
@@ -724,6 +772,8 @@ class Team:
             log_warning("Database not provided. Memories will not be stored.")
 
         if self.memory_manager is None:
+            from agno.memory import MemoryManager
+
             self.memory_manager = MemoryManager(model=self.model, db=self.db)
         else:
             if self.memory_manager.model is None:
@@ -1499,6 +1549,7 @@ class Team:
         **kwargs: Any,
     ) -> Iterator[Union[RunOutputEvent, TeamRunOutputEvent]]: ...
 
+    @traced("team.run", attributes=_run_span_attributes)
     def run(
         self,
         input: Union[str, List, Dict, Message, BaseModel, List[Message]],
@@ -1559,6 +1610,8 @@ class Team:
             files=file_artifacts,
         )
 
+        get_current_span().set_attributes({"run.id": run_id, "session.id": session_id})
+
         # Read existing session from database
         team_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
         self._update_metadata(session=team_session)
@@ -2209,6 +2262,7 @@ class Team:
         **kwargs: Any,
     ) -> AsyncIterator[Union[RunOutputEvent, TeamRunOutputEvent]]: ...
 
+    @traced("team.run", attributes=_run_span_attributes)
     def arun(  # type: ignore
         self,
         input: Union[str, List, Dict, Message, BaseModel],
@@ -2269,6 +2323,8 @@ class Team:
             files=file_artifacts,
         )
 
+        get_current_span().set_attributes({"run.id": run_id, "session.id": session_id})
+
         team_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
         self._update_metadata(session=team_session)
 
@@ -2541,6 +2597,7 @@ class Team:
             stream_model_response = False
 
         full_model_response = ModelResponse()
+        stream_buffers = ResponseStreamBuffers()
         for model_response_event in self.model.response_stream(
             messages=run_messages.messages,
             response_format=response_format,
@@ -2556,12 +2613,15 @@ class Team:
                 run_response=run_response,
                 full_model_response=full_model_response,
                 model_response_event=model_response_event,
+                stream_buffers=stream_buffers,
                 reasoning_state=reasoning_state,
                 stream_intermediate_steps=stream_intermediate_steps,
                 parse_structured_output=self.should_parse_structured_output,
                 workflow_context=workflow_context,
             )
 
+        self._flush_stream_buffers(stream_buffers, full_model_response, run_response)
+
         # 3. Update TeamRunOutput
         if full_model_response.content is not None:
             run_response.content = full_model_response.content
@@ -2623,6 +2683,7 @@ class Team:
             stream_model_response = False
 
         full_model_response = ModelResponse()
+        stream_buffers = ResponseStreamBuffers()
         model_stream = self.model.aresponse_stream(
             messages=run_messages.messages,
             response_format=response_format,
@@ -2639,6 +2700,7 @@ class Team:
                 run_response=run_response,
                 full_model_response=full_model_response,
                 model_response_event=model_response_event,
+                stream_buffers=stream_buffers,
                 reasoning_state=reasoning_state,
                 stream_intermediate_steps=stream_intermediate_steps,
                 parse_structured_output=self.should_parse_structured_output,
@@ -2646,6 +2708,8 @@ class Team:
             ):
                 yield event
 
+        self._flush_stream_buffers(stream_buffers, full_model_response, run_response)
+
         # Handle structured outputs
         if (self.output_schema is not None) and not self.use_json_mode and (full_model_response.parsed is not None):
             # Update the run_response content with the structured output
@@ -2686,17 +2750,31 @@ class Team:
                     run_response,
                 )
 
+    def _flush_stream_buffers(
+        self, stream_buffers: ResponseStreamBuffers, full_model_response: ModelResponse, run_response: TeamRunOutput
+    ) -> None:
+        """Write the content streamed into the buffers to the full model response"""
+        stream_buffers.flush(full_model_response)
+        if stream_buffers.reasoning_content:
+            run_response.reasoning_content = full_model_response.reasoning_content
+
     def _handle_model_response_chunk(
         self,
         session: TeamSession,
         run_response: TeamRunOutput,
         full_model_response: ModelResponse,
         model_response_event: Union[ModelResponse, TeamRunOutputEvent, RunOutputEvent],
+        stream_buffers: ResponseStreamBuffers,
         reasoning_state: Optional[Dict[str, Any]] = None,
         stream_intermediate_steps: bool = False,
         parse_structured_output: bool = False,
         workflow_context: Optional[Dict] = None,
     ) -> Iterator[Union[TeamRunOutputEvent, RunOutputEvent]]:
+        """Handle a chunk of a streamed model response.
+
+        Streamed content, reasoning and audio are accumulated in `stream_buffers`, which the caller flushes to the
+        full model response once the stream ends, see `_flush_stream_buffers`.
+        """
         if isinstance(model_response_event, tuple(get_args(RunOutputEvent))) or isinstance(
             model_response_event, tuple(get_args(TeamRunOutputEvent))
         ):
@@ -2735,23 +2813,16 @@ class Team:
                         content_type = self._member_response_model.__name__  # type: ignore
                         run_response.content_type = content_type
                     elif isinstance(model_response_event.content, str):
-                        full_model_response.content = (full_model_response.content or "") + model_response_event.content
+                        stream_buffers.content.append(model_response_event.content)
                     should_yield = True
 
                 # Process reasoning content
                 if model_response_event.reasoning_content is not None:
-                    full_model_response.reasoning_content = (
-                        full_model_response.reasoning_content or ""
-                    ) + model_response_event.reasoning_content
-                    run_response.reasoning_content = full_model_response.reasoning_content
+                    stream_buffers.reasoning_content.append(model_response_event.reasoning_content)
                     should_yield = True
 
                 if model_response_event.redacted_reasoning_content is not None:
-                    if not full_model_response.reasoning_content:
-                        full_model_response.reasoning_content = model_response_event.redacted_reasoning_content
-                    else:
-                        full_model_response.reasoning_content += model_response_event.redacted_reasoning_content
-                    run_response.reasoning_content = full_model_response.reasoning_content
+                    stream_buffers.reasoning_content.append(model_response_event.redacted_reasoning_content)
                     should_yield = True
 
                 # Handle provider data (one chunk)
@@ -2777,25 +2848,16 @@ class Team:
                             try:
                                 import base64
 
-                                decoded_content = base64.b64decode(model_response_event.audio.content)
-                                if full_model_response.audio.content is None:
-                                    full_model_response.audio.content = b""
-                                full_model_response.audio.content += decoded_content
+                                stream_buffers.audio_content += base64.b64decode(model_response_event.audio.content)
                             except Exception:
                                 # If decode fails, encode string as bytes
-                                if full_model_response.audio.content is None:
-                                    full_model_response.audio.content = b""
-                                full_model_response.audio.content += model_response_event.audio.content.encode("utf-8")
+                                stream_buffers.audio_content += model_response_event.audio.content.encode("utf-8")
                         elif isinstance(model_response_event.audio.content, bytes):
                             # Content is already bytes
-                            if full_model_response.audio.content is None:
-                                full_model_response.audio.content = b""
-                            full_model_response.audio.content += model_response_event.audio.content
+                            stream_buffers.audio_content += model_response_event.audio.content
 
                     if model_response_event.audio.transcript is not None:
-                        if full_model_response.audio.transcript is None:
-                            full_model_response.audio.transcript = ""
-                        full_model_response.audio.transcript += model_response_event.audio.transcript  # type: ignore
+                        stream_buffers.audio_transcript.append(model_response_event.audio.transcript)
                     if model_response_event.audio.expires_at is not None:
                         full_model_response.audio.expires_at = model_response_event.audio.expires_at  # type: ignore
                     if model_response_event.audio.mime_type is not None:
@@ -2823,7 +2885,8 @@ class Team:
                                 content=model_response_event.content,
                                 reasoning_content=model_response_event.reasoning_content,
                                 redacted_reasoning_content=model_response_event.redacted_reasoning_content,
-                                response_audio=full_model_response.audio,
+                                # Only the audio of this chunk, the full audio is set on the run output at the end
+                                response_audio=model_response_event.audio,
                                 citations=model_response_event.citations,
                                 model_provider_data=model_response_event.provider_data,
                                 image=model_response_event.images[-1] if model_response_event.images else None,
@@ -2984,6 +3047,7 @@ class Team:
             else:
                 log_warning("Something went wrong. Member run response content is not a string")
 
+    @traced("team.update_memories", attributes=_span_attributes)
     def _make_memories_and_summaries(
         self,
         run_response: TeamRunOutput,
@@ -2992,7 +3056,9 @@ class Team:
         user_id: Optional[str] = None,
     ) -> Iterator[TeamRunOutputEvent]:
         from concurrent.futures import ThreadPoolExecutor, as_completed
+        from contextvars import copy_context
 
+        # The updates run in a copy of the current context, so their tracing spans are nested under the run
         # Create a thread pool with a reasonable number of workers
         with ThreadPoolExecutor(max_workers=3) as executor:
             futures = []
@@ -3003,6 +3069,7 @@ class Team:
             if user_message_str is not None and self.memory_manager is not None and not self.enable_agentic_memory:
                 futures.append(
                     executor.submit(
+                        copy_context().run,
                         self.memory_manager.create_user_memories,
                         message=user_message_str,
                         user_id=user_id,
@@ -3015,6 +3082,7 @@ class Team:
                 log_debug("Creating session summary.")
                 futures.append(
                     executor.submit(
+                        copy_context().run,
                         self.session_summary_manager.create_session_summary,  # type: ignore
                         session=session,
                     )
@@ -3039,6 +3107,7 @@ class Team:
                         run_response,
                     )
 
+    @traced("team.update_memories", attributes=_span_attributes)
     async def _amake_memories_and_summaries(
         self,
         run_response: TeamRunOutput,
@@ -3179,6 +3248,7 @@ class Team:
                     )
 
                 parser_model_response = ModelResponse(content="")
+                stream_buffers = ResponseStreamBuffers()
                 parser_response_format = self._get_response_format(self.parser_model)
                 messages_for_parser_model = self._get_messages_for_parser_model_stream(
                     run_response, parser_response_format
@@ -3193,10 +3263,13 @@ class Team:
                         run_response=run_response,
                         full_model_response=parser_model_response,
                         model_response_event=model_response_event,
+                        stream_buffers=stream_buffers,
                         parse_structured_output=True,
                         stream_intermediate_steps=stream_intermediate_steps,
                     )
 
+                self._flush_stream_buffers(stream_buffers, parser_model_response, run_response)
+
                 run_response.content = parser_model_response.content
 
                 parser_model_response_message: Optional[Message] = None
@@ -3230,6 +3303,7 @@ class Team:
                     )
 
                 parser_model_response = ModelResponse(content="")
+                stream_buffers = ResponseStreamBuffers()
                 parser_response_format = self._get_response_format(self.parser_model)
                 messages_for_parser_model = self._get_messages_for_parser_model_stream(
                     run_response, parser_response_format
@@ -3245,11 +3319,14 @@ class Team:
                         run_response=run_response,
                         full_model_response=parser_model_response,
                         model_response_event=model_response_event,
+                        stream_buffers=stream_buffers,
                         parse_structured_output=True,
                         stream_intermediate_steps=stream_intermediate_steps,
                     ):
                         yield event
 
+                self._flush_stream_buffers(stream_buffers, parser_model_response, run_response)
+
                 run_response.content = parser_model_response.content
 
                 parser_model_response_message: Optional[Message] = None
@@ -3301,6 +3378,7 @@ class Team:
 
         messages_for_output_model = self._get_messages_for_output_model(run_messages.messages)
         model_response = ModelResponse(content="")
+        stream_buffers = ResponseStreamBuffers()
 
         for model_response_event in self.output_model.response_stream(messages=messages_for_output_model):
             yield from self._handle_model_response_chunk(
@@ -3308,9 +3386,12 @@ class Team:
                 run_response=run_response,
                 full_model_response=model_response,
                 model_response_event=model_response_event,
+                stream_buffers=stream_buffers,
                 workflow_context=workflow_context,
             )
 
+        self._flush_stream_buffers(stream_buffers, model_response, run_response)
+
         # Update the TeamRunResponse content
         run_response.content = model_response.content
 
@@ -3357,6 +3438,7 @@ class Team:
 
         messages_for_output_model = self._get_messages_for_output_model(run_messages.messages)
         model_response = ModelResponse(content="")
+        stream_buffers = ResponseStreamBuffers()
 
         async for model_response_event in self.output_model.aresponse_stream(messages=messages_for_output_model):
             for event in self._handle_model_response_chunk(
@@ -3364,10 +3446,13 @@ class Team:
                 run_response=run_response,
                 full_model_response=model_response,
                 model_response_event=model_response_event,
+                stream_buffers=stream_buffers,
                 workflow_context=workflow_context,
             ):
                 yield event
 
+        self._flush_stream_buffers(stream_buffers, model_response, run_response)
+
         # Update the TeamRunResponse content
         run_response.content = model_response.content
 
@@ -3449,6 +3534,9 @@ class Team:
         if stream_intermediate_steps is None:
             stream_intermediate_steps = self.stream_intermediate_steps or False
 
+        # Printing needs rich, which is only imported when printing
+        from agno.utils.print_response.team import print_response, print_response_stream
+
         if stream:
             print_response_stream(
                 team=self,
@@ -3546,6 +3634,8 @@ class Team:
         if stream_intermediate_steps is None:
             stream_intermediate_steps = self.stream_intermediate_steps or False
 
+        from agno.utils.print_response.team import aprint_response, aprint_response_stream
+
         if stream:
             await aprint_response_stream(
                 team=self,
@@ -3886,9 +3976,7 @@ class Team:
         reasoning_model: Optional[Model] = self.reasoning_model
         reasoning_model_provided = reasoning_model is not None
         if reasoning_model is None and self.model is not None:
-            from copy import deepcopy
-
-            reasoning_model = deepcopy(self.model)
+            reasoning_model = self._reasoning_cache.get_model_copy(self.model)
         if reasoning_model is None:
             log_warning("Reasoning error. Reasoning model is None, continuing regular session...")
             return
@@ -3902,8 +3990,11 @@ class Team:
             from agno.reasoning.ollama import is_ollama_reasoning_model
             from agno.reasoning.openai import is_openai_reasoning_model
 
-            reasoning_agent = self.reasoning_agent or get_reasoning_agent(
-                reasoning_model=reasoning_model,
+            reasoning_agent = self.reasoning_agent or self._reasoning_cache.get_agent(
+                "reasoning_model",
+                key=(),
+                objects=(reasoning_model,),
+                build=partial(get_reasoning_agent, reasoning_model=reasoning_model),
                 session_state=self.session_state,
                 dependencies=self.dependencies,
                 metadata=self.metadata,
@@ -3990,15 +4081,29 @@ class Team:
 
             reasoning_agent: Optional[Agent] = self.reasoning_agent  # type: ignore
             if reasoning_agent is None:
-                reasoning_agent = get_default_reasoning_agent(
-                    reasoning_model=reasoning_model,
-                    min_steps=self.reasoning_min_steps,
-                    max_steps=self.reasoning_max_steps,
-                    tool_call_limit=self.tool_call_limit,
-                    telemetry=self.telemetry,
-                    debug_mode=self.debug_mode,
-                    debug_level=self.debug_level,
-                    use_json_mode=use_json_mode,
+                reasoning_agent = self._reasoning_cache.get_agent(
+                    "default",
+                    key=(
+                        self.reasoning_min_steps,
+                        self.reasoning_max_steps,
+                        self.tool_call_limit,
+                        self.telemetry,
+                        self.debug_mode,
+                        self.debug_level,
+                        use_json_mode,
+                    ),
+                    objects=(reasoning_model,),
+                    build=partial(
+                        get_default_reasoning_agent,
+                        reasoning_model=reasoning_model,
+                        min_steps=self.reasoning_min_steps,
+                        max_steps=self.reasoning_max_steps,
+                        tool_call_limit=self.tool_call_limit,
+                        telemetry=self.telemetry,
+                        debug_mode=self.debug_mode,
+                        debug_level=self.debug_level,
+                        use_json_mode=use_json_mode,
+                    ),
                     session_state=self.session_state,
                     dependencies=self.dependencies,
                     metadata=self.metadata,
@@ -4114,9 +4219,7 @@ class Team:
         reasoning_model: Optional[Model] = self.reasoning_model
         reasoning_model_provided = reasoning_model is not None
         if reasoning_model is None and self.model is not None:
-            from copy import deepcopy
-
-            reasoning_model = deepcopy(self.model)
+            reasoning_model = self._reasoning_cache.get_model_copy(self.model)
         if reasoning_model is None:
             log_warning("Reasoning error. Reasoning model is None, continuing regular session...")
             return
@@ -4130,8 +4233,11 @@ class Team:
             from agno.reasoning.ollama import is_ollama_reasoning_model
             from agno.reasoning.openai import is_openai_reasoning_model
 
-            reasoning_agent = self.reasoning_agent or get_reasoning_agent(
-                reasoning_model=reasoning_model,
+            reasoning_agent = self.reasoning_agent or self._reasoning_cache.get_agent(
+                "reasoning_model",
+                key=(),
+                objects=(reasoning_model,),
+                build=partial(get_reasoning_agent, reasoning_model=reasoning_model),
                 session_state=self.session_state,
                 dependencies=self.dependencies,
                 metadata=self.metadata,
@@ -4216,14 +4322,27 @@ class Team:
             use_json_mode: bool = self.use_json_mode
             reasoning_agent: Optional[Agent] = self.reasoning_agent  # type: ignore
             if reasoning_agent is None:
-                reasoning_agent = get_default_reasoning_agent(  # type: ignore
-                    reasoning_model=reasoning_model,
-                    min_steps=self.reasoning_min_steps,
-                    max_steps=self.reasoning_max_steps,
-                    telemetry=self.telemetry,
-                    debug_mode=self.debug_mode,
-                    debug_level=self.debug_level,
-                    use_json_mode=use_json_mode,
+                reasoning_agent = self._reasoning_cache.get_agent(
+                    "default",
+                    key=(
+                        self.reasoning_min_steps,
+                        self.reasoning_max_steps,
+                        self.telemetry,
+                        self.debug_mode,
+                        self.debug_level,
+                        use_json_mode,
+                    ),
+                    objects=(reasoning_model,),
+                    build=partial(
+                        get_default_reasoning_agent,
+                        reasoning_model=reasoning_model,
+                        min_steps=self.reasoning_min_steps,
+                        max_steps=self.reasoning_max_steps,
+                        telemetry=self.telemetry,
+                        debug_mode=self.debug_mode,
+                        debug_level=self.debug_level,
+                        use_json_mode=use_json_mode,
+                    ),
                     session_state=self.session_state,
                     dependencies=self.dependencies,
                     metadata=self.metadata,
@@ -4703,6 +4822,8 @@ class Team:
                 except Exception as e:
                     log_warning(f"Could not add tool {tool}: {e}")
 
+        add_result_page_tool(self._functions_for_model, self._tools_for_model, self.max_tool_result_chars)
+
         if self._functions_for_model:
             from inspect import signature
 
@@ -4758,6 +4879,7 @@ class Team:
 
         return system_message_content
 
+    @traced("team.build_system_message", attributes=_span_attributes)
     def get_system_message(
         self,
         session: TeamSession,
@@ -5417,11 +5539,9 @@ class Team:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """Format a message with the session state variables."""
-        import re
-        import string
-
         if not isinstance(message, str):
             return message
+
         # Should already be resolved and passed from run() method
         format_variables = ChainMap(
             session_state or {},
@@ -5429,18 +5549,8 @@ class Team:
             metadata or {},
             {"user_id": user_id} if user_id is not None else {},
         )
-        converted_msg = message
-        for var_name in format_variables.keys():
-            # Only convert standalone {var_name} patterns, not nested ones
-            pattern = r"\{" + re.escape(var_name) + r"\}"
-            replacement = "${" + var_name + "}"
-            converted_msg = re.sub(pattern, replacement, converted_msg)
-
-        # Use Template to safely substitute variables
-        template = string.Template(converted_msg)
         try:
-            result = template.safe_substitute(format_variables)
-            return result
+            return substitute_variables(message, format_variables)
         except Exception as e:
             log_warning(f"Template substitution failed: {e}")
             return message
@@ -5581,7 +5691,7 @@ class Team:
             Returns:
                 str: A string indicating the status of the update.
             """
-            self.memory_manager = cast(MemoryManager, self.memory_manager)
+            self.memory_manager = cast("MemoryManager", self.memory_manager)
             response = self.memory_manager.update_memory_task(task=task, user_id=user_id)
             return response
 
@@ -5597,7 +5707,7 @@ class Team:
             Returns:
                 str: A string indicating the status of the update.
             """
-            self.memory_manager = cast(MemoryManager, self.memory_manager)
+            self.memory_manager = cast("MemoryManager", self.memory_manager)
             response = await self.memory_manager.aupdate_memory_task(task=task, user_id=user_id)
             return response
 
@@ -6567,6 +6677,7 @@ class Team:
                 log_warning(f"No run responses found in AgentSession {session_id}")
         return None
 
+    @traced("team.read_session", attributes=_session_span_attributes)
     def _read_or_create_session(self, session_id: str, user_id: Optional[str] = None) -> TeamSession:
         """Load the TeamSession from storage
 
@@ -6640,6 +6751,7 @@ class Team:
         log_debug(f"TeamSession {session_id_to_load} not found in db")
         return None
 
+    @traced("team.save_session", attributes=_span_attributes)
     def save_session(self, session: TeamSession) -> None:
         """Save the TeamSession to storage"""
         if self.db is not None and self.parent_team_id is None and self.workflow_id is None:
@@ -7083,6 +7195,7 @@ class Team:
         )
         return "Successfully added to knowledge base"
 
+    @traced("team.knowledge_retrieval", attributes=_span_attributes)
     def get_relevant_docs_from_knowledge(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None, **kwargs
     ) -> Optional[List[Union[Dict[str, Any], str]]]:
@@ -7143,6 +7256,7 @@ class Team:
             log_warning(f"Error searching knowledge base: {e}")
             raise e
 
+    @traced("team.knowledge_retrieval", attributes=_span_attributes)
     async def aget_relevant_docs_from_knowledge(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None, **kwargs
     ) -> Optional[List[Union[Dict[str, Any], str]]]:
@@ -1,7 +1,11 @@
 import csv
+import io
 import json
+import os
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_info, logger
@@ -14,6 +18,7 @@ class CsvTools(Toolkit):
         row_limit: Optional[int] = None,
         duckdb_connection: Optional[Any] = None,
         duckdb_kwargs: Optional[Dict[str, Any]] = None,
+        cache_tables: bool = False,
         enable_read_csv_file: bool = True,
         enable_list_csv_files: bool = True,
         enable_get_columns: bool = True,
@@ -33,6 +38,12 @@ class CsvTools(Toolkit):
         self.row_limit = row_limit
         self.duckdb_connection: Optional[Any] = duckdb_connection
         self.duckdb_kwargs: Optional[Dict[str, Any]] = duckdb_kwargs
+        # Load each csv into a DuckDB table on first query, instead of a view reading the file on every query.
+        # Tables make repeated queries faster, at the cost of holding the data in DuckDB.
+        self.cache_tables: bool = cache_tables
+        # Name of each registered csv -> (modification time, size) of the file when it was registered
+        self._registered: Dict[str, Tuple[float, int]] = {}
+        self._lock = Lock()
 
         tools: List[Any] = []
         if all or enable_read_csv_file:
@@ -76,15 +87,11 @@ class CsvTools(Toolkit):
             log_info(f"Reading file: {csv_name}")
             file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
 
-            # Read the csv file
-            csv_data = []
+            # Read the csv file, stopping after the row limit
             _row_limit = row_limit or self.row_limit
             with open(str(file_path), newline="") as csvfile:
                 reader = csv.DictReader(csvfile)
-                if _row_limit is not None:
-                    csv_data = [row for row in reader][:_row_limit]
-                else:
-                    csv_data = [row for row in reader]
+                csv_data = list(islice(reader, _row_limit))
             return json.dumps(csv_data)
         except Exception as e:
             logger.error(f"Error reading csv: {e}")
@@ -116,6 +123,41 @@ class CsvTools(Toolkit):
             logger.error(f"Error getting columns: {e}")
             return f"Error getting columns: {e}"
 
+    def _get_connection(self) -> Any:
+        """Get a cursor on the shared connection, so queries from different threads don't share a connection."""
+        import duckdb
+
+        with self._lock:
+            if self.duckdb_connection is None:
+                self.duckdb_connection = duckdb.connect(**(self.duckdb_kwargs or {}))
+            return self.duckdb_connection.cursor()
+
+    def _register_csv(self, con: Any, csv_name: str, file_path: Path) -> None:
+        """Create the view or table of the csv file, or refresh it if the file changed since it was created."""
+        stat = os.stat(file_path)
+        version = (stat.st_mtime, stat.st_size)
+        with self._lock:
+            if self._registered.get(csv_name) == version:
+                return
+            log_info(f"Loading csv file: {csv_name}")
+            relation = "TABLE" if self.cache_tables else "VIEW"
+            table_name = '"' + csv_name.replace('"', '""') + '"'
+            path = str(file_path).replace("'", "''")
+            con.execute(
+                f"CREATE OR REPLACE {relation} {table_name} AS "
+                f"SELECT * FROM read_csv('{path}', ignore_errors=false, auto_detect=true)"
+            )
+            self._registered[csv_name] = version
+
+    @staticmethod
+    def _format_rows(columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> str:
+        """Format the rows as csv with a header, quoting only the values that need it"""
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(rows)
+        return output.getvalue().rstrip("\n")
+
     def query_csv_file(self, csv_name: str, sql_query: str) -> str:
         """Use this function to run a SQL query on csv file `csv_name` without the extension.
         The Table name is the name of the csv file without the extension.
@@ -131,28 +173,16 @@ class CsvTools(Toolkit):
         Returns:
             str: The query results if successful, otherwise returns an error message.
         """
+        con = None
         try:
-            import duckdb
-
             if csv_name not in [_csv.stem for _csv in self.csvs]:
                 return f"File: {csv_name} not found, please use one of {self.list_csv_files()}"
 
-            # Load the csv file into duckdb
-            log_info(f"Loading csv file: {csv_name}")
             file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
 
-            # Create duckdb connection
-            con = self.duckdb_connection
-            if not self.duckdb_connection:
-                con = duckdb.connect(**(self.duckdb_kwargs or {}))
-            if con is None:
-                logger.error("Error connecting to DuckDB")
-                return "Error connecting to DuckDB, please check the connection."
-
-            # Create a table from the csv file
-            con.execute(
-                f"CREATE TABLE {csv_name} AS SELECT * FROM read_csv('{file_path}', ignore_errors=false, auto_detect=true)"
-            )
+            # The connection is kept across queries, and each csv is registered once
+            con = self._get_connection()
+            self._register_csv(con, csv_name, file_path)
 
             # -*- Format the SQL Query
             # Remove backticks
@@ -165,16 +195,17 @@ class CsvTools(Toolkit):
             result_output = "No output"
             if query_result is not None:
                 try:
-                    results_as_python_objects = query_result.fetchall()
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
-                        else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
+                    # Only fetch the rows that are returned
+                    if self.row_limit is not None:
+                        rows = query_result.fetchmany(self.row_limit + 1)
+                        truncated = len(rows) > self.row_limit
+                        rows = rows[: self.row_limit]
+                    else:
+                        rows = query_result.fetchall()
+                        truncated = False
+                    result_output = self._format_rows(query_result.columns, rows)
+                    if truncated:
+                        result_output += f"\n[Showing the first {self.row_limit} rows]"
                 except AttributeError:
                     result_output = str(query_result)
 
@@ -183,3 +214,6 @@ class CsvTools(Toolkit):
         except Exception as e:
             logger.error(f"Error querying csv: {e}")
             return f"Error querying csv: {e}"
+        finally:
+            if con is not None:
+                con.close()
@@ -76,6 +76,8 @@ def tool(
     cache_results: bool = False,
     cache_dir: Optional[str] = None,
     cache_ttl: int = 3600,
+    max_result_chars: Optional[int] = None,
+    result_preview_chars: Optional[int] = None,
 ) -> Callable[[F], Function]: ...
 
 
@@ -104,6 +106,9 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         cache_results: bool - If True, enable caching of function results
         cache_dir: Optional[str] - Directory to store cache files
         cache_ttl: int - Time-to-live for cached results in seconds
+        max_result_chars: Optional[int] - Results longer than this are replaced with a preview and a handle to page
+            through them
+        result_preview_chars: Optional[int] - Length of the preview of a replaced result
 
     Returns:
         Union[Function, Callable[[F], Function]]: Decorated function or decorator
@@ -141,6 +146,8 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "cache_results",
             "cache_dir",
             "cache_ttl",
+            "max_result_chars",
+            "result_preview_chars",
         }
     )
 
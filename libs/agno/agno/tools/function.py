@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field, validate_call
 
 from agno.exceptions import AgentRunException
 from agno.media import Audio, File, Image, Video
+from agno.tracing import traced
 from agno.utils.log import log_debug, log_error, log_exception, log_warning
 
 T = TypeVar("T")
@@ -117,6 +118,12 @@ class Function(BaseModel):
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
 
+    # Results longer than this many characters are stored aside, and the model gets a preview and a handle to page
+    # through the rest with the `get_tool_result_page` tool. None sends results in full.
+    max_result_chars: Optional[int] = None
+    # Length of the preview of a stored result
+    result_preview_chars: Optional[int] = None
+
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
     _agent: Optional[Any] = None
@@ -133,6 +140,10 @@ class Function(BaseModel):
     _audios: Optional[Sequence[Audio]] = None
     _files: Optional[Sequence[File]] = None
 
+    # The entrypoint processed by `process_entrypoint`, and whether it was processed in strict mode
+    _processed_entrypoint: Optional[Callable] = None
+    _processed_strict: Optional[bool] = None
+
     def to_dict(self) -> Dict[str, Any]:
         return self.model_dump(
             exclude_none=True,
@@ -266,6 +277,10 @@ class Function(BaseModel):
         if self.entrypoint is None:
             return
 
+        # The entrypoint was already processed, e.g. for a previous run
+        if self._processed_entrypoint is self.entrypoint and self._processed_strict == strict:
+            return
+
         parameters = {"type": "object", "properties": {}, "required": []}
 
         params_set_by_user = False
@@ -397,6 +412,9 @@ class Function(BaseModel):
         except Exception as e:
             log_warning(f"Failed to add validate decorator to entrypoint: {e}")
 
+        self._processed_entrypoint = self.entrypoint
+        self._processed_strict = strict
+
     @staticmethod
     def _wrap_callable(func: Callable) -> Callable:
         """Wrap a callable with Pydantic's validate_call decorator, if relevant"""
@@ -562,6 +580,10 @@ class FunctionExecutionResult(BaseModel):
     files: Optional[List[File]] = None
 
 
+def _function_call_span_attributes(function_call: "FunctionCall") -> Dict[str, Any]:
+    return {"tool.name": function_call.function.name, "tool.call_id": function_call.call_id}
+
+
 class FunctionCall(BaseModel):
     """Model for Function Calls"""
 
@@ -603,6 +625,21 @@ class FunctionCall(BaseModel):
 
         return call_str
 
+    def spill_result(self, output: str) -> str:
+        """Replace an output longer than `max_result_chars` of the function, or else the `max_tool_result_chars` of
+        its agent or team, with a preview and a handle to page through it."""
+        from agno.tools.spillover import get_max_result_chars, spill_result
+
+        max_result_chars = get_max_result_chars(self.function)
+        if max_result_chars is None:
+            return output
+        return spill_result(
+            output,
+            tool_name=self.function.name,
+            max_result_chars=max_result_chars,
+            preview_chars=self.function.result_preview_chars,
+        )
+
     def _handle_pre_hook(self):
         """Handles the pre-hook for the function call."""
         if self.function.pre_hook is not None:
@@ -773,6 +810,7 @@ class FunctionCall(BaseModel):
         chain = reduce(create_hook_wrapper, hooks, execute_entrypoint)
         return chain
 
+    @traced("tool.execute", attributes=_function_call_span_attributes)
     def execute(self) -> FunctionExecutionResult:
         """Runs the function call."""
         from inspect import isgenerator, isgeneratorfunction
@@ -961,6 +999,7 @@ class FunctionCall(BaseModel):
             chain = reduce(create_hook_wrapper, hooks, execute_entrypoint)
         return chain
 
+    @traced("tool.execute", attributes=_function_call_span_attributes)
     async def aexecute(self) -> FunctionExecutionResult:
         """Runs the function call asynchronously."""
         from inspect import isasyncgen, isasyncgenfunction, iscoroutinefunction, isgenerator, isgeneratorfunction
@@ -0,0 +1,168 @@
+"""Spillover of large tool results.
+
+A tool result longer than the `max_result_chars` of its function is not sent to the model in full. It is kept in a
+result store, and the model gets a preview with a handle to read the rest, page by page, with the
+`get_tool_result_page` tool. This keeps large results (e.g. wide query results or long files) from being sent with
+every following model call and stored in the session.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from agno.tools.function import Function
+from agno.utils.log import log_debug
+
+RESULT_PAGE_TOOL_NAME = "get_tool_result_page"
+
+# Length of the preview of a spilled result, when the function doesn't set one
+DEFAULT_PREVIEW_CHARS = 2000
+
+
+@dataclass
+class StoredResult:
+    content: str
+    tool_name: str
+    # Number of characters returned per page
+    page_chars: int
+
+    @property
+    def pages(self) -> int:
+        return max(1, -(-len(self.content) // self.page_chars))
+
+
+class ToolResultStore:
+    """In-memory store of spilled tool results, evicting the least recently used results over `max_chars`."""
+
+    def __init__(self, max_chars: int = 50_000_000):
+        self.max_chars = max_chars
+        self._results: "OrderedDict[str, StoredResult]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def put(self, content: str, tool_name: str, page_chars: int) -> str:
+        handle = f"result_{uuid4().hex[:16]}"
+        with self._lock:
+            self._results[handle] = StoredResult(content=content, tool_name=tool_name, page_chars=page_chars)
+            self._size += len(content)
+            # Keep at least the new result
+            while self._size > self.max_chars and len(self._results) > 1:
+                _, evicted = self._results.popitem(last=False)
+                self._size -= len(evicted.content)
+        return handle
+
+    def get(self, handle: str) -> Optional[StoredResult]:
+        with self._lock:
+            result = self._results.get(handle)
+            if result is not None:
+                self._results.move_to_end(handle)
+            return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self._size = 0
+
+
+# Results are looked up by handle from any agent or team of the process
+_store = ToolResultStore()
+
+
+def get_tool_result_store() -> ToolResultStore:
+    return _store
+
+
+def _cut(content: str, limit: int) -> str:
+    """Cut the content at the last line break before `limit`, so rows and lines are not split, if there is one"""
+    if len(content) <= limit:
+        return content
+    line_break = content.rfind("\n", 0, limit)
+    return content[:line_break] if line_break > limit // 2 else content[:limit]
+
+
+def spill_result(content: str, tool_name: str, max_result_chars: int, preview_chars: Optional[int] = None) -> str:
+    """Return the content if it fits in `max_result_chars`, and otherwise store it and return a preview with a handle"""
+    if len(content) <= max_result_chars:
+        return content
+
+    preview_chars = min(preview_chars or DEFAULT_PREVIEW_CHARS, max_result_chars)
+    handle = get_tool_result_store().put(content, tool_name=tool_name, page_chars=max_result_chars)
+    pages = -(-len(content) // max_result_chars)
+    preview = _cut(content, preview_chars)
+    log_debug(f"Spilled {len(content)} characters of the {tool_name} result to {handle}")
+    return (
+        f"{preview}\n\n"
+        f"[Result truncated: showing {len(preview)} of {len(content)} characters. "
+        f"The full result has {pages} pages of up to {max_result_chars} characters. "
+        f'Call {RESULT_PAGE_TOOL_NAME}(handle="{handle}", page=1) to read it.]'
+    )
+
+
+def get_tool_result_page(handle: str, page: int = 1) -> str:
+    """Use this function to read a tool result that was truncated because it was too long.
+
+    Args:
+        handle: The handle given in the truncated result.
+        page: The page to read, starting at 1.
+
+    Returns:
+        str: The requested page of the result.
+    """
+    stored = get_tool_result_store().get(handle)
+    if stored is None:
+        return f"No result found for handle {handle}. It may have expired, call the original tool again."
+    if page < 1 or page > stored.pages:
+        return f"Page {page} does not exist. The result has {stored.pages} pages."
+
+    start = (page - 1) * stored.page_chars
+    content = stored.content[start : start + stored.page_chars]
+    footer = f"[Page {page} of {stored.pages} of the {stored.tool_name} result"
+    if page < stored.pages:
+        footer += f'. Call {RESULT_PAGE_TOOL_NAME}(handle="{handle}", page={page + 1}) for the next page.]'
+    else:
+        footer += ".]"
+    return f"{content}\n\n{footer}"
+
+
+def get_max_result_chars(function: Function) -> Optional[int]:
+    """Get the limit of the results of a function when it is called: its own `max_result_chars`, or else the
+    `max_tool_result_chars` of the agent or team it runs for."""
+    if function.max_result_chars is not None:
+        return function.max_result_chars
+    # Pages are already cut to the limit of the spilled result
+    if function.name == RESULT_PAGE_TOOL_NAME:
+        return None
+    owner = function._agent if function._agent is not None else function._team
+    return getattr(owner, "max_tool_result_chars", None)
+
+
+def add_result_page_tool(
+    functions: Dict[str, Function], tools: List[Dict[str, Any]], max_result_chars: Optional[int] = None
+) -> None:
+    """Add the paging tool if any function can spill its results.
+
+    With a default limit, the functions without their own limit are replaced by copies. Toolkits and functions can be
+    shared by several agents and teams, and the `_agent` or `_team` of a copy, which the default is read from when the
+    function is called, stays the one the functions were built for.
+
+    Args:
+        functions: Functions for the model, by name
+        tools: Tool definitions sent to the model
+        max_result_chars: Default limit of the agent or team
+    """
+    if max_result_chars is not None:
+        for name, function in functions.items():
+            if function.max_result_chars is None and name != RESULT_PAGE_TOOL_NAME:
+                functions[name] = function.model_copy()
+
+    if RESULT_PAGE_TOOL_NAME in functions:
+        return
+    if max_result_chars is None and not any(function.max_result_chars is not None for function in functions.values()):
+        return
+
+    page_function = Function.from_callable(get_tool_result_page, name=RESULT_PAGE_TOOL_NAME)
+    functions[page_function.name] = page_function
+    tools.append({"type": "function", "function": page_function.to_dict()})
+    log_debug(f"Added tool {page_function.name}")
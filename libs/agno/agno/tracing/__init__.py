@@ -0,0 +1,40 @@
+from agno.tracing.exporters import ConsoleSpanExporter, InMemorySpanExporter, format_span_tree
+from agno.tracing.span import NOOP_SPAN, NoOpSpan, Span, SpanEvent
+from agno.tracing.tracer import (
+    SpanExporter,
+    add_span_exporter,
+    end_span,
+    get_current_span,
+    get_span_exporters,
+    is_tracing_enabled,
+    remove_span_exporter,
+    set_span_exporters,
+    start_span,
+    trace_async_iterator,
+    trace_iterator,
+    trace_span,
+    traced,
+)
+
+__all__ = [
+    "ConsoleSpanExporter",
+    "InMemorySpanExporter",
+    "format_span_tree",
+    "NOOP_SPAN",
+    "NoOpSpan",
+    "Span",
+    "SpanEvent",
+    "SpanExporter",
+    "add_span_exporter",
+    "end_span",
+    "get_current_span",
+    "get_span_exporters",
+    "is_tracing_enabled",
+    "remove_span_exporter",
+    "set_span_exporters",
+    "start_span",
+    "trace_async_iterator",
+    "trace_iterator",
+    "trace_span",
+    "traced",
+]
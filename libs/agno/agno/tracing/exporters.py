@@ -0,0 +1,76 @@
+from collections import defaultdict
+from threading import Lock
+from typing import Dict, List, Optional
+
+from agno.tracing.span import Span
+from agno.tracing.tracer import SpanExporter
+
+
+def format_span_tree(spans: List[Span]) -> str:
+    """Format spans as an indented tree with the duration of every span"""
+    span_ids = {span.span_id for span in spans}
+    children: Dict[Optional[str], List[Span]] = defaultdict(list)
+    for span in spans:
+        parent_id = span.parent_id if span.parent_id in span_ids else None
+        children[parent_id].append(span)
+
+    lines: List[str] = []
+
+    def add_span(span: Span, depth: int) -> None:
+        duration = f"{span.duration * 1000:.2f}ms" if span.duration is not None else "running"
+        line = f"{'  ' * depth}{span.name} {duration}"
+        if span.status == "error":
+            line += f" [error: {span.error}]"
+        lines.append(line)
+        for child in sorted(children.get(span.span_id, []), key=lambda child: child.start_time):
+            add_span(child, depth + 1)
+
+    for root in sorted(children.get(None, []), key=lambda span: span.start_time):
+        add_span(root, 0)
+    return "\n".join(lines)
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the finished spans in memory, e.g. for tests or to inspect a run in a notebook"""
+
+    def __init__(self, max_spans: Optional[int] = 10000):
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self._lock = Lock()
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+            if self.max_spans is not None and len(self.spans) > self.max_spans:
+                del self.spans[: len(self.spans) - self.max_spans]
+
+    def get_spans(self, name: Optional[str] = None, trace_id: Optional[str] = None) -> List[Span]:
+        with self._lock:
+            return [
+                span
+                for span in self.spans
+                if (name is None or span.name == name) and (trace_id is None or span.trace_id == trace_id)
+            ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+    def format_tree(self, trace_id: Optional[str] = None) -> str:
+        return format_span_tree(self.get_spans(trace_id=trace_id))
+
+
+class ConsoleSpanExporter(SpanExporter):
+    """Prints the span tree of every trace when its root span ends"""
+
+    def __init__(self):
+        self._traces: Dict[str, List[Span]] = defaultdict(list)
+        self._lock = Lock()
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            self._traces[span.trace_id].append(span)
+            if span.parent_id is not None:
+                return
+            spans = self._traces.pop(span.trace_id)
+        print(format_span_tree(spans))
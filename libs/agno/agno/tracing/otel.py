@@ -0,0 +1,76 @@
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from agno.tracing.span import Span
+from agno.tracing.tracer import SpanExporter
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:
+    raise ImportError("`opentelemetry` not installed. Please install it using `pip install agno[opentelemetry]`")
+
+
+def _to_otel_value(value: Any) -> Any:
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (list, tuple)) and all(isinstance(item, (str, bool, int, float)) for item in value):
+        return list(value)
+    return str(value)
+
+
+def _to_otel_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: _to_otel_value(value) for key, value in attributes.items() if value is not None}
+
+
+class OpenTelemetrySpanExporter(SpanExporter):
+    """Exports the spans of agno runs to OpenTelemetry.
+
+    Spans are created with the configured OpenTelemetry tracer provider, so they are sent wherever the provider
+    exports to, e.g. an OTLP collector, and nest under the active OpenTelemetry span, e.g. an HTTP request span.
+
+    Args:
+        tracer_provider: Tracer provider to use. Defaults to the global tracer provider.
+        instrumentation_name: Name of the OpenTelemetry tracer.
+    """
+
+    def __init__(self, tracer_provider: Optional[Any] = None, instrumentation_name: str = "agno"):
+        self.tracer = trace.get_tracer(instrumentation_name, tracer_provider=tracer_provider)
+        self._otel_spans: Dict[str, Any] = {}
+        self._lock = Lock()
+
+    def on_start(self, span: Span) -> None:
+        parent_context = None
+        with self._lock:
+            parent = self._otel_spans.get(span.parent_id) if span.parent_id is not None else None
+        if parent is not None:
+            parent_context = trace.set_span_in_context(parent)
+        otel_span = self.tracer.start_span(
+            span.name,
+            context=parent_context,
+            attributes=_to_otel_attributes(span.attributes),
+            start_time=int(span.start_time * 1e9),
+        )
+        with self._lock:
+            self._otel_spans[span.span_id] = otel_span
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            otel_span = self._otel_spans.pop(span.span_id, None)
+        if otel_span is None:
+            return
+        otel_span.set_attributes(_to_otel_attributes(span.attributes))
+        for event in span.events:
+            otel_span.add_event(
+                event.name, attributes=_to_otel_attributes(event.attributes), timestamp=int(event.timestamp * 1e9)
+            )
+        if span.status == "error":
+            otel_span.set_status(Status(StatusCode.ERROR, span.error))
+        else:
+            otel_span.set_status(Status(StatusCode.OK))
+        end_time = span.end_time if span.end_time is not None else span.start_time
+        otel_span.end(end_time=int(end_time * 1e9))
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._otel_spans.clear()
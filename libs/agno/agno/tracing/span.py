@@ -0,0 +1,124 @@
+from dataclasses import dataclass, field
+from time import perf_counter, time
+from typing import Any, Dict, List, Literal, Optional
+from uuid import uuid4
+
+
+@dataclass
+class SpanEvent:
+    """A point in time event recorded on a span, e.g. an exception"""
+
+    name: str
+    timestamp: float
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Span:
+    """A timed stage of a run, e.g. a model call or a tool execution.
+
+    Spans started while another span is active become its children, so the spans of a run form a tree that shows
+    where the time of the run went.
+    """
+
+    name: str
+    trace_id: str = field(default_factory=lambda: uuid4().hex)
+    span_id: str = field(default_factory=lambda: uuid4().hex[:16])
+    parent_id: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    events: List[SpanEvent] = field(default_factory=list)
+    status: Literal["ok", "error"] = "ok"
+    error: Optional[str] = None
+
+    # Wall clock times, in seconds since the epoch
+    start_time: float = field(default_factory=time)
+    end_time: Optional[float] = None
+
+    # Monotonic clock, used for the duration
+    _start_counter: float = field(default_factory=perf_counter, repr=False)
+    _duration: Optional[float] = field(default=None, repr=False)
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Duration of the span in seconds, None while it is still running"""
+        return self._duration
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the span started"""
+        return perf_counter() - self._start_counter
+
+    @property
+    def is_recording(self) -> bool:
+        return True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        self.events.append(SpanEvent(name=name, timestamp=time(), attributes=attributes or {}))
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.status = "error"
+        self.error = f"{type(exception).__name__}: {exception}"
+        self.add_event(
+            "exception",
+            {"exception.type": type(exception).__name__, "exception.message": str(exception)},
+        )
+
+    def end(self) -> None:
+        if self._duration is None:
+            self._duration = perf_counter() - self._start_counter
+            self.end_time = self.start_time + self._duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.duration,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+            "events": [
+                {"name": event.name, "timestamp": event.timestamp, "attributes": event.attributes}
+                for event in self.events
+            ],
+        }
+
+
+class NoOpSpan(Span):
+    """Span returned when tracing is disabled. It records nothing."""
+
+    def __init__(self):
+        super().__init__(name="noop", trace_id="", span_id="", start_time=0.0, _start_counter=0.0)
+
+    @property
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN = NoOpSpan()
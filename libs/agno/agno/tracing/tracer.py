@@ -0,0 +1,348 @@
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
+from types import AsyncGeneratorType, CoroutineType, GeneratorType
+from typing import Any, AsyncIterator, Callable, Coroutine, Dict, Iterator, List, Optional, TypeVar
+
+from agno.tracing.span import NOOP_SPAN, Span
+from agno.utils.log import log_warning
+
+T = TypeVar("T")
+
+SpanAttributes = Optional[Callable[..., Dict[str, Any]]]
+
+
+class SpanExporter(ABC):
+    """Receives the spans of every traced run stage, e.g. to send them to a tracing backend"""
+
+    def on_start(self, span: Span) -> None:
+        """Called when a span starts"""
+        pass
+
+    @abstractmethod
+    def on_end(self, span: Span) -> None:
+        """Called when a span ends"""
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Flush and release the resources of the exporter"""
+        pass
+
+
+# Tracing is disabled while there are no exporters: every traced stage then costs a single check
+_exporters: List[SpanExporter] = []
+_current_span: ContextVar[Optional[Span]] = ContextVar("agno_current_span", default=None)
+
+
+def add_span_exporter(exporter: SpanExporter) -> None:
+    """Enable tracing, sending the spans of every run to the exporter"""
+    if exporter not in _exporters:
+        _exporters.append(exporter)
+
+
+def remove_span_exporter(exporter: SpanExporter) -> None:
+    if exporter in _exporters:
+        _exporters.remove(exporter)
+        exporter.shutdown()
+
+
+def set_span_exporters(exporters: Optional[List[SpanExporter]]) -> None:
+    """Replace the span exporters. An empty list or None disables tracing."""
+    for exporter in list(_exporters):
+        if exporters is None or exporter not in exporters:
+            exporter.shutdown()
+    _exporters[:] = exporters or []
+
+
+def get_span_exporters() -> List[SpanExporter]:
+    return list(_exporters)
+
+
+def is_tracing_enabled() -> bool:
+    return bool(_exporters)
+
+
+def get_current_span() -> Span:
+    """The active span, or a span that records nothing if there is none"""
+    return _current_span.get() or NOOP_SPAN
+
+
+def start_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Span:
+    """Start a span as a child of the active span. The caller must end it with `end_span`."""
+    parent = _current_span.get()
+    span = Span(name=name)
+    if parent is not None:
+        span.trace_id = parent.trace_id
+        span.parent_id = parent.span_id
+    if attributes:
+        span.set_attributes(attributes)
+    for exporter in _exporters:
+        try:
+            exporter.on_start(span)
+        except Exception as e:
+            log_warning(f"Error starting span {name} in {type(exporter).__name__}: {e}")
+    return span
+
+
+def end_span(span: Span, exception: Optional[BaseException] = None) -> None:
+    if exception is not None:
+        span.record_exception(exception)
+    span.end()
+    for exporter in _exporters:
+        try:
+            exporter.on_end(span)
+        except Exception as e:
+            log_warning(f"Error exporting span {span.name} in {type(exporter).__name__}: {e}")
+
+
+def _reset_current_span(token: Any) -> None:
+    try:
+        _current_span.reset(token)
+    except ValueError:
+        # The span was activated in another context, e.g. by a generator that was resumed from another task
+        pass
+
+
+class _SpanContext:
+    __slots__ = ("_name", "_attributes", "_span", "_token")
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]]):
+        self._name = name
+        self._attributes = attributes
+
+    def __enter__(self) -> Span:
+        self._span = start_span(self._name, self._attributes)
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        _reset_current_span(self._token)
+        end_span(self._span, exc_value)
+
+
+class _NoOpSpanContext:
+    __slots__ = ()
+
+    def __enter__(self) -> Span:
+        return NOOP_SPAN
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+_NOOP_SPAN_CONTEXT = _NoOpSpanContext()
+
+
+def trace_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Any:
+    """Context manager tracing the enclosed block as a span.
+
+    Example:
+        with trace_span("agent.custom_stage", {"agent.id": agent.id}) as span:
+            span.set_attribute("items", len(items))
+    """
+    if not _exporters:
+        return _NOOP_SPAN_CONTEXT
+    return _SpanContext(name, attributes)
+
+
+def trace_iterator(
+    name: str,
+    iterator: Iterator[T],
+    attributes: Optional[Dict[str, Any]] = None,
+    first_chunk_attribute: Optional[str] = None,
+) -> Iterator[T]:
+    """Trace the consumption of an iterator as a span.
+
+    The span is only active while the iterator runs, not while the caller handles the items it yields.
+    If `first_chunk_attribute` is set, the seconds until the first item are recorded under that attribute.
+    """
+    if not _exporters:
+        return iterator
+    return _trace_iterator(start_span(name, attributes), iterator, first_chunk_attribute)
+
+
+def _trace_iterator(span: Span, iterator: Iterator[T], first_chunk_attribute: Optional[str] = None) -> Iterator[T]:
+    exception: Optional[BaseException] = None
+    first_chunk = first_chunk_attribute is not None
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _reset_current_span(token)
+            if first_chunk:
+                span.set_attribute(first_chunk_attribute, span.elapsed)  # type: ignore
+                first_chunk = False
+            yield item
+    except GeneratorExit:
+        raise
+    except BaseException as e:
+        exception = e
+        raise
+    finally:
+        if hasattr(iterator, "close"):
+            iterator.close()  # type: ignore
+        end_span(span, exception)
+
+
+def trace_async_iterator(
+    name: str,
+    iterator: AsyncIterator[T],
+    attributes: Optional[Dict[str, Any]] = None,
+    first_chunk_attribute: Optional[str] = None,
+) -> AsyncIterator[T]:
+    """Trace the consumption of an async iterator as a span. See `trace_iterator`."""
+    if not _exporters:
+        return iterator
+    return _trace_async_iterator(start_span(name, attributes), iterator, first_chunk_attribute)
+
+
+async def _trace_async_iterator(
+    span: Span, iterator: AsyncIterator[T], first_chunk_attribute: Optional[str] = None
+) -> AsyncIterator[T]:
+    exception: Optional[BaseException] = None
+    first_chunk = first_chunk_attribute is not None
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _reset_current_span(token)
+            if first_chunk:
+                span.set_attribute(first_chunk_attribute, span.elapsed)  # type: ignore
+                first_chunk = False
+            yield item
+    except GeneratorExit:
+        raise
+    except BaseException as e:
+        exception = e
+        raise
+    finally:
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()  # type: ignore
+        end_span(span, exception)
+
+
+async def _trace_coroutine(span: Span, coroutine: Coroutine[Any, Any, T]) -> T:
+    token = _current_span.set(span)
+    try:
+        result = await coroutine
+    except BaseException as e:
+        end_span(span, e)
+        raise
+    finally:
+        _reset_current_span(token)
+    end_span(span)
+    return result
+
+
+def _trace_result(span: Span, result: Any, first_chunk_attribute: Optional[str]) -> Any:
+    # Functions can return the generator or coroutine doing the actual work, e.g. `Agent.run(stream=True)`.
+    # The span then ends once the result is consumed.
+    if isinstance(result, GeneratorType):
+        return _trace_iterator(span, result, first_chunk_attribute)
+    if isinstance(result, AsyncGeneratorType):
+        return _trace_async_iterator(span, result, first_chunk_attribute)
+    if isinstance(result, CoroutineType):
+        return _trace_coroutine(span, result)
+    end_span(span)
+    return result
+
+
+def _trace_call(span: Span, func: Callable, args: Any, kwargs: Any, first_chunk_attribute: Optional[str]) -> Any:
+    token = _current_span.set(span)
+    try:
+        result = func(*args, **kwargs)
+    except BaseException as e:
+        end_span(span, e)
+        raise
+    finally:
+        _reset_current_span(token)
+    return _trace_result(span, result, first_chunk_attribute)
+
+
+async def _atrace_call(span: Span, func: Callable, args: Any, kwargs: Any, first_chunk_attribute: Optional[str]) -> Any:
+    token = _current_span.set(span)
+    try:
+        result = await func(*args, **kwargs)
+    except BaseException as e:
+        end_span(span, e)
+        raise
+    finally:
+        _reset_current_span(token)
+    return _trace_result(span, result, first_chunk_attribute)
+
+
+def traced(name: str, attributes: SpanAttributes = None, first_chunk_attribute: Optional[str] = None):
+    """Decorator tracing every call of a function, coroutine, generator or async generator as a span.
+
+    If a function returns a generator or a coroutine, its span ends once the generator or coroutine is consumed.
+
+    Args:
+        name: Name of the span.
+        attributes: Function called with the arguments of the traced function, returning the span attributes.
+        first_chunk_attribute: For generators, the attribute recording the seconds until the first item.
+    """
+
+    def get_attributes(args: Any, kwargs: Any) -> Optional[Dict[str, Any]]:
+        if attributes is None:
+            return None
+        try:
+            return attributes(*args, **kwargs)
+        except Exception as e:
+            log_warning(f"Error getting the attributes of span {name}: {e}")
+            return None
+
+    def decorator(func: Callable) -> Callable:
+        if isasyncgenfunction(func):
+
+            @wraps(func)
+            def async_gen_wrapper(*args, **kwargs):
+                if not _exporters:
+                    return func(*args, **kwargs)
+                span = start_span(name, get_attributes(args, kwargs))
+                return _trace_async_iterator(span, func(*args, **kwargs), first_chunk_attribute)
+
+            return async_gen_wrapper
+
+        if isgeneratorfunction(func):
+
+            @wraps(func)
+            def gen_wrapper(*args, **kwargs):
+                if not _exporters:
+                    return func(*args, **kwargs)
+                span = start_span(name, get_attributes(args, kwargs))
+                return _trace_iterator(span, func(*args, **kwargs), first_chunk_attribute)
+
+            return gen_wrapper
+
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _exporters:
+                    return await func(*args, **kwargs)
+                return await _atrace_call(
+                    start_span(name, get_attributes(args, kwargs)), func, args, kwargs, first_chunk_attribute
+                )
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _exporters:
+                return func(*args, **kwargs)
+            return _trace_call(
+                start_span(name, get_attributes(args, kwargs)), func, args, kwargs, first_chunk_attribute
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,61 @@
+from dataclasses import dataclass, field
+from typing import Any, List, Union
+
+from agno.models.response import ModelResponse
+
+
+class StreamBuffer:
+    """Accumulates the chunks of a streamed string (or bytes) in linear time.
+
+    `obj.content += chunk` copies the whole string on every chunk, as CPython can only extend a string in place when
+    nothing else references it, which is never the case for an attribute. The buffer keeps the chunks in a list and
+    joins them when the value is read.
+    """
+
+    __slots__ = ("_chunks", "_empty")
+
+    def __init__(self, initial: Union[str, bytes] = ""):
+        self._empty = initial[:0]
+        self._chunks: List[Any] = [initial] if initial else []
+
+    def append(self, chunk: Union[str, bytes]) -> None:
+        if chunk:
+            if not self._chunks:
+                # The first chunk decides whether the value is a string or bytes
+                self._empty = chunk[:0]
+            self._chunks.append(chunk)
+
+    @property
+    def value(self) -> Any:
+        if len(self._chunks) > 1:
+            # Keep the joined value, so reading it again is free until the next chunk
+            self._chunks = [self._empty.join(self._chunks)]
+        return self._chunks[0] if self._chunks else self._empty
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+    def __repr__(self) -> str:
+        return f"StreamBuffer({self.value!r})"
+
+
+@dataclass
+class ResponseStreamBuffers:
+    """Accumulates the content, reasoning and audio streamed into a model response, until they are flushed to it"""
+
+    content: StreamBuffer = field(default_factory=StreamBuffer)
+    reasoning_content: StreamBuffer = field(default_factory=StreamBuffer)
+    audio_content: bytearray = field(default_factory=bytearray)
+    audio_transcript: StreamBuffer = field(default_factory=StreamBuffer)
+
+    def flush(self, model_response: ModelResponse) -> None:
+        """Write the accumulated values to the model response"""
+        if self.content:
+            model_response.content = self.content.value
+        if self.reasoning_content:
+            model_response.reasoning_content = self.reasoning_content.value
+        if model_response.audio is not None:
+            if self.audio_content:
+                model_response.audio.content = bytes(self.audio_content)
+            if self.audio_transcript:
+                model_response.audio.transcript = self.audio_transcript.value
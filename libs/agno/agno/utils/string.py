@@ -2,13 +2,17 @@ import hashlib
 import json
 import re
 import uuid
-from typing import Optional, Type
+from string import Template
+from typing import Any, Mapping, Optional, Type
 from uuid import uuid4
 
 from pydantic import BaseModel, ValidationError
 
 from agno.utils.log import logger
 
+# A {variable} not nested in other braces
+_VARIABLE_PATTERN = re.compile(r"\{([^{}]+)\}")
+
 
 def is_valid_uuid(uuid_str: str) -> bool:
     """
@@ -229,3 +233,25 @@ def generate_id_from_name(name: Optional[str] = None) -> str:
         return name.lower().replace(" ", "-").replace("_", "-")
     else:
         return str(uuid4())
+
+
+def substitute_variables(text: str, variables: Mapping[str, Any]) -> str:
+    """
+    Substitute the {variable} and $variable patterns of a text with their values. Unknown variables are left as is.
+
+    Args:
+        text: Text to substitute the variables in
+        variables: Values of the variables
+
+    Returns:
+        str: The text with the variables substituted
+    """
+    # Nothing to substitute
+    if "{" not in text and "$" not in text:
+        return text
+
+    # Convert the {variable} patterns of known variables to ${variable}, in a single pass over the text
+    converted_text = _VARIABLE_PATTERN.sub(
+        lambda match: "${" + match.group(1) + "}" if match.group(1) in variables else match.group(0), text
+    )
+    return Template(converted_text).safe_substitute(variables)
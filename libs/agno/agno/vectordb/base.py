@@ -1,5 +1,15 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+from weakref import WeakKeyDictionary
+
+from agno.utils.log import log_debug, log_info
+from agno.vectordb.executor import SearchMetrics, run_in_vectordb_executor
+from agno.vectordb.pipeline import WriteStats, embed_documents, write_documents
+
+T = TypeVar("T")
 
 
 class VectorDb(ABC):
@@ -7,6 +17,15 @@ class VectorDb(ABC):
 
     from agno.knowledge.document import Document
 
+    # Maximum number of concurrent searches made through `run_async_search`. None means no limit.
+    search_concurrency: Optional[int] = None
+    # Thread pool used for blocking calls made from async code. None uses the pool shared by all vector dbs.
+    executor: Optional[Executor] = None
+    # Number of documents embedded and written at once by `write_in_batches`
+    write_batch_size: int = 100
+    # Throughput of the last write made through `write_in_batches`
+    write_stats: Optional[WriteStats] = None
+
     @abstractmethod
     def create(self) -> None:
         raise NotImplementedError
@@ -54,6 +73,32 @@ class VectorDb(ABC):
     ) -> None:
         raise NotImplementedError
 
+    def write_in_batches(
+        self,
+        documents: List[Document],
+        write_batch: Callable[[List[Document]], Any],
+        embed: bool = True,
+        batch_size: Optional[int] = None,
+    ) -> WriteStats:
+        """Embed documents with the embedder of the vector db and write them with `write_batch`, batch by batch.
+
+        The next batch is embedded while the current one is written. Backends should write each batch with their bulk
+        API, in a single request.
+        """
+        embedder = getattr(self, "embedder", None)
+        stats = write_documents(
+            documents,
+            write_batch,
+            embed_batch=(lambda batch: embed_documents(embedder, batch)) if embed and embedder is not None else None,
+            batch_size=batch_size or self.write_batch_size,
+        )
+        self.write_stats = stats
+        log_info(
+            f"Wrote {stats.documents} documents in {stats.batches} batches "
+            f"({stats.total_time:.2f}s, {stats.docs_per_second:.1f} docs/s)"
+        )
+        return stats
+
     @abstractmethod
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         raise NotImplementedError
@@ -64,6 +109,86 @@ class VectorDb(ABC):
     ) -> List[Document]:
         raise NotImplementedError
 
+    def embedding_search_available(self) -> bool:
+        """Whether `search_with_embedding` is supported, so callers can embed queries themselves, e.g. in batch"""
+        return False
+
+    def search_with_embedding(
+        self, query: str, embedding: List[float], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Search with an embedding of the query computed by the caller"""
+        raise NotImplementedError
+
+    async def run_in_executor(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call (e.g. a sync client method) in a thread pool, without blocking the event loop."""
+        return await run_in_vectordb_executor(func, *args, executor=self.executor, **kwargs)
+
+    @property
+    def search_metrics(self) -> SearchMetrics:
+        """Counters and latencies of the searches made through `run_async_search`"""
+        metrics = getattr(self, "_search_metrics", None)
+        if metrics is None:
+            metrics = SearchMetrics()
+            self._search_metrics = metrics
+        return metrics
+
+    def _get_search_semaphore(self) -> Optional[asyncio.Semaphore]:
+        if not self.search_concurrency:
+            return None
+        # Semaphores are bound to an event loop, so keep one per loop
+        semaphores = getattr(self, "_search_semaphores", None)
+        if semaphores is None:
+            semaphores = WeakKeyDictionary()
+            self._search_semaphores = semaphores
+        loop = asyncio.get_running_loop()
+        semaphore = semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.search_concurrency)
+            semaphores[loop] = semaphore
+        return semaphore
+
+    async def run_async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Search from async code without ever blocking the event loop.
+
+        Uses `async_search` when the backend implements it, and otherwise runs the sync `search` in the thread pool.
+        At most `search_concurrency` searches run at once, and every search is recorded in `search_metrics`.
+        """
+        semaphore = self._get_search_semaphore()
+        if semaphore is None:
+            return await self._timed_async_search(query, limit, filters)
+
+        metrics = self.search_metrics
+        metrics.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            metrics.waiting -= 1
+        try:
+            return await self._timed_async_search(query, limit, filters)
+        finally:
+            semaphore.release()
+
+    async def _timed_async_search(self, query: str, limit: int, filters: Optional[Dict[str, Any]]) -> List[Document]:
+        metrics = self.search_metrics
+        metrics.in_flight += 1
+        start = time.perf_counter()
+        error = False
+        try:
+            try:
+                return await self.async_search(query=query, limit=limit, filters=filters)
+            except NotImplementedError:
+                log_debug(f"{self.__class__.__name__} does not support async search, searching in a thread")
+                metrics.thread_fallbacks += 1
+                return await self.run_in_executor(self.search, query=query, limit=limit, filters=filters)
+        except Exception:
+            error = True
+            raise
+        finally:
+            metrics.in_flight -= 1
+            metrics.record(time.perf_counter() - start, error=error)
+
     @abstractmethod
     def drop(self) -> None:
         raise NotImplementedError
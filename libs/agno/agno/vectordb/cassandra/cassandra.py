@@ -90,9 +90,15 @@ class Cassandra(VectorDb):
 
     def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         log_info(f"Cassandra VectorDB : Inserting Documents to the table {self.table_name}")
+        # Documents are embedded batch by batch, the next batch while the current one is written
+        self.write_in_batches(documents, lambda batch: self._write_batch(content_hash, batch, filters))
+
+    def _write_batch(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Write a batch of embedded documents with concurrent asynchronous puts."""
         futures = []
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             metadata = {key: str(value) for key, value in doc.meta_data.items()}
             metadata.update(filters or {})
             metadata["content_id"] = doc.content_id or ""
@@ -208,7 +214,7 @@ class Cassandra(VectorDb):
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
         """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        return await self.run_in_executor(self.search, query, limit, filters)
 
     def _search_to_documents(
         self,
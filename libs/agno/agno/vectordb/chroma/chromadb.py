@@ -160,47 +160,11 @@ class ChromaDb(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to merge with document metadata
         """
         log_info(f"Inserting {len(documents)} documents")
-        ids: List = []
-        docs: List = []
-        docs_embeddings: List = []
-        docs_metadata: List = []
-
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
-        for document in documents:
-            document.embed(embedder=self.embedder)
-            cleaned_content = document.content.replace("\x00", "\ufffd")
-            doc_id = md5(cleaned_content.encode()).hexdigest()
-
-            # Handle metadata and filters
-            metadata = document.meta_data or {}
-            if filters:
-                metadata.update(filters)
-
-            # Add name, content_id to metadata
-            if document.name is not None:
-                metadata["name"] = document.name
-            if document.content_id is not None:
-                metadata["content_id"] = document.content_id
-
-            metadata["content_hash"] = content_hash
-
-            # Flatten metadata for ChromaDB compatibility
-            flattened_metadata = self._flatten_metadata(metadata)
-
-            docs_embeddings.append(document.embedding)
-            docs.append(cleaned_content)
-            ids.append(doc_id)
-            docs_metadata.append(flattened_metadata)
-            log_debug(f"Prepared document: {document.id} | {document.name} | {flattened_metadata}")
-
-        if self._collection is None:
-            logger.warning("Collection does not exist")
-        else:
-            if len(docs) > 0:
-                self._collection.add(ids=ids, embeddings=docs_embeddings, documents=docs, metadatas=docs_metadata)
-                log_debug(f"Committed {len(docs)} documents")
+        # Documents are embedded batch by batch, the next batch while the current one is added
+        self.write_in_batches(documents, lambda batch: self._write_batch(content_hash, batch, filters))
 
     async def async_insert(
         self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
@@ -317,16 +281,25 @@ class ChromaDb(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         log_info(f"Upserting {len(documents)} documents")
+        if not self._collection:
+            self._collection = self.client.get_collection(name=self.collection_name)
+
+        self.write_in_batches(documents, lambda batch: self._write_batch(content_hash, batch, filters, upsert=True))
+
+    def _write_batch(
+        self,
+        content_hash: str,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        upsert: bool = False,
+    ) -> None:
+        """Add or upsert a batch of embedded documents in a single request."""
         ids: List = []
         docs: List = []
         docs_embeddings: List = []
         docs_metadata: List = []
 
-        if not self._collection:
-            self._collection = self.client.get_collection(name=self.collection_name)
-
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -350,14 +323,16 @@ class ChromaDb(VectorDb):
             docs.append(cleaned_content)
             ids.append(doc_id)
             docs_metadata.append(flattened_metadata)
-            log_debug(f"Upserted document: {document.id} | {document.name} | {flattened_metadata}")
+            log_debug(f"Prepared document: {document.id} | {document.name} | {flattened_metadata}")
 
         if self._collection is None:
             logger.warning("Collection does not exist")
-        else:
-            if len(docs) > 0:
+        elif len(docs) > 0:
+            if upsert:
                 self._collection.upsert(ids=ids, embeddings=docs_embeddings, documents=docs, metadatas=docs_metadata)
-                log_debug(f"Committed {len(docs)} documents")
+            else:
+                self._collection.add(ids=ids, embeddings=docs_embeddings, documents=docs, metadatas=docs_metadata)
+            log_debug(f"Committed {len(docs)} documents")
 
     async def _async_upsert(
         self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
@@ -593,7 +568,7 @@ class ChromaDb(VectorDb):
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
         """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        return await self.run_in_executor(self.search, query, limit, filters)
 
     def drop(self) -> None:
         """Delete the collection."""
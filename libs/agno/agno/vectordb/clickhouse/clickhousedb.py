@@ -266,9 +266,16 @@ class Clickhouse(VectorDb):
         documents: List[Document],
         filters: Optional[Dict[str, Any]] = None,
     ) -> None:
+        # Documents are embedded batch by batch, the next batch while the current one is inserted
+        self.write_in_batches(documents, lambda batch: self._write_batch(content_hash, batch, filters))
+        log_debug(f"Inserted {len(documents)} documents")
+
+    def _write_batch(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Insert a batch of embedded documents in a single request."""
         rows: List[List[Any]] = []
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             _id = md5(cleaned_content.encode()).hexdigest()
 
@@ -300,7 +307,7 @@ class Clickhouse(VectorDb):
                 "content_hash",
             ],
         )
-        log_debug(f"Inserted {len(documents)} documents")
+        log_debug(f"Inserted batch of {len(rows)} documents")
 
     async def async_insert(
         self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
@@ -503,7 +510,7 @@ class Clickhouse(VectorDb):
         """Search for documents asynchronously."""
         async_client = await self._ensure_async_client()
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.async_get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -296,76 +296,11 @@ class CouchbaseSearch(VectorDb):
             filters: Optional filters to apply to the documents
         """
         log_debug(f"Inserting {len(documents)} documents")
-
-        docs_to_insert: Dict[str, Any] = {}
-        for document in documents:
-            if document.embedding is None:
-                document.embed(embedder=self.embedder)
-
-            if document.embedding is None:
-                raise ValueError(f"Failed to generate embedding for document: {document.name}")
-            try:
-                doc_data = self.prepare_doc(content_hash, document)
-                if filters:
-                    doc_data["filters"] = filters
-                # For insert_multi, the key of the dict is the document ID,
-                # and the value is the document content itself.
-                doc_id = doc_data.pop("_id")
-                docs_to_insert[doc_id] = doc_data
-            except Exception as e:
-                logger.error(f"Error preparing document '{document.name}': {e}")
-
-        if not docs_to_insert:
-            logger.info("No documents prepared for insertion.")
-            return
-
-        doc_ids = list(docs_to_insert.keys())
-        total_inserted_count = 0
-        total_processed_count = len(doc_ids)
-        errors_occurred = False
-
-        for i in range(0, len(doc_ids), self.batch_limit):
-            batch_doc_ids = doc_ids[i : i + self.batch_limit]
-            batch_docs_to_insert = {doc_id: docs_to_insert[doc_id] for doc_id in batch_doc_ids}
-
-            if not batch_docs_to_insert:
-                continue
-
-            log_debug(f"Inserting batch of {len(batch_docs_to_insert)} documents.")
-            try:
-                result = self.collection.insert_multi(batch_docs_to_insert)
-                # Check for errors in the batch result
-                # The actual way to count successes/failures might depend on the SDK version
-                # For Couchbase SDK 3.x/4.x, result.all_ok is a good indicator for the whole batch.
-                # If not all_ok, result.exceptions (dict) contains errors for specific keys.
-
-                # Simplistic success counting for this example, assuming partial success is possible
-                # and we want to count how many actually made it.
-                if result.all_ok:
-                    batch_inserted_count = len(batch_docs_to_insert)
-                    logger.info(f"Batch of {batch_inserted_count} documents inserted successfully.")
-                else:
-                    # If not all_ok, count successes by checking which keys are NOT in exceptions
-                    # This is a more robust way than just len(batch) - len(exceptions)
-                    # as some items might succeed even if others fail.
-                    succeeded_ids = set(batch_docs_to_insert.keys()) - set(
-                        result.exceptions.keys() if result.exceptions else []
-                    )
-                    batch_inserted_count = len(succeeded_ids)
-                    if batch_inserted_count > 0:
-                        logger.info(f"Partially inserted {batch_inserted_count} documents in batch.")
-                    logger.warning(f"Bulk write error during batch insert: {result.exceptions}")
-                    errors_occurred = True
-                total_inserted_count += batch_inserted_count
-
-            except Exception as e:
-                logger.error(f"Error during batch bulk insert for {len(batch_docs_to_insert)} documents: {e}")
-                errors_occurred = True  # Mark that an error occurred in this batch
-
-        logger.info(f"Finished processing {total_processed_count} documents for insertion.")
-        logger.info(f"Total successfully inserted: {total_inserted_count}.")
-        if errors_occurred:
-            logger.warning("Some errors occurred during the insert operation. Please check logs for details.")
+        # Documents are embedded batch by batch, the next batch while the current one is inserted
+        stats = self.write_in_batches(
+            documents, lambda batch: self._write_batch(content_hash, batch, filters), batch_size=self.batch_limit
+        )
+        logger.info(f"Finished processing {stats.documents} documents for insertion.")
 
     def upsert_available(self) -> bool:
         """Check if upsert is available in Couchbase."""
@@ -388,68 +323,63 @@ class CouchbaseSearch(VectorDb):
             filters: Optional filters to apply to the documents
         """
         logger.info(f"Upserting {len(documents)} documents")
-
-        docs_to_upsert: Dict[str, Any] = {}
+        stats = self.write_in_batches(
+            documents,
+            lambda batch: self._write_batch(content_hash, batch, filters, upsert=True),
+            batch_size=self.batch_limit,
+        )
+        logger.info(f"Finished processing {stats.documents} documents for upsert.")
+
+    def _write_batch(
+        self,
+        content_hash: str,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        upsert: bool = False,
+    ) -> None:
+        """Write a batch of embedded documents with a single insert_multi or upsert_multi call."""
+        operation = "upsert" if upsert else "insert"
+        docs_to_write: Dict[str, Any] = {}
         for document in documents:
+            if document.embedding is None:
+                error = ValueError(f"Failed to generate embedding for document: {document.name}")
+                # An insert fails, an upsert skips the document
+                if not upsert:
+                    raise error
+                logger.error(f"Error preparing document '{document.name}': {error}")
+                continue
             try:
-                if document.embedding is None:
-                    document.embed(embedder=self.embedder)
-
-                if document.embedding is None:
-                    raise ValueError(f"Failed to generate embedding for document: {document.name}")
-
                 doc_data = self.prepare_doc(content_hash, document)
                 if filters:
                     doc_data["filters"] = filters
-                # For upsert_multi, the key of the dict is the document ID,
+                # For insert_multi and upsert_multi, the key of the dict is the document ID,
                 # and the value is the document content itself.
                 doc_id = doc_data.pop("_id")
-                docs_to_upsert[doc_id] = doc_data
+                docs_to_write[doc_id] = doc_data
             except Exception as e:
                 logger.error(f"Error preparing document '{document.name}': {e}")
 
-        if not docs_to_upsert:
-            logger.info("No documents prepared for upsert.")
+        if not docs_to_write:
+            logger.info(f"No documents prepared for {operation}.")
             return
 
-        doc_ids = list(docs_to_upsert.keys())
-        total_upserted_count = 0
-        total_processed_count = len(doc_ids)
-        errors_occurred = False
-
-        for i in range(0, len(doc_ids), self.batch_limit):
-            batch_doc_ids = doc_ids[i : i + self.batch_limit]
-            batch_docs_to_upsert = {doc_id: docs_to_upsert[doc_id] for doc_id in batch_doc_ids}
-
-            if not batch_docs_to_upsert:
-                continue
-
-            logger.info(f"Upserting batch of {len(batch_docs_to_upsert)} documents.")
-            try:
-                result = self.collection.upsert_multi(batch_docs_to_upsert)
-                # Similar to insert_multi, check for errors in the batch result.
-                if result.all_ok:
-                    batch_upserted_count = len(batch_docs_to_upsert)
-                    logger.info(f"Batch of {batch_upserted_count} documents upserted successfully.")
-                else:
-                    succeeded_ids = set(batch_docs_to_upsert.keys()) - set(
-                        result.exceptions.keys() if result.exceptions else []
-                    )
-                    batch_upserted_count = len(succeeded_ids)
-                    if batch_upserted_count > 0:
-                        logger.info(f"Partially upserted {batch_upserted_count} documents in batch.")
-                    logger.warning(f"Bulk write error during batch upsert: {result.exceptions}")
-                    errors_occurred = True
-                total_upserted_count += batch_upserted_count
-
-            except Exception as e:
-                logger.error(f"Error during batch bulk upsert for {len(batch_docs_to_upsert)} documents: {e}")
-                errors_occurred = True
-
-        logger.info(f"Finished processing {total_processed_count} documents for upsert.")
-        logger.info(f"Total successfully upserted: {total_upserted_count}.")
-        if errors_occurred:
-            logger.warning("Some errors occurred during the upsert operation. Please check logs for details.")
+        log_debug(f"{operation.capitalize()}ing batch of {len(docs_to_write)} documents.")
+        try:
+            if upsert:
+                result = self.collection.upsert_multi(docs_to_write)
+            else:
+                result = self.collection.insert_multi(docs_to_write)
+            # If not all_ok, result.exceptions (dict) contains errors for specific keys, and the other documents
+            # of the batch were written
+            if result.all_ok:
+                logger.info(f"Batch of {len(docs_to_write)} documents {operation}ed successfully.")
+            else:
+                succeeded_ids = set(docs_to_write.keys()) - set(result.exceptions.keys() if result.exceptions else [])
+                if succeeded_ids:
+                    logger.info(f"Partially {operation}ed {len(succeeded_ids)} documents in batch.")
+                logger.warning(f"Bulk write error during batch {operation}: {result.exceptions}")
+        except Exception as e:
+            logger.error(f"Error during batch bulk {operation} for {len(docs_to_write)} documents: {e}")
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """Search the Couchbase bucket for documents relevant to the query."""
@@ -1063,7 +993,7 @@ class CouchbaseSearch(VectorDb):
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.async_get_embedding(query)
         if query_embedding is None:
             logger.error(f"[async] Failed to generate embedding for query: {query}")
             return []
@@ -0,0 +1,102 @@
+"""Runs blocking vector db calls without blocking the event loop.
+
+Backends without a native async client run their sync calls in a dedicated, bounded thread pool shared by all
+vector dbs. Keeping it separate from the loop's default executor means slow vector queries cannot starve the
+other blocking work of the application, and vice versa.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Same default as the asyncio default executor, which suits I/O-bound database clients
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_vectordb_executor() -> ThreadPoolExecutor:
+    """Return the thread pool shared by all vector dbs, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="agno-vectordb")
+    return _executor
+
+
+async def run_in_vectordb_executor(
+    func: Callable[..., T], *args: Any, executor: Optional[Executor] = None, **kwargs: Any
+) -> T:
+    """Run a blocking call in a thread pool (the shared vector db pool by default) and await its result.
+
+    Like `asyncio.to_thread`, the call sees the context variables of the caller.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(executor or get_vectordb_executor(), call)
+
+
+@dataclass
+class SearchMetrics:
+    """Counters and latencies of the searches made through `VectorDb.run_async_search`"""
+
+    # Number of completed searches, including failed ones
+    searches: int = 0
+    errors: int = 0
+    # Searches run in the thread pool because the backend has no native async search
+    thread_fallbacks: int = 0
+    # Searches currently running, and searches waiting for the concurrency limit
+    in_flight: int = 0
+    waiting: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    # Latencies of the most recent searches, used for percentiles
+    recent_latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, latency: float, error: bool = False) -> None:
+        with self._lock:
+            self.searches += 1
+            if error:
+                self.errors += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            self.recent_latencies.append(latency)
+
+    @property
+    def avg_latency(self) -> float:
+        return self.total_latency / self.searches if self.searches else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """Latency percentile (0-100) over the most recent searches"""
+        with self._lock:
+            latencies = sorted(self.recent_latencies)
+        if not latencies:
+            return 0.0
+        index = min(len(latencies) - 1, int(round(percentile / 100 * (len(latencies) - 1))))
+        return latencies[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "searches": self.searches,
+            "errors": self.errors,
+            "thread_fallbacks": self.thread_fallbacks,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "avg_latency": self.avg_latency,
+            "p50_latency": self.percentile(50),
+            "p95_latency": self.percentile(95),
+            "max_latency": self.max_latency,
+        }
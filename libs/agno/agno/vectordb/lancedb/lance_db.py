@@ -290,19 +290,31 @@ class LanceDb(VectorDb):
             return
 
         log_debug(f"Inserting {len(documents)} documents")
-        data = []
+        if self.table is None:
+            logger.error("Table not initialized. Please create the table first")
+            return
 
-        for document in documents:
-            if self.doc_exists(document):
-                continue
+        new_documents = [document for document in documents if not self.doc_exists(document)]
+        if not new_documents:
+            log_debug("No new data to insert")
+            return
+
+        # Documents are embedded batch by batch, the next batch while the current one is added
+        self.write_in_batches(new_documents, lambda batch: self._write_batch(content_hash, batch, filters))
+        log_debug(f"Inserted {len(new_documents)} documents")
 
+    def _write_batch(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Add a batch of embedded documents to the table in a single call."""
+        data = []
+        for document in documents:
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -322,21 +334,13 @@ class LanceDb(VectorDb):
             )
             log_debug(f"Parsed document: {document.name} ({document.meta_data})")
 
-        if self.table is None:
-            logger.error("Table not initialized. Please create the table first")
+        if not data or self.table is None:
             return
-
-        if not data:
-            log_debug("No new data to insert")
-            return
-
         if self.on_bad_vectors is not None:
             self.table.add(data, on_bad_vectors=self.on_bad_vectors, fill_value=self.fill_value)
         else:
             self.table.add(data)
 
-        log_debug(f"Inserted {len(data)} documents")
-
     async def async_insert(
         self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -557,50 +561,7 @@ class LanceDb(VectorDb):
             List[Document]: List of matching documents
         """
         # TODO: Search is not yet supported in async (https://github.com/lancedb/lancedb/pull/2049)
-        if self.connection:
-            self.table = self.connection.open_table(name=self.table_name)
-
-        results = None
-
-        if self.search_type == SearchType.vector:
-            results = self.vector_search(query, limit)
-        elif self.search_type == SearchType.keyword:
-            results = self.keyword_search(query, limit)
-        elif self.search_type == SearchType.hybrid:
-            results = self.hybrid_search(query, limit)
-        else:
-            logger.error(f"Invalid search type '{self.search_type}'.")
-            return []
-
-        if results is None:
-            return []
-
-        search_results = self._build_search_results(results)
-
-        # Filter results based on metadata if filters are provided
-        if filters and search_results:
-            filtered_results = []
-            for doc in search_results:
-                if doc.meta_data is None:
-                    continue
-
-                # Check if all filter criteria match
-                match = True
-                for key, value in filters.items():
-                    if key not in doc.meta_data or doc.meta_data[key] != value:
-                        match = False
-                        break
-
-                if match:
-                    filtered_results.append(doc)
-
-            search_results = filtered_results
-
-        if self.reranker and search_results:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
-
-        log_info(f"Found {len(search_results)} documents")
-        return search_results
+        return await self.run_in_executor(self.search, query, limit, filters)
 
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
         query_embedding = self.embedder.get_embedding(query)
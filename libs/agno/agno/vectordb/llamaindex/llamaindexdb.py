@@ -91,7 +91,7 @@ class LlamaIndexVectorDb(VectorDb):
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        return self.search(query, limit, filters)
+        return await self.run_in_executor(self.search, query, limit, filters)
 
     def drop(self) -> None:
         raise NotImplementedError
@@ -393,16 +393,6 @@ class Milvus(VectorDb):
             return True
         return False
 
-    def _insert_hybrid_document(self, content_hash: str, document: Document) -> None:
-        """Insert a document with both dense and sparse vectors."""
-        data = self._prepare_document_data(content_hash=content_hash, document=document, include_vectors=True)
-        document.embed(embedder=self.embedder)
-        self.client.insert(
-            collection_name=self.collection,
-            data=data,
-        )
-        log_debug(f"Inserted hybrid document: {document.name} ({document.meta_data})")
-
     async def _async_insert_hybrid_document(self, content_hash: str, document: Document) -> None:
         """Insert a document with both dense and sparse vectors asynchronously."""
         data = self._prepare_document_data(content_hash=content_hash, document=document, include_vectors=True)
@@ -413,42 +403,54 @@ class Milvus(VectorDb):
         )
         log_debug(f"Inserted hybrid document asynchronously: {document.name} ({document.meta_data})")
 
-    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Insert documents based on search type."""
-        log_debug(f"Inserting {len(documents)} documents")
-
+    def _document_row(
+        self, content_hash: str, document: Document, filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build the row stored for an embedded document."""
         if self.search_type == SearchType.hybrid:
-            for document in documents:
-                self._insert_hybrid_document(content_hash=content_hash, document=document)
-        else:
-            for document in documents:
-                document.embed(embedder=self.embedder)
-                if not document.embedding:
-                    log_debug(f"Skipping document without embedding: {document.name} ({document.meta_data})")
-                    continue
-                cleaned_content = document.content.replace("\x00", "\ufffd")
-                doc_id = md5(cleaned_content.encode()).hexdigest()
+            return self._prepare_document_data(content_hash=content_hash, document=document, include_vectors=True)
 
-                meta_data = document.meta_data or {}
-                if filters:
-                    meta_data.update(filters)
+        cleaned_content = document.content.replace("\x00", "\ufffd")
+        meta_data = document.meta_data or {}
+        if filters:
+            meta_data.update(filters)
+        return {
+            "id": md5(cleaned_content.encode()).hexdigest(),
+            "vector": document.embedding,
+            "name": document.name,
+            "content_id": document.content_id,
+            "meta_data": meta_data,
+            "content": cleaned_content,
+            "usage": document.usage,
+            "content_hash": content_hash,
+        }
 
-                data = {
-                    "id": doc_id,
-                    "vector": document.embedding,
-                    "name": document.name,
-                    "content_id": document.content_id,
-                    "meta_data": meta_data,
-                    "content": cleaned_content,
-                    "usage": document.usage,
-                    "content_hash": content_hash,
-                }
-                self.client.insert(
-                    collection_name=self.collection,
-                    data=data,
-                )
-                log_debug(f"Inserted document: {document.name} ({meta_data})")
+    def _write_batch(
+        self,
+        content_hash: str,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        upsert: bool = False,
+    ) -> None:
+        """Write a batch of embedded documents with a single insert or upsert request."""
+        rows = []
+        for document in documents:
+            if not document.embedding:
+                log_debug(f"Skipping document without embedding: {document.name} ({document.meta_data})")
+                continue
+            rows.append(self._document_row(content_hash=content_hash, document=document, filters=filters))
+        if not rows:
+            return
+        if upsert:
+            self.client.upsert(collection_name=self.collection, data=rows)
+        else:
+            self.client.insert(collection_name=self.collection, data=rows)
+        log_debug(f"{'Upserted' if upsert else 'Inserted'} batch of {len(rows)} documents")
 
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents based on search type."""
+        log_debug(f"Inserting {len(documents)} documents")
+        self.write_in_batches(documents, lambda batch: self._write_batch(content_hash, batch, filters))
         log_info(f"Inserted {len(documents)} documents")
 
     async def async_insert(
@@ -553,30 +555,7 @@ class Milvus(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         log_debug(f"Upserting {len(documents)} documents")
-        for document in documents:
-            document.embed(embedder=self.embedder)
-            cleaned_content = document.content.replace("\x00", "\ufffd")
-            doc_id = md5(cleaned_content.encode()).hexdigest()
-
-            meta_data = document.meta_data or {}
-            if filters:
-                meta_data.update(filters)
-
-            data = {
-                "id": doc_id,
-                "vector": document.embedding,
-                "name": document.name,
-                "content_id": document.content_id,
-                "meta_data": document.meta_data,
-                "content": cleaned_content,
-                "usage": document.usage,
-                "content_hash": content_hash,
-            }
-            self.client.upsert(
-                collection_name=self.collection,
-                data=data,
-            )
-            log_debug(f"Upserted document: {document.name} ({document.meta_data})")
+        self.write_in_batches(documents, lambda batch: self._write_batch(content_hash, batch, filters, upsert=True))
 
     async def async_upsert(
         self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
@@ -709,7 +688,7 @@ class Milvus(VectorDb):
         if self.search_type == SearchType.hybrid:
             return await self.async_hybrid_search(query, limit, filters)
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.async_get_embedding(query)
         if query_embedding is None:
             log_error(f"Error getting embedding for Query: {query}")
             return []
@@ -849,7 +828,7 @@ class Milvus(VectorDb):
         from pymilvus import AnnSearchRequest, RRFRanker
 
         # Get query embeddings
-        dense_vector = self.embedder.get_embedding(query)
+        dense_vector = await self.embedder.async_get_embedding(query)
         sparse_vector = self._get_sparse_vector(query)
 
         if dense_vector is None:
@@ -17,7 +17,7 @@ try:
 except ImportError:
     raise ImportError("`hashlib` not installed. Please install using `pip install hashlib`")
 try:
-    from pymongo import AsyncMongoClient, MongoClient, errors
+    from pymongo import AsyncMongoClient, MongoClient, UpdateOne, errors
     from pymongo.collection import Collection
     from pymongo.operations import SearchIndexModel
 
@@ -518,49 +518,56 @@ class MongoDb(VectorDb):
     def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents into the MongoDB collection."""
         log_debug(f"Inserting {len(documents)} documents")
-        collection = self._get_collection()
+        # Documents are embedded batch by batch, the next batch while the current one is written
+        self.write_in_batches(documents, lambda batch: self._write_batch(content_hash, batch, filters))
+
+    def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Upsert documents into the MongoDB collection."""
+        log_info(f"Upserting {len(documents)} documents")
+        self.write_in_batches(documents, lambda batch: self._write_batch(content_hash, batch, filters, upsert=True))
 
+    def _prepare_docs(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         prepared_docs = []
         for document in documents:
             try:
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     raise ValueError(f"Failed to generate embedding for document: {document.id}")
-                doc_data = self.prepare_doc(content_hash, document, filters)
-                prepared_docs.append(doc_data)
+                prepared_docs.append(self.prepare_doc(content_hash, document, filters))
             except ValueError as e:
                 logger.error(f"Error preparing document '{document.name}': {e}")
+        return prepared_docs
 
-        if prepared_docs:
-            try:
-                collection.insert_many(prepared_docs, ordered=False)
-                log_info(f"Inserted {len(prepared_docs)} documents successfully.")
-                if self.wait_after_insert_in_seconds and self.wait_after_insert_in_seconds > 0:
-                    time.sleep(self.wait_after_insert_in_seconds)
-            except errors.BulkWriteError as e:
-                logger.warning(f"Bulk write error while inserting documents: {e.details}")
-            except Exception as e:
-                logger.error(f"Error inserting documents: {e}")
+    def _write_batch(
+        self,
+        content_hash: str,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        upsert: bool = False,
+    ) -> None:
+        """Write a batch of embedded documents in a single bulk request."""
+        prepared_docs = self._prepare_docs(content_hash, documents, filters)
+        if not prepared_docs:
+            return
 
-    def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Upsert documents into the MongoDB collection."""
-        log_info(f"Upserting {len(documents)} documents")
         collection = self._get_collection()
-
-        for document in documents:
-            try:
-                document.embed(embedder=self.embedder)
-                if document.embedding is None:
-                    raise ValueError(f"Failed to generate embedding for document: {document.id}")
-                doc_data = self.prepare_doc(content_hash, document, filters)
-                collection.update_one(
-                    {"_id": doc_data["_id"]},
-                    {"$set": doc_data},
-                    upsert=True,
+        try:
+            if upsert:
+                collection.bulk_write(
+                    [UpdateOne({"_id": doc["_id"]}, {"$set": doc}, upsert=True) for doc in prepared_docs],
+                    ordered=False,
                 )
-                log_info(f"Upserted document: {doc_data['_id']}")
-            except Exception as e:
-                logger.error(f"Error upserting document '{document.name}': {e}")
+                log_info(f"Upserted {len(prepared_docs)} documents successfully.")
+            else:
+                collection.insert_many(prepared_docs, ordered=False)
+                log_info(f"Inserted {len(prepared_docs)} documents successfully.")
+            if self.wait_after_insert_in_seconds and self.wait_after_insert_in_seconds > 0:
+                time.sleep(self.wait_after_insert_in_seconds)
+        except errors.BulkWriteError as e:
+            logger.warning(f"Bulk write error while writing documents: {e.details}")
+        except Exception as e:
+            logger.error(f"Error writing documents: {e}")
 
     def upsert_available(self) -> bool:
         """Indicate that upsert functionality is available."""
@@ -1138,7 +1145,7 @@ class MongoDb(VectorDb):
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
         """Search for documents asynchronously."""
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.async_get_embedding(query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
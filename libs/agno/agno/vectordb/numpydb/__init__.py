@@ -0,0 +1,9 @@
+from agno.vectordb.numpydb.index import HNSW, IVF, VectorIndex
+from agno.vectordb.numpydb.numpydb import NumpyDb
+
+__all__ = [
+    "HNSW",
+    "IVF",
+    "NumpyDb",
+    "VectorIndex",
+]
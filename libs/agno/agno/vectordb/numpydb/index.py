@@ -0,0 +1,212 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("The `numpy` package is not installed. Please install it via `pip install numpy`.")
+
+# Rows of the matrix compared with the centroids at once while training, to bound the memory used by the scores
+_ASSIGN_CHUNK_ROWS = 65536
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class VectorIndex(ABC):
+    """Approximate nearest neighbour index of a NumpyDb collection.
+
+    The index only selects candidate rows for a query. The collection then scores the candidates exactly and skips
+    deleted rows, so an index never has to support deletes.
+    """
+
+    # Collections with fewer rows are searched by brute force, which is exact and fast enough
+    min_rows: int = 10_000
+
+    @property
+    @abstractmethod
+    def is_built(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def build(self, vectors: np.ndarray, rows: np.ndarray, metric: str) -> None:
+        """Index the vectors of the rows. The metric is "cosine", "max_inner_product" or "l2"."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def add(self, vectors: np.ndarray, rows: np.ndarray) -> None:
+        """Add the vectors of new rows to a built index"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def candidates(self, query: np.ndarray, limit: int) -> np.ndarray:
+        """Return the rows that are likely to be among the `limit` nearest rows of the query"""
+        raise NotImplementedError
+
+    def needs_rebuild(self, rows: int) -> bool:
+        """Whether the index should be rebuilt now that the collection has that many rows"""
+        return False
+
+    @abstractmethod
+    def reset(self) -> None:
+        raise NotImplementedError
+
+
+@dataclass
+class IVF(VectorIndex):
+    """Inverted file index, built with k-means in NumPy.
+
+    The rows are clustered around `nlist` centroids, and a query is only compared with the rows of its `nprobe`
+    nearest clusters. New rows join their nearest cluster, and the clusters are trained again once the collection
+    doubled in size.
+    """
+
+    # Number of clusters. Defaults to sqrt(rows).
+    nlist: Optional[int] = None
+    # Number of clusters searched per query. Higher is more accurate and slower.
+    nprobe: int = 8
+    min_rows: int = 10_000
+    # k-means iterations, and rows sampled per cluster to train it
+    iterations: int = 10
+    training_rows_per_list: int = 256
+    seed: int = 0
+
+    _metric: str = field(default="cosine", init=False, repr=False)
+    _centroids: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _lists: List[List[int]] = field(default_factory=list, init=False, repr=False)
+    _list_arrays: List[Optional[np.ndarray]] = field(default_factory=list, init=False, repr=False)
+    _trained_rows: int = field(default=0, init=False, repr=False)
+
+    @property
+    def is_built(self) -> bool:
+        return self._centroids is not None
+
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        return _normalize(vectors) if self._metric == "cosine" else vectors
+
+    def _scores(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Similarity of prepared vectors with the centroids, higher is closer"""
+        dot = vectors @ centroids.T
+        if self._metric == "l2":
+            return 2 * dot - np.einsum("ij,ij->i", centroids, centroids)
+        return dot
+
+    def _assign(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        assignments = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), _ASSIGN_CHUNK_ROWS):
+            chunk = vectors[start : start + _ASSIGN_CHUNK_ROWS]
+            assignments[start : start + len(chunk)] = np.argmax(self._scores(chunk, centroids), axis=1)
+        return assignments
+
+    def build(self, vectors: np.ndarray, rows: np.ndarray, metric: str) -> None:
+        self._metric = metric
+        prepared = self._prepare(np.asarray(vectors, dtype=np.float32))
+        nlist = self.nlist or int(np.sqrt(len(prepared)))
+        nlist = max(1, min(nlist, len(prepared)))
+
+        rng = np.random.default_rng(self.seed)
+        sample_size = min(len(prepared), nlist * self.training_rows_per_list)
+        sample = prepared[rng.choice(len(prepared), size=sample_size, replace=False)]
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+        for _ in range(self.iterations):
+            assignments = self._assign(sample, centroids)
+            for cluster in range(nlist):
+                members = sample[assignments == cluster]
+                # Empty clusters keep their centroid
+                if len(members) > 0:
+                    centroids[cluster] = members.mean(axis=0)
+            if metric == "cosine":
+                centroids = _normalize(centroids)
+
+        self._centroids = centroids
+        self._lists = [[] for _ in range(nlist)]
+        self._list_arrays = [None] * nlist
+        self._trained_rows = len(prepared)
+        self._add_prepared(prepared, rows)
+
+    def _add_prepared(self, prepared: np.ndarray, rows: np.ndarray) -> None:
+        assert self._centroids is not None
+        for row, cluster in zip(rows.tolist(), self._assign(prepared, self._centroids).tolist()):
+            self._lists[cluster].append(row)
+            self._list_arrays[cluster] = None
+
+    def add(self, vectors: np.ndarray, rows: np.ndarray) -> None:
+        self._add_prepared(self._prepare(np.asarray(vectors, dtype=np.float32)), rows)
+
+    def candidates(self, query: np.ndarray, limit: int) -> np.ndarray:
+        assert self._centroids is not None
+        scores = self._scores(self._prepare(query.reshape(1, -1)), self._centroids)[0]
+        nprobe = min(self.nprobe, len(scores))
+        probes = np.argpartition(-scores, nprobe - 1)[:nprobe]
+        arrays = []
+        for cluster in probes.tolist():
+            array = self._list_arrays[cluster]
+            if array is None:
+                array = np.asarray(self._lists[cluster], dtype=np.int64)
+                self._list_arrays[cluster] = array
+            arrays.append(array)
+        return np.concatenate(arrays)
+
+    def needs_rebuild(self, rows: int) -> bool:
+        return rows > 2 * self._trained_rows
+
+    def reset(self) -> None:
+        self._centroids = None
+        self._lists = []
+        self._list_arrays = []
+        self._trained_rows = 0
+
+
+@dataclass
+class HNSW(VectorIndex):
+    """Hierarchical navigable small world graph, built with `hnswlib`.
+
+    More accurate than IVF at the same speed, at the cost of a slower build and more memory.
+    """
+
+    m: int = 16
+    ef_construction: int = 200
+    # Size of the candidate list of a query. Higher is more accurate and slower.
+    ef_search: int = 64
+    min_rows: int = 10_000
+    seed: int = 0
+
+    _index: Any = field(default=None, init=False, repr=False)
+
+    @property
+    def is_built(self) -> bool:
+        return self._index is not None
+
+    def build(self, vectors: np.ndarray, rows: np.ndarray, metric: str) -> None:
+        try:
+            import hnswlib
+        except ImportError:
+            raise ImportError("The `hnswlib` package is not installed. Please install it via `pip install hnswlib`.")
+
+        space = {"cosine": "cosine", "max_inner_product": "ip", "l2": "l2"}[metric]
+        index = hnswlib.Index(space=space, dim=vectors.shape[1])
+        index.init_index(
+            max_elements=max(len(rows), 1), ef_construction=self.ef_construction, M=self.m, random_seed=self.seed
+        )
+        index.add_items(np.asarray(vectors, dtype=np.float32), rows)
+        index.set_ef(self.ef_search)
+        self._index = index
+
+    def add(self, vectors: np.ndarray, rows: np.ndarray) -> None:
+        required = self._index.get_current_count() + len(rows)
+        if required > self._index.get_max_elements():
+            self._index.resize_index(max(required, 2 * self._index.get_max_elements()))
+        self._index.add_items(np.asarray(vectors, dtype=np.float32), rows)
+
+    def candidates(self, query: np.ndarray, limit: int) -> np.ndarray:
+        k = min(max(limit, 1), self._index.get_current_count())
+        # The candidate list must be at least as long as the number of results
+        self._index.set_ef(max(self.ef_search, k))
+        labels, _ = self._index.knn_query(query.reshape(1, -1).astype(np.float32), k=k)
+        return labels[0].astype(np.int64)
+
+    def reset(self) -> None:
+        self._index = None
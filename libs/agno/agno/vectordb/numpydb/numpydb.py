@@ -0,0 +1,717 @@
+import asyncio
+import json
+import os
+import shutil
+from hashlib import md5
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("The `numpy` package is not installed. Please install it via `pip install numpy`.")
+
+from agno.knowledge.document import Document
+from agno.knowledge.embedder import Embedder
+from agno.knowledge.reranker.base import Reranker
+from agno.utils.log import log_debug, log_error, log_info, log_warning
+from agno.vectordb.base import VectorDb
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb.index import VectorIndex
+from agno.vectordb.pipeline import embed_documents
+
+# Fields of the documents indexed for lookups, besides the metadata
+_FIELDS = ("name", "content_id", "content_hash")
+# Capacity of the embedding matrix when the first rows are added
+_MIN_CAPACITY = 64
+
+_EMBEDDINGS_FILE = "embeddings.npy"
+_DOCUMENTS_FILE = "documents.json"
+# Changes to the documents since documents.json was written, one JSON line per change. The generation of the
+# snapshot is part of the name, so a log is never replayed on the snapshot that replaced it.
+_LOG_FILE = "documents.{generation}.log"
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class NumpyDb(VectorDb):
+    """Vector db embedded in the process, storing the embeddings in a NumPy float32 matrix.
+
+    It needs no service and no dependency besides NumPy, so it suits edge workers, tests and small collections. If
+    `path` is set, the collection is stored in `path/collection`: the embeddings in a memory-mapped `.npy` file, so
+    they are paged in from disk instead of loaded in memory, and the documents in a JSON snapshot and a log of the
+    changes made since, which `optimize()` compacts into a new snapshot. Otherwise the collection lives in memory.
+
+    Searches compare the query with every embedding, unless an `index` (IVF or HNSW) is set and the collection has at
+    least `index.min_rows` rows. Filtered searches compare the query with the rows matching the filters only, which
+    are looked up in indexes of the metadata values.
+    """
+
+    def __init__(
+        self,
+        collection: str = "documents",
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        path: Optional[str] = None,
+        index: Optional[VectorIndex] = None,
+        reranker: Optional[Reranker] = None,
+    ):
+        self.collection_name: str = collection
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        self.distance: Distance = distance
+
+        # Directory of the collection. None keeps the collection in memory.
+        self.path: Optional[Path] = Path(path) / collection if path is not None else None
+        # Approximate nearest neighbour index. None searches by brute force.
+        self.index: Optional[VectorIndex] = index
+        self.reranker: Optional[Reranker] = reranker
+
+        self._lock = RLock()
+        self._loaded = False
+        # Generation of the snapshot of the documents on disk, and number of changes logged since
+        self._generation = 0
+        self._log_entries = 0
+        self._init_state()
+
+    def _init_state(self) -> None:
+        # Embeddings, with room for more rows than `_count`
+        self._vectors: Optional[np.ndarray] = None
+        # Norms of the embeddings: their length for cosine, their squared length for l2
+        self._norms: np.ndarray = np.zeros(0, dtype=np.float32)
+        self._live: np.ndarray = np.zeros(0, dtype=bool)
+        self._count = 0
+        self._deleted = 0
+        # Documents by row. Deleted rows are None until the collection is optimized.
+        self._records: List[Optional[Dict[str, Any]]] = []
+        self._rows_by_id: Dict[str, int] = {}
+        # Rows by value of each field and metadata key
+        self._field_index: Dict[str, Dict[Any, Set[int]]] = {field: {} for field in _FIELDS}
+        self._metadata_index: Dict[str, Dict[Any, Set[int]]] = {}
+        if self.index is not None:
+            self.index.reset()
+
+    # --- Storage ---
+
+    @property
+    def _embeddings_file(self) -> Path:
+        assert self.path is not None
+        return self.path / _EMBEDDINGS_FILE
+
+    @property
+    def _documents_file(self) -> Path:
+        assert self.path is not None
+        return self.path / _DOCUMENTS_FILE
+
+    @property
+    def _log_file(self) -> Path:
+        assert self.path is not None
+        return self.path / _LOG_FILE.format(generation=self._generation)
+
+    def _load(self) -> None:
+        """Load the collection from disk on first use"""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if self.path is not None and self._documents_file.exists():
+                log_debug(f"Loading collection {self.collection_name} from {self.path}")
+                with open(self._documents_file) as f:
+                    data = json.load(f)
+                records: List[Optional[Dict[str, Any]]] = data["documents"]
+                self._generation = data.get("generation", 0)
+                self._replay_log(records)
+                self._count = len(records)
+                self._records = records
+                if self._embeddings_file.exists():
+                    self._vectors = np.load(self._embeddings_file, mmap_mode="r+")
+                    self._live = np.zeros(len(self._vectors), dtype=bool)
+                    self._norms = np.zeros(len(self._vectors), dtype=np.float32)
+                    if self._count > 0:
+                        self._norms[: self._count] = self._compute_norms(self._vectors[: self._count])
+                for row, record in enumerate(records):
+                    if record is None:
+                        self._deleted += 1
+                    else:
+                        self._live[row] = True
+                        self._index_row(row, record)
+            self._loaded = True
+
+    def _replay_log(self, records: List[Optional[Dict[str, Any]]]) -> None:
+        """Apply the changes logged since the snapshot to its documents"""
+        self._log_entries = 0
+        if not self._log_file.exists():
+            return
+        with open(self._log_file) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A write interrupted by a crash, the changes before it are complete
+                    log_warning(f"Ignoring an incomplete change at the end of {self._log_file}")
+                    break
+                if entry["op"] == "add":
+                    records.extend(entry["documents"])
+                elif entry["op"] == "delete":
+                    for row in entry["rows"]:
+                        records[row] = None
+                elif entry["op"] == "update":
+                    for row, meta_data in entry["meta_data"]:
+                        record = records[row]
+                        if record is not None:
+                            record["meta_data"] = meta_data
+                self._log_entries += 1
+
+    def _flush_embeddings(self) -> None:
+        assert self.path is not None
+        self.path.mkdir(parents=True, exist_ok=True)
+        if isinstance(self._vectors, np.memmap):
+            self._vectors.flush()
+
+    def _save(self) -> None:
+        """Write a snapshot of the documents to disk and start a new log, once the embeddings they refer to are
+        flushed"""
+        if self.path is None:
+            return
+        self._flush_embeddings()
+        previous_log = self._log_file
+        temp_file = self._documents_file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump({"generation": self._generation + 1, "documents": self._records[: self._count]}, f, default=str)
+        os.replace(temp_file, self._documents_file)
+        self._generation += 1
+        self._log_entries = 0
+        previous_log.unlink(missing_ok=True)
+
+    def _log_changes(self, *entries: Dict[str, Any]) -> None:
+        """Append changes of the documents to the log, once the embeddings they refer to are flushed"""
+        if self.path is None or not entries:
+            return
+        if not self._documents_file.exists():
+            # The log is replayed on a snapshot, so the first changes are saved as one
+            self._save()
+            return
+        self._flush_embeddings()
+        with open(self._log_file, "a") as f:
+            f.write("".join(json.dumps(entry, default=str) + "\n" for entry in entries))
+        self._log_entries += len(entries)
+
+    def _allocate(self, capacity: int, dimensions: int) -> np.ndarray:
+        if self.path is None:
+            return np.zeros((capacity, dimensions), dtype=np.float32)
+        self.path.mkdir(parents=True, exist_ok=True)
+        temp_file = self._embeddings_file.with_suffix(".tmp.npy")
+        vectors = np.lib.format.open_memmap(temp_file, mode="w+", dtype=np.float32, shape=(capacity, dimensions))
+        if self._vectors is not None and self._count > 0:
+            vectors[: self._count] = self._vectors[: self._count]
+        vectors.flush()
+        # The memory map follows the file when it is renamed
+        os.replace(temp_file, self._embeddings_file)
+        return vectors
+
+    def _reserve(self, rows: int, dimensions: int) -> None:
+        """Make room for `rows` more rows, doubling the capacity so appending rows one by one is amortized"""
+        if self._vectors is not None and self._vectors.shape[1] != dimensions:
+            raise ValueError(
+                f"Expected embeddings of {self._vectors.shape[1]} dimensions, got {dimensions}. "
+                "Use the same embedder for the whole collection."
+            )
+        capacity = 0 if self._vectors is None else len(self._vectors)
+        required = self._count + rows
+        if required <= capacity:
+            return
+        capacity = max(required, 2 * capacity, _MIN_CAPACITY)
+        self._vectors = self._allocate(capacity, dimensions)
+        self._norms = np.concatenate([self._norms[: self._count], np.zeros(capacity - self._count, dtype=np.float32)])
+        self._live = np.concatenate([self._live[: self._count], np.zeros(capacity - self._count, dtype=bool)])
+
+    def _compute_norms(self, vectors: np.ndarray) -> np.ndarray:
+        if self.distance == Distance.cosine:
+            return np.linalg.norm(vectors, axis=1)
+        if self.distance == Distance.l2:
+            return np.einsum("ij,ij->i", vectors, vectors)
+        return np.zeros(len(vectors), dtype=np.float32)
+
+    @property
+    def _metric(self) -> str:
+        return self.distance.value if isinstance(self.distance, Distance) else str(self.distance)
+
+    # --- Column indexes ---
+
+    def _index_row(self, row: int, record: Dict[str, Any], remove: bool = False) -> None:
+        if remove:
+            self._rows_by_id.pop(record["id"], None)
+        else:
+            self._rows_by_id[record["id"]] = row
+
+        columns = [(self._field_index[field], record.get(field)) for field in _FIELDS]
+        for key, value in (record.get("meta_data") or {}).items():
+            columns.append((self._metadata_index.setdefault(key, {}), value))
+        for column, value in columns:
+            # Unhashable values, e.g. lists, are not indexed and can't be filtered on
+            if value is None or not _hashable(value):
+                continue
+            if remove:
+                rows = column.get(value)
+                if rows is not None:
+                    rows.discard(row)
+                    if not rows:
+                        del column[value]
+            else:
+                column.setdefault(value, set()).add(row)
+
+    def _lookup(self, column: Dict[Any, Set[int]], value: Any) -> Set[int]:
+        # A list matches any of its values
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        rows: Set[int] = set()
+        for item in values:
+            if _hashable(item):
+                rows.update(column.get(item, ()))
+        return rows
+
+    def _filter_rows(self, filters: Dict[str, Any]) -> Set[int]:
+        """Return the live rows whose metadata match all the filters"""
+        matches: Optional[Set[int]] = None
+        for key, value in filters.items():
+            rows = self._lookup(self._metadata_index.get(key, {}), value)
+            matches = rows if matches is None else matches & rows
+            if not matches:
+                return set()
+        return matches if matches is not None else set(np.flatnonzero(self._live[: self._count]).tolist())
+
+    def _rows_with(self, field: str, value: Any) -> Set[int]:
+        return set(self._field_index[field].get(value, ()))
+
+    # --- Writes ---
+
+    def _prepare_record(
+        self, content_hash: str, document: Document, filters: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        cleaned_content = document.content.replace("\x00", "\ufffd")
+        meta_data = dict(document.meta_data or {})
+        if filters:
+            meta_data.update(filters)
+        return {
+            "id": md5(cleaned_content.encode()).hexdigest(),
+            "name": document.name,
+            "content": cleaned_content,
+            "meta_data": meta_data,
+            "content_id": document.content_id,
+            "content_hash": content_hash,
+            "usage": document.usage,
+        }
+
+    def _add_documents(
+        self,
+        content_hash: str,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        replace: bool = False,
+    ) -> None:
+        """Add embedded documents. Documents whose content is already stored are skipped, or replace the stored
+        document if `replace` is set."""
+        self._load()
+        with self._lock:
+            removed_rows: List[int] = []
+            if replace:
+                removed_rows.extend(self._remove_rows(self._rows_with("content_hash", content_hash)))
+
+            records: Dict[str, Dict[str, Any]] = {}
+            embeddings: List[List[float]] = []
+            for document in documents:
+                if not document.embedding:
+                    log_warning(f"Skipping document without embedding: {document.name}")
+                    continue
+                record = self._prepare_record(content_hash, document, filters)
+                row = self._rows_by_id.get(record["id"])
+                if record["id"] in records or (row is not None and not replace):
+                    log_debug(f"Skipping duplicate document: {document.name}")
+                    continue
+                if row is not None:
+                    removed_rows.extend(self._remove_rows({row}))
+                records[record["id"]] = record
+                embeddings.append(document.embedding)
+
+            if records:
+                vectors = np.asarray(embeddings, dtype=np.float32)
+                self._reserve(len(vectors), vectors.shape[1])
+                assert self._vectors is not None
+                start, end = self._count, self._count + len(vectors)
+                self._vectors[start:end] = vectors
+                self._norms[start:end] = self._compute_norms(vectors)
+                self._live[start:end] = True
+                for row, record in enumerate(records.values(), start=start):
+                    self._records.append(record)
+                    self._index_row(row, record)
+                self._count = end
+                if self.index is not None and self.index.is_built:
+                    self.index.add(vectors, np.arange(start, end))
+
+            changes = []
+            if removed_rows:
+                changes.append({"op": "delete", "rows": removed_rows})
+            if records:
+                changes.append({"op": "add", "documents": list(records.values())})
+            self._log_changes(*changes)
+            log_debug(f"Committed {len(records)} documents")
+
+    def _remove_rows(self, rows: Set[int]) -> List[int]:
+        """Remove the documents of the rows, returning the rows that held a document"""
+        removed = []
+        for row in sorted(rows):
+            record = self._records[row]
+            if record is None:
+                continue
+            self._index_row(row, record, remove=True)
+            self._records[row] = None
+            self._live[row] = False
+            removed.append(row)
+        self._deleted += len(removed)
+        return removed
+
+    def _delete_rows(self, rows: Set[int]) -> bool:
+        self._load()
+        with self._lock:
+            removed = self._remove_rows(rows)
+            if removed:
+                self._log_changes({"op": "delete", "rows": removed})
+        log_debug(f"Deleted {len(removed)} documents")
+        return len(removed) > 0
+
+    # --- Embedding ---
+
+    async def _async_embed_documents(self, documents: List[Document]) -> None:
+        if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
+            from agno.knowledge.embedder.batch import is_rate_limit_error
+
+            try:
+                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(
+                    [doc.content for doc in documents]
+                )
+                for j, document in enumerate(documents):
+                    if j < len(embeddings):
+                        document.embedding = embeddings[j]
+                        document.usage = usages[j] if j < len(usages) else None
+                return
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    log_error(f"Rate limit detected during batch embedding. {e}")
+                    raise
+                log_warning(f"Async batch embedding failed, falling back to individual embeddings: {e}")
+
+        results = await asyncio.gather(
+            *[document.async_embed(embedder=self.embedder) for document in documents], return_exceptions=True
+        )
+        for document, result in zip(documents, results):
+            if isinstance(result, Exception):
+                log_error(f"Error embedding document '{document.name}': {result}")
+
+    # --- VectorDb interface ---
+
+    def create(self) -> None:
+        """Create the collection, or load it from disk if it exists"""
+        self._load()
+        if self.path is not None and not self._documents_file.exists():
+            log_debug(f"Creating collection: {self.collection_name}")
+            with self._lock:
+                self._save()
+
+    async def async_create(self) -> None:
+        await self.run_in_executor(self.create)
+
+    def exists(self) -> bool:
+        if self.path is not None:
+            return self._documents_file.exists()
+        return self._loaded
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def name_exists(self, name: str) -> bool:
+        self._load()
+        return bool(self._field_index["name"].get(name))
+
+    async def async_name_exists(self, name: str) -> bool:
+        return self.name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        self._load()
+        return id in self._rows_by_id
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        self._load()
+        return bool(self._field_index["content_hash"].get(content_hash))
+
+    def get_count(self) -> int:
+        self._load()
+        return self._count - self._deleted
+
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents, skipping the documents whose content is already stored.
+
+        Args:
+            content_hash (str): Hash of the content the documents were read from
+            documents (List[Document]): List of documents to insert
+            filters (Optional[Dict[str, Any]]): Filters to merge with document metadata
+        """
+        log_info(f"Inserting {len(documents)} documents")
+        embed_documents(self.embedder, documents)
+        self._add_documents(content_hash, documents, filters)
+
+    async def async_insert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        log_info(f"Async Inserting {len(documents)} documents")
+        await self._async_embed_documents(documents)
+        await self.run_in_executor(self._add_documents, content_hash, documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Replace the documents of the content with the given documents.
+
+        Args:
+            content_hash (str): Hash of the content the documents were read from
+            documents (List[Document]): List of documents to upsert
+            filters (Optional[Dict[str, Any]]): Filters to merge with document metadata
+        """
+        log_info(f"Upserting {len(documents)} documents")
+        embed_documents(self.embedder, documents)
+        self._add_documents(content_hash, documents, filters, replace=True)
+
+    async def async_upsert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        log_info(f"Async Upserting {len(documents)} documents")
+        await self._async_embed_documents(documents)
+        await self.run_in_executor(self._add_documents, content_hash, documents, filters, True)
+
+    def _nearest(
+        self, embedding: List[float], limit: int, filters: Optional[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], np.ndarray, float]]:
+        """Return the documents nearest to the embedding, with their embedding and score (higher is closer)"""
+        self._load()
+        query = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            if self._vectors is None or self._count == self._deleted:
+                return []
+            live_count = self._count - self._deleted
+            if self.index is not None and live_count >= self.index.min_rows:
+                if not self.index.is_built or self.index.needs_rebuild(live_count):
+                    log_debug(f"Building {self.index.__class__.__name__} index of {live_count} rows")
+                    rows = np.flatnonzero(self._live[: self._count])
+                    self.index.build(self._vectors[rows], rows, self._metric)
+
+            # Snapshot the collection, so the exact scoring below runs without holding the lock. Rows are only
+            # appended, or replaced as a whole when the collection is optimized.
+            vectors, norms, count = self._vectors, self._norms, self._count
+            live = self._live[:count].copy()
+            records = self._records
+            candidates: Optional[np.ndarray] = None
+            if filters:
+                candidates = np.fromiter(self._filter_rows(filters), dtype=np.int64)
+            elif self.index is not None and self.index.is_built:
+                # Ask for enough rows to make up for deleted rows still in the index
+                candidates = self.index.candidates(query, limit + self._deleted)
+                candidates = candidates[live[candidates]]
+                if len(candidates) < min(limit, live_count):
+                    candidates = None
+
+        if candidates is None:
+            scores = self._scores(vectors[:count], norms[:count], query)
+            scores[~live] = -np.inf
+            rows = np.arange(count)
+        else:
+            if len(candidates) == 0:
+                return []
+            rows = candidates
+            scores = self._scores(vectors[rows], norms[rows], query)
+
+        limit = min(limit, int(np.count_nonzero(scores > -np.inf)))
+        if limit <= 0:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        nearest = []
+        for i in top.tolist():
+            row = int(rows[i])
+            # Rows deleted since the snapshot are skipped
+            record = records[row]
+            if record is not None:
+                nearest.append((record, vectors[row], float(scores[i])))
+        return nearest
+
+    def _scores(self, vectors: np.ndarray, norms: np.ndarray, query: np.ndarray) -> np.ndarray:
+        dot = vectors @ query
+        if self.distance == Distance.cosine:
+            return dot / np.maximum(norms * np.linalg.norm(query), 1e-12)
+        if self.distance == Distance.l2:
+            # Negative squared distance, without the norm of the query which is the same for all rows
+            return 2 * dot - norms
+        return dot
+
+    def search_by_embedding(
+        self, embedding: List[float], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Return the documents nearest to the embedding"""
+        return [
+            Document(
+                id=record["id"],
+                name=record["name"],
+                meta_data=dict(record["meta_data"]),
+                content=record["content"],
+                embedder=self.embedder,
+                embedding=vector.tolist(),
+                usage=record.get("usage"),
+                content_id=record.get("content_id"),
+            )
+            for record, vector, _ in self._nearest(embedding, limit, filters)
+        ]
+
+    def _search(
+        self, query: str, embedding: List[float], limit: int, filters: Optional[Dict[str, Any]]
+    ) -> List[Document]:
+        search_results = self.search_by_embedding(embedding, limit=limit, filters=filters)
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Search for the documents most similar to the query.
+
+        Args:
+            query (str): Query to search for
+            limit (int): Number of results to return
+            filters (Optional[Dict[str, Any]]): Metadata values the results must have. A list matches any of its values.
+        """
+        embedding = self.embedder.get_embedding(query)
+        if not embedding:
+            log_error(f"Error getting embedding for Query: {query}")
+            return []
+        return self._search(query, embedding, limit, filters)
+
+    def embedding_search_available(self) -> bool:
+        return True
+
+    def search_with_embedding(
+        self, query: str, embedding: List[float], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        return self._search(query, embedding, limit, filters)
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        embedding = await self.embedder.async_get_embedding(query)
+        if not embedding:
+            log_error(f"Error getting embedding for Query: {query}")
+            return []
+        # Scoring a large collection takes long enough to stall the event loop
+        return await self.run_in_executor(self._search, query, embedding, limit, filters)
+
+    def optimize(self) -> None:
+        """Drop the deleted rows from the storage, compact the log of changes into a new snapshot, and build the
+        index"""
+        self._load()
+        with self._lock:
+            if self._vectors is not None and self._deleted > 0:
+                log_debug(f"Compacting collection {self.collection_name}: dropping {self._deleted} deleted rows")
+                rows = np.flatnonzero(self._live[: self._count])
+                vectors = np.array(self._vectors[rows])
+                records = [self._records[row] for row in rows.tolist()]
+                self._init_state()
+                self._reserve(len(vectors), vectors.shape[1])
+                assert self._vectors is not None
+                self._vectors[: len(vectors)] = vectors
+                self._norms[: len(vectors)] = self._compute_norms(vectors)
+                self._live[: len(vectors)] = True
+                self._count = len(vectors)
+                self._records = records
+                for row, record in enumerate(records):
+                    assert record is not None
+                    self._index_row(row, record)
+                self._save()
+            elif self._log_entries > 0:
+                self._save()
+            if self.index is not None and self._vectors is not None and self._count > 0:
+                self.index.build(self._vectors[: self._count], np.arange(self._count), self._metric)
+
+    def drop(self) -> None:
+        """Delete the collection, including its files"""
+        with self._lock:
+            self._init_state()
+            if self.path is not None and self.path.exists():
+                log_debug(f"Deleting collection: {self.collection_name}")
+                shutil.rmtree(self.path)
+            self._generation = 0
+            self._log_entries = 0
+            self._loaded = False
+
+    async def async_drop(self) -> None:
+        await self.run_in_executor(self.drop)
+
+    def delete(self) -> bool:
+        """Delete all documents, keeping the collection"""
+        self._load()
+        with self._lock:
+            self._init_state()
+            if self.path is not None:
+                self._embeddings_file.unlink(missing_ok=True)
+                self._save()
+        return True
+
+    def delete_by_id(self, id: str) -> bool:
+        self._load()
+        row = self._rows_by_id.get(id)
+        return self._delete_rows({row}) if row is not None else False
+
+    def delete_by_name(self, name: str) -> bool:
+        self._load()
+        return self._delete_rows(self._rows_with("name", name))
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        self._load()
+        return self._delete_rows(self._rows_with("content_id", content_id))
+
+    def _delete_by_content_hash(self, content_hash: str) -> bool:
+        self._load()
+        return self._delete_rows(self._rows_with("content_hash", content_hash))
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        self._load()
+        if not metadata:
+            return False
+        return self._delete_rows(self._filter_rows(metadata))
+
+    def update_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None:
+        """Merge the metadata into the metadata of the documents of a content"""
+        self._load()
+        with self._lock:
+            rows = self._rows_with("content_id", content_id)
+            updated = []
+            for row in sorted(rows):
+                record = self._records[row]
+                if record is None:
+                    continue
+                self._index_row(row, record, remove=True)
+                record["meta_data"] = {**(record.get("meta_data") or {}), **metadata}
+                self._index_row(row, record)
+                updated.append((row, record["meta_data"]))
+            if updated:
+                self._log_changes({"op": "update", "meta_data": updated})
+        log_debug(f"Updated metadata of {len(rows)} documents with content_id {content_id}")
@@ -296,9 +296,8 @@ class PgVector(VectorDb):
         """
         try:
             with self.Session() as sess:
-                for i in range(0, len(documents), batch_size):
-                    batch_docs = documents[i : i + batch_size]
-                    log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
+
+                def insert_batch(batch_docs: List[Document]) -> None:
                     try:
                         # Prepare documents for insertion
                         batch_records = []
@@ -314,9 +313,12 @@ class PgVector(VectorDb):
                         sess.commit()  # Commit batch independently
                         log_info(f"Inserted batch of {len(batch_records)} documents.")
                     except Exception as e:
-                        logger.error(f"Error with batch starting at index {i}: {e}")
+                        logger.error(f"Error with batch of {len(batch_docs)} documents: {e}")
                         sess.rollback()  # Rollback the current batch if there's an error
                         raise
+
+                # The next batch is embedded while the current one is inserted
+                self.write_in_batches(documents, insert_batch, batch_size=batch_size)
         except Exception as e:
             logger.error(f"Error inserting documents: {e}")
             raise
@@ -424,9 +426,8 @@ class PgVector(VectorDb):
         """
         try:
             with self.Session() as sess:
-                for i in range(0, len(documents), batch_size):
-                    batch_docs = documents[i : i + batch_size]
-                    log_info(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
+
+                def upsert_batch(batch_docs: List[Document]) -> None:
                     try:
                         # Prepare documents for upserting
                         batch_records_dict: Dict[str, Dict[str, Any]] = {}  # Use dict to deduplicate by ID
@@ -440,7 +441,7 @@ class PgVector(VectorDb):
                         batch_records = list(batch_records_dict.values())
                         if not batch_records:
                             log_info("No valid records to upsert in this batch.")
-                            continue
+                            return
 
                         # Upsert the batch of records
                         insert_stmt = postgresql.insert(self.table).values(batch_records)
@@ -461,9 +462,12 @@ class PgVector(VectorDb):
                         sess.commit()  # Commit batch independently
                         log_info(f"Upserted batch of {len(batch_records)} documents.")
                     except Exception as e:
-                        logger.error(f"Error with batch starting at index {i}: {e}")
+                        logger.error(f"Error with batch of {len(batch_docs)} documents: {e}")
                         sess.rollback()  # Rollback the current batch if there's an error
                         raise
+
+                # The next batch is embedded while the current one is upserted
+                self.write_in_batches(documents, upsert_batch, batch_size=batch_size)
         except Exception as e:
             logger.error(f"Error upserting documents: {e}")
             raise
@@ -471,7 +475,9 @@ class PgVector(VectorDb):
     def _get_document_record(
         self, doc: Document, filters: Optional[Dict[str, Any]] = None, content_hash: str = ""
     ) -> Dict[str, Any]:
-        doc.embed(embedder=self.embedder)
+        # Documents written through `write_in_batches` are already embedded
+        if doc.embedding is None:
+            doc.embed(embedder=self.embedder)
         cleaned_content = self._clean_content(doc.content)
         record_id = doc.id or content_hash
 
@@ -686,13 +692,37 @@ class PgVector(VectorDb):
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
+    def embedding_search_available(self) -> bool:
+        return self.search_type in [SearchType.vector, SearchType.hybrid]
+
+    def search_with_embedding(
+        self, query: str, embedding: List[float], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Perform a vector or hybrid search with an embedding of the query computed by the caller."""
+        if self.search_type == SearchType.hybrid:
+            return self.hybrid_search(query=query, limit=limit, filters=filters, query_embedding=embedding)
+        return self.vector_search(query=query, limit=limit, filters=filters, query_embedding=embedding)
+
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        """Search asynchronously. The query is embedded with the async API of the embedder, and only the database
+        query runs in a thread."""
+        if not self.embedding_search_available():
+            return await self.run_in_executor(self.search, query, limit, filters)
+        query_embedding = await self.embedder.async_get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+        return await self.run_in_executor(self.search_with_embedding, query, query_embedding, limit, filters)
 
-    def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[Document]:
         """
         Perform a vector similarity search.
 
@@ -700,13 +730,15 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            query_embedding (Optional[List[float]]): Embedding of the query, if already computed.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            if query_embedding is None:
+                query_embedding = self.embedder.get_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
@@ -883,6 +915,7 @@ class PgVector(VectorDb):
         query: str,
         limit: int = 5,
         filters: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Document]:
         """
         Perform a hybrid search combining vector similarity and full-text search.
@@ -891,13 +924,15 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            query_embedding (Optional[List[float]]): Embedding of the query, if already computed.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            if query_embedding is None:
+                query_embedding = self.embedder.get_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
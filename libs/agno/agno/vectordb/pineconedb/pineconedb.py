@@ -265,9 +265,24 @@ class PineconeDb(VectorDb):
 
         """
 
+        # Documents are embedded batch by batch, the next batch while the current one is upserted
+        self.write_in_batches(
+            documents,
+            lambda batch: self._write_batch(content_hash, batch, filters, namespace, show_progress),
+            batch_size=batch_size,
+        )
+
+    def _write_batch(
+        self,
+        content_hash: str,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None,
+        show_progress: bool = False,
+    ) -> None:
+        """Upsert a batch of embedded documents in a single request."""
         vectors = []
         for document in documents:
-            document.embed(embedder=self.embedder)
             document.meta_data["text"] = document.content
             # Include name and content_id in metadata
             metadata = document.meta_data.copy()
@@ -293,7 +308,6 @@ class PineconeDb(VectorDb):
         self.index.upsert(
             vectors=vectors,
             namespace=namespace or self.namespace,
-            batch_size=batch_size,
             show_progress=show_progress,
         )
 
@@ -518,7 +532,7 @@ class PineconeDb(VectorDb):
         include_values: Optional[bool] = None,
     ) -> List[Document]:
         """Search for similar documents in the index asynchronously."""
-        return await asyncio.to_thread(self.search, query, limit, filters, namespace, include_values)
+        return await self.run_in_executor(self.search, query, limit, filters, namespace, include_values)
 
     def optimize(self) -> None:
         """Optimize the index.
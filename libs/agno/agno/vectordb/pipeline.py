@@ -0,0 +1,121 @@
+"""Pipelined bulk writes for the sync insert and upsert paths of vector dbs.
+
+Documents are embedded and written in batches. While a batch is written to the vector db, the next batch is embedded
+in a background thread, so the embedding requests and the database writes overlap instead of taking turns.
+"""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from agno.knowledge.document import Document
+from agno.knowledge.embedder import Embedder
+from agno.utils.log import log_error, log_warning
+
+
+@dataclass
+class WriteStats:
+    """Throughput of a bulk write"""
+
+    documents: int = 0
+    batches: int = 0
+    # Time spent embedding and writing, in seconds. They overlap, so their sum can exceed the total time.
+    embedding_time: float = 0.0
+    write_time: float = 0.0
+    total_time: float = 0.0
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.documents / self.total_time if self.total_time > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "documents": self.documents,
+            "batches": self.batches,
+            "embedding_time": self.embedding_time,
+            "write_time": self.write_time,
+            "total_time": self.total_time,
+            "docs_per_second": self.docs_per_second,
+        }
+
+
+def embed_documents(embedder: Embedder, documents: List[Document]) -> None:
+    """Embed documents with a single batch call when the embedder supports it, and one by one otherwise.
+
+    Documents that could not be embedded are left without embedding. Rate limit errors are raised, as falling back to
+    one request per document would make them worse.
+    """
+    if not documents:
+        return
+    if embedder.enable_batch and hasattr(embedder, "get_embeddings_batch_and_usage"):
+        from agno.knowledge.embedder.batch import is_rate_limit_error
+
+        try:
+            embeddings, usages = embedder.get_embeddings_batch_and_usage([document.content for document in documents])
+            for j, document in enumerate(documents):
+                if j < len(embeddings):
+                    document.embedding = embeddings[j]
+                    document.usage = usages[j] if j < len(usages) else None
+            return
+        except Exception as e:
+            if is_rate_limit_error(e):
+                log_error(f"Rate limit detected during batch embedding. {e}")
+                raise
+            log_warning(f"Batch embedding failed, falling back to individual embeddings: {e}")
+
+    for document in documents:
+        try:
+            document.embed(embedder=embedder)
+        except Exception as e:
+            log_error(f"Error embedding document '{document.name}': {e}")
+
+
+def write_documents(
+    documents: Sequence[Document],
+    write_batch: Callable[[List[Document]], Any],
+    embed_batch: Optional[Callable[[List[Document]], Any]] = None,
+    batch_size: int = 100,
+) -> WriteStats:
+    """Embed and write documents in batches, embedding the next batch while the current one is written.
+
+    Args:
+        documents: Documents to write
+        write_batch: Writes a batch of embedded documents to the vector db
+        embed_batch: Embeds a batch of documents. None if the documents don't need embedding.
+        batch_size: Number of documents per batch
+    """
+    stats = WriteStats()
+    start = time.perf_counter()
+    batches = [list(documents[i : i + batch_size]) for i in range(0, len(documents), max(batch_size, 1))]
+    if not batches:
+        return stats
+
+    def timed_embed(batch: List[Document]) -> float:
+        embed_start = time.perf_counter()
+        if embed_batch is not None:
+            embed_batch(batch)
+        return time.perf_counter() - embed_start
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="agno-embed") as executor:
+        pending: Optional[Future] = executor.submit(copy_context().run, timed_embed, batches[0])
+        try:
+            for i, batch in enumerate(batches):
+                assert pending is not None
+                stats.embedding_time += pending.result()
+                pending = (
+                    executor.submit(copy_context().run, timed_embed, batches[i + 1]) if i + 1 < len(batches) else None
+                )
+
+                write_start = time.perf_counter()
+                write_batch(batch)
+                stats.write_time += time.perf_counter() - write_start
+                stats.documents += len(batch)
+                stats.batches += 1
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    stats.total_time = time.perf_counter() - start
+    return stats
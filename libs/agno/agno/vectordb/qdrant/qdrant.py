@@ -312,7 +312,7 @@ class Qdrant(VectorDb):
         content_hash: str,
         documents: List[Document],
         filters: Optional[Dict[str, Any]] = None,
-        batch_size: int = 10,
+        batch_size: Optional[int] = None,
     ) -> None:
         """
         Insert documents into the database.
@@ -320,35 +320,52 @@ class Qdrant(VectorDb):
         Args:
             documents (List[Document]): List of documents to insert
             filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
-            batch_size (int): Batch size for inserting documents
+            batch_size (Optional[int]): Number of documents written per request. Defaults to `write_batch_size`.
         """
         log_debug(f"Inserting {len(documents)} documents")
+        # Dense embeddings are only needed for vector and hybrid search. The next batch is embedded while the current
+        # one is written.
+        embed = self.search_type in [SearchType.vector, SearchType.hybrid]
+        self.write_in_batches(
+            documents, lambda batch: self._write_batch(content_hash, batch, filters), embed=embed, batch_size=batch_size
+        )
+
+    def _skip_unembedded(self, documents: List[Document]) -> List[Document]:
+        """Leave out the documents that could not be embedded, as a point without its dense vector fails the whole
+        request"""
+        if self.search_type not in [SearchType.vector, SearchType.hybrid]:
+            return documents
+        embedded = [document for document in documents if document.embedding is not None]
+        if len(embedded) < len(documents):
+            log_warning(f"Skipping {len(documents) - len(embedded)} documents that could not be embedded")
+        return embedded
+
+    def _write_batch(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Write a batch of embedded documents in a single request."""
+        documents = self._skip_unembedded(documents)
+        sparse_vectors: List[Any] = []
+        if self.search_type in [SearchType.keyword, SearchType.hybrid]:
+            sparse_vectors = list(self.sparse_encoder.embed([document.content for document in documents]))  # type: ignore
+
         points = []
-        for document in documents:
+        for i, document in enumerate(documents):
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
-            # TODO(v2.0.0): Remove conditional vector naming logic
-            if self.use_named_vectors:
-                vector = {self.dense_vector_name: document.embedding}
-            else:
-                vector = document.embedding  # type: ignore
-
+            vector: Any
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
-                vector = document.embedding  # type: ignore
+                vector = document.embedding
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
-                    vector[self.sparse_vector_name] = next(
-                        iter(self.sparse_encoder.embed([document.content]))
-                    ).as_object()  # type: ignore
+                    vector[self.sparse_vector_name] = sparse_vectors[i].as_object()
 
             # Create payload with document properties
             payload = {
@@ -434,6 +451,8 @@ class Qdrant(VectorDb):
                     if self.search_type in [SearchType.vector, SearchType.hybrid]:
                         doc.embed(embedder=self.embedder)
 
+        documents = self._skip_unembedded(documents)
+
         async def process_document(document):
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
@@ -625,7 +644,7 @@ class Qdrant(VectorDb):
         limit: int,
         filters: Optional[Dict[str, Any]],
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = await self.embedder.async_get_embedding(query)
 
         # TODO(v2.0.0): Remove this conditional and always use named vectors
         if self.use_named_vectors:
@@ -674,7 +693,7 @@ class Qdrant(VectorDb):
         limit: int,
         filters: Optional[Dict[str, Any]],
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = await self.embedder.async_get_embedding(query)
         sparse_embedding = next(iter(self.sparse_encoder.embed([query]))).as_object()
         call = await self.async_client.query_points(
             collection_name=self.collection,
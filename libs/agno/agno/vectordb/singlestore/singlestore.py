@@ -165,7 +165,7 @@ class SingleStore(VectorDb):
         content_hash: str,
         documents: List[Document],
         filters: Optional[Dict[str, Any]] = None,
-        batch_size: int = 10,
+        batch_size: Optional[int] = None,
     ) -> None:
         """
         Insert documents into the table.
@@ -173,38 +173,10 @@ class SingleStore(VectorDb):
         Args:
             documents (List[Document]): List of documents to insert.
             filters (Optional[Dict[str, Any]]): Optional filters for the insert.
-            batch_size (int): Number of documents to insert in each batch.
+            batch_size (Optional[int]): Number of documents to insert in each batch. Defaults to `write_batch_size`.
         """
-        with self.Session.begin() as sess:
-            counter = 0
-            for document in documents:
-                document.embed(embedder=self.embedder)
-                cleaned_content = document.content.replace("\x00", "\ufffd")
-                record_id = md5(cleaned_content.encode()).hexdigest()
-                _id = document.id or record_id
-
-                meta_data_json = json.dumps(document.meta_data)
-                usage_json = json.dumps(document.usage)
-
-                # Convert embedding list to SingleStore VECTOR format
-                embeddings = f"[{','.join(map(str, document.embedding))}]" if document.embedding else None
-
-                stmt = mysql.insert(self.table).values(
-                    id=_id,
-                    name=document.name,
-                    meta_data=meta_data_json,
-                    content=cleaned_content,
-                    embedding=embeddings,
-                    usage=usage_json,
-                    content_hash=content_hash,
-                    content_id=document.content_id,
-                )
-                sess.execute(stmt)
-                counter += 1
-                log_debug(f"Inserted document: {document.name} ({document.meta_data})")
-
-            sess.commit()
-            log_debug(f"Committed {counter} documents")
+        # Documents are embedded batch by batch, the next batch while the current one is inserted
+        self.write_in_batches(documents, lambda batch: self._write_batch(content_hash, batch), batch_size=batch_size)
 
     def upsert_available(self) -> bool:
         """Indicate that upsert functionality is available."""
@@ -215,7 +187,7 @@ class SingleStore(VectorDb):
         content_hash: str,
         documents: List[Document],
         filters: Optional[Dict[str, Any]] = None,
-        batch_size: int = 20,
+        batch_size: Optional[int] = None,
     ) -> None:
         if self.content_hash_exists(content_hash):
             self._delete_by_content_hash(content_hash)
@@ -226,7 +198,7 @@ class SingleStore(VectorDb):
         content_hash: str,
         documents: List[Document],
         filters: Optional[Dict[str, Any]] = None,
-        batch_size: int = 20,
+        batch_size: Optional[int] = None,
     ) -> None:
         """
         Upsert (insert or update) documents in the table.
@@ -234,49 +206,43 @@ class SingleStore(VectorDb):
         Args:
             documents (List[Document]): List of documents to upsert.
             filters (Optional[Dict[str, Any]]): Optional filters for the upsert.
-            batch_size (int): Number of documents to upsert in each batch.
+            batch_size (Optional[int]): Number of documents to upsert in each batch. Defaults to `write_batch_size`.
         """
-        with self.Session.begin() as sess:
-            counter = 0
-            for document in documents:
-                document.embed(embedder=self.embedder)
-                cleaned_content = document.content.replace("\x00", "\ufffd")
-                record_id = md5(cleaned_content.encode()).hexdigest()
-                _id = document.id or record_id
-
-                meta_data_json = json.dumps(document.meta_data)
-                usage_json = json.dumps(document.usage)
+        self.write_in_batches(
+            documents, lambda batch: self._write_batch(content_hash, batch, upsert=True), batch_size=batch_size
+        )
 
-                # Convert embedding list to SingleStore VECTOR format
-                embeddings = f"[{','.join(map(str, document.embedding))}]" if document.embedding else None
-                stmt = (
-                    mysql.insert(self.table)
-                    .values(
-                        id=_id,
-                        name=document.name,
-                        meta_data=meta_data_json,
-                        content=cleaned_content,
-                        embedding=embeddings,
-                        usage=usage_json,
-                        content_hash=content_hash,
-                        content_id=document.content_id,
-                    )
-                    .on_duplicate_key_update(
-                        name=document.name,
-                        meta_data=meta_data_json,
-                        content=cleaned_content,
-                        embedding=embeddings,
-                        usage=usage_json,
-                        content_hash=content_hash,
-                        content_id=document.content_id,
-                    )
-                )
-                sess.execute(stmt)
-                counter += 1
-                log_debug(f"Upserted document: {document.name} ({document.meta_data})")
+    def _write_batch(self, content_hash: str, documents: List[Document], upsert: bool = False) -> None:
+        """Write a batch of embedded documents with a single multi-row statement, committed on its own."""
+        records = []
+        for document in documents:
+            cleaned_content = document.content.replace("\x00", "\ufffd")
+            record_id = md5(cleaned_content.encode()).hexdigest()
+            records.append(
+                {
+                    "id": document.id or record_id,
+                    "name": document.name,
+                    "meta_data": json.dumps(document.meta_data),
+                    "content": cleaned_content,
+                    # Convert embedding list to SingleStore VECTOR format
+                    "embedding": f"[{','.join(map(str, document.embedding))}]" if document.embedding else None,
+                    "usage": json.dumps(document.usage),
+                    "content_hash": content_hash,
+                    "content_id": document.content_id,
+                }
+            )
+        if not records:
+            return
 
+        stmt = mysql.insert(self.table)
+        if upsert:
+            stmt = stmt.on_duplicate_key_update(
+                {column: stmt.inserted[column] for column in records[0] if column != "id"}
+            )
+        with self.Session.begin() as sess:
+            sess.execute(stmt, records)
             sess.commit()
-            log_debug(f"Committed {counter} documents")
+        log_debug(f"{'Upserted' if upsert else 'Inserted'} batch of {len(records)} documents")
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -663,7 +629,7 @@ class SingleStore(VectorDb):
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        return self.search(query=query, limit=limit, filters=filters)
+        return await self.run_in_executor(self.search, query=query, limit=limit, filters=filters)
 
     async def async_drop(self) -> None:
         raise NotImplementedError(f"Async not supported on {self.__class__.__name__}.")
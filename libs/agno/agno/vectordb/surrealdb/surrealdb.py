@@ -278,14 +278,8 @@ class SurrealDb(VectorDb):
             filters: A dictionary of filters to apply to the query.
 
         """
-        for doc in documents:
-            doc.embed(embedder=self.embedder)
-            meta_data: Dict[str, Any] = doc.meta_data if isinstance(doc.meta_data, dict) else {}
-            meta_data["content_hash"] = content_hash
-            data: Dict[str, Any] = {"content": doc.content, "embedding": doc.embedding, "meta_data": meta_data}
-            if filters:
-                data["meta_data"].update(filters)
-            self.client.create(self.collection, data)
+        # Documents are embedded batch by batch, the next batch while the current one is inserted
+        self.write_in_batches(documents, lambda batch: self._write_batch(content_hash, batch, filters))
 
     def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Upsert documents into the vector store.
@@ -296,15 +290,27 @@ class SurrealDb(VectorDb):
             filters: A dictionary of filters to apply to the query.
 
         """
+        self.write_in_batches(documents, lambda batch: self._write_batch(content_hash, batch, filters, upsert=True))
+
+    def _write_batch(
+        self,
+        content_hash: str,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        upsert: bool = False,
+    ) -> None:
+        """Write a batch of embedded documents. The client has no bulk write, so they are written one by one."""
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             meta_data: Dict[str, Any] = doc.meta_data if isinstance(doc.meta_data, dict) else {}
             meta_data["content_hash"] = content_hash
             data: Dict[str, Any] = {"content": doc.content, "embedding": doc.embedding, "meta_data": meta_data}
             if filters:
                 data["meta_data"].update(filters)
-            thing = f"{self.collection}:{doc.id}" if doc.id else self.collection
-            self.client.query(self.UPSERT_QUERY.format(thing=thing), data)
+            if upsert:
+                thing = f"{self.collection}:{doc.id}" if doc.id else self.collection
+                self.client.query(self.UPSERT_QUERY.format(thing=thing), data)
+            else:
+                self.client.create(self.collection, data)
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """Search for similar documents.
@@ -561,7 +567,7 @@ class SurrealDb(VectorDb):
             A list of documents that are similar to the query.
 
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.async_get_embedding(query)
         if query_embedding is None:
             log_error(f"Error getting embedding for Query: {query}")
             return []
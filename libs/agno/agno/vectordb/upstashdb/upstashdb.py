@@ -225,8 +225,19 @@ class UpstashVectorDb(VectorDb):
             namespace (Optional[str], optional): The namespace for the documents. Defaults to None, which uses the instance namespace.
         """
         _namespace = self.namespace if namespace is None else namespace
-        vectors = []
+        # Documents are embedded batch by batch, the next batch while the current one is upserted. Upstash embeds
+        # the documents itself with use_upstash_embeddings.
+        self.write_in_batches(
+            documents,
+            lambda batch: self._write_batch(content_hash, batch, filters, _namespace),
+            embed=not self.use_upstash_embeddings,
+        )
 
+    def _write_batch(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]], namespace: str
+    ) -> None:
+        """Upsert a batch of documents in a single request."""
+        vectors = []
         for i, document in enumerate(documents):
             if document.id is None:
                 logger.error(f"Document ID must not be None. Skipping document: {document.content[:100]}...")
@@ -265,7 +276,6 @@ class UpstashVectorDb(VectorDb):
                     logger.error("Embedder is None but use_upstash_embeddings is False")
                     continue
 
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     logger.error(f"Failed to generate embedding for document: {document.id}")
                     continue
@@ -280,7 +290,7 @@ class UpstashVectorDb(VectorDb):
             return
 
         logger.info(f"Upserting {len(vectors)} vectors to Upstash with IDs: {[v.id for v in vectors[:5]]}...")
-        self.index.upsert(vectors, namespace=_namespace)
+        self.index.upsert(vectors, namespace=namespace)
 
     def upsert_available(self) -> bool:
         """Check if upsert operation is available.
@@ -11,6 +11,7 @@ try:
     import weaviate
     from weaviate import WeaviateAsyncClient
     from weaviate.classes.config import Configure, DataType, Property, Tokenization, VectorDistances
+    from weaviate.classes.data import DataObject
     from weaviate.classes.init import Auth
     from weaviate.classes.query import Filter
 
@@ -223,10 +224,15 @@ class Weaviate(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents into Weaviate.")
-        collection = self.get_client().collections.get(self.collection)
+        # Documents are embedded batch by batch, the next batch while the current one is inserted
+        self.write_in_batches(documents, lambda batch: self._write_batch(content_hash, batch, filters))
 
+    def _write_batch(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Insert a batch of embedded documents in a single request."""
+        objects = []
         for document in documents:
-            document.embed(embedder=self.embedder)
             if document.embedding is None:
                 logger.error(f"Document embedding is None: {document.name}")
                 continue
@@ -243,19 +249,27 @@ class Weaviate(VectorDb):
             # Serialize meta_data to JSON string
             meta_data_str = json.dumps(meta_data) if meta_data else None
 
-            collection.data.insert(
-                properties={
-                    "name": document.name,
-                    "content": cleaned_content,
-                    "meta_data": meta_data_str,
-                    "content_id": document.content_id,
-                    "content_hash": content_hash,
-                },
-                vector=document.embedding,
-                uuid=doc_uuid,
+            objects.append(
+                DataObject(
+                    properties={
+                        "name": document.name,
+                        "content": cleaned_content,
+                        "meta_data": meta_data_str,
+                        "content_id": document.content_id,
+                        "content_hash": content_hash,
+                    },
+                    vector=document.embedding,
+                    uuid=doc_uuid,
+                )
             )
             log_debug(f"Inserted document: {document.name} ({meta_data})")
 
+        if not objects:
+            return
+        result = self.get_client().collections.get(self.collection).data.insert_many(objects)
+        if result.has_errors:
+            logger.error(f"Errors inserting {len(result.errors)} of {len(objects)} documents: {result.errors}")
+
     async def async_insert(
         self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -471,7 +485,7 @@ class Weaviate(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.async_get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for query: {query}")
             return []
@@ -626,7 +640,7 @@ class Weaviate(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.async_get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for query: {query}")
             return []
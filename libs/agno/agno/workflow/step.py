@@ -18,6 +18,7 @@ from agno.run.workflow import (
     WorkflowRunOutputEvent,
 )
 from agno.team import Team
+from agno.tracing import traced
 from agno.utils.log import log_debug, logger, use_agent_logger, use_team_logger, use_workflow_logger
 from agno.utils.merge_dict import merge_dictionaries
 from agno.workflow.types import StepInput, StepOutput, StepType
@@ -36,6 +37,10 @@ StepExecutor = Callable[
 ]
 
 
+def _span_attributes(step: "Step", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"step.id": step.step_id, "step.name": step.name}
+
+
 @dataclass
 class Step:
     """A single unit of work in a workflow pipeline"""
@@ -196,6 +201,7 @@ class Step:
             else:
                 return await func(step_input)
 
+    @traced("workflow.step", attributes=_span_attributes)
     def execute(
         self,
         step_input: StepInput,
@@ -348,6 +354,7 @@ class Step:
         except Exception:
             return False
 
+    @traced("workflow.step", attributes=_span_attributes)
     def execute_stream(
         self,
         step_input: StepInput,
@@ -549,6 +556,7 @@ class Step:
 
         return
 
+    @traced("workflow.step", attributes=_span_attributes)
     async def aexecute(
         self,
         step_input: StepInput,
@@ -711,6 +719,7 @@ class Step:
 
         return StepOutput(content=f"Step {self.name} failed but skipped", success=False)
 
+    @traced("workflow.step", attributes=_span_attributes)
     async def aexecute_stream(
         self,
         step_input: StepInput,
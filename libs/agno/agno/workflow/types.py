@@ -1,14 +1,16 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from fastapi import WebSocket
 from pydantic import BaseModel
 
 from agno.media import Audio, File, Image, Video
 from agno.models.metrics import Metrics
 from agno.utils.log import log_warning
 
+if TYPE_CHECKING:
+    from fastapi import WebSocket
+
 
 @dataclass
 class WorkflowExecutionInput:
@@ -404,7 +406,7 @@ class WorkflowMetrics:
 class WebSocketHandler:
     """Generic WebSocket handler for real-time workflow events"""
 
-    websocket: Optional[WebSocket] = None
+    websocket: Optional["WebSocket"] = None
 
     def format_sse_event(self, json_data: str) -> str:
         """Parse JSON data into SSE-compliant format.
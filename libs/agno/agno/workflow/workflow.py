@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from os import getenv
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Awaitable,
@@ -20,7 +21,6 @@ from typing import (
 )
 from uuid import uuid4
 
-from fastapi import WebSocket
 from pydantic import BaseModel
 
 from agno.agent.agent import Agent
@@ -51,6 +51,7 @@ from agno.run.workflow import (
 )
 from agno.session.workflow import WorkflowSession
 from agno.team.team import Team
+from agno.tracing import get_current_span, traced
 from agno.utils.common import is_typed_dict, validate_typed_dict
 from agno.utils.log import (
     log_debug,
@@ -61,12 +62,6 @@ from agno.utils.log import (
     set_log_level_to_info,
     use_workflow_logger,
 )
-from agno.utils.print_response.workflow import (
-    aprint_response,
-    aprint_response_stream,
-    print_response,
-    print_response_stream,
-)
 from agno.workflow.condition import Condition
 from agno.workflow.loop import Loop
 from agno.workflow.parallel import Parallel
@@ -83,6 +78,9 @@ from agno.workflow.types import (
     WorkflowMetrics,
 )
 
+if TYPE_CHECKING:
+    from fastapi import WebSocket
+
 STEP_TYPE_MAPPING = {
     Step: StepType.STEP,
     Steps: StepType.STEPS,
@@ -114,6 +112,22 @@ WorkflowSteps = Union[
 ]
 
 
+def _span_attributes(workflow: "Workflow", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"workflow.id": workflow.id, "workflow.name": workflow.name}
+
+
+def _session_span_attributes(workflow: "Workflow", session_id: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"workflow.id": workflow.id, "workflow.name": workflow.name, "session.id": session_id}
+
+
+def _run_span_attributes(workflow: "Workflow", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {
+        "workflow.id": workflow.id,
+        "workflow.name": workflow.name,
+        "user.id": kwargs.get("user_id"),
+    }
+
+
 @dataclass
 class Workflow:
     """Pipeline-based workflow execution"""
@@ -486,6 +500,7 @@ class Workflow:
                 log_warning(f"No run responses found in WorkflowSession {session_id}")
                 return None
 
+    @traced("workflow.read_session", attributes=_session_span_attributes)
     def read_or_create_session(
         self,
         session_id: str,
@@ -548,6 +563,7 @@ class Workflow:
         log_warning(f"WorkflowSession {session_id_to_load} not found in db")
         return None
 
+    @traced("workflow.save_session", attributes=_span_attributes)
     def save_session(self, session: WorkflowSession) -> None:
         """Save the WorkflowSession to storage
 
@@ -1771,6 +1787,8 @@ class Workflow:
             session_id=session_id, user_id=user_id, session_state=session_state, run_id=run_id
         )
 
+        get_current_span().set_attributes({"run.id": run_id, "session.id": session_id})
+
         # Read existing session from database
         workflow_session = self.read_or_create_session(session_id=session_id, user_id=user_id)
         self._update_metadata(session=workflow_session)
@@ -1862,6 +1880,8 @@ class Workflow:
             session_id=session_id, user_id=user_id, session_state=session_state, run_id=run_id
         )
 
+        get_current_span().set_attributes({"run.id": run_id, "session.id": session_id})
+
         # Read existing session from database
         workflow_session = self.read_or_create_session(session_id=session_id, user_id=user_id)
         self._update_metadata(session=workflow_session)
@@ -1991,6 +2011,7 @@ class Workflow:
         background: Optional[bool] = False,
     ) -> Iterator[WorkflowRunOutputEvent]: ...
 
+    @traced("workflow.run", attributes=_run_span_attributes)
     def run(
         self,
         input: Optional[Union[str, Dict[str, Any], List[Any], BaseModel]] = None,
@@ -2022,6 +2043,8 @@ class Workflow:
             session_id=session_id, user_id=user_id, session_state=session_state, run_id=run_id
         )
 
+        get_current_span().set_attributes({"run.id": run_id, "session.id": session_id})
+
         # Read existing session from database
         workflow_session = self.read_or_create_session(session_id=session_id, user_id=user_id)
         self._update_metadata(session=workflow_session)
@@ -2102,7 +2125,7 @@ class Workflow:
         stream: Literal[False] = False,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
-        websocket: Optional[WebSocket] = None,
+        websocket: Optional["WebSocket"] = None,
     ) -> WorkflowRunOutput: ...
 
     @overload
@@ -2120,9 +2143,10 @@ class Workflow:
         stream: Literal[True] = True,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
-        websocket: Optional[WebSocket] = None,
+        websocket: Optional["WebSocket"] = None,
     ) -> AsyncIterator[WorkflowRunOutputEvent]: ...
 
+    @traced("workflow.run", attributes=_run_span_attributes)
     async def arun(
         self,
         input: Optional[Union[str, Dict[str, Any], List[Any], BaseModel, List[Message]]] = None,
@@ -2137,7 +2161,7 @@ class Workflow:
         stream: bool = False,
         stream_intermediate_steps: Optional[bool] = False,
         background: Optional[bool] = False,
-        websocket: Optional[WebSocket] = None,
+        websocket: Optional["WebSocket"] = None,
         **kwargs: Any,
     ) -> Union[WorkflowRunOutput, AsyncIterator[WorkflowRunOutputEvent]]:
         """Execute the workflow synchronously with optional streaming"""
@@ -2192,6 +2216,8 @@ class Workflow:
             session_id=session_id, user_id=user_id, session_state=session_state, run_id=run_id
         )
 
+        get_current_span().set_attributes({"run.id": run_id, "session.id": session_id})
+
         # Read existing session from database
         workflow_session = self.read_or_create_session(session_id=session_id, user_id=user_id)
         self._update_metadata(session=workflow_session)
@@ -2330,6 +2356,9 @@ class Workflow:
         if stream_intermediate_steps is None:
             stream_intermediate_steps = self.stream_intermediate_steps or False
 
+        # Printing needs rich, which is only imported when printing
+        from agno.utils.print_response.workflow import print_response, print_response_stream
+
         if stream:
             print_response_stream(
                 workflow=self,
@@ -2407,6 +2436,8 @@ class Workflow:
         if stream_intermediate_steps is None:
             stream_intermediate_steps = self.stream_intermediate_steps or False
 
+        from agno.utils.print_response.workflow import aprint_response, aprint_response_stream
+
         if stream:
             await aprint_response_stream(
                 workflow=self,
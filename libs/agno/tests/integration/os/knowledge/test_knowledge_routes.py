@@ -2,7 +2,7 @@
 
 import json
 from io import BytesIO
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
@@ -10,6 +10,7 @@ from fastapi import APIRouter, FastAPI
 from fastapi.testclient import TestClient
 
 from agno.knowledge.content import Content, FileData
+from agno.knowledge.ingestion import IngestionJob, IngestionQueue
 from agno.knowledge.knowledge import ContentStatus, Knowledge
 from agno.os.routers.knowledge.knowledge import attach_routes
 
@@ -25,6 +26,7 @@ def mock_knowledge():
     # Mock external dependencies
     knowledge.vector_db = Mock()
     knowledge.contents_db = Mock()
+    knowledge.contents_db.id = "test_db"
     knowledge.readers = {}
 
     # Configure vector_db mock to prevent actual operations
@@ -67,10 +69,20 @@ def mock_content():
 
 
 @pytest.fixture
-def test_app(mock_knowledge):
+def ingestion_queue(mock_knowledge, tmp_path):
+    """Create an ingestion queue without workers, so queued jobs stay pending."""
+    return IngestionQueue(knowledge_instances=[mock_knowledge], spool_dir=str(tmp_path), num_workers=0, retry_delay=0)
+
+
+def pending_jobs(ingestion_queue):
+    return [ingestion_queue._read_job(path) for path in sorted(ingestion_queue.pending_dir.glob("*.json"))]
+
+
+@pytest.fixture
+def test_app(mock_knowledge, ingestion_queue):
     """Create a FastAPI test app with knowledge routes."""
     app = FastAPI()
-    router = attach_routes(APIRouter(), [mock_knowledge])
+    router = attach_routes(APIRouter(), [mock_knowledge], ingestion_queue=ingestion_queue)
     app.include_router(router)
     return TestClient(app)
 
@@ -78,68 +90,69 @@ def test_app(mock_knowledge):
 class TestKnowledgeContentEndpoints:
     """Test suite for knowledge content endpoints."""
 
-    def test_upload_content_success(self, test_app, mock_knowledge, mock_content):
+    def test_upload_content_success(self, test_app, mock_knowledge, ingestion_queue):
         """Test successful content upload."""
-        # Mock the background task processing
-        with patch("agno.os.routers.knowledge.knowledge.process_content") as mock_process:  # Fixed import path
-            # Create test file
-            test_file_content = b"test file content"
-            test_file = BytesIO(test_file_content)
-
-            response = test_app.post(
-                "/knowledge/content",
-                files={"file": ("test.txt", test_file, "text/plain")},
-                data={
-                    "name": "Test Content",
-                    "description": "Test description",
-                    "metadata": '{"key": "value"}',
-                    "reader_id": "test_reader",
-                },
-            )
-
-            assert response.status_code == 202
-            data = response.json()
-            assert "id" in data
-            assert data["status"] == "processing"
-
-            # Verify background task was added
-            mock_process.assert_called_once()
+        # Create test file
+        test_file_content = b"test file content"
+        test_file = BytesIO(test_file_content)
+
+        response = test_app.post(
+            "/knowledge/content",
+            files={"file": ("test.txt", test_file, "text/plain")},
+            data={
+                "name": "Test Content",
+                "description": "Test description",
+                "metadata": '{"key": "value"}',
+                "reader_id": "test_reader",
+            },
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert "id" in data
+        assert data["status"] == "processing"
+
+        # Verify the job was queued with its spooled body
+        [job] = pending_jobs(ingestion_queue)
+        assert job.content_id == data["id"]
+        assert job.db_id == "test_db"
+        assert job.reader_id == "test_reader"
+        assert job.metadata == {"key": "value"}
+        assert ingestion_queue.body_path(job).read_bytes() == test_file_content
 
     def test_upload_content_with_url(self, test_app, mock_knowledge):
         """Test content upload with URL."""
-        with patch("agno.os.routers.knowledge.knowledge.process_content"):
-            response = test_app.post(
-                "/knowledge/content",
-                data={
-                    "name": "URL Content",
-                    "description": "Content from URL",
-                    "url": "https://example.com",
-                    "metadata": '{"source": "web"}',
-                },
-            )
-
-            assert response.status_code == 202
-            data = response.json()
-            assert "id" in data
-            assert data["status"] == "processing"
+        response = test_app.post(
+            "/knowledge/content",
+            data={
+                "name": "URL Content",
+                "description": "Content from URL",
+                "url": "https://example.com",
+                "metadata": '{"source": "web"}',
+            },
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert "id" in data
+        assert data["status"] == "processing"
 
     def test_upload_content_invalid_json(self, test_app):
         """Test content upload with invalid JSON metadata."""
-        with patch("agno.os.routers.knowledge.knowledge.process_content"):
-            response = test_app.post(
-                "/knowledge/content",
-                data={
-                    "name": "Test Content",
-                    "description": "Test description",
-                    "metadata": "invalid json",
-                    "url": "invalid json",
-                },
-            )
-
-            # Should still succeed as the code handles invalid JSON gracefully
-            assert response.status_code == 202
-            data = response.json()
-            assert "id" in data
+        response = test_app.post(
+            "/knowledge/content",
+            data={
+                "name": "Test Content",
+                "description": "Test description",
+                "metadata": "invalid json",
+                "url": "invalid json",
+            },
+        )
+
+        # Should still succeed as the code handles invalid JSON gracefully
+        assert response.status_code == 202
+        data = response.json()
+        assert "id" in data
 
     def test_edit_content_success(self, test_app, mock_knowledge):
         """Test successful content editing."""
@@ -295,40 +308,53 @@ class TestKnowledgeContentEndpoints:
         assert data["filters"] == ["filter_tag_1", "filter_tag2"]
 
 
-class TestBackgroundTaskProcessing:
-    """Test suite for background task processing."""
-
-    async def test_process_content_success(self, mock_knowledge, mock_content):
-        """Test successful content processing."""
-        from agno.os.routers.knowledge.knowledge import process_content
+class TestQueuedProcessing:
+    """Test suite for the processing of queued content."""
 
-        reader_id = "text_reader"
+    def queue_file(self, test_app, ingestion_queue) -> IngestionJob:
+        response = test_app.post(
+            "/knowledge/content",
+            files={"file": ("test.txt", BytesIO(b"test file content"), "text/plain")},
+            data={"name": "Test Content", "reader_id": "text_reader"},
+        )
+        assert response.status_code == 202
+        job = ingestion_queue._claim_next_job()
+        assert job is not None
+        return job
 
-        # Set up the readers dictionary in the mock
+    async def test_process_queued_content_success(self, test_app, mock_knowledge, ingestion_queue):
+        """Test successful processing of a queued upload."""
         mock_reader = Mock()
         mock_knowledge.readers = {"text_reader": mock_reader}
+        job = self.queue_file(test_app, ingestion_queue)
 
-        # Mock the knowledge.process_content method
-        with patch.object(mock_knowledge, "_load_content") as mock_add:
-            # Call the function with correct parameter order: (knowledge, content, reader_id)
-            await process_content(mock_knowledge, mock_content, reader_id)
-
-            # Verify the content was added
-            mock_add.assert_called_once_with(mock_content, upsert=False, skip_if_exists=True)
+        with patch.object(mock_knowledge, "_load_content", new_callable=AsyncMock) as mock_add:
+            await ingestion_queue.process(job)
 
-            # Verify that the reader was set
-            assert mock_content.reader == mock_reader
+        mock_add.assert_called_once()
+        content = mock_add.call_args.args[0]
+        assert content.id == job.content_id
+        assert content.file_data.content == b"test file content"
+        # Verify that the reader was set
+        assert content.reader == mock_reader
+        # The job and its body are removed once processed
+        assert not ingestion_queue.body_path(job).exists()
+        assert list(ingestion_queue.running_dir.iterdir()) == []
+        assert ingestion_queue.metrics.completed == 1
 
-    async def test_process_content_with_exception(self, mock_knowledge, mock_content):
-        """Test content processing with exception."""
-        from agno.os.routers.knowledge.knowledge import process_content
+    async def test_process_queued_content_with_exception(self, test_app, mock_knowledge, ingestion_queue):
+        """Test processing of a queued upload that raises an exception."""
+        job = self.queue_file(test_app, ingestion_queue)
 
-        reader_id = "test_reader"
+        with patch.object(mock_knowledge, "_load_content", new_callable=AsyncMock, side_effect=Exception("Test error")):
+            # Should not raise an exception, the job is scheduled for a retry
+            await ingestion_queue.process(job)
 
-        # Mock the knowledge.process_content method to raise an exception
-        with patch.object(mock_knowledge, "_load_content", side_effect=Exception("Test error")):
-            # Should not raise an exception
-            await process_content(mock_knowledge, mock_content, reader_id)
+        [retried] = pending_jobs(ingestion_queue)
+        assert retried.id == job.id
+        assert retried.attempts == 1
+        assert retried.last_error == "Test error"
+        assert ingestion_queue.body_path(job).exists()
 
 
 class TestFileUploadScenarios:
@@ -336,42 +362,39 @@ class TestFileUploadScenarios:
 
     def test_upload_large_file(self, test_app):
         """Test uploading a large file."""
-        with patch("agno.os.routers.knowledge.knowledge.process_content"):
-            # Create a large file content
-            large_content = b"x" * (10 * 1024 * 1024)  # 10MB
-            test_file = BytesIO(large_content)
-
-            response = test_app.post(
-                "/knowledge/content",
-                files={"file": ("large_file.txt", test_file, "text/plain")},
-                data={"name": "Large File"},
-            )
+        # Create a large file content
+        large_content = b"x" * (10 * 1024 * 1024)  # 10MB
+        test_file = BytesIO(large_content)
+
+        response = test_app.post(
+            "/knowledge/content",
+            files={"file": ("large_file.txt", test_file, "text/plain")},
+            data={"name": "Large File"},
+        )
 
-            assert response.status_code == 202
-            data = response.json()
-            assert "id" in data
+        assert response.status_code == 202
+        data = response.json()
+        assert "id" in data
 
     def test_upload_without_file(self, test_app):
         """Test uploading content without a file."""
-        with patch("agno.os.routers.knowledge.knowledge.process_content"):
-            response = test_app.post(
-                "/knowledge/content",
-                data={"name": "Text Content", "description": "Content without file", "metadata": '{"type": "text"}'},
-            )
+        response = test_app.post(
+            "/knowledge/content",
+            data={"name": "Text Content", "description": "Content without file", "metadata": '{"type": "text"}'},
+        )
 
-            assert response.status_code == 202
-            data = response.json()
-            assert "id" in data
+        assert response.status_code == 202
+        data = response.json()
+        assert "id" in data
 
     def test_upload_with_special_characters(self, test_app):
         """Test uploading content with special characters in metadata."""
-        with patch("agno.os.routers.knowledge.knowledge.process_content"):
-            special_metadata = {"special_chars": "!@#$%^&*()", "unicode": "测试内容", "quotes": '{"nested": "value"}'}
+        special_metadata = {"special_chars": "!@#$%^&*()", "unicode": "测试内容", "quotes": '{"nested": "value"}'}
 
-            response = test_app.post(
-                "/knowledge/content", data={"name": "Special Content", "metadata": json.dumps(special_metadata)}
-            )
+        response = test_app.post(
+            "/knowledge/content", data={"name": "Special Content", "metadata": json.dumps(special_metadata)}
+        )
 
-            assert response.status_code == 202
-            data = response.json()
-            assert "id" in data
+        assert response.status_code == 202
+        data = response.json()
+        assert "id" in data
@@ -251,6 +251,50 @@ def test_custom_lifespan_integration(test_agent: Agent):
     assert shutdown_called is True
 
 
+def test_ingestion_workers_run_in_lifespan(test_agent: Agent, tmp_path, monkeypatch):
+    """Test the knowledge ingestion workers are started and stopped with the app."""
+    from agno.knowledge.knowledge import Knowledge
+
+    monkeypatch.setenv("KNOWLEDGE_SPOOL_DIR", str(tmp_path))
+    test_agent.knowledge = Knowledge(name="test-knowledge", vector_db=Mock(), contents_db=InMemoryDb())
+    agent_os = AgentOS(agents=[test_agent])
+
+    app = agent_os.get_app()
+    # Adding the routes again doesn't add the workers to the lifespan twice
+    agent_os.get_app()
+    ingestion_queue = app.state.ingestion_queue
+    assert str(ingestion_queue.spool_dir) == str(tmp_path)
+    assert not ingestion_queue.started
+
+    with TestClient(app):
+        assert ingestion_queue.started
+
+    assert not ingestion_queue.started
+
+
+def test_local_models_are_loaded_in_lifespan(test_agent: Agent, test_team: Team, tmp_path, monkeypatch):
+    """Test the local embedders and rerankers of the knowledge bases are loaded when the app starts."""
+    from agno.knowledge.knowledge import Knowledge
+
+    monkeypatch.setenv("KNOWLEDGE_SPOOL_DIR", str(tmp_path))
+    embedder, reranker = Mock(), Mock()
+    reranker.warm_up.side_effect = OSError("Model not found")
+    test_agent.knowledge = Knowledge(name="agent-knowledge", vector_db=Mock(embedder=embedder, reranker=None))
+    # The embedder is shared, so it is loaded once
+    test_team.knowledge = Knowledge(name="team-knowledge", vector_db=Mock(embedder=embedder, reranker=reranker))
+    agent_os = AgentOS(agents=[test_agent], teams=[test_team])
+
+    app = agent_os.get_app()
+    embedder.warm_up.assert_not_called()
+
+    # A model failing to load doesn't stop the app from starting
+    with TestClient(app) as client:
+        embedder.warm_up.assert_called_once()
+        reranker.warm_up.assert_called_once()
+        assert app.state.ingestion_queue.started
+        assert client.get("/health").status_code == 200
+
+
 def test_custom_app_middleware_preservation(test_agent: Agent):
     """Test that custom middleware is preserved when using custom FastAPI app."""
     custom_middleware_called = False
@@ -0,0 +1,81 @@
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.reasoning.default import get_default_reasoning_agent
+from agno.reasoning.helpers import ReasoningAgentCache
+
+
+def test_model_copy_is_reused():
+    cache = ReasoningAgentCache()
+    model = OpenAIChat(id="gpt-4o")
+
+    copy = cache.get_model_copy(model)
+    assert copy is not model
+    assert cache.get_model_copy(model) is copy
+
+    # A new model is copied again
+    other_model = OpenAIChat(id="gpt-4o-mini")
+    assert cache.get_model_copy(other_model).id == "gpt-4o-mini"
+
+
+def test_model_copy_follows_changes_to_the_model():
+    cache = ReasoningAgentCache()
+    model = OpenAIChat(id="gpt-4o", temperature=0.2)
+    copy = cache.get_model_copy(model)
+
+    model.temperature = 0.9
+    new_copy = cache.get_model_copy(model)
+    assert new_copy is not copy
+    assert new_copy.temperature == 0.9
+    assert cache.get_model_copy(model) is new_copy
+
+
+def test_reasoning_agent_is_built_once_per_configuration():
+    cache = ReasoningAgentCache()
+    model = OpenAIChat(id="gpt-4o")
+    builds = []
+
+    def build():
+        builds.append(1)
+        return get_default_reasoning_agent(reasoning_model=model, min_steps=1, max_steps=5)
+
+    first = cache.get_agent("default", key=(1,), build=build, session_state={"a": 1})
+    first.session_id = "sticky"  # type: ignore
+    second = cache.get_agent("default", key=(1,), build=build, session_state={"a": 2})
+
+    assert len(builds) == 1
+    # Every run gets its own copy of the cached agent, sharing its model
+    assert second is not first
+    assert second.model is first.model  # type: ignore
+    assert first.session_state == {"a": 1}  # type: ignore
+    assert second.session_state == {"a": 2}  # type: ignore
+    assert second.session_id is None  # type: ignore
+
+    cache.get_agent("default", key=(2,), build=build)
+    assert len(builds) == 2
+
+
+def test_reasoning_agent_is_rebuilt_when_its_objects_are_replaced():
+    cache = ReasoningAgentCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return get_default_reasoning_agent(reasoning_model=OpenAIChat(id="gpt-4o"), min_steps=1, max_steps=5)
+
+    tools = [lambda: "sunny"]
+    cache.get_agent("default", key=(1,), build=build, objects=(tools, *tools))
+    cache.get_agent("default", key=(1,), build=build, objects=(tools, *tools))
+    assert len(builds) == 1
+
+    # Objects are compared by identity, not by value
+    cache.get_agent("default", key=(1,), build=build, objects=(list(tools), *tools))
+    assert len(builds) == 2
+
+
+def test_agent_reuses_its_reasoning_model_copy():
+    agent = Agent(model=OpenAIChat(id="gpt-4o"), reasoning=True)
+    copy = agent._reasoning_cache.get_model_copy(agent.model)  # type: ignore
+
+    assert agent._reasoning_cache.get_model_copy(agent.model) is copy  # type: ignore
+    # Copies of the agent don't share the cache
+    assert agent.deep_copy()._reasoning_cache is not agent._reasoning_cache
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.session import AgentSession
+from agno.tools.function import Function
+
+
+class Forecast(BaseModel):
+    city: str
+    forecast: str
+
+
+def get_weather(city: str) -> str:
+    """Get the weather of a city."""
+    return f"It is sunny in {city}"
+
+
+def test_output_format_prompt_is_built_once():
+    agent = Agent(model=OpenAIChat(id="gpt-4o"), instructions="Be brief.", output_schema=Forecast, use_json_mode=True)
+    session = AgentSession(session_id="session")
+    with patch("agno.agent.agent.get_json_output_prompt", return_value="Respond in JSON.") as json_prompt:
+        first = agent.get_system_message(session=session)
+        second = agent.get_system_message(session=session)
+
+    assert first is not None and second is not None
+    assert first.content == second.content
+    assert "Respond in JSON." in first.content  # type: ignore
+    assert json_prompt.call_count == 1
+
+    # Changing the configuration builds the section again
+    agent.output_schema = None
+    assert "Respond in JSON." not in agent.get_system_message(session=session).content  # type: ignore
+
+
+def test_changed_instructions_are_used():
+    agent = Agent(model=OpenAIChat(id="gpt-4o"), instructions="Be brief.")
+    session = AgentSession(session_id="session")
+
+    assert "Be brief." in agent.get_system_message(session=session).content  # type: ignore
+    agent.instructions = "Be thorough."
+    assert "Be thorough." in agent.get_system_message(session=session).content  # type: ignore
+
+
+def test_dynamic_sections_come_last():
+    agent = Agent(
+        model=OpenAIChat(id="gpt-4o"),
+        description="You are a weather agent for {city}.",
+        expected_output="A short forecast.",
+        add_datetime_to_context=True,
+        resolve_in_context=True,
+    )
+    session = AgentSession(session_id="session")
+
+    content = agent.get_system_message(session=session, session_state={"city": "Paris"}).content  # type: ignore
+    assert content.startswith("You are a weather agent for Paris.")
+    assert content.index("<expected_output>") < content.index("The current time is")
+
+
+def test_function_entrypoint_is_processed_once():
+    function = Function.from_callable(get_weather)
+    function.process_entrypoint()
+    parameters = function.parameters
+
+    with patch("agno.tools.function.get_type_hints") as get_type_hints:
+        function.process_entrypoint()
+        assert get_type_hints.call_count == 0
+        assert function.parameters == parameters
+
+        # Strict mode processes the entrypoint again
+        function.process_entrypoint(strict=True)
+        assert get_type_hints.call_count == 1
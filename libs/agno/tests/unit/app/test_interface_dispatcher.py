@@ -0,0 +1,101 @@
+import asyncio
+from typing import List, Tuple
+
+from agno.os.interfaces.dispatcher import EventDispatcher
+
+
+class Recorder:
+    def __init__(self, delay: float = 0.0, fail_on: str = ""):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls: List[Tuple[str, List[str]]] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, key: str, events: List[str]) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_on in events:
+                raise RuntimeError("run failed")
+            self.calls.append((key, events))
+        finally:
+            self.running -= 1
+
+
+async def test_duplicate_events_are_dropped():
+    recorder = Recorder()
+    dispatcher = EventDispatcher(recorder)
+
+    assert dispatcher.submit("c1", "hello", event_id="e1")
+    assert not dispatcher.submit("c1", "hello", event_id="e1")
+    await dispatcher.join()
+
+    assert recorder.calls == [("c1", ["hello"])]
+    assert dispatcher.metrics.duplicates == 1
+
+
+async def test_dedup_entries_expire():
+    dispatcher = EventDispatcher(Recorder(), dedup_ttl=0)
+    assert not dispatcher.is_duplicate("e1")
+    assert not dispatcher.is_duplicate("e1")
+
+    dispatcher = EventDispatcher(Recorder(), max_dedup_entries=2)
+    for event_id in ["e1", "e2", "e3"]:
+        dispatcher.is_duplicate(event_id)
+    assert not dispatcher.is_duplicate("e1")
+    assert dispatcher.is_duplicate("e3")
+
+
+async def test_events_of_a_conversation_are_processed_in_order_and_coalesced():
+    recorder = Recorder(delay=0.05)
+    dispatcher = EventDispatcher(recorder)
+
+    dispatcher.submit("c1", "first")
+    await asyncio.sleep(0.01)
+    # Received while the first run is in progress
+    dispatcher.submit("c1", "second")
+    dispatcher.submit("c1", "third")
+    await dispatcher.join()
+
+    assert recorder.calls == [("c1", ["first"]), ("c1", ["second", "third"])]
+    assert recorder.max_running == 1
+    assert dispatcher.metrics.coalesced == 1
+
+
+async def test_coalesce_window():
+    recorder = Recorder()
+    dispatcher = EventDispatcher(recorder, coalesce_window=0.05)
+
+    dispatcher.submit("c1", "a")
+    await asyncio.sleep(0.01)
+    dispatcher.submit("c1", "b")
+    await dispatcher.join()
+
+    assert recorder.calls == [("c1", ["a", "b"])]
+
+
+async def test_concurrency_is_bounded_across_conversations():
+    recorder = Recorder(delay=0.02)
+    dispatcher = EventDispatcher(recorder, max_concurrent_runs=2)
+
+    for i in range(6):
+        dispatcher.submit(f"c{i}", f"m{i}")
+    await dispatcher.join()
+
+    assert len(recorder.calls) == 6
+    assert recorder.max_running == 2
+    assert dispatcher.pending == 0
+
+
+async def test_errors_do_not_stop_the_conversation():
+    recorder = Recorder(delay=0.02, fail_on="bad")
+    dispatcher = EventDispatcher(recorder, max_batch_size=1)
+
+    dispatcher.submit("c1", "bad")
+    dispatcher.submit("c1", "good")
+    await dispatcher.join()
+
+    assert recorder.calls == [("c1", ["good"])]
+    assert dispatcher.metrics.errors == 1
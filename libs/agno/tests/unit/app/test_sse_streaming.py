@@ -0,0 +1,119 @@
+import asyncio
+import json
+
+import pytest
+
+from agno.agent import Agent
+from agno.models.replay import ReplayModel
+from agno.os.router import format_sse_event
+from agno.os.streaming import SSEEncoder, StreamCoalescingPolicy, stream_sse_events
+from agno.run.agent import RunContentEvent, RunStartedEvent, ToolCallStartedEvent
+
+ANSWER = "The weather in Paris is sunny, with a light breeze coming from the river."
+
+
+def parse_frames(frames):
+    events = []
+    for frame in "".join(frames).split("\n\n"):
+        if frame:
+            event_line, data_line = frame.split("\n")
+            events.append((event_line[len("event: ") :], json.loads(data_line[len("data: ") :])))
+    return events
+
+
+async def collect(events, policy=None):
+    async def iterate():
+        for event in events:
+            yield event
+
+    return [frames async for frames in stream_sse_events(iterate(), policy)]
+
+
+def content_events(*deltas, run_id="run-1"):
+    return [RunContentEvent(agent_id="agent", run_id=run_id, content=delta) for delta in deltas]
+
+
+def test_encoder_matches_format_sse_event():
+    encoder = SSEEncoder()
+    for event in [
+        RunContentEvent(agent_id="agent", agent_name="Agent", run_id="run-1", content="Hello"),
+        RunContentEvent(agent_id="agent", run_id="run-1", content={"city": "Paris"}, content_type="dict"),
+        RunStartedEvent(agent_id="agent", run_id="run-1", model="replay"),
+    ]:
+        assert encoder.encode(event) == format_sse_event(event)
+
+
+def test_disabled_policy_sends_every_event():
+    frames = asyncio.run(collect(content_events("a", "b", "c")))
+    assert len(frames) == 3
+
+
+def test_merges_content_until_size_limit():
+    events = content_events("Hello ", "world", ", how", " are") + [ToolCallStartedEvent(agent_id="agent")]
+    frames = asyncio.run(collect(events, StreamCoalescingPolicy(max_chars=11)))
+
+    assert [(name, data.get("content")) for name, data in parse_frames(frames)] == [
+        ("RunContent", "Hello world"),
+        ("RunContent", ", how are"),
+        ("ToolCallStarted", None),
+    ]
+    # The merged content and the event that ended it are written together
+    assert len(frames) == 2
+
+
+def test_merges_content_until_time_limit():
+    async def slow_events():
+        for event in content_events("a", "b", "c", "d"):
+            await asyncio.sleep(0.02)
+            yield event
+
+    async def run():
+        return [frames async for frames in stream_sse_events(slow_events(), StreamCoalescingPolicy(max_delay=0.03))]
+
+    events = parse_frames(asyncio.run(run()))
+    assert 1 < len(events) < 4
+    assert "".join(data["content"] for _, data in events) == "abcd"
+
+
+def test_does_not_merge_other_runs():
+    events = content_events("a", "b") + content_events("c", run_id="run-2")
+    frames = asyncio.run(collect(events, StreamCoalescingPolicy(max_chars=100)))
+    assert [data["content"] for _, data in parse_frames(frames)] == ["ab", "c"]
+
+
+def test_compact_encoding_skips_unchanged_fields():
+    frames = asyncio.run(collect(content_events("a", "b"), StreamCoalescingPolicy(compact=True)))
+    first, second = [data for _, data in parse_frames(frames)]
+
+    assert first["run_id"] == "run-1" and first["agent_id"] == "agent"
+    assert second == {"event": "RunContent", "content": "b"}
+
+
+def test_sends_merged_content_before_error():
+    async def failing_events():
+        for event in content_events("a", "b"):
+            yield event
+        raise ValueError("boom")
+
+    async def run():
+        frames = []
+        with pytest.raises(ValueError):
+            async for chunk in stream_sse_events(failing_events(), StreamCoalescingPolicy(max_chars=100)):
+                frames.append(chunk)
+        return frames
+
+    assert [data["content"] for _, data in parse_frames(asyncio.run(run()))] == ["ab"]
+
+
+def test_agent_stream():
+    agent = Agent(model=ReplayModel(responses=[ANSWER]), telemetry=False)
+
+    async def run():
+        events = agent.arun("What is the weather in Paris?", stream=True, stream_intermediate_steps=True)
+        return [frames async for frames in stream_sse_events(events, StreamCoalescingPolicy(max_chars=20))]  # type: ignore
+
+    events = parse_frames(asyncio.run(run()))
+    content = [data["content"] for name, data in events if name == "RunContent"]
+    assert "".join(content) == ANSWER
+    assert 1 < len(content) < len(ANSWER.split())
+    assert events[-1][0] == "RunCompleted"
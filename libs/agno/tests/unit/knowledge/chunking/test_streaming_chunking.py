@@ -0,0 +1,88 @@
+import io
+import random
+import re
+
+import pytest
+
+from agno.knowledge.chunking.document import DocumentChunking
+from agno.knowledge.chunking.fixed import FixedSizeChunking
+from agno.knowledge.chunking.recursive import RecursiveChunking
+from agno.knowledge.chunking.row import RowChunking
+from agno.knowledge.chunking.strategy import iter_clean_text, iter_text
+from agno.knowledge.document.base import Document
+
+TEXT = " ".join(
+    random.Random(0).choice(["lorem", "ipsum\n", "dolor\n\n", "sit", "amet.", "  ", "consectetur\r\n"])
+    for _ in range(3000)
+)
+
+
+def random_blocks(text: str, seed: int):
+    rng = random.Random(seed)
+    i = 0
+    while i < len(text):
+        size = rng.randint(1, 200)
+        yield text[i : i + size]
+        i += size
+
+
+def summarize(chunks):
+    return [(c.id, c.content, c.meta_data) for c in chunks]
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        FixedSizeChunking(chunk_size=300),
+        FixedSizeChunking(chunk_size=300, overlap=20),
+        RecursiveChunking(chunk_size=250, overlap=10),
+        RowChunking(),
+        RowChunking(skip_header=True),
+    ],
+)
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_chunk_stream_matches_chunk(strategy, seed):
+    document = Document(id="doc", name="doc", content=TEXT, meta_data={"source": "test"})
+    template = Document(id="doc", name="doc", content="", meta_data={"source": "test"})
+
+    expected = summarize(strategy.chunk(document))
+    streamed = summarize(strategy.chunk_stream(random_blocks(TEXT, seed), template))
+
+    assert streamed == expected
+
+
+def test_clean_text_streams_across_block_boundaries():
+    blocks = ["a  \n", "\t b", "   ", "c\n"]
+    assert "".join(iter_clean_text(blocks)) == FixedSizeChunking().clean_text("".join(blocks))
+
+
+def test_iter_text_decodes_file_handles_incrementally():
+    data = "naïve café " * 100
+    blocks = list(iter_text(io.BytesIO(data.encode("utf-8")), block_size=7))
+    assert len(blocks) > 1
+    assert "".join(blocks) == data
+
+
+def test_chunk_stream_is_lazy():
+    consumed = []
+
+    def blocks():
+        for i in range(1000):
+            consumed.append(i)
+            yield "word " * 100
+
+    chunks = FixedSizeChunking(chunk_size=1000).chunk_stream(blocks())
+    next(chunks)
+    assert len(consumed) < 10
+
+
+def test_default_chunk_stream_windows_and_renumbers():
+    strategy = DocumentChunking(chunk_size=100)
+    strategy.stream_window_size = 500
+    paragraphs = "\n\n".join(f"Paragraph {i} " + "text " * 15 for i in range(20))
+
+    chunks = list(strategy.chunk_stream(random_blocks(paragraphs, 0), Document(id="doc", content="")))
+
+    assert [c.meta_data["chunk"] for c in chunks] == list(range(1, len(chunks) + 1))
+    assert [c.id for c in chunks] == [f"doc_{i}" for i in range(1, len(chunks) + 1)]
+    assert re.sub(r"\s+", "", "".join(c.content for c in chunks)) == re.sub(r"\s+", "", paragraphs)
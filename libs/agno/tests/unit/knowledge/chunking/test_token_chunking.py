@@ -0,0 +1,102 @@
+import re
+import sys
+from types import ModuleType
+from typing import List
+
+import pytest
+
+from agno.knowledge.chunking.fixed import FixedSizeChunking
+from agno.knowledge.chunking.recursive import RecursiveChunking
+from agno.knowledge.chunking.tokenizer import ApproximateTokenizer, Tokenizer, get_tiktoken_tokenizer
+from agno.knowledge.document.base import Document
+from agno.knowledge.embedder.base import Embedder
+
+
+class WordTokenizer(Tokenizer):
+    """Counts every word as one token"""
+
+    def token_offsets(self, text: str) -> List[int]:
+        return [match.start() for match in re.finditer(r"\S+", text)]
+
+
+class WordEmbedder(Embedder):
+    def get_tokenizer(self) -> Tokenizer:
+        return WordTokenizer()
+
+
+TEXT = " ".join(f"w{i}" + ("." if i % 7 == 6 else "") for i in range(200))
+
+
+@pytest.mark.parametrize("strategy_class", [FixedSizeChunking, RecursiveChunking])
+def test_chunks_are_sized_in_tokens(strategy_class):
+    tokenizer = WordTokenizer()
+    chunks = strategy_class(chunk_size=20, tokenizer=tokenizer).chunk(Document(id="doc", content=TEXT))
+
+    assert all(tokenizer.count_tokens(c.content) <= 20 for c in chunks)
+    assert " ".join(c.content.strip() for c in chunks) == TEXT
+    # Fixed chunks are full, recursive chunks end at a sentence
+    assert len(chunks) <= (10 if strategy_class is FixedSizeChunking else 15)
+
+
+def test_fixed_token_overlap():
+    chunks = FixedSizeChunking(chunk_size=20, overlap=5, tokenizer=WordTokenizer()).chunk(Document(content=TEXT))
+
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous.content.split()[-5:] == current.content.split()[:5]
+    assert chunks[-1].content.endswith("w199")
+
+
+def test_character_sizing_is_unchanged_without_tokenizer():
+    chunks = FixedSizeChunking(chunk_size=100).chunk(Document(content=TEXT))
+    assert all(len(c.content) <= 100 for c in chunks)
+
+
+def test_embedder_provides_the_tokenizer():
+    strategy = RecursiveChunking(chunk_size=50, embedder=WordEmbedder())
+    assert isinstance(strategy.tokenizer, WordTokenizer)
+    # A document within the token budget is returned as is, even if it is longer than 50 characters
+    document = Document(content=" ".join(["word"] * 30))
+    assert strategy.chunk(document) == [document]
+
+
+def test_approximate_tokenizer():
+    tokenizer = ApproximateTokenizer()
+    assert tokenizer.count_tokens("hello world") == 2
+    assert tokenizer.count_tokens("tokenization") == 3
+    assert tokenizer.count_tokens("中文字符") == 4
+    assert tokenizer.token_offsets("hi, you") == [0, 2, 4]
+    assert Embedder().get_tokenizer().count_tokens("hello") == 1
+
+
+def test_tiktoken_falls_back_to_approximation(monkeypatch):
+    get_tiktoken_tokenizer.cache_clear()
+    monkeypatch.setitem(sys.modules, "tiktoken", None)
+    try:
+        assert isinstance(get_tiktoken_tokenizer("text-embedding-3-small"), ApproximateTokenizer)
+    finally:
+        get_tiktoken_tokenizer.cache_clear()
+
+
+def test_markdown_token_sizing(monkeypatch):
+    title_module = ModuleType("unstructured.chunking.title")
+    md_module = ModuleType("unstructured.partition.md")
+    title_module.chunk_by_title = lambda **kwargs: []  # type: ignore
+    md_module.partition_md = lambda **kwargs: []  # type: ignore
+    for name, module in [
+        ("unstructured", ModuleType("unstructured")),
+        ("unstructured.chunking", ModuleType("unstructured.chunking")),
+        ("unstructured.chunking.title", title_module),
+        ("unstructured.partition", ModuleType("unstructured.partition")),
+        ("unstructured.partition.md", md_module),
+    ]:
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.delitem(sys.modules, "agno.knowledge.chunking.markdown", raising=False)
+
+    from agno.knowledge.chunking.markdown import MarkdownChunking
+
+    tokenizer = WordTokenizer()
+    paragraphs = "\n\n".join(" ".join(f"p{p}w{i}" for i in range(8)) for p in range(10)) + "\n\n" + TEXT
+    chunks = MarkdownChunking(chunk_size=20, tokenizer=tokenizer).chunk(Document(content=paragraphs))
+
+    assert all(tokenizer.count_tokens(c.content) <= 20 for c in chunks)
+    assert sum(tokenizer.count_tokens(c.content) for c in chunks) == tokenizer.count_tokens(paragraphs)
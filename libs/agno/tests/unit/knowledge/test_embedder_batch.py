@@ -0,0 +1,154 @@
+import threading
+from typing import Dict, List, Optional
+
+import pytest
+
+from agno.knowledge.embedder import batch as batch_module
+from agno.knowledge.embedder.batch import (
+    BatchScheduler,
+    async_embed_in_batches,
+    embed_in_batches,
+    get_retry_after,
+    is_rate_limit_error,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: Dict[str, str]):
+        self.status_code = status_code
+        self.headers = headers
+
+
+class FakeAPIError(Exception):
+    def __init__(self, status_code: int, headers: Optional[Dict[str, str]] = None):
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+        self.response = FakeResponse(status_code, headers or {})
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(batch_module, "backoff_delay", lambda attempt, *args, **kwargs: 0.0)
+
+
+def fake_embed(texts: List[str]):
+    return [[float(len(text))] for text in texts], {"total_tokens": len(texts)}
+
+
+def test_plan_respects_batch_size_and_token_budget():
+    scheduler = BatchScheduler(["a" * 40] * 10, batch_size=4, max_batch_tokens=25)
+    # Each text is estimated at 11 tokens, so only two fit within the token budget
+    assert [(b.start, b.end) for b in scheduler._pending] == [(0, 2), (2, 4), (4, 6), (6, 8), (8, 10)]
+
+    scheduler = BatchScheduler(["a"] * 10, batch_size=4)
+    assert [(b.start, b.end) for b in scheduler._pending] == [(0, 4), (4, 8), (8, 10)]
+
+
+def test_retry_after_headers():
+    assert get_retry_after(FakeAPIError(429, {"retry-after": "2"})) == 2.0
+    assert get_retry_after(FakeAPIError(429, {"retry-after-ms": "500"})) == 0.5
+    assert get_retry_after(FakeAPIError(429)) is None
+    assert is_rate_limit_error(FakeAPIError(429))
+    assert is_rate_limit_error(Exception("Too Many Requests"))
+    assert not is_rate_limit_error(FakeAPIError(500))
+
+
+def test_embed_in_batches_preserves_order():
+    texts = [f"text-{'x' * i}" for i in range(25)]
+    embeddings, usage = embed_in_batches(texts, fake_embed, batch_size=4, max_concurrency=3)
+
+    assert embeddings == [[float(len(text))] for text in texts]
+    assert usage[0] == {"total_tokens": 4}
+    assert usage[-1] == {"total_tokens": 1}
+
+
+def test_rate_limit_lowers_concurrency_and_retries():
+    lock = threading.Lock()
+    calls = {"count": 0}
+
+    def flaky_embed(texts: List[str]):
+        with lock:
+            calls["count"] += 1
+            first = calls["count"] == 1
+        if first:
+            raise FakeAPIError(429, {"retry-after": "0"})
+        return fake_embed(texts)
+
+    scheduler_limits = []
+    original_fail = BatchScheduler.fail
+
+    def recording_fail(self, batch, error):
+        original_fail(self, batch, error)
+        scheduler_limits.append(self.limit)
+
+    BatchScheduler.fail = recording_fail  # type: ignore
+    try:
+        embeddings, _ = embed_in_batches(["a", "b", "c", "d"], flaky_embed, batch_size=1, max_concurrency=4)
+    finally:
+        BatchScheduler.fail = original_fail  # type: ignore
+
+    assert embeddings == [[1.0]] * 4
+    assert scheduler_limits == [2]
+    assert calls["count"] == 5
+
+
+def test_persistent_rate_limit_raises():
+    def always_limited(texts: List[str]):
+        raise FakeAPIError(429, {"retry-after": "0"})
+
+    with pytest.raises(FakeAPIError):
+        embed_in_batches(["a", "b"], always_limited, batch_size=2, max_retries=2)
+
+    with pytest.raises(FakeAPIError):
+        embed_in_batches(["a", "b"], always_limited, batch_size=2, retry_rate_limits=False)
+
+
+def test_bad_request_is_bisected_to_the_offending_text():
+    calls: List[List[str]] = []
+
+    def reject_bad(texts: List[str]):
+        calls.append(texts)
+        if "bad" in texts:
+            raise FakeAPIError(400)
+        return fake_embed(texts)
+
+    embeddings, usage = embed_in_batches(["ok", "bad", "fine", "good"], reject_bad, batch_size=4)
+
+    assert embeddings == [[2.0], [], [4.0], [4.0]]
+    assert usage[1] is None
+    # The client error is not retried as-is, only split
+    assert calls[0] == ["ok", "bad", "fine", "good"]
+    assert ["ok", "bad", "fine", "good"] not in calls[1:]
+
+
+def test_persistent_connection_error_is_not_bisected():
+    calls: List[List[str]] = []
+
+    def unreachable(texts: List[str]):
+        calls.append(texts)
+        raise ConnectionError("Connection refused")
+
+    texts = [f"text {i}" for i in range(100)]
+    embeddings, usage = embed_in_batches(texts, unreachable, batch_size=100, max_retries=2)
+
+    assert embeddings == [[] for _ in texts]
+    assert usage == [None] * 100
+    # The batch is retried as-is, and then left without embeddings
+    assert calls == [texts] * 3
+
+
+async def test_async_embed_in_batches_with_transient_error():
+    calls = {"count": 0}
+
+    async def flaky_embed(texts: List[str]):
+        calls["count"] += 1
+        if calls["count"] == 2:
+            raise FakeAPIError(503)
+        return fake_embed(texts)
+
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+    embeddings, usage = await async_embed_in_batches(texts, flaky_embed, batch_size=2, max_concurrency=2)
+
+    assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert usage[4] == {"total_tokens": 1}
+    assert calls["count"] == 4
@@ -0,0 +1,115 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.hybrid import BM25Index, HybridSearch, reciprocal_rank_fusion
+from agno.knowledge.knowledge import Knowledge
+from agno.vectordb.numpydb import NumpyDb
+
+
+@dataclass
+class ConstantEmbedder(Embedder):
+    """Embeds every text the same way, so vector search can't tell documents apart"""
+
+    dimensions: Optional[int] = 4
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [1.0, 0.0, 0.0, 0.0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+def test_bm25_index_is_incremental(tmp_path):
+    index = BM25Index(path=str(tmp_path / "keywords.json"))
+    index.add(
+        [Document(content="error code E1234 when starting the pump"), Document(content="how to start the pump")],
+        content_hash="manual",
+        metadata={"product": "pump"},
+    )
+    index.add([Document(content="the valve leaks at low pressure", meta_data={"product": "valve"})])
+
+    results = index.search("E1234 pump", limit=2)
+    assert results[0][0].content == "error code E1234 when starting the pump"
+    assert results[0][1] > results[1][1]
+    assert [document.content for document, _ in index.search("the", filters={"product": "valve"})] == [
+        "the valve leaks at low pressure"
+    ]
+
+    assert index.remove_by_content_hash("manual") == 2
+    assert index.search("pump") == []
+    # The index is reloaded from its file
+    assert len(BM25Index(path=str(tmp_path / "keywords.json"))) == 1
+
+
+def test_bm25_index_removes_documents_by_vector_db_id(tmp_path):
+    path = tmp_path / "keywords.json"
+    BM25Index(path=str(path)).add(
+        [Document(id="point-1", content="the pump hums"), Document(id="point-2", content="the valve leaks")]
+    )
+
+    # The ids are kept in the file, and don't match the content keys of the index
+    index = BM25Index(path=str(path))
+    assert index.remove_by_id("point-1") == 1
+    assert [document.content for document, _ in index.search("the")] == ["the valve leaks"]
+    assert len(BM25Index(path=str(path))) == 1
+
+
+def test_bm25_index_appends_changes_to_a_log(tmp_path):
+    path = tmp_path / "keywords.json"
+    index = BM25Index(path=str(path))
+    index.add([Document(content="the pump hums"), Document(content="the valve leaks")], content_hash="first")
+    snapshot = path.read_text()
+
+    index.add([Document(content="the filter clogs")], content_hash="second")
+    index.remove_by_content_hash("first")
+    # Changes are appended to the log, the JSON file is not rewritten
+    assert path.read_text() == snapshot
+    assert len((tmp_path / "keywords.json.1.log").read_text().splitlines()) == 2
+
+    with open(tmp_path / "keywords.json.1.log", "a") as f:
+        f.write('{"add": {"partial')
+    reloaded = BM25Index(path=str(path))
+    assert [document.content for document, _ in reloaded.search("the")] == ["the filter clogs"]
+    reloaded.add([Document(content="the hose bursts")])
+    assert len(BM25Index(path=str(path))) == 2
+
+    # The log is compacted into the JSON file once it holds more documents than the index
+    reloaded.add([Document(content=f"document {i}") for i in range(1000)])
+    assert not (tmp_path / "keywords.json.1.log").exists()
+    assert len(BM25Index(path=str(path))) == 1002
+
+
+def test_reciprocal_rank_fusion():
+    a, b, c = Document(content="a"), Document(content="b"), Document(content="c")
+
+    assert [document.content for document in reciprocal_rank_fusion([[a, b, c], [b, c]])] == ["b", "c", "a"]
+    fused = reciprocal_rank_fusion([[a, b, c], [c]], weights=[1.0, 3.0], limit=2)
+    assert [document.content for document in fused] == ["c", "a"]
+
+
+def test_knowledge_fuses_keyword_and_vector_results():
+    knowledge = Knowledge(
+        vector_db=NumpyDb(embedder=ConstantEmbedder()),
+        hybrid_search=HybridSearch(),
+    )
+    for i, text in enumerate(["The pump shows error E1234", "Cleaning the filter", "Replacing the valve"]):
+        knowledge.add_content(name=f"doc-{i}", text_content=text, metadata={"team": "support"})
+
+    assert knowledge.search("what does E1234 mean?", max_results=1)[0].content == "The pump shows error E1234"
+    results = asyncio.run(knowledge.async_search("valve", max_results=2, filters={"team": "support"}))
+    assert results[0].content == "Replacing the valve"
+
+    metrics = knowledge.hybrid_search.get_metrics()  # type: ignore
+    assert metrics["vector"]["searches"] == metrics["keyword"]["searches"] == metrics["fusion"]["searches"] == 2
+
+    knowledge.remove_vectors_by_name("doc-2")
+    assert knowledge.hybrid_search.index.search("valve") == []  # type: ignore
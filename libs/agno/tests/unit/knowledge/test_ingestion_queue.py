@@ -0,0 +1,240 @@
+import asyncio
+import os
+import time
+from io import BytesIO
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from agno.knowledge.content import Content, ContentStatus
+from agno.knowledge.ingestion import IngestionJob, IngestionQueue
+
+
+class FakeKnowledge:
+    """Records the contents it loads and the status updates of the contents DB"""
+
+    def __init__(self, failures: int = 0, reject: bool = False):
+        self.failures = failures
+        self.reject = reject
+        self.contents_db = None
+        self.readers: Optional[Dict[str, Any]] = None
+        self.loaded: List[Content] = []
+        self.rows: Dict[str, Content] = {}
+        self.status_updates: List[ContentStatus] = []
+
+    def _add_to_contents_db(self, content: Content) -> None:
+        self.rows[content.id] = content  # type: ignore
+
+    def patch_content(self, content: Content) -> None:
+        self.status_updates.append(content.status)  # type: ignore
+
+    async def _load_content(self, content: Content, upsert: bool, skip_if_exists: bool) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("embedder unavailable")
+        if self.reject:
+            content.status = ContentStatus.FAILED
+            content.status_message = "Unsupported file"
+            return
+        self.loaded.append(content)
+
+
+def make_queue(tmp_path, knowledge: FakeKnowledge, **kwargs) -> IngestionQueue:
+    return IngestionQueue(
+        knowledge_instances=[knowledge],  # type: ignore
+        spool_dir=str(tmp_path),
+        retry_delay=0,
+        poll_interval=0.01,
+        **kwargs,
+    )
+
+
+def enqueue_file(queue: IngestionQueue, body: bytes = b"hello world") -> IngestionJob:
+    job = IngestionJob(content_id="content-1", name="doc.txt", filename="doc.txt", file_type="text/plain")
+    queue.spool_body(job, BytesIO(body))
+    queue.enqueue(job)
+    return job
+
+
+async def wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+async def test_job_is_processed_by_a_worker(tmp_path):
+    knowledge = FakeKnowledge()
+    queue = make_queue(tmp_path, knowledge)
+    job = enqueue_file(queue)
+
+    assert knowledge.rows["content-1"].status == ContentStatus.PROCESSING
+    assert queue.get_metrics()["pending"] == 1
+
+    queue.start()
+    try:
+        await wait_for(lambda: knowledge.loaded)
+    finally:
+        await queue.stop()
+
+    assert knowledge.loaded[0].file_data.content == b"hello world"  # type: ignore
+    assert not queue.body_path(job).exists()
+    metrics = queue.get_metrics()
+    assert metrics["pending"] == metrics["running"] == 0
+    assert metrics["completed"] == 1
+
+
+async def test_failed_jobs_are_retried(tmp_path):
+    knowledge = FakeKnowledge(failures=2)
+    queue = make_queue(tmp_path, knowledge, max_attempts=3)
+    enqueue_file(queue)
+
+    queue.start()
+    try:
+        await wait_for(lambda: knowledge.loaded)
+    finally:
+        await queue.stop()
+
+    assert queue.metrics.retried == 2
+    assert queue.metrics.completed == 1
+
+
+async def test_job_fails_after_max_attempts(tmp_path):
+    knowledge = FakeKnowledge(failures=5)
+    queue = make_queue(tmp_path, knowledge, max_attempts=2)
+    job = enqueue_file(queue)
+
+    queue.start()
+    try:
+        await wait_for(lambda: queue.metrics.failed)
+    finally:
+        await queue.stop()
+
+    assert knowledge.status_updates == [ContentStatus.PROCESSING, ContentStatus.FAILED]
+    assert (queue.failed_dir / f"{job.id}.json").exists()
+    assert not queue.body_path(job).exists()
+
+
+async def test_rejected_content_is_not_retried(tmp_path):
+    knowledge = FakeKnowledge(reject=True)
+    queue = make_queue(tmp_path, knowledge)
+    enqueue_file(queue)
+
+    queue.start()
+    try:
+        await wait_for(lambda: queue.metrics.failed)
+    finally:
+        await queue.stop()
+
+    assert queue.metrics.retried == 0
+    assert queue.get_metrics()["failed"] == 1
+
+
+async def test_jobs_of_a_stopped_worker_are_recovered(tmp_path):
+    knowledge = FakeKnowledge()
+    queue = make_queue(tmp_path, knowledge, lease_timeout=1)
+    job = enqueue_file(queue)
+
+    # Simulate a worker that claimed the job and then crashed
+    assert queue._claim_next_job() is not None
+    running_file = queue.running_dir / f"{job.id}.json"
+    os.utime(running_file, (time.time() - 10, time.time() - 10))
+
+    # A new queue on the same spool directory, e.g. after a restart
+    restarted = make_queue(tmp_path, knowledge, lease_timeout=1)
+    restarted.start()
+    try:
+        await wait_for(lambda: knowledge.loaded)
+    finally:
+        await restarted.stop()
+
+    assert restarted.metrics.recovered == 1
+
+
+def test_job_is_claimed_once(tmp_path):
+    queue = make_queue(tmp_path, FakeKnowledge())
+    enqueue_file(queue)
+    other = make_queue(tmp_path, FakeKnowledge())
+
+    assert queue._claim_next_job() is not None
+    assert other._claim_next_job() is None
+
+
+def test_job_that_stops_its_worker_fails_after_max_attempts(tmp_path):
+    knowledge = FakeKnowledge()
+    queue = make_queue(tmp_path, knowledge, lease_timeout=1, max_attempts=2)
+    job = enqueue_file(queue)
+    running_file = queue.running_dir / f"{job.id}.json"
+
+    for attempt in (1, 2):
+        # The worker claims the job and crashes before processing it
+        claimed = queue._claim_next_job()
+        assert claimed is not None and claimed.attempts == attempt
+        assert queue._read_job(running_file).attempts == attempt  # type: ignore
+        os.utime(running_file, (time.time() - 10, time.time() - 10))
+        queue._recover_expired_jobs()
+
+    assert queue._claim_next_job() is None
+    assert queue.metrics.recovered == 1
+    assert queue.metrics.failed == 1
+    assert (queue.failed_dir / f"{job.id}.json").exists()
+    assert not running_file.exists()
+    assert knowledge.status_updates[-1] == ContentStatus.FAILED
+    assert list(queue.bodies_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize("delay, ready", [(0, True), (60, False)])
+def test_retries_wait_for_their_delay(tmp_path, delay, ready):
+    queue = make_queue(tmp_path, FakeKnowledge())
+    job = enqueue_file(queue)
+    assert queue._claim_next_job() is not None
+    job.next_attempt_at = time.time() + delay
+    queue._move_job(job, queue.running_dir, queue.pending_dir)
+
+    assert (queue._claim_next_job() is not None) == ready
+
+
+def test_jobs_are_claimed_in_order(tmp_path):
+    queue = make_queue(tmp_path, FakeKnowledge())
+    now = time.time()
+    later = IngestionJob(content_id="later", next_attempt_at=now + 60)
+    second = IngestionJob(content_id="second", created_at=int(now) - 10)
+    first = IngestionJob(content_id="first", created_at=int(now) - 20)
+    for job in (later, second, first):
+        queue._write_job(queue.pending_dir, job)
+
+    claimed = [queue._claim_next_job() for _ in range(3)]
+    assert [job.content_id if job else None for job in claimed] == ["first", "second", None]
+
+
+def test_unreadable_job_is_failed(tmp_path):
+    queue = make_queue(tmp_path, FakeKnowledge())
+    (queue.pending_dir / "000000000000000_broken.json").write_text("{not json")
+
+    assert queue._claim_next_job() is None
+    assert (queue.failed_dir / "broken.json").exists()
+
+
+def test_body_is_deleted_if_enqueue_fails(tmp_path):
+    class BrokenContentsDb(FakeKnowledge):
+        def _add_to_contents_db(self, content: Content) -> None:
+            raise RuntimeError("contents db is down")
+
+    queue = make_queue(tmp_path, BrokenContentsDb())
+    with pytest.raises(RuntimeError):
+        enqueue_file(queue)
+
+    assert list(queue.bodies_dir.iterdir()) == []
+    assert list(queue.pending_dir.iterdir()) == []
+
+
+def test_default_spool_dir_is_private_and_namespaced():
+    knowledge, other = FakeKnowledge(), FakeKnowledge()
+    knowledge.contents_db = SimpleNamespace(id="db-1")
+    other.contents_db = SimpleNamespace(id="db-2")
+
+    spool_dir = IngestionQueue._default_spool_dir([knowledge])  # type: ignore
+    assert spool_dir == IngestionQueue._default_spool_dir([knowledge])  # type: ignore
+    assert spool_dir != IngestionQueue._default_spool_dir([other])  # type: ignore
+    assert spool_dir.parent.parent.stat().st_mode & 0o077 == 0
@@ -0,0 +1,102 @@
+import sys
+from types import ModuleType
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def sentence_transformer_embedder(monkeypatch):
+    module = ModuleType("sentence_transformers")
+    module.SentenceTransformer = MagicMock()  # type: ignore
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    monkeypatch.delitem(sys.modules, "agno.knowledge.embedder.sentence_transformer", raising=False)
+
+    from agno.knowledge.embedder.sentence_transformer import SentenceTransformerEmbedder
+
+    client = MagicMock()
+    client.encode.side_effect = lambda texts, **kwargs: np.ones((len(texts), 4), dtype=np.float64)
+    return SentenceTransformerEmbedder(dimensions=4, batch_size=8, sentence_transformer_client=client)
+
+
+@pytest.fixture
+def fastembed_embedder(monkeypatch):
+    module = ModuleType("fastembed")
+    module.TextEmbedding = MagicMock()  # type: ignore
+    monkeypatch.setitem(sys.modules, "fastembed", module)
+    monkeypatch.delitem(sys.modules, "agno.knowledge.embedder.fastembed", raising=False)
+
+    from agno.knowledge.embedder.fastembed import FastEmbedEmbedder
+
+    client = MagicMock()
+    client.embed.side_effect = lambda texts, **kwargs: (np.ones(4, dtype=np.float32) for _ in texts)
+    return FastEmbedEmbedder(dimensions=4, fastembed_client=client)
+
+
+def test_sentence_transformer_batch_encodes_in_one_call(sentence_transformer_embedder):
+    texts = [f"text {i}" for i in range(20)]
+
+    embeddings, usages = sentence_transformer_embedder.get_embeddings_batch_and_usage(texts)
+
+    assert len(embeddings) == 20
+    assert embeddings[0] == [1.0, 1.0, 1.0, 1.0]
+    assert usages == [None] * 20
+    client = sentence_transformer_embedder.sentence_transformer_client
+    client.encode.assert_called_once()
+    assert client.encode.call_args.kwargs["batch_size"] == 8
+
+
+def test_sentence_transformer_array_is_float32(sentence_transformer_embedder):
+    array = sentence_transformer_embedder.get_embeddings_array(["a", "b"])
+    assert array.dtype == np.float32
+    assert array.shape == (2, 4)
+
+    empty = sentence_transformer_embedder.get_embeddings_array([])
+    assert empty.shape == (0, 4)
+
+
+def test_sentence_transformer_multi_process_pool_is_reused(sentence_transformer_embedder):
+    client = sentence_transformer_embedder.sentence_transformer_client
+    client.start_multi_process_pool.return_value = {"processes": []}
+    client.encode_multi_process.side_effect = lambda texts, pool, **kwargs: np.ones((len(texts), 4))
+    sentence_transformer_embedder.multi_process = True
+
+    sentence_transformer_embedder.get_embeddings_batch_and_usage(["a", "b"])
+    sentence_transformer_embedder.get_embeddings_batch_and_usage(["c"])
+
+    client.start_multi_process_pool.assert_called_once()
+    assert client.encode_multi_process.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_sentence_transformer_async_batch(sentence_transformer_embedder):
+    embeddings, usages = await sentence_transformer_embedder.async_get_embeddings_batch_and_usage(["a", "b", "c"])
+    assert len(embeddings) == 3
+    assert len(usages) == 3
+    sentence_transformer_embedder.sentence_transformer_client.encode.assert_called_once()
+
+
+def test_fastembed_batch_reuses_model(fastembed_embedder):
+    embeddings, usages = fastembed_embedder.get_embeddings_batch_and_usage(["a", "b", "c"])
+    fastembed_embedder.get_embedding("d")
+
+    assert len(embeddings) == 3
+    assert embeddings[0] == [1.0, 1.0, 1.0, 1.0]
+    assert usages == [None, None, None]
+    assert fastembed_embedder.fastembed_client.embed.call_count == 2
+
+
+def test_local_embedders_enable_batch_by_default(sentence_transformer_embedder, fastembed_embedder):
+    assert sentence_transformer_embedder.enable_batch
+    assert fastembed_embedder.enable_batch
+
+
+def test_batch_embedding_errors_propagate(sentence_transformer_embedder, fastembed_embedder):
+    sentence_transformer_embedder.sentence_transformer_client.encode.side_effect = RuntimeError("out of memory")
+    fastembed_embedder.fastembed_client.embed.side_effect = RuntimeError("out of memory")
+
+    with pytest.raises(RuntimeError):
+        sentence_transformer_embedder.get_embeddings_batch_and_usage(["a", "b"])
+    with pytest.raises(RuntimeError):
+        fastembed_embedder.get_embeddings_batch_and_usage(["a", "b"])
@@ -0,0 +1,88 @@
+import gc
+import sys
+from types import ModuleType
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.knowledge.document import Document
+from agno.knowledge.local_models import LocalModelRegistry, get_local_model_registry, warm_up_local_models
+
+
+class Holder:
+    pass
+
+
+class FakeModel:
+    def __init__(self, size: int):
+        self.size = size
+
+    def parameters(self):
+        parameter = MagicMock()
+        parameter.numel.return_value = self.size
+        parameter.element_size.return_value = 1
+        return [parameter]
+
+
+def test_model_is_loaded_once_and_shared():
+    registry = LocalModelRegistry()
+    loads = []
+
+    def load():
+        loads.append(1)
+        return FakeModel(10)
+
+    first, second = Holder(), Holder()
+    model = registry.get("embedder", "mini", load=load, holder=first)
+    assert registry.get("embedder", "mini", load=load, holder=second) is model
+    assert len(loads) == 1
+    assert registry.get_reference_count("embedder", "mini") == 2
+
+    # Different loading arguments are a different model
+    assert registry.get("embedder", "mini", load=load, kwargs={"device": "cpu"}) is not model
+
+    del first
+    gc.collect()
+    assert registry.get_reference_count("embedder", "mini") == 1
+
+
+def test_released_models_are_evicted_over_the_memory_budget():
+    registry = LocalModelRegistry(max_memory_bytes=25)
+    holder = Holder()
+
+    registry.get("embedder", "used", load=lambda: FakeModel(10), holder=holder)
+    registry.get("embedder", "released", load=lambda: FakeModel(10))
+    registry.get("embedder", "new", load=lambda: FakeModel(10))
+
+    # The least recently used released model is evicted, the model in use is kept
+    assert registry.is_loaded("embedder", "used")
+    assert not registry.is_loaded("embedder", "released")
+    assert registry.is_loaded("embedder", "new")
+    assert registry.memory_usage == 20
+
+
+@pytest.fixture
+def cross_encoder(monkeypatch):
+    module = ModuleType("sentence_transformers")
+    module.CrossEncoder = MagicMock()  # type: ignore
+    module.CrossEncoder.return_value.predict.side_effect = lambda pairs: MagicMock(
+        tolist=lambda: [float(len(document)) for _, document in pairs]
+    )
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    monkeypatch.delitem(sys.modules, "agno.knowledge.reranker.sentence_transformer", raising=False)
+    yield module.CrossEncoder
+    get_local_model_registry().clear()
+
+
+def test_reranker_loads_its_model_once(cross_encoder):
+    from agno.knowledge.reranker.sentence_transformer import SentenceTransformerReranker
+
+    reranker = SentenceTransformerReranker(model="test-reranker")
+    copy = SentenceTransformerReranker(model="test-reranker")
+    warm_up_local_models(reranker, copy, object())
+
+    for _ in range(3):
+        documents = reranker.rerank("query", [Document(content="short"), Document(content="much longer")])
+        assert [document.content for document in documents] == ["much longer", "short"]
+
+    assert cross_encoder.call_count == 1
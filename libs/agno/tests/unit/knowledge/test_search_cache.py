@@ -0,0 +1,85 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.search_cache import SearchCache, build_search_key
+from agno.vectordb.numpydb import NumpyDb
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    """Embeds a text by the letters it contains and counts the embedding requests"""
+
+    dimensions: Optional[int] = 26
+    calls: int = 0
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.calls += 1
+        embedding = [0.0] * 26
+        for char in text.lower():
+            if "a" <= char <= "z":
+                embedding[ord(char) - ord("a")] += 1.0
+        return embedding
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+def test_search_key_normalizes_the_query():
+    assert build_search_key("  What is   AGNO? ", 5) == build_search_key("what is agno?", 5)
+    assert build_search_key("agno", 5, {"a": 1, "b": 2}) == build_search_key("agno", 5, {"b": 2, "a": 1})
+    assert build_search_key("agno", 5) != build_search_key("agno", 10)
+
+
+def test_search_cache_expires_entries():
+    cache = SearchCache(ttl=0.05, max_entries=1)
+    cache.set("a", 0, [Document(content="a")])
+    assert cache.get("a", 0)[0].content == "a"  # type: ignore
+    assert cache.get("a", 1) is None
+
+    cache.set("a", 0, [Document(content="a")])
+    time.sleep(0.06)
+    assert cache.get("a", 0) is None
+
+    cache.set("a", 0, [])
+    cache.set("b", 0, [])
+    assert cache.get_metrics() == {
+        "hits": 1,
+        "misses": 2,
+        "expired": 1,
+        "invalidated": 1,
+        "evictions": 1,
+        "hit_rate": 1 / 3,
+        "entries": 1,
+    }
+
+
+def test_knowledge_search_is_cached_until_content_changes():
+    embedder = CountingEmbedder()
+    knowledge = Knowledge(vector_db=NumpyDb(embedder=embedder), search_cache=SearchCache())
+    knowledge.add_content(name="pump", text_content="The pump shows error E1234")
+
+    calls = embedder.calls
+    first = knowledge.search("pump error", max_results=2)
+    first[0].content = "changed by the caller"
+    assert knowledge.search("Pump  error", max_results=2)[0].content == "The pump shows error E1234"
+    assert asyncio.run(knowledge.async_search("pump error", max_results=2))[0].name == "pump"
+    assert embedder.calls == calls + 1
+
+    # Ingesting content invalidates the cached results
+    knowledge.add_content(name="valve", text_content="The valve leaks")
+    assert len(knowledge.search("pump error", max_results=2)) == 2
+
+    knowledge.remove_vectors_by_name("valve")
+    assert len(knowledge.search("pump error", max_results=2)) == 1
+    assert knowledge.search_cache.get_metrics()["hit_rate"] == 0.4  # type: ignore
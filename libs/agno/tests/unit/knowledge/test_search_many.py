@@ -0,0 +1,101 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agno.agent import Agent
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.multi_query import merge_results, unique_queries
+from agno.knowledge.search_cache import SearchCache
+from agno.run.agent import RunOutput
+from agno.vectordb.numpydb import NumpyDb
+
+WORDS = ["pump", "error", "valve", "leak", "filter", "clean"]
+
+
+@dataclass
+class BatchEmbedder(Embedder):
+    """Embeds a text by the known words it contains, and counts single and batch embedding requests"""
+
+    dimensions: Optional[int] = len(WORDS)
+    calls: int = 0
+    batch_calls: int = 0
+
+    def _embed(self, text: str) -> List[float]:
+        return [float(word in text.lower()) + 0.01 for word in WORDS]
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.calls += 1
+        return self._embed(text)
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.batch_calls += 1
+        return [self._embed(text) for text in texts], [None] * len(texts)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return self.get_embeddings_batch_and_usage(texts)
+
+
+def make_knowledge(embedder: BatchEmbedder, search_cache: Optional[SearchCache] = None) -> Knowledge:
+    vector_db = NumpyDb(embedder=embedder)
+    vector_db.insert(
+        content_hash="manual",
+        documents=[
+            Document(content="The pump shows an error"),
+            Document(content="The valve has a leak"),
+            Document(content="Clean the filter"),
+        ],
+    )
+    return Knowledge(vector_db=vector_db, search_cache=search_cache)
+
+
+def test_merge_results_deduplicates_documents():
+    a, b, c = Document(content="a"), Document(content="b"), Document(content="c")
+    assert [d.content for d in merge_results([[a, b], [Document(content="b"), c]], limit=3)] == ["b", "a", "c"]
+
+    scored = [Document(content="a", reranking_score=0.2), Document(content="b", reranking_score=0.5)]
+    assert [d.content for d in merge_results([scored, [Document(content="a", reranking_score=0.9)]])] == ["a", "b"]
+    assert unique_queries(["Pump error", " pump  ERROR", "", "valve"]) == ["Pump error", "valve"]
+
+
+def test_search_many_embeds_queries_in_one_batch():
+    embedder = BatchEmbedder()
+    knowledge = make_knowledge(embedder, search_cache=SearchCache())
+    calls = embedder.calls
+
+    results = knowledge.search_many(["pump error", "valve leak", "Pump  error"], max_results=2)
+    assert {document.content for document in results} == {"The pump shows an error", "The valve has a leak"}
+    assert embedder.batch_calls == 1 and embedder.calls == calls
+
+    # Cached queries are not searched again
+    results = asyncio.run(knowledge.async_search_many(["pump error", "clean filter"], max_results=2))
+    assert {document.content for document in results} == {"The pump shows an error", "Clean the filter"}
+    assert embedder.batch_calls == 2
+    assert knowledge.search_cache.metrics.hits == 1  # type: ignore
+
+
+def test_agent_multi_query_search_tool():
+    embedder = BatchEmbedder()
+    agent = Agent(knowledge=make_knowledge(embedder), search_knowledge_multi_query=True)
+    run_response = RunOutput(run_id="run", session_id="session")
+
+    function = agent._get_multi_query_search_knowledge_base_function(run_response=run_response)
+    assert function.name == "search_knowledge_base"
+    result = json.loads(function.entrypoint(queries=["pump error", "filter"]))  # type: ignore
+
+    assert [document["content"] for document in result][:2] == ["The pump shows an error", "Clean the filter"]
+    assert run_response.references[0].query == "pump error; filter"  # type: ignore
+    assert embedder.batch_calls == 1
@@ -0,0 +1,51 @@
+import copy
+import pickle
+
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ToolExecution
+
+
+def test_metrics_are_summed_in_place():
+    provider_metrics = {"model": "a"}
+    first = Metrics(input_tokens=10, total_tokens=12, duration=1.0, provider_metrics=provider_metrics)
+    second = Metrics(input_tokens=5, total_tokens=6, time_to_first_token=0.2, provider_metrics={"region": "b"})
+
+    total = Metrics()
+    same = total
+    total += first
+    total += second
+    assert total is same
+    assert total.to_dict() == {
+        "input_tokens": 15,
+        "total_tokens": 18,
+        "duration": 1.0,
+        "time_to_first_token": 0.2,
+        "provider_metrics": {"model": "a", "region": "b"},
+    }
+    # The added metrics are not changed
+    assert provider_metrics == {"model": "a"} and first.input_tokens == 10
+
+    assert (first + second).to_dict() == total.to_dict()
+    assert sum([first, second]).to_dict() == total.to_dict()  # type: ignore
+
+
+def test_compact_dataclasses_have_no_instance_dict():
+    metrics = Metrics(input_tokens=1, provider_metrics={"a": {"b": 1}})
+    tool = ToolExecution(tool_name="get_weather", metrics=metrics)
+    assert not hasattr(metrics, "__dict__") and not hasattr(tool, "__dict__")
+
+    assert copy.deepcopy(tool) == tool
+    assert pickle.loads(pickle.dumps(metrics)) == metrics
+    assert ToolExecution.from_dict(tool.to_dict()).metrics == metrics
+    # to_dict returns copies of the nested dicts
+    metrics.to_dict()["provider_metrics"]["a"]["b"] = 2
+    assert metrics.provider_metrics == {"a": {"b": 1}}
+
+
+def test_message_metrics_round_trip():
+    message = Message(role="assistant", content="Hi", metrics=Metrics(input_tokens=3, output_tokens=2, duration=0.1))
+    restored = Message.from_dict(message.to_dict())
+    assert isinstance(restored.metrics, Metrics)
+    assert restored.metrics == message.metrics
+    assert Message.from_dict({"role": "user", "content": "Hi"}).metrics == Metrics()
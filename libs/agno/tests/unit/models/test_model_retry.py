@@ -0,0 +1,160 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import pytest
+
+from agno.agent import Agent
+from agno.exceptions import ModelProviderError
+from agno.models.latency import LatencyHistogram
+from agno.models.message import Message
+from agno.models.replay import ReplayModel
+from agno.models.retry import ModelRetryPolicy, RetryBudget, get_retry_after
+
+NO_DELAY = dict(initial_delay=0, jitter=False)
+
+
+@dataclass
+class FlakyModel(ReplayModel):
+    """Replay model whose first requests fail"""
+
+    failures: int = 0
+    status_code: int = 503
+
+    def _fail(self):
+        if self.failures > 0:
+            self.failures -= 1
+            raise ModelProviderError("Service unavailable", status_code=self.status_code, model_id=self.id)
+
+    def invoke(self, *args, **kwargs):
+        self._fail()
+        return super().invoke(*args, **kwargs)
+
+    async def ainvoke(self, *args, **kwargs):
+        self._fail()
+        return await super().ainvoke(*args, **kwargs)
+
+    def invoke_stream(self, *args, **kwargs):
+        self._fail()
+        yield from super().invoke_stream(*args, **kwargs)
+
+
+def test_retries_transient_errors():
+    model = FlakyModel(id="flaky-retry", responses=["Sunny"], failures=2, retry_policy=ModelRetryPolicy(**NO_DELAY))
+    agent = Agent(model=model, telemetry=False)
+
+    assert agent.run("Weather?").content == "Sunny"
+    assert model.failures == 0
+
+
+def test_does_not_retry_client_errors():
+    model = FlakyModel(id="flaky-client-error", failures=1, status_code=400, retry_policy=ModelRetryPolicy(**NO_DELAY))
+
+    with pytest.raises(ModelProviderError):
+        model._invoke_with_retries(assistant_message=Message(role="assistant"), messages=[])
+
+
+def test_retries_streams_failing_before_first_delta():
+    model = FlakyModel(
+        id="flaky-stream", responses=["Sunny in Paris"], failures=1, retry_policy=ModelRetryPolicy(**NO_DELAY)
+    )
+    agent = Agent(model=model, telemetry=False)
+
+    content = "".join(event.content for event in agent.run("Weather?", stream=True) if event.event == "RunContent")
+    assert content == "Sunny in Paris"
+
+
+def test_falls_back_to_fallback_model():
+    model = FlakyModel(
+        id="flaky-fallback",
+        failures=10,
+        retry_policy=ModelRetryPolicy(max_retries=1, **NO_DELAY),
+        fallback_model=ReplayModel(id="fallback", responses=["From the fallback"]),
+    )
+    agent = Agent(model=model, telemetry=False)
+
+    assert asyncio.run(agent.arun("Weather?")).content == "From the fallback"
+
+
+@dataclass
+class SlowFirstModel(ReplayModel):
+    """Replay model whose first request hangs"""
+
+    calls: int = 0
+
+    async def ainvoke(self, *args, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            await asyncio.sleep(5)
+        return await super().ainvoke(*args, **kwargs)
+
+
+def test_hedges_slow_requests():
+    model = SlowFirstModel(
+        id="slow-hedge", responses=["Sunny"], retry_policy=ModelRetryPolicy(hedge_percentile=0.9, hedge_min_samples=5)
+    )
+    histogram = model._get_latency_histogram()
+    histogram.reset()
+    for _ in range(5):
+        histogram.record(0.01)
+
+    start = time.perf_counter()
+    response = asyncio.run(model._ainvoke_with_retries(assistant_message=Message(role="assistant"), messages=[]))
+
+    assert response.content == "Sunny"
+    assert model.calls == 2
+    assert time.perf_counter() - start < 1
+
+
+def test_retries_wrapped_errors_on_their_own_status():
+    policy = ModelRetryPolicy()
+
+    def wrap(cause: BaseException) -> ModelProviderError:
+        error = ModelProviderError(str(cause))
+        error.__cause__ = cause
+        return error
+
+    # The default 502 of the wrapper doesn't make a bug in the request retryable
+    assert not policy.is_retryable(wrap(ValueError("Invalid tool schema")))
+    assert policy.is_retryable(wrap(TimeoutError("Read timed out")))
+    assert policy.is_retryable(wrap(ConnectionResetError("Connection reset")))
+
+    status_error = Exception("Overloaded")
+    status_error.response = SimpleNamespace(status_code=503)  # type: ignore
+    assert policy.is_retryable(wrap(status_error))
+    status_error.response.status_code = 400  # type: ignore
+    assert not policy.is_retryable(wrap(status_error))
+
+
+def test_retry_after_header_is_respected():
+    cause = Exception("Rate limited")
+    cause.response = SimpleNamespace(headers={"retry-after": "3"})  # type: ignore
+    error = ModelProviderError("Rate limited", status_code=429)
+    error.__cause__ = cause
+
+    assert get_retry_after(error) == 3.0
+    assert ModelRetryPolicy().get_delay(0, error) == 3.0
+    # Without the header, the backoff grows exponentially with jitter
+    delays = [ModelRetryPolicy(initial_delay=1).get_delay(3) for _ in range(20)]
+    assert all(0 <= delay <= 8 for delay in delays)
+
+
+def test_retry_budget_caps_retries():
+    budget = RetryBudget(ratio=0.5, min_retries=2)
+    assert budget.try_withdraw() and budget.try_withdraw()
+    assert not budget.try_withdraw()
+
+    budget.deposit()
+    budget.deposit()
+    assert budget.try_withdraw()
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for latency in range(1, 101):
+        histogram.record(latency / 100)
+
+    assert histogram.count == 100
+    assert histogram.percentile(0.5) == pytest.approx(0.5, rel=0.1)
+    assert histogram.percentile(0.99) == pytest.approx(0.99, rel=0.1)
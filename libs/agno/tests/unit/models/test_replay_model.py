@@ -0,0 +1,101 @@
+import time
+
+import pytest
+
+from agno.agent import Agent
+from agno.exceptions import ModelProviderError
+from agno.models.message import Message
+from agno.models.replay import ReplayModel, ReplayResponse
+from agno.models.response import ModelResponse
+
+
+def get_weather(city: str) -> str:
+    """Get the weather of a city."""
+    return f"It is sunny in {city}"
+
+
+def weather_agent(**kwargs) -> Agent:
+    model = ReplayModel(
+        responses=[
+            {"tool_calls": [{"name": "get_weather", "arguments": {"city": "Paris"}}]},
+            "It is sunny in Paris.",
+        ],
+        **kwargs,
+    )
+    return Agent(model=model, tools=[get_weather], telemetry=False)
+
+
+def test_scripted_responses_with_tool_calls():
+    response = weather_agent().run("What is the weather in Paris?")
+
+    assert response.content == "It is sunny in Paris."
+    assert response.tools[0].tool_name == "get_weather"  # type: ignore
+    assert response.tools[0].result == "It is sunny in Paris"  # type: ignore
+    assert response.metrics.output_tokens > 0  # type: ignore
+
+
+def test_streaming_deltas():
+    events = list(weather_agent(chunk_size=2).run("What is the weather in Paris?", stream=True))
+
+    content = [event.content for event in events if event.event == "RunContent"]
+    assert content == ["It is ", "sunny in ", "Paris."]
+
+
+async def test_async_streaming_deltas():
+    agent = weather_agent()
+    content = [
+        event.content
+        async for event in agent.arun("What is the weather in Paris?", stream=True)
+        if event.event == "RunContent"
+    ]
+    assert "".join(content) == "It is sunny in Paris."
+
+
+def test_delays():
+    model = ReplayModel(responses=["one two three four"], latency=0.05, token_delay=0.02)
+    start = time.perf_counter()
+    list(
+        model.invoke_stream(messages=[Message(role="user", content="hi")], assistant_message=Message(role="assistant"))
+    )
+    assert time.perf_counter() - start >= 0.05 + 3 * 0.02
+
+
+def test_loop_and_exhaustion():
+    messages = [Message(role="user", content="hi")]
+    model = ReplayModel(responses=["first", "second"])
+    contents = [model.invoke(messages=messages, assistant_message=Message(role="assistant")).content for _ in range(3)]
+    assert contents == ["first", "second", "first"]
+
+    model = ReplayModel(responses=["first"], loop=False)
+    model.invoke(messages=messages, assistant_message=Message(role="assistant"))
+    with pytest.raises(ModelProviderError):
+        model.invoke(messages=messages, assistant_message=Message(role="assistant"))
+
+
+def test_usage_and_structured_content():
+    model = ReplayModel(responses=[ReplayResponse(content={"city": "Paris"}, usage={"input_tokens": 3})])
+    response = model.invoke(messages=[Message(role="user", content="hi")], assistant_message=Message(role="assistant"))
+
+    assert response.content == '{"city": "Paris"}'
+    assert response.response_usage.input_tokens == 3  # type: ignore
+
+
+def test_echo_without_responses():
+    model = ReplayModel()
+    response = model.invoke(messages=[Message(role="user", content="hi")], assistant_message=Message(role="assistant"))
+    assert isinstance(response, ModelResponse)
+    assert response.content == "hi"
+
+
+def test_record_and_replay(tmp_path):
+    responses_file = tmp_path / "responses.json"
+    live_model = ReplayModel(responses=weather_agent().model.responses)  # type: ignore
+    recorder = ReplayModel(record_model=live_model, responses_file=responses_file)
+
+    recorded = Agent(model=recorder, tools=[get_weather], telemetry=False).run("What is the weather in Paris?")
+    replayed = Agent(model=ReplayModel(responses_file=responses_file), tools=[get_weather], telemetry=False).run(
+        "What is the weather in Paris?"
+    )
+
+    assert replayed.content == recorded.content == "It is sunny in Paris."
+    assert replayed.tools[0].result == "It is sunny in Paris"  # type: ignore
@@ -0,0 +1,232 @@
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator, List
+from unittest.mock import ANY
+
+import pytest
+from pydantic import BaseModel
+
+from agno.knowledge.embedder.base import Embedder
+from agno.models.base import Model
+from agno.models.cache import (
+    InMemoryResponseCache,
+    SemanticResponseCache,
+    SqliteResponseCache,
+    build_cache_key,
+)
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
+
+
+@dataclass
+class CountingModel(Model):
+    """Answers with the number of calls made to the provider"""
+
+    id: str = "counting-model"
+    temperature: float = 0.0
+
+    def __post_init__(self):
+        super().__post_init__()
+        # Not a dataclass field, so it is not part of the cache key
+        self.calls = 0
+
+    def _next(self) -> str:
+        self.calls += 1
+        return f"answer {self.calls}"
+
+    def invoke(self, *args, **kwargs) -> ModelResponse:
+        return ModelResponse(role="assistant", content=self._next(), response_usage=Metrics(input_tokens=10))
+
+    async def ainvoke(self, *args, **kwargs) -> ModelResponse:
+        return self.invoke()
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[ModelResponse]:
+        for word in self._next().split():
+            yield ModelResponse(content=word + " ")
+        yield ModelResponse(response_usage=Metrics(input_tokens=10))
+
+    async def ainvoke_stream(self, *args, **kwargs) -> AsyncIterator[ModelResponse]:
+        for response in self.invoke_stream():
+            yield response
+
+    def _parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return response
+
+    def _parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return response
+
+
+class KeywordEmbedder(Embedder):
+    """Embeds texts by the keywords they contain"""
+
+    keywords = ["capital", "france", "weather"]
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(keyword in text.lower()) for keyword in self.keywords]
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+
+def user_messages(content: str = "What is the capital of France?") -> List[Message]:
+    return [Message(role="system", content="Be concise."), Message(role="user", content=content)]
+
+
+def test_identical_requests_are_cached():
+    model = CountingModel(response_cache=InMemoryResponseCache())
+
+    first = model.response(messages=user_messages())
+    second = model.response(messages=user_messages())
+
+    assert first.content == second.content == "answer 1"
+    assert model.calls == 1
+
+
+def test_different_requests_are_not_cached():
+    model = CountingModel(response_cache=InMemoryResponseCache())
+
+    model.response(messages=user_messages())
+    model.response(messages=user_messages("What is the capital of Spain?"))
+    model.temperature = 1.0
+    model.response(messages=user_messages())
+
+    assert model.calls == 3
+
+
+def test_no_cache_by_default():
+    model = CountingModel()
+    model.response(messages=user_messages())
+    model.response(messages=user_messages())
+    assert model.calls == 2
+
+
+def test_cached_response_has_no_usage():
+    model = CountingModel(response_cache=InMemoryResponseCache())
+    model.response(messages=user_messages())
+
+    messages = user_messages()
+    model.response(messages=messages)
+
+    assert messages[-1].role == "assistant"
+    assert messages[-1].metrics.input_tokens == 0
+
+
+def test_ttl():
+    model = CountingModel(response_cache=InMemoryResponseCache(), cache_ttl=0.05)
+    model.response(messages=user_messages())
+    time.sleep(0.1)
+    model.response(messages=user_messages())
+    assert model.calls == 2
+
+
+def test_stream_is_replayed():
+    model = CountingModel(response_cache=InMemoryResponseCache())
+
+    first = [r.content for r in model.response_stream(messages=user_messages()) if isinstance(r, ModelResponse)]
+    second = [r.content for r in model.response_stream(messages=user_messages()) if isinstance(r, ModelResponse)]
+
+    assert first == second
+    assert [content for content in first if content] == ["answer ", "1 "]
+    assert model.calls == 1
+
+
+async def test_async_responses_are_cached():
+    model = CountingModel(response_cache=InMemoryResponseCache())
+
+    first = await model.aresponse(messages=user_messages())
+    second = await model.aresponse(messages=user_messages())
+    streamed = [r.content async for r in model.aresponse_stream(messages=user_messages())]
+    streamed_again = [r.content async for r in model.aresponse_stream(messages=user_messages())]
+
+    assert first.content == second.content
+    assert streamed == streamed_again
+    assert model.calls == 2
+
+
+def test_sqlite_cache_persists(tmp_path):
+    db_file = str(tmp_path / "cache.db")
+    model = CountingModel(response_cache=SqliteResponseCache(db_file=db_file))
+    model.response(messages=user_messages())
+
+    other_model = CountingModel(response_cache=SqliteResponseCache(db_file=db_file))
+    response = other_model.response(messages=user_messages())
+
+    assert response.content == "answer 1"
+    assert other_model.calls == 0
+
+
+def test_sqlite_cache_stores_json(tmp_path):
+    cache = SqliteResponseCache(db_file=str(tmp_path / "cache.db"))
+    key = build_cache_key(CountingModel(), user_messages())
+    cache.set(key, [ModelResponse(role="assistant", content="answer", response_usage=Metrics(input_tokens=10))])
+
+    [data] = cache._connection.execute("SELECT responses FROM model_responses").fetchone()
+    assert json.loads(data) == [
+        {
+            "role": "assistant",
+            "content": "answer",
+            "tool_calls": [],
+            "event": "AssistantResponse",
+            "created_at": ANY,
+            "tool_executions": [],
+            "response_usage": {"input_tokens": 10},
+        }
+    ]
+
+
+def test_sqlite_cache_defaults_to_a_private_dir():
+    cache = SqliteResponseCache()
+    assert os.stat(os.path.dirname(cache.db_file)).st_mode & 0o077 == 0
+
+
+def test_structured_output_is_parsed_from_the_cache():
+    class Answer(BaseModel):
+        city: str
+
+    model = CountingModel(response_cache=InMemoryResponseCache())
+    key = build_cache_key(model, user_messages(), response_format=Answer)
+    model.response_cache.set(key, [ModelResponse(content='{"city": "Paris"}', parsed=Answer(city="Paris"))])  # type: ignore
+
+    [cached] = model._get_cached_responses(key, response_format=Answer)  # type: ignore
+    assert cached.parsed == Answer(city="Paris")
+
+
+def test_semantic_cache_matches_similar_prompts():
+    model = CountingModel(response_cache=SemanticResponseCache(embedder=KeywordEmbedder(), similarity_threshold=0.99))
+
+    model.response(messages=user_messages("What is the capital of France?"))
+    similar = model.response(messages=user_messages("capital of france please"))
+    different = model.response(messages=user_messages("How is the weather?"))
+
+    assert similar.content == "answer 1"
+    assert different.content == "answer 2"
+
+
+def test_semantic_cache_requires_the_same_context():
+    cache = SemanticResponseCache(embedder=KeywordEmbedder(), similarity_threshold=0.99)
+    model = CountingModel(response_cache=cache)
+
+    model.response(messages=user_messages())
+    messages = user_messages("capital of france please")
+    messages[0].content = "Be verbose."
+    model.response(messages=messages)
+
+    assert model.calls == 2
+
+
+@pytest.mark.parametrize("field", ["id", "tool_call_id"])
+def test_cache_key_ignores_tool_call_ids(field):
+    model = CountingModel()
+
+    def messages(call_id: str) -> List[Message]:
+        tool_call = {"id": call_id, "type": "function", "function": {"name": "f", "arguments": "{}"}}
+        return [
+            Message(role="user", content="hi"),
+            Message(role="assistant", tool_calls=[tool_call]),
+            Message(role="tool", content="42", tool_call_id=call_id),
+        ]
+
+    assert build_cache_key(model, messages("call_1")).exact == build_cache_key(model, messages("call_2")).exact
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+import pytest
+
+# Optional subsystems that are loaded on first use, and not when importing agents, teams or workflows
+LAZY_MODULES = ["agno.knowledge.knowledge", "agno.memory.manager", "rich.markdown", "httpx", "fastapi"]
+
+
+@pytest.mark.parametrize("module", ["agno.agent", "agno.team", "agno.workflow"])
+def test_optional_subsystems_are_not_imported(module):
+    code = f"import sys, {module}; print(' '.join(name for name in {LAZY_MODULES!r} if name in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_imports_resolve_on_first_use():
+    from agno.agent import Agent
+    from agno.guardrails import PIIDetectionGuardrail
+    from agno.knowledge import Knowledge
+    from agno.memory import MemoryManager
+
+    agent = Agent(enable_user_memories=True)
+    agent._set_memory_manager()
+    assert isinstance(agent.memory_manager, MemoryManager)
+    assert Knowledge.__module__ == "agno.knowledge.knowledge"
+    assert PIIDetectionGuardrail.__module__ == "agno.guardrails.pii"
+
+
+@pytest.mark.parametrize("module, cls", [("agno.agent.agent", "Agent"), ("agno.team.team", "Team")])
+def test_type_hints_resolve_only_after_lazy_imports(module, cls):
+    # get_type_hints doesn't call the module __getattr__, so the lazy annotation types must be accessed first
+    code = (
+        f"import typing; from {module} import {cls}\n"
+        f"try:\n    typing.get_type_hints({cls})\nexcept NameError as e:\n    print('unresolved', e.name)\n"
+        f"from {module} import Knowledge, MemoryManager\n"
+        f"hints = typing.get_type_hints({cls}); print(hints['knowledge'], hints['memory_manager'])"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert "unresolved" in result.stdout
+    assert "agno.knowledge.knowledge.Knowledge" in result.stdout
+    assert "agno.memory.manager.MemoryManager" in result.stdout
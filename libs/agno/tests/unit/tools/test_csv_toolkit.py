@@ -0,0 +1,56 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agno.tools.csv_toolkit import CsvTools
+
+pytest.importorskip("duckdb")
+
+
+@pytest.fixture
+def movies_csv(tmp_path):
+    path = tmp_path / "movies.csv"
+    path.write_text('title,year,rating\n"Dune, Part One",2021,8.0\nArrival,2016,7.9\nHer,2013,8.0\n')
+    return path
+
+
+def test_read_csv_file_stops_at_row_limit(movies_csv):
+    tools = CsvTools(csvs=[movies_csv])
+    rows = json.loads(tools.read_csv_file("movies", row_limit=2))
+    assert [row["title"] for row in rows] == ["Dune, Part One", "Arrival"]
+    assert len(json.loads(tools.read_csv_file("movies"))) == 3
+
+
+@pytest.mark.parametrize("cache_tables", [False, True])
+def test_repeated_queries_reuse_the_registered_csv(movies_csv, cache_tables):
+    tools = CsvTools(csvs=[movies_csv], cache_tables=cache_tables)
+    query = "SELECT title, rating FROM movies WHERE rating >= 8 ORDER BY title"
+
+    assert tools.query_csv_file("movies", query) == 'title,rating\n"Dune, Part One",8.0\nHer,8.0'
+    connection = tools.duckdb_connection
+    assert tools.query_csv_file("movies", "SELECT count(*) FROM movies") == "count_star()\n3"
+    assert tools.duckdb_connection is connection
+
+    # The csv is registered again when the file changes
+    with open(movies_csv, "a") as f:
+        f.write("Tenet,2020,7.3\n")
+    os.utime(movies_csv, (0, os.stat(movies_csv).st_mtime + 10))
+    assert tools.query_csv_file("movies", "SELECT count(*) FROM movies") == "count_star()\n4"
+
+
+def test_query_results_are_limited(movies_csv):
+    tools = CsvTools(csvs=[movies_csv], row_limit=1)
+    assert tools.query_csv_file("movies", "SELECT year FROM movies ORDER BY year") == (
+        "year\n2013\n[Showing the first 1 rows]"
+    )
+
+
+def test_queries_from_threads_use_their_own_cursor(movies_csv):
+    tools = CsvTools(csvs=[movies_csv])
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda year: tools.query_csv_file("movies", f"SELECT {year} AS year"), range(2000, 2032))
+        )
+    assert results == [f"year\n{year}" for year in range(2000, 2032)]
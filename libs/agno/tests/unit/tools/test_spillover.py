@@ -0,0 +1,108 @@
+import re
+from typing import Dict
+
+from agno.agent import Agent, RunOutput
+from agno.models.openai import OpenAIChat
+from agno.session import AgentSession
+from agno.tools import Toolkit, tool
+from agno.tools.function import Function, FunctionCall
+from agno.tools.spillover import RESULT_PAGE_TOOL_NAME, add_result_page_tool, get_tool_result_page, spill_result
+
+
+def get_handle(output: str) -> str:
+    match = re.search(r'handle="(result_[0-9a-f]+)"', output)
+    assert match is not None
+    return match.group(1)
+
+
+def test_small_results_are_unchanged():
+    assert spill_result("short result", tool_name="run_query", max_result_chars=100) == "short result"
+
+
+def test_large_result_is_paged():
+    rows = "\n".join(f"row {i:04d}" for i in range(1000))
+    output = spill_result(rows, tool_name="run_query", max_result_chars=3000, preview_chars=100)
+
+    assert output.startswith("row 0000\n")
+    # The preview ends at a line break
+    assert output.split("\n\n")[0].endswith("row 0010")
+    assert "The full result has 3 pages" in output
+
+    handle = get_handle(output)
+    pages = [get_tool_result_page(handle, page=page) for page in (1, 2, 3)]
+    assert "".join(page.split("\n\n[Page")[0] for page in pages) == rows
+    assert f'{RESULT_PAGE_TOOL_NAME}(handle="{handle}", page=2)' in pages[0]
+    assert get_tool_result_page(handle, page=4) == "Page 4 does not exist. The result has 3 pages."
+    assert get_tool_result_page("result_unknown").startswith("No result found")
+
+
+def test_tool_result_message_is_spilled():
+    @tool(max_result_chars=50, result_preview_chars=10)
+    def read_file() -> str:
+        """Read a file"""
+        return "x" * 200
+
+    function_call = FunctionCall(function=read_file, call_id="call_1", arguments={})
+    message = OpenAIChat(id="gpt-4o").create_function_call_result(
+        function_call,
+        success=True,
+        output=read_file.entrypoint(),  # type: ignore
+    )
+
+    assert message.content.startswith("x" * 10 + "\n\n[Result truncated")  # type: ignore
+    assert get_tool_result_page(get_handle(message.content), page=4).startswith("x" * 50)  # type: ignore
+
+
+def test_page_tool_is_added_for_tools_with_a_limit():
+    def run_query(query: str) -> str:
+        """Run a query"""
+        return query
+
+    toolkit = Toolkit(name="db", tools=[run_query], max_result_chars=1000)
+    functions = dict(toolkit.functions)
+    tools = [{"type": "function", "function": f.to_dict()} for f in functions.values()]
+    add_result_page_tool(functions, tools)
+    assert list(functions) == ["run_query", RESULT_PAGE_TOOL_NAME]
+    assert tools[-1]["function"]["name"] == RESULT_PAGE_TOOL_NAME
+
+    # An agent or team default adds the tool, without being written on the functions
+    functions = {"search": Function.from_callable(run_query, name="search")}
+    add_result_page_tool(functions, [], max_result_chars=500)
+    assert list(functions) == ["search", RESULT_PAGE_TOOL_NAME]
+    assert functions["search"].max_result_chars is None
+
+    functions = {"search": Function.from_callable(run_query, name="search")}
+    add_result_page_tool(functions, [])
+    assert list(functions) == ["search"]
+
+
+def test_agents_sharing_a_toolkit_keep_their_own_limit():
+    def big() -> str:
+        """Return a large result"""
+        return "x" * 500
+
+    toolkit = Toolkit(name="shared", tools=[big])
+    agent_a = Agent(model=OpenAIChat(id="gpt-4o"), tools=[toolkit], max_tool_result_chars=100)
+    agent_b = Agent(model=OpenAIChat(id="gpt-4o"), tools=[toolkit])
+
+    def build_tools(agent: Agent) -> Dict[str, Function]:
+        agent._determine_tools_for_model(
+            model=agent.model,  # type: ignore
+            run_response=RunOutput(run_id="run", session_id="session"),
+            session=AgentSession(session_id="session"),
+        )
+        return agent._functions_for_model  # type: ignore
+
+    functions_a = build_tools(agent_a)
+    assert RESULT_PAGE_TOOL_NAME in functions_a
+    assert FunctionCall(function=functions_a["big"]).spill_result("x" * 500).startswith("x" * 100 + "\n\n[Result")
+
+    functions_b = build_tools(agent_b)
+    assert list(functions_b) == ["big"]
+    assert functions_b["big"].max_result_chars is None
+    assert FunctionCall(function=functions_b["big"]).spill_result("x" * 500) == "x" * 500
+
+    # A later change of the default of an agent applies to its next calls
+    agent_a.max_tool_result_chars = 200
+    functions_a = build_tools(agent_a)
+    assert FunctionCall(function=functions_a["big"]).spill_result("x" * 500).startswith("x" * 200 + "\n\n[Result")
@@ -0,0 +1,87 @@
+from agno.agent import Agent
+from agno.media import Audio
+from agno.models.base import MessageData
+from agno.models.message import Message
+from agno.models.replay import ReplayModel, ReplayResponse
+from agno.models.response import ModelResponse
+from agno.run.agent import RunEvent
+from agno.team import Team
+from agno.utils.stream import ResponseStreamBuffers, StreamBuffer
+
+RESPONSE = ReplayResponse(content="The answer is 42, obviously.", reasoning_content="Let me think about it.")
+
+
+def test_stream_buffer():
+    buffer = StreamBuffer()
+    assert not buffer
+    assert buffer.value == ""
+
+    for chunk in ["a", "", "b", "c"]:
+        buffer.append(chunk)
+    assert buffer
+    assert buffer.value == "abc"
+    buffer.append("d")
+    assert buffer.value == "abcd"
+
+    bytes_buffer = StreamBuffer()
+    bytes_buffer.append(b"x")
+    bytes_buffer.append(b"y")
+    assert bytes_buffer.value == b"xy"
+
+
+def test_response_stream_buffers_flush():
+    buffers = ResponseStreamBuffers()
+    buffers.content.append("Hello ")
+    buffers.content.append("world")
+    buffers.audio_content += b"\x00\x01"
+    buffers.audio_transcript.append("Hello")
+
+    model_response = ModelResponse(content="", audio=Audio(content=b"", transcript=""))
+    buffers.flush(model_response)
+
+    assert model_response.content == "Hello world"
+    assert model_response.reasoning_content is None
+    assert model_response.audio.content == b"\x00\x01"  # type: ignore
+    assert model_response.audio.transcript == "Hello"  # type: ignore
+
+
+def test_message_data_accumulates_deltas():
+    model = ReplayModel()
+    stream_data = MessageData()
+    deltas = [
+        ModelResponse(content="Hello "),
+        ModelResponse(content="world", audio=Audio(id="audio", content="AAA", transcript="Hel")),
+        ModelResponse(reasoning_content="thinking", audio=Audio(content="BBB", transcript="lo")),
+    ]
+    for delta in deltas:
+        list(model._populate_stream_data_and_assistant_message(stream_data, Message(role="assistant"), delta))
+
+    assert stream_data.response_content == "Hello world"
+    assert stream_data.response_reasoning_content == "thinking"
+    audio = stream_data.get_response_audio()
+    assert audio.content == b"AAABBB"  # type: ignore
+    assert audio.transcript == "Hello"  # type: ignore
+
+    # Setting the value replaces the accumulated chunks
+    stream_data.response_content = "replaced"
+    assert stream_data.response_content == "replaced"
+
+
+def test_agent_stream_content():
+    agent = Agent(model=ReplayModel(responses=[RESPONSE]), telemetry=False)
+    events = list(agent.run("What is the answer?", stream=True, stream_intermediate_steps=True))
+
+    content_events = [event for event in events if event.event == RunEvent.run_content]
+    assert "".join(event.content for event in content_events if event.content) == RESPONSE.content
+    completed = [event for event in events if event.event == RunEvent.run_completed][0]
+    assert completed.content == RESPONSE.content
+    assert completed.reasoning_content == RESPONSE.reasoning_content
+
+
+def test_team_stream_content():
+    member = Agent(name="Member", model=ReplayModel(), telemetry=False)
+    team = Team(members=[member], model=ReplayModel(responses=[RESPONSE]), telemetry=False)
+    events = list(team.run("What is the answer?", stream=True, stream_intermediate_steps=True))
+
+    assert events[-1].content == RESPONSE.content
+    assert events[-1].reasoning_content == RESPONSE.reasoning_content
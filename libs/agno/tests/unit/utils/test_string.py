@@ -2,7 +2,7 @@ from typing import List, Optional
 
 from pydantic import BaseModel
 
-from agno.utils.string import parse_response_model_str, url_safe_string
+from agno.utils.string import parse_response_model_str, substitute_variables, url_safe_string
 
 
 def test_url_safe_string_spaces():
@@ -346,3 +346,11 @@ def test_parse_json_with_python_code_in_value():
         == "def factorial(n):     # Calculate factorial of n     if n <= 1:         return 1     return n * factorial(n - 1)"
     )
     assert result.description == "A recursive factorial function with comments and multiplication"
+
+
+def test_substitute_variables():
+    variables = {"name": "Ada", "city": "Paris"}
+    assert substitute_variables("Hello {name} from $city", variables) == "Hello Ada from Paris"
+    # Unknown variables are left as is, and the inner braces of a doubled {{variable}} are substituted
+    assert substitute_variables("{unknown} and {{name}}", variables) == "{unknown} and {Ada}"
+    assert substitute_variables("No variables", variables) == "No variables"
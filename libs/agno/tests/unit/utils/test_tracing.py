@@ -0,0 +1,220 @@
+import asyncio
+
+import pytest
+
+from agno.agent import Agent
+from agno.db.in_memory import InMemoryDb
+from agno.models.replay import ReplayModel
+from agno.team import Team
+from agno.tracing import (
+    NOOP_SPAN,
+    InMemorySpanExporter,
+    get_current_span,
+    set_span_exporters,
+    trace_span,
+    traced,
+)
+from agno.workflow import Step, Workflow
+
+
+def get_weather(city: str) -> str:
+    """Get the weather of a city."""
+    return f"It is sunny in {city}"
+
+
+def weather_model() -> ReplayModel:
+    return ReplayModel(
+        responses=[
+            {"tool_calls": [{"name": "get_weather", "arguments": {"city": "Paris"}}]},
+            "It is sunny in Paris.",
+        ]
+    )
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    set_span_exporters([exporter])
+    yield exporter
+    set_span_exporters(None)
+
+
+def test_disabled_by_default():
+    with trace_span("stage") as span:
+        assert span is NOOP_SPAN
+    assert get_current_span() is NOOP_SPAN
+
+
+def test_nested_spans(exporter):
+    @traced("inner", attributes=lambda value: {"value": value})
+    def inner(value):
+        return value * 2
+
+    with trace_span("outer") as outer:
+        assert inner(2) == 4
+
+    inner_span, outer_span = exporter.spans
+    assert inner_span.parent_id == outer.span_id
+    assert inner_span.trace_id == outer.trace_id
+    assert inner_span.attributes == {"value": 2}
+    assert outer_span.duration >= inner_span.duration  # type: ignore
+
+
+def test_error_is_recorded(exporter):
+    with pytest.raises(ValueError):
+        with trace_span("failing"):
+            raise ValueError("boom")
+
+    assert exporter.spans[0].status == "error"
+    assert exporter.spans[0].error == "ValueError: boom"
+
+
+def test_generator_span_is_only_active_while_running(exporter):
+    @traced("numbers", first_chunk_attribute="time_to_first_item")
+    def numbers():
+        for i in range(3):
+            yield i
+
+    for _ in numbers():
+        # The caller does not run inside the span of the generator
+        assert get_current_span() is NOOP_SPAN
+
+    assert exporter.spans[0].name == "numbers"
+    assert "time_to_first_item" in exporter.spans[0].attributes
+
+
+def test_agent_run_stages(exporter):
+    agent = Agent(id="weather-agent", model=weather_model(), tools=[get_weather], db=InMemoryDb(), telemetry=False)
+    response = agent.run("What is the weather in Paris?", session_id="session-1")
+
+    run_span = exporter.get_spans("agent.run")[0]
+    assert run_span.attributes["agent.id"] == "weather-agent"
+    assert run_span.attributes["run.id"] == response.run_id
+    assert run_span.attributes["session.id"] == "session-1"
+    assert run_span.parent_id is None
+
+    children = {span.name for span in exporter.spans if span.parent_id == run_span.span_id}
+    assert {
+        "agent.read_session",
+        "agent.build_system_message",
+        "model.response",
+        "tool.execute",
+        "agent.save_session",
+    } <= children
+    assert len(exporter.get_spans("model.response")) == 2
+    assert exporter.get_spans("tool.execute")[0].attributes["tool.name"] == "get_weather"
+    assert "agent.run" in exporter.format_tree()
+
+
+def test_agent_stream_records_time_to_first_token(exporter):
+    agent = Agent(model=weather_model(), tools=[get_weather], telemetry=False)
+    for _ in agent.run("What is the weather in Paris?", stream=True):
+        pass
+
+    run_span = exporter.get_spans("agent.run")[0]
+    model_spans = exporter.get_spans("model.response")
+    assert len(model_spans) == 2
+    assert all(span.parent_id == run_span.span_id for span in model_spans)
+    assert all("time_to_first_token" in span.attributes for span in model_spans)
+
+
+def test_async_agent_runs_are_separate_traces(exporter):
+    async def run_agents():
+        agents = [Agent(model=weather_model(), tools=[get_weather], telemetry=False) for _ in range(3)]
+        await asyncio.gather(*(agent.arun("What is the weather in Paris?") for agent in agents))
+
+    asyncio.run(run_agents())
+
+    run_spans = exporter.get_spans("agent.run")
+    assert len({span.trace_id for span in run_spans}) == 3
+    for run_span in run_spans:
+        tool_spans = exporter.get_spans("tool.execute", trace_id=run_span.trace_id)
+        assert len(tool_spans) == 1
+        assert tool_spans[0].parent_id == run_span.span_id
+
+
+def test_team_and_workflow_spans(exporter):
+    member = Agent(name="Member", model=ReplayModel(), telemetry=False)
+    team = Team(members=[member], model=ReplayModel(responses=["Done"]), telemetry=False)
+    team.run("Hello")
+    assert exporter.get_spans("team.run")
+    assert exporter.get_spans("team.build_system_message")
+
+    exporter.clear()
+    workflow = Workflow(
+        name="Workflow",
+        steps=[Step(name="first", agent=Agent(model=ReplayModel(responses=["Done"]), telemetry=False))],
+        telemetry=False,
+    )
+    workflow.run("Hello")
+
+    workflow_span = exporter.get_spans("workflow.run")[0]
+    step_span = exporter.get_spans("workflow.step")[0]
+    assert step_span.parent_id == workflow_span.span_id
+    assert step_span.attributes["step.name"] == "first"
+    assert exporter.get_spans("agent.run")[0].parent_id == step_span.span_id
+
+
+def test_opentelemetry_exporter():
+    pytest.importorskip("opentelemetry")
+    from agno.tracing.otel import OpenTelemetrySpanExporter
+
+    started, ended = [], []
+
+    class RecordingSpan:
+        def __init__(self, name):
+            self.name = name
+
+        def set_attributes(self, attributes):
+            self.attributes = attributes
+
+        def add_event(self, name, attributes=None, timestamp=None):
+            pass
+
+        def set_status(self, status):
+            self.status = status
+
+        def end(self, end_time=None):
+            ended.append(self)
+
+    class RecordingTracer:
+        def start_span(self, name, context=None, attributes=None, start_time=None):
+            span = RecordingSpan(name)
+            started.append((name, context))
+            return span
+
+    otel_exporter = OpenTelemetrySpanExporter()
+    otel_exporter.tracer = RecordingTracer()  # type: ignore
+    set_span_exporters([otel_exporter])
+    try:
+        with trace_span("outer", {"key": ["a", "b"]}):
+            with trace_span("inner", {"value": {"nested": True}}):
+                pass
+    finally:
+        set_span_exporters(None)
+
+    assert [name for name, _ in started] == ["outer", "inner"]
+    assert started[0][1] is None and started[1][1] is not None
+    assert [span.name for span in ended] == ["inner", "outer"]
+    assert ended[0].attributes == {"value": "{'nested': True}"}
+
+
+def test_agentos_request_span(exporter):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from agno.os.tracing import TracingMiddleware
+
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+    agent = Agent(model=ReplayModel(responses=["Done"]), telemetry=False)
+
+    @app.get("/run")
+    def run():
+        return {"content": agent.run("Hello").content}
+
+    assert TestClient(app).get("/run").json() == {"content": "Done"}
+
+    request_span = exporter.get_spans("agentos.request")[0]
+    assert request_span.attributes["http.status_code"] == 200
+    assert exporter.get_spans("agent.run")[0].parent_id == request_span.span_id
@@ -1,5 +1,5 @@
 from typing import Any, Dict, List
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -22,4 +22,8 @@ def mock_embedder():
     mock_usage: Dict[str, Any] = {"prompt_tokens": 10, "total_tokens": 10}
     mock.get_embedding_and_usage.return_value = (mock_embedding, mock_usage)
 
+    # Mock the async methods
+    mock.async_get_embedding = AsyncMock(return_value=mock_embedding)
+    mock.async_get_embedding_and_usage = AsyncMock(return_value=(mock_embedding, mock_usage))
+
     return mock
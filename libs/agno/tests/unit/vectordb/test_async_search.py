@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from agno.knowledge.document import Document
+from agno.knowledge.knowledge import Knowledge
+from agno.vectordb.base import VectorDb
+
+
+class SyncOnlyDb(VectorDb):
+    """Vector db with a blocking search and no async search"""
+
+    def __init__(self, delay: float = 0.05, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.search_threads: List[str] = []
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.search_threads.append(threading.current_thread().name)
+        try:
+            time.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("search failed")
+            return [Document(content=f"{query} {i}") for i in range(limit)]
+        finally:
+            with self.lock:
+                self.running -= 1
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        raise NotImplementedError
+
+    def exists(self) -> bool:
+        return True
+
+
+# Stub out the rest of the interface
+SyncOnlyDb.__abstractmethods__ = frozenset()
+
+
+async def test_sync_search_runs_off_the_event_loop():
+    db = SyncOnlyDb(delay=0.2)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        results = await db.run_async_search("query", limit=2)
+    finally:
+        ticker_task.cancel()
+
+    assert [doc.content for doc in results] == ["query 0", "query 1"]
+    assert db.search_threads[0].startswith("agno-vectordb")
+    # The loop kept running while the search was blocked
+    assert ticks >= 5
+    assert db.search_metrics.thread_fallbacks == 1
+
+
+async def test_search_concurrency_limit():
+    db = SyncOnlyDb(delay=0.05)
+    db.search_concurrency = 2
+
+    results = await asyncio.gather(*[db.run_async_search(f"q{i}", limit=1) for i in range(8)])
+
+    assert len(results) == 8
+    assert db.max_running == 2
+    assert db.search_metrics.waiting == 0
+    assert db.search_metrics.in_flight == 0
+
+
+async def test_search_metrics():
+    db = SyncOnlyDb(delay=0.01)
+    await db.run_async_search("a")
+    await db.run_async_search("b")
+
+    db.fail = True
+    with pytest.raises(RuntimeError):
+        await db.run_async_search("c")
+
+    metrics = db.search_metrics.to_dict()
+    assert metrics["searches"] == 3
+    assert metrics["errors"] == 1
+    assert metrics["thread_fallbacks"] == 3
+    assert 0.01 <= metrics["p50_latency"] <= metrics["max_latency"]
+
+
+async def test_knowledge_async_search_falls_back_without_blocking():
+    db = SyncOnlyDb(delay=0.01)
+    knowledge = Knowledge(vector_db=db)
+
+    results = await knowledge.async_search("query", max_results=3)
+
+    assert len(results) == 3
+    assert db.search_threads[0] != threading.current_thread().name
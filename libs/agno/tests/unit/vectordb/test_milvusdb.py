@@ -120,15 +120,16 @@ def test_insert_documents(milvus_db, sample_documents, mock_milvus_client):
     with patch.object(milvus_db.embedder, "get_embedding", return_value=[0.1] * 768):
         milvus_db.insert(documents=sample_documents, content_hash="test_hash")
 
-        # Should call insert once for each document
-        assert mock_milvus_client.insert.call_count == 3
+        # Should call insert once for the whole batch
+        assert mock_milvus_client.insert.call_count == 1
 
-        # Check the first call's parameters
-        args, kwargs = mock_milvus_client.insert.call_args_list[0]
+        # Check the call's parameters
+        args, kwargs = mock_milvus_client.insert.call_args
         assert kwargs["collection_name"] == "test_collection"
-        assert "vector" in kwargs["data"]
-        assert "name" in kwargs["data"]
-        assert "content" in kwargs["data"]
+        assert len(kwargs["data"]) == 3
+        assert "vector" in kwargs["data"][0]
+        assert "name" in kwargs["data"][0]
+        assert "content" in kwargs["data"][0]
 
 
 def test_name_exists(milvus_db, mock_milvus_client):
@@ -158,15 +159,16 @@ def test_upsert_documents(milvus_db, sample_documents, mock_milvus_client):
     with patch.object(milvus_db.embedder, "get_embedding", return_value=[0.1] * 768):
         milvus_db.upsert(documents=sample_documents, content_hash="test_hash")
 
-        # Should call upsert once for each document
-        assert mock_milvus_client.upsert.call_count == 3
+        # Should call upsert once for the whole batch
+        assert mock_milvus_client.upsert.call_count == 1
 
-        # Check the first call's parameters
-        args, kwargs = mock_milvus_client.upsert.call_args_list[0]
+        # Check the call's parameters
+        args, kwargs = mock_milvus_client.upsert.call_args
         assert kwargs["collection_name"] == "test_collection"
-        assert "vector" in kwargs["data"]
-        assert "name" in kwargs["data"]
-        assert "content" in kwargs["data"]
+        assert len(kwargs["data"]) == 3
+        assert "vector" in kwargs["data"][0]
+        assert "name" in kwargs["data"][0]
+        assert "content" in kwargs["data"][0]
 
 
 def test_upsert_available(milvus_db):
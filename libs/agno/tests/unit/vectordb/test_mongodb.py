@@ -376,7 +376,7 @@ def test_upsert(vector_db: MongoDb, mock_mongodb_client: MagicMock, mock_embedde
     # Setup mock responses
     mock_doc = {"_id": "doc_0", "content": "Modified content", "name": "test_doc_0", "meta_data": {"type": "modified"}}
     collection.find_one.return_value = mock_doc
-    collection.update_one = MagicMock(return_value=MagicMock(modified_count=1))
+    collection.bulk_write = MagicMock()
 
     # Modify document and upsert
     modified_doc = Document(
@@ -405,8 +405,9 @@ def test_upsert(vector_db: MongoDb, mock_mongodb_client: MagicMock, mock_embedde
     # Perform the upsert
     vector_db.upsert(content_hash="test_hash", documents=[modified_doc])
 
-    # Verify the update was called
-    collection.update_one.assert_called_once()
+    # Verify the update was sent in a single bulk request
+    collection.bulk_write.assert_called_once()
+    assert len(collection.bulk_write.call_args.args[0]) == 1
 
     # Restore original method
     vector_db.prepare_doc = original_prepare_doc
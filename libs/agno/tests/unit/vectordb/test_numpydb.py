@@ -0,0 +1,186 @@
+import asyncio
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pytest
+
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb import IVF, NumpyDb
+
+
+@dataclass
+class WordEmbedder(Embedder):
+    """Embeds a text as the counts of its words, hashed into a few dimensions"""
+
+    dimensions: Optional[int] = 32
+
+    def get_embedding(self, text: str) -> List[float]:
+        embedding = [0.0] * (self.dimensions or 32)
+        for word in text.lower().split():
+            embedding[zlib.crc32(word.encode()) % len(embedding)] += 1.0
+        return embedding
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+def make_documents() -> List[Document]:
+    return [
+        Document(content="green curry with chicken", name="thai", meta_data={"cuisine": "thai"}, content_id="c1"),
+        Document(content="pad thai with shrimp", name="thai", meta_data={"cuisine": "thai"}, content_id="c1"),
+        Document(content="margherita pizza with basil", name="italian", meta_data={"cuisine": "italian"}),
+        Document(content="carbonara pasta with pancetta", name="italian", meta_data={"cuisine": "italian"}),
+    ]
+
+
+@pytest.fixture
+def db():
+    vector_db = NumpyDb(embedder=WordEmbedder())
+    vector_db.create()
+    return vector_db
+
+
+def test_insert_and_search(db):
+    db.insert(content_hash="recipes", documents=make_documents())
+    # Documents already stored are skipped
+    db.insert(content_hash="recipes", documents=make_documents()[:2])
+
+    assert db.get_count() == 4
+    assert db.name_exists("thai") and not db.name_exists("french")
+    assert db.content_hash_exists("recipes")
+
+    results = db.search("pizza with basil", limit=2)
+    assert results[0].content == "margherita pizza with basil"
+    assert len(results) == 2
+    assert db.id_exists(results[0].id)
+
+
+def test_filters_and_deletes(db):
+    db.insert(content_hash="recipes", documents=make_documents(), filters={"source": "book"})
+
+    results = db.search("pizza with basil", limit=5, filters={"cuisine": "thai"})
+    assert {result.name for result in results} == {"thai"}
+    results = db.search("pizza", limit=5, filters={"cuisine": ["thai", "italian"], "source": "book"})
+    assert len(results) == 4
+    assert db.search("pizza", filters={"cuisine": "french"}) == []
+
+    db.update_metadata("c1", {"spicy": True})
+    assert len(db.search("curry", filters={"spicy": True})) == 2
+
+    assert db.delete_by_content_id("c1")
+    assert db.delete_by_metadata({"cuisine": "italian"})
+    assert not db.delete_by_name("italian")
+    assert db.get_count() == 0
+    assert db.search("pizza") == []
+
+
+def test_upsert_replaces_the_documents_of_a_content(db):
+    db.upsert(content_hash="recipes", documents=make_documents())
+    db.upsert(content_hash="recipes", documents=[Document(content="massaman curry with beef", name="thai")])
+
+    assert db.get_count() == 1
+    assert db.search("curry", limit=5)[0].content == "massaman curry with beef"
+
+
+def test_collection_is_persisted(tmp_path):
+    db = NumpyDb(collection="recipes", embedder=WordEmbedder(), path=str(tmp_path))
+    db.create()
+    db.insert(content_hash="recipes", documents=make_documents())
+    db.delete_by_name("thai")
+
+    reloaded = NumpyDb(collection="recipes", embedder=WordEmbedder(), path=str(tmp_path))
+    assert reloaded.exists()
+    assert reloaded.get_count() == 2
+    assert isinstance(reloaded._vectors, np.memmap)
+    assert reloaded.search("carbonara pasta", limit=1)[0].content == "carbonara pasta with pancetta"
+
+    # Optimizing drops the deleted rows from the storage
+    reloaded.optimize()
+    reloaded.insert(content_hash="more", documents=[Document(content="tiramisu with coffee", name="dessert")])
+    reloaded = NumpyDb(collection="recipes", embedder=WordEmbedder(), path=str(tmp_path))
+    assert reloaded.get_count() == reloaded._count == 3
+
+    reloaded.drop()
+    assert not reloaded.exists()
+
+
+def test_changes_are_logged_and_compacted(tmp_path):
+    db = NumpyDb(collection="recipes", embedder=WordEmbedder(), path=str(tmp_path))
+    db.create()
+    snapshot = db._documents_file.read_text()
+    db.insert(content_hash="recipes", documents=make_documents())
+    db.insert(content_hash="desserts", documents=[Document(content="tiramisu with coffee", name="dessert")])
+    db.upsert(content_hash="recipes", documents=make_documents()[:1])
+    db.update_metadata(content_id="c1", metadata={"spicy": True})
+    db.delete_by_name("dessert")
+
+    # Changes are appended to the log, without writing the documents again
+    assert db._documents_file.read_text() == snapshot
+    assert len(db._log_file.read_text().splitlines()) == 6
+    reloaded = NumpyDb(collection="recipes", embedder=WordEmbedder(), path=str(tmp_path))
+    [document] = reloaded.search("green curry", limit=5)
+    assert document.meta_data == {"cuisine": "thai", "spicy": True}
+    assert reloaded.get_count() == 1
+
+    # Optimizing writes a new snapshot and starts a new log
+    log_file = reloaded._log_file
+    reloaded.optimize()
+    assert not log_file.exists()
+    assert not reloaded._log_file.exists()
+    reloaded = NumpyDb(collection="recipes", embedder=WordEmbedder(), path=str(tmp_path))
+    assert reloaded.get_count() == reloaded._count == 1
+
+
+def test_incomplete_change_is_ignored(tmp_path):
+    db = NumpyDb(collection="recipes", embedder=WordEmbedder(), path=str(tmp_path))
+    db.create()
+    db.insert(content_hash="recipes", documents=make_documents())
+    with open(db._log_file, "a") as f:
+        f.write('{"op": "delete", "rows": [0')
+
+    reloaded = NumpyDb(collection="recipes", embedder=WordEmbedder(), path=str(tmp_path))
+    assert reloaded.get_count() == 4
+
+
+@pytest.mark.parametrize("distance", [Distance.cosine, Distance.l2, Distance.max_inner_product])
+def test_ivf_index_recall(distance):
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(20, 16))
+    vectors = (centers[rng.integers(0, 20, size=2000)] + rng.normal(scale=0.3, size=(2000, 16))).astype(np.float32)
+    documents = [Document(content=f"document {i}", embedding=vector.tolist()) for i, vector in enumerate(vectors)]
+
+    brute_force = NumpyDb(embedder=WordEmbedder(dimensions=16), distance=distance)
+    indexed = NumpyDb(embedder=WordEmbedder(dimensions=16), distance=distance, index=IVF(nprobe=8, min_rows=1000))
+    for vector_db in (brute_force, indexed):
+        vector_db._add_documents("vectors", documents)
+
+    hits = 0
+    queries = rng.normal(size=(20, 16)).tolist()
+    for query in queries:
+        expected = {document.id for document in brute_force.search_by_embedding(query, limit=10)}
+        hits += len(expected & {document.id for document in indexed.search_by_embedding(query, limit=10)})
+
+    assert indexed.index is not None and indexed.index.is_built
+    assert hits / (10 * len(queries)) >= 0.9
+
+
+def test_async_interface(db):
+    async def run():
+        await db.async_insert(content_hash="recipes", documents=make_documents())
+        await db.async_upsert(content_hash="recipes", documents=make_documents()[:1])
+        assert await db.async_name_exists("thai")
+        return await db.async_search("green curry", limit=1)
+
+    results = asyncio.run(run())
+    assert results[0].content == "green curry with chicken"
+    assert db.get_count() == 1
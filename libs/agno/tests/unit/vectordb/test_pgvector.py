@@ -446,16 +446,20 @@ async def test_async_search(mock_pgvector):
     expected_results = [Document(id="test", content="Test document")]
 
     with (
-        patch.object(mock_pgvector, "search", return_value=expected_results),
-        patch("asyncio.to_thread") as mock_to_thread,
+        patch.object(mock_pgvector, "search_with_embedding", return_value=expected_results),
+        patch.object(mock_pgvector, "run_in_executor") as mock_run_in_executor,
     ):
-        mock_to_thread.return_value = expected_results
+        mock_run_in_executor.return_value = expected_results
 
         results = await mock_pgvector.async_search("test query")
 
-        # Check results and that search was called via to_thread
+        # Check results, that the query was embedded asynchronously, and that only the database query was run in
+        # the vector db thread pool
         assert results == expected_results
-        mock_to_thread.assert_called_once_with(mock_pgvector.search, "test query", 5, None)
+        mock_pgvector.embedder.async_get_embedding.assert_awaited_with("test query")
+        mock_run_in_executor.assert_called_once_with(
+            mock_pgvector.search_with_embedding, "test query", [0.1] * 1024, 5, None
+        )
 
 
 @pytest.mark.asyncio
@@ -392,14 +392,14 @@ async def test_async_search(mock_pinecone_db):
 
     with (
         patch.object(mock_pinecone_db, "search", return_value=expected_results),
-        patch("asyncio.to_thread") as mock_to_thread,
+        patch.object(mock_pinecone_db, "run_in_executor") as mock_run_in_executor,
     ):
-        mock_to_thread.return_value = expected_results
+        mock_run_in_executor.return_value = expected_results
 
         results = await mock_pinecone_db.async_search(query)
 
         assert results == expected_results
-        mock_to_thread.assert_called_once_with(mock_pinecone_db.search, query, 5, None, None, None)
+        mock_run_in_executor.assert_called_once_with(mock_pinecone_db.search, query, 5, None, None, None)
 
 
 @pytest.mark.asyncio
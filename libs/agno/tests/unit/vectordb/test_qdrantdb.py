@@ -135,6 +135,24 @@ def test_insert_documents(qdrant_db, sample_documents, mock_qdrant_client):
         assert len(kwargs["points"]) == 3
 
 
+def test_insert_documents_in_batches(qdrant_db, sample_documents, mock_qdrant_client):
+    """Test that each batch is written in its own request"""
+    qdrant_db.insert(documents=sample_documents, content_hash="test_hash", batch_size=2)
+    assert [len(call.kwargs["points"]) for call in mock_qdrant_client.upsert.call_args_list] == [2, 1]
+
+
+def test_insert_skips_documents_without_embedding(qdrant_db, sample_documents, mock_qdrant_client):
+    """Test that documents which could not be embedded are left out of the request"""
+    for document in sample_documents:
+        document.embedding = [0.1] * 1024
+    sample_documents[1].embedding = None
+
+    qdrant_db._write_batch("test_hash", sample_documents)
+
+    points = mock_qdrant_client.upsert.call_args.kwargs["points"]
+    assert [point.payload["name"] for point in points] == ["tom_kha", "green_curry"]
+
+
 def test_name_exists(qdrant_db, mock_qdrant_client):
     """Test name existence check"""
     # Test when name exists
@@ -72,8 +72,9 @@ def test_insert_documents(singlestore_db, sample_documents, mock_session):
     """Test inserting documents"""
     singlestore_db.insert(documents=sample_documents, content_hash="test_hash")
 
-    # Verify insert was called for each document
-    assert mock_session.execute.call_count == len(sample_documents)
+    # Verify the documents were inserted with a single statement
+    mock_session.execute.assert_called_once()
+    assert len(mock_session.execute.call_args.args[1]) == len(sample_documents)
 
     # Verify commit was called
     mock_session.commit.assert_called_once()
@@ -33,7 +33,7 @@ def mock_weaviate_client():
 
         # Set up collection data mocks
         collection.data.exists.return_value = False
-        collection.data.insert = Mock()
+        collection.data.insert_many = Mock(return_value=Mock(has_errors=False))
         collection.data.delete_by_id = Mock()
         collection.data.delete_many = Mock()
         collection.aggregate.over_all.return_value = Mock(total_count=0)
@@ -102,7 +102,8 @@ def test_insert_documents(weaviate_db, sample_documents, mock_weaviate_client):
     collection = mock_weaviate_client.collections.get.return_value
 
     weaviate_db.insert(content_hash="test_hash", documents=sample_documents)
-    assert collection.data.insert.call_count == 3
+    collection.data.insert_many.assert_called_once()
+    assert len(collection.data.insert_many.call_args.args[0]) == 3
 
 
 def test_vector_search(weaviate_db, sample_documents, mock_weaviate_client):
@@ -292,7 +293,8 @@ def test_upsert_documents(weaviate_db, sample_documents, mock_weaviate_client):
     collection.query.fetch_objects.return_value = mock_result
 
     weaviate_db.upsert(content_hash="test_hash", documents=sample_documents)
-    assert collection.data.insert.call_count == 3
+    collection.data.insert_many.assert_called_once()
+    assert len(collection.data.insert_many.call_args.args[0]) == 3
 
 
 def test_upsert_documents_with_existing_data(weaviate_db, sample_documents, mock_weaviate_client):
@@ -304,7 +306,8 @@ def test_upsert_documents_with_existing_data(weaviate_db, sample_documents, mock
     collection.query.fetch_objects.return_value = mock_result
 
     weaviate_db.upsert(content_hash="test_hash", documents=sample_documents)
-    assert collection.data.insert.call_count == 3
+    collection.data.insert_many.assert_called_once()
+    assert len(collection.data.insert_many.call_args.args[0]) == 3
 
 
 def test_vector_index_config(weaviate_db):
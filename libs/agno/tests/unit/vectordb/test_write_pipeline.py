@@ -0,0 +1,94 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.vectordb.pipeline import embed_documents, write_documents
+
+
+@dataclass
+class SlowEmbedder(Embedder):
+    """Takes `delay` seconds per batch and records the batches it embedded"""
+
+    dimensions: Optional[int] = 2
+    delay: float = 0.0
+    batches: List[List[str]] = field(default_factory=list)
+    fail_batch: bool = False
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text)), 1.0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        if self.fail_batch:
+            raise ValueError("batch embedding is not available")
+        time.sleep(self.delay)
+        self.batches.append(texts)
+        return [self.get_embedding(text) for text in texts], [{"tokens": len(text)} for text in texts]
+
+
+def make_documents(count: int) -> List[Document]:
+    return [Document(content=f"document {i}") for i in range(count)]
+
+
+def test_embed_documents_uses_one_batch_call():
+    embedder = SlowEmbedder(enable_batch=True)
+    documents = make_documents(3)
+    embed_documents(embedder, documents)
+
+    assert len(embedder.batches) == 1
+    assert [document.embedding for document in documents] == [[10.0, 1.0]] * 3
+    assert documents[0].usage == {"tokens": 10}
+
+
+def test_embed_documents_falls_back_to_single_embeddings():
+    embedder = SlowEmbedder(enable_batch=True, fail_batch=True)
+    documents = make_documents(2)
+    embed_documents(embedder, documents)
+
+    assert all(document.embedding == [10.0, 1.0] for document in documents)
+
+
+def test_write_documents_overlaps_embedding_and_writes():
+    embedder = SlowEmbedder(enable_batch=True, delay=0.05)
+    written: List[List[Document]] = []
+    writer_threads = set()
+
+    def write_batch(batch: List[Document]) -> None:
+        # Every batch is embedded before it is written
+        assert all(document.embedding is not None for document in batch)
+        writer_threads.add(threading.get_ident())
+        time.sleep(0.05)
+        written.append(batch)
+
+    documents = make_documents(10)
+    stats = write_documents(
+        documents, write_batch, embed_batch=lambda batch: embed_documents(embedder, batch), batch_size=2
+    )
+
+    assert [document for batch in written for document in batch] == documents
+    assert writer_threads == {threading.get_ident()}
+    assert (stats.documents, stats.batches) == (10, 5)
+    # Sequential embedding and writing would take at least 0.5s
+    assert stats.total_time < stats.embedding_time + stats.write_time
+    assert stats.docs_per_second > 0
+
+
+def test_write_documents_stops_on_write_error():
+    embedder = SlowEmbedder(enable_batch=True)
+
+    def write_batch(batch: List[Document]) -> None:
+        raise RuntimeError("write failed")
+
+    with pytest.raises(RuntimeError):
+        write_documents(
+            make_documents(6), write_batch, embed_batch=lambda b: embed_documents(embedder, b), batch_size=2
+        )
+    # At most the batch being written and the next one were embedded
+    assert len(embedder.batches) <= 2